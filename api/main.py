@@ -6,13 +6,16 @@ AI agents call this API to execute verified blocks without owning the library.
 
 import os
 import json
+import asyncio
 import hashlib
+import hmac
 import time
 import uuid
 import random
 import traceback
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
 from pathlib import Path
 from contextlib import contextmanager
 
@@ -22,6 +25,13 @@ from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
 
 from neurop_forge.core.block_schema import NeuropBlock
+from neurop_forge.library.block_header import BlockHeader
+from neurop_forge.library.block_store import BlockStore, LazyBlockMapping
+from neurop_forge.library.packed_archive import default_archive_path
+from neurop_forge.runtime.compiled_cache import configure_compiled_block_cache
+from neurop_forge.runtime.executor import BlockExecutor
+from neurop_forge.runtime.process_pool import PooledBlockExecutor
+from neurop_forge.runtime.result_cache import ResultCache
 from neurop_forge.compliance.audit_chain import AuditChain
 from neurop_forge.compliance.policy_engine import PolicyEngine
 from api.templates.demo_templates import (
@@ -106,6 +116,26 @@ if STATIC_DIR.exists():
 API_KEYS: Dict[str, Dict[str, Any]] = {}
 USAGE_LOG: List[Dict[str, Any]] = []
 LIBRARY_PATH = Path(".neurop_expanded_library")
+# Load block headers at startup and build full blocks on first access
+# (NEUROP_LAZY_LIBRARY=1). Off by default: eager loading parses every block once.
+LAZY_LIBRARY = os.environ.get("NEUROP_LAZY_LIBRARY", "0") == "1"
+# Processes used to parse block files when there is no packed archive (0 = one per CPU).
+LOAD_WORKERS = int(os.environ.get("NEUROP_LOAD_WORKERS", "0"))
+# Lazy mode: read block headers straight from the mmap'd archive, which all
+# uvicorn workers share, instead of copying the catalog into each worker.
+SHARED_CATALOG = os.environ.get("NEUROP_SHARED_CATALOG", "1") != "0"
+# Lazy mode: max hydrated blocks per worker (LRU; 0 = keep every block once built).
+HYDRATED_CACHE_SIZE = int(os.environ.get("NEUROP_HYDRATED_CACHE_SIZE", "512"))
+# Compiled block functions kept per worker, shared by every BlockExecutor (LRU).
+COMPILED_CACHE_SIZE = int(os.environ.get("NEUROP_COMPILED_CACHE_SIZE", "1024"))
+# Run /execute-block and /demo/execute in this many worker processes, with
+# hard timeouts and rlimits (0 = run blocks in the API process).
+EXECUTION_PROCESSES = int(os.environ.get("NEUROP_EXECUTION_PROCESSES", "0"))
+# Cached results of pure, deterministic blocks for the execution endpoints
+# (0 = no result caching).
+RESULT_CACHE_SIZE = int(os.environ.get("NEUROP_RESULT_CACHE_SIZE", "0"))
+# Required by /admin/* endpoints; they are disabled when unset.
+ADMIN_KEY = os.environ.get("NEUROP_ADMIN_KEY")
 REPORTS_STORAGE: Dict[str, Dict[str, Any]] = {}
 
 DATABASE_URL = os.environ.get("DATABASE_URL")
@@ -296,7 +326,10 @@ def delete_report_from_db(report_id: str) -> bool:
 
 audit_chain: Optional[AuditChain] = None
 policy_engine: Optional[PolicyEngine] = None
-block_library: Dict[str, NeuropBlock] = {}
+block_library: Mapping[str, NeuropBlock] = {}
+library_store: Optional[BlockStore] = None
+# Shared by the execution endpoints so signatures and compiled functions stay warm.
+block_executor: Optional[BlockExecutor] = None
 
 
 class ExecuteRequest(BaseModel):
@@ -347,6 +380,17 @@ def get_api_key(x_api_key: str = Header(None)) -> str:
     return x_api_key
 
 
+def get_admin_key(x_admin_key: str = Header(None)) -> str:
+    """Validate the admin key (NEUROP_ADMIN_KEY) from header."""
+    if not ADMIN_KEY:
+        raise HTTPException(status_code=503, detail="Admin endpoints are disabled. Set NEUROP_ADMIN_KEY.")
+    
+    if not x_admin_key or not hmac.compare_digest(x_admin_key, ADMIN_KEY):
+        raise HTTPException(status_code=403, detail="Invalid admin key. Use X-Admin-Key header.")
+    
+    return x_admin_key
+
+
 def log_usage(api_key: str, endpoint: str, query: str, success: bool, execution_time_ms: float):
     """Log API usage for analytics."""
     USAGE_LOG.append({
@@ -363,34 +407,77 @@ def log_usage(api_key: str, endpoint: str, query: str, success: bool, execution_
 
 
 def load_library():
-    """Load the block library from disk."""
-    global audit_chain, policy_engine, block_library
+    """Load the block library from disk (packed archive when available)."""
+    global audit_chain, policy_engine, block_library, library_store, block_executor
     
-    if not LIBRARY_PATH.exists():
+    if not LIBRARY_PATH.exists() and not default_archive_path(LIBRARY_PATH).exists():
         print(f"Library path {LIBRARY_PATH} does not exist")
         return False
     
     audit_chain = AuditChain()
     policy_engine = PolicyEngine()
+    configure_compiled_block_cache(COMPILED_CACHE_SIZE)
+    if isinstance(block_executor, PooledBlockExecutor):
+        block_executor.close()
+    result_cache = ResultCache(max_entries=RESULT_CACHE_SIZE) if RESULT_CACHE_SIZE > 0 else None
+    if EXECUTION_PROCESSES > 0:
+        block_executor = PooledBlockExecutor(workers=EXECUTION_PROCESSES, result_cache=result_cache)
+    else:
+        block_executor = BlockExecutor(result_cache=result_cache)
+    
+    # Hydrated blocks are kept in a bounded LRU so scans of the whole library
+    # don't leave every block built in every worker; 0 lifts the bound.
+    library_store = BlockStore(
+        storage_path=str(LIBRARY_PATH),
+        lazy=LAZY_LIBRARY,
+        hydrated_cache_size=HYDRATED_CACHE_SIZE or None,
+        workers=LOAD_WORKERS,
+        shared_catalog=SHARED_CATALOG,
+    )
+    for error in library_store.get_load_errors():
+        print(error)
     
-    block_count = 0
-    
-    for block_file in LIBRARY_PATH.glob("*.json"):
-        try:
-            with open(block_file, "r") as f:
-                block_data = json.load(f)
-            
-            block = NeuropBlock.from_dict(block_data)
-            block_id = block_data.get("identity", {}).get("content_hash", block_file.stem)
-            block_library[block_id] = block
-            block_count += 1
-            
-        except Exception as e:
-            print(f"Error loading block {block_file}: {e}")
-            continue
+    if LAZY_LIBRARY:
+        block_library = LazyBlockMapping(library_store)
+        print(f"Loaded {len(block_library)} block headers (lazy)")
+    else:
+        block_library = _eager_block_mapping(library_store)
+        print(f"Loaded {len(block_library)} blocks")
+    return len(block_library) > 0
+
+
+def _eager_block_mapping(store: BlockStore) -> Dict[str, NeuropBlock]:
+    """Map short block id (first 16 hex chars) to block for an eager store."""
+    return {block.get_identity_hash()[:16]: block for block in store.get_all()}
+
+
+def iter_block_headers() -> Iterator[Tuple[str, BlockHeader]]:
+    """
+    Iterate (short block id, header) over the library without hydrating.
     
-    print(f"Loaded {block_count} blocks")
-    return block_count > 0
+    Endpoints that list, count or search blocks only need header fields,
+    so in lazy mode they must not go through block_library.values().
+    """
+    if library_store is None:
+        return
+    for header in library_store.iter_headers():
+        yield header.identity[:16], header
+
+
+def find_block(name: str) -> Tuple[Optional[str], Optional[NeuropBlock]]:
+    """Resolve a block name to (short block id, block), hydrating only that block."""
+    if library_store is None:
+        return None, None
+    identity = library_store.find_by_name(name)
+    block = library_store.get(identity) if identity is not None else None
+    if block is None:
+        return None, None
+    return identity[:16], block
+
+
+def header_params(params: Tuple[Tuple[str, str], ...]) -> List[Dict[str, str]]:
+    """Interface parameters of a header as [{"name", "type"}]."""
+    return [{"name": name, "type": data_type} for name, data_type in params]
 
 
 @app.on_event("startup")
@@ -400,6 +487,19 @@ async def startup():
     init_db()
 
 
+@app.on_event("shutdown")
+async def shutdown():
+    """Stop execution worker processes."""
+    if isinstance(block_executor, PooledBlockExecutor):
+        block_executor.close()
+
+
+async def run_block(block: NeuropBlock, inputs: Dict[str, Any]) -> tuple:
+    """Execute a block with the shared executor without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, block_executor.execute, block, inputs)
+
+
 @app.get("/", response_model=HealthResponse)
 async def root():
     """Health check endpoint."""
@@ -442,15 +542,15 @@ async def search(request: SearchRequest, api_key: str = Depends(get_api_key)):
         scored_blocks = []
         seen_names = set()
         
-        for block_id, block in block_library.items():
-            if block.metadata.name in seen_names:
+        for block_id, header in iter_block_headers():
+            if header.name in seen_names:
                 continue
-            seen_names.add(block.metadata.name)
+            seen_names.add(header.name)
             
             score = 0.0
-            name_lower = block.metadata.name.lower()
-            desc_lower = block.metadata.description.lower() if block.metadata.description else ""
-            category_lower = block.metadata.category.lower() if block.metadata.category else ""
+            name_lower = header.name.lower()
+            desc_lower = header.description.lower() if header.description else ""
+            category_lower = header.category.lower() if header.category else ""
             
             for word in query_words:
                 if word in name_lower:
@@ -461,7 +561,7 @@ async def search(request: SearchRequest, api_key: str = Depends(get_api_key)):
                     score += 0.5
             
             if score > 0:
-                category = block.metadata.category.lower() if block.metadata.category else "utility"
+                category = header.category.lower() if header.category else "utility"
                 operation_map = {
                     "validation": "validate",
                     "arithmetic": "calculate",
@@ -478,11 +578,11 @@ async def search(request: SearchRequest, api_key: str = Depends(get_api_key)):
                 operation = operation_map.get(category, "transform")
                 
                 scored_blocks.append({
-                    "name": block.metadata.name,
-                    "description": block.metadata.description,
-                    "category": block.metadata.category,
+                    "name": header.name,
+                    "description": header.description,
+                    "category": header.category,
                     "operation": operation,
-                    "inputs": [p.name for p in block.interface.inputs],
+                    "inputs": [name for name, _ in header.input_types],
                     "score": score,
                 })
         
@@ -539,14 +639,7 @@ async def execute_block_direct(request: DirectExecuteRequest, api_key: str = Dep
     if not block_library:
         raise HTTPException(status_code=503, detail="Library not loaded")
     
-    target_block = None
-    target_block_id = None
-    
-    for block_id, block in block_library.items():
-        if block.metadata.name == request.block_name:
-            target_block = block
-            target_block_id = block_id
-            break
+    target_block_id, target_block = find_block(request.block_name)
     
     if target_block is None:
         execution_time = (time.time() - start_time) * 1000
@@ -556,14 +649,11 @@ async def execute_block_direct(request: DirectExecuteRequest, api_key: str = Dep
             result=None,
             execution_time_ms=execution_time,
             error=f"Block '{request.block_name}' not found in library",
-            debug_info={"available_blocks_sample": list(block.metadata.name for block in list(block_library.values())[:10])}
+            debug_info={"available_blocks_sample": [header.name for _, header in islice(iter_block_headers(), 10)]}
         )
     
     try:
-        from neurop_forge.runtime.executor import BlockExecutor
-        block_executor = BlockExecutor()
-        
-        outputs, error = block_executor.execute(target_block, request.inputs)
+        outputs, error = await run_block(target_block, request.inputs)
         
         execution_time = (time.time() - start_time) * 1000
         
@@ -614,14 +704,14 @@ async def list_blocks(api_key: str = Depends(get_api_key), limit: int = 50, cate
         raise HTTPException(status_code=503, detail="Library not loaded")
     
     blocks = []
-    for block_id, block in block_library.items():
-        if category and block.metadata.category.lower() != category.lower():
+    for block_id, header in iter_block_headers():
+        if category and header.category.lower() != category.lower():
             continue
         blocks.append({
-            "name": block.metadata.name,
-            "category": block.metadata.category,
-            "description": block.metadata.description,
-            "inputs": [p.name for p in block.interface.inputs],
+            "name": header.name,
+            "category": header.category,
+            "description": header.description,
+            "inputs": [name for name, _ in header.input_types],
         })
         if len(blocks) >= limit:
             break
@@ -636,8 +726,8 @@ async def stats(api_key: str = Depends(get_api_key)):
         raise HTTPException(status_code=503, detail="Library not loaded")
     
     categories = {}
-    for block in block_library.values():
-        cat = block.metadata.category
+    for _, header in iter_block_headers():
+        cat = header.category
         categories[cat] = categories.get(cat, 0) + 1
     
     return {
@@ -649,10 +739,37 @@ async def stats(api_key: str = Depends(get_api_key)):
             "total_requests": len(USAGE_LOG),
             "recent_success_rate": sum(1 for u in USAGE_LOG[-100:] if u["success"]) / max(len(USAGE_LOG[-100:]), 1),
         },
+        "compiled_cache": block_executor.compiled_cache.get_statistics() if block_executor else None,
+        "execution_pool": block_executor.get_statistics() if isinstance(block_executor, PooledBlockExecutor) else None,
+        "result_cache": block_executor.result_cache.get_statistics() if block_executor and block_executor.result_cache else None,
         "version": "2.0.0",
     }
 
 
+@app.post("/admin/reload")
+async def admin_reload(admin_key: str = Depends(get_admin_key)):
+    """Reload only the block files that changed on disk since the last load."""
+    global block_library
+    
+    if library_store is None:
+        raise HTTPException(status_code=503, detail="Library not loaded")
+    
+    result = library_store.refresh()
+    if result.has_changes():
+        if isinstance(block_library, LazyBlockMapping):
+            block_library.sync()
+        else:
+            block_library = _eager_block_mapping(library_store)
+    
+    for error in result.errors:
+        print(error)
+    
+    return {
+        **result.to_dict(),
+        "block_count": len(block_library),
+    }
+
+
 @app.get("/audit/chain")
 async def get_audit_chain(api_key: str = Depends(get_api_key)):
     """Get the audit chain for verification."""
@@ -1321,19 +1438,19 @@ async def demo_list_blocks(request: Request, limit: int = 100, category: Optiona
     blocks = []
     categories_count: Dict[str, int] = {}
     
-    for block_id, block in block_library.items():
-        cat = block.metadata.category
+    for block_id, header in iter_block_headers():
+        cat = header.category
         categories_count[cat] = categories_count.get(cat, 0) + 1
         
         if category and cat.lower() != category.lower():
             continue
         
         blocks.append({
-            "name": block.metadata.name,
+            "name": header.name,
             "category": cat,
-            "description": block.metadata.description,
-            "inputs": [{"name": p.name, "type": p.data_type.value if hasattr(p.data_type, 'value') else str(p.data_type)} for p in block.interface.inputs],
-            "outputs": [{"name": p.name, "type": p.data_type.value if hasattr(p.data_type, 'value') else str(p.data_type)} for p in block.interface.outputs],
+            "description": header.description,
+            "inputs": header_params(header.input_types),
+            "outputs": header_params(header.output_types),
         })
         
         if len(blocks) >= limit:
@@ -1369,15 +1486,15 @@ async def demo_search(request: Request, query: str):
     scored_blocks = []
     seen_names = set()
     
-    for block_id, block in block_library.items():
-        if block.metadata.name in seen_names:
+    for block_id, header in iter_block_headers():
+        if header.name in seen_names:
             continue
-        seen_names.add(block.metadata.name)
+        seen_names.add(header.name)
         
         score = 0.0
-        name_lower = block.metadata.name.lower()
-        desc_lower = block.metadata.description.lower() if block.metadata.description else ""
-        category_lower = block.metadata.category.lower() if block.metadata.category else ""
+        name_lower = header.name.lower()
+        desc_lower = header.description.lower() if header.description else ""
+        category_lower = header.category.lower() if header.category else ""
         
         for word in query_words:
             if word in name_lower:
@@ -1389,11 +1506,11 @@ async def demo_search(request: Request, query: str):
         
         if score > 0:
             scored_blocks.append({
-                "name": block.metadata.name,
-                "category": block.metadata.category,
-                "description": block.metadata.description,
-                "inputs": [{"name": p.name, "type": p.data_type.value if hasattr(p.data_type, 'value') else str(p.data_type)} for p in block.interface.inputs],
-                "outputs": [{"name": p.name, "type": p.data_type.value if hasattr(p.data_type, 'value') else str(p.data_type)} for p in block.interface.outputs],
+                "name": header.name,
+                "category": header.category,
+                "description": header.description,
+                "inputs": header_params(header.input_types),
+                "outputs": header_params(header.output_types),
                 "score": score,
             })
     
@@ -1429,11 +1546,7 @@ async def demo_execute(request: Request, exec_request: DemoExecuteRequest):
     execution_id = str(uuid.uuid4())[:8]
     
     # Find the block
-    target_block = None
-    for block_id, block in block_library.items():
-        if block.metadata.name == exec_request.block_name:
-            target_block = block
-            break
+    _, target_block = find_block(exec_request.block_name)
     
     if target_block is None:
         return {
@@ -1446,10 +1559,7 @@ async def demo_execute(request: Request, exec_request: DemoExecuteRequest):
         }
     
     try:
-        from neurop_forge.runtime.executor import BlockExecutor
-        block_executor = BlockExecutor()
-        
-        outputs, error = block_executor.execute(target_block, exec_request.inputs)
+        outputs, error = await run_block(target_block, exec_request.inputs)
         
         execution_time = (time.time() - start_time) * 1000
         
@@ -1710,11 +1820,7 @@ After getting results, provide a brief summary."""
                 block_name = tool_call.function.name
                 args = json.loads(tool_call.function.arguments)
                 
-                target_block = None
-                for block_id, block in block_library.items():
-                    if block.metadata.name == block_name:
-                        target_block = block
-                        break
+                _, target_block = find_block(block_name)
                 
                 if target_block:
                     outputs, error = block_executor.execute(target_block, args)
@@ -1810,8 +1916,8 @@ async def demo_categories(request: Request):
         raise HTTPException(status_code=503, detail="Library not loaded")
     
     categories: Dict[str, int] = {}
-    for block in block_library.values():
-        cat = block.metadata.category
+    for _, header in iter_block_headers():
+        cat = header.category
         categories[cat] = categories.get(cat, 0) + 1
     
     # Sort by count descending
@@ -1863,24 +1969,24 @@ async def ai_chat(req: AIChatRequest, request: Request):
                       'contains_substring', 'split_by_delimiter'}
     
     # First pass: add priority blocks by semantic name (block.metadata.name)
-    for block_id, block in block_library.items():
-        semantic_name = block.metadata.name
+    for block_id, header in iter_block_headers():
+        semantic_name = header.name
         if semantic_name in priority_names:
-            inputs = [f"{p.name}: {p.data_type.value}" for p in block.interface.inputs]
-            block_list.append(f"- {semantic_name}({', '.join(inputs)}): {block.metadata.description[:80]}")
+            inputs = [f"{name}: {data_type}" for name, data_type in header.input_types]
+            block_list.append(f"- {semantic_name}({', '.join(inputs)}): {header.description[:80]}")
             priority_block_names.add(semantic_name)
     
     # Then add samples from each category (using semantic names)
-    for block_id, block in block_library.items():
+    for block_id, header in iter_block_headers():
         if len(block_list) >= 150:
             break
-        semantic_name = block.metadata.name
-        cat = block.metadata.category
+        semantic_name = header.name
+        cat = header.category
         if categories_seen.get(cat, 0) < 15:  # Max 15 per category
             categories_seen[cat] = categories_seen.get(cat, 0) + 1
             if semantic_name not in priority_block_names:
-                inputs = [f"{p.name}: {p.data_type.value}" for p in block.interface.inputs]
-                block_list.append(f"- {semantic_name}({', '.join(inputs)}): {block.metadata.description[:80]}")
+                inputs = [f"{name}: {data_type}" for name, data_type in header.input_types]
+                block_list.append(f"- {semantic_name}({', '.join(inputs)}): {header.description[:80]}")
     
     blocks_context = "\n".join(block_list)
     
@@ -1947,11 +2053,7 @@ Respond with ONLY the JSON, no other text."""
             inputs = ai_json.get("inputs", {})
             
             # Find block by semantic name (same as /demo/execute)
-            target_block = None
-            for block_id, block in block_library.items():
-                if block.metadata.name == block_name:
-                    target_block = block
-                    break
+            _, target_block = find_block(block_name) if block_name else (None, None)
             
             if not block_name or target_block is None:
                 return {"success": False, "error": f"Block '{block_name}' not found"}
@@ -1961,9 +2063,7 @@ Respond with ONLY the JSON, no other text."""
             start_time = time.time()
             
             try:
-                from neurop_forge.runtime.executor import BlockExecutor
-                block_executor = BlockExecutor()
-                result, error = block_executor.execute(block, inputs)
+                result, error = await run_block(block, inputs)
                 
                 if error:
                     return {"success": False, "error": f"Execution error: {error}", "block": block_name}
@@ -2639,9 +2739,9 @@ async def demo_ai_policy_execute(request: Request, req: AIPolicyRequest):
         import httpx
         
         block_samples = []
-        for block_id, block in list(block_library.items())[:100]:
-            name = block.metadata.name
-            inputs = [f"{p.name}: {p.data_type.value}" for p in block.interface.inputs]
+        for block_id, header in islice(iter_block_headers(), 100):
+            name = header.name
+            inputs = [f"{param}: {data_type}" for param, data_type in header.input_types]
             block_samples.append(f"{name}({', '.join(inputs)})")
         
         system_prompt = f"""You execute verified function blocks. Available blocks:
@@ -2695,11 +2795,7 @@ If no matching block, respond: {{"block": "none", "reason": "description"}}"""
                         "violation": violation
                     }
                 
-                target_block = None
-                for bid, b in block_library.items():
-                    if b.metadata.name == block_name:
-                        target_block = b
-                        break
+                _, target_block = find_block(block_name)
                 
                 if not target_block:
                     return {"status": "blocked", "attempted_block": block_name, "violation": f"Block '{block_name}' not in verified library"}
@@ -2741,11 +2837,7 @@ async def demo_policy_execute(request: Request, req: PolicyExecuteRequest):
             "ai_attempted": True
         }
     
-    target_block = None
-    for block_id, block in block_library.items():
-        if block.metadata.name == req.block_name:
-            target_block = block
-            break
+    _, target_block = find_block(req.block_name)
     
     if not target_block:
         return {
@@ -3728,11 +3820,7 @@ Start executing now. Call multiple functions to complete the task."""
                         })
                         continue
                     
-                    target_block = None
-                    for b in block_library.values():
-                        if b.metadata.name == func_name:
-                            target_block = b
-                            break
+                    _, target_block = find_block(func_name)
                     
                     if not target_block:
                         blocks_blocked += 1
@@ -3769,10 +3857,8 @@ Start executing now. Call multiple functions to complete the task."""
                         "block_data": format_block_for_display(target_block, func_args, None, 0)
                     })
                     
-                    from neurop_forge.runtime.executor import BlockExecutor
-                    executor = BlockExecutor()
                     coerced = coerce_block_inputs(target_block, func_args)
-                    outputs, error = executor.execute(target_block, coerced)
+                    outputs, error = await run_block(target_block, coerced)
                     
                     if error is None:
                         blocks_executed += 1
@@ -5305,15 +5391,12 @@ def _compute_category_cache():
         return _cached_categories
     
     category_counts = {}
-    for hash_id, block in block_library.items():
-        try:
-            name = block.metadata.name if hasattr(block.metadata, 'name') else hash_id
-            if name.startswith('_'):
-                continue
-            category = block.metadata.category if hasattr(block.metadata, 'category') else "general"
-            category_counts[category] = category_counts.get(category, 0) + 1
-        except:
+    for hash_id, header in iter_block_headers():
+        name = header.name
+        if name.startswith('_'):
             continue
+        category = header.category
+        category_counts[category] = category_counts.get(category, 0) + 1
     
     categories = [{"name": cat, "count": count} for cat, count in sorted(category_counts.items())]
     total = sum(c["count"] for c in categories)
@@ -5336,17 +5419,14 @@ def _get_blocks_for_category(category: str):
         return _cached_blocks_by_category[category]
     
     blocks = []
-    for hash_id, block in block_library.items():
-        try:
-            name = block.metadata.name if hasattr(block.metadata, 'name') else hash_id
-            if name.startswith('_'):
-                continue
-            block_category = block.metadata.category if hasattr(block.metadata, 'category') else "general"
-            if block_category != category:
-                continue
-            description = block.metadata.description if hasattr(block.metadata, 'description') else block.metadata.intent
-        except:
+    for hash_id, header in iter_block_headers():
+        name = header.name
+        if name.startswith('_'):
+            continue
+        block_category = header.category
+        if block_category != category:
             continue
+        description = header.description
         blocks.append({
             "name": name,
             "category": block_category,
@@ -5387,11 +5467,7 @@ async def get_library_blocks(category: str = None, page: int = 0, limit: int = 5
 @app.get("/api/library/block/{block_name}")
 async def get_library_block_detail(block_name: str):
     """Get full block details for the detail modal."""
-    block = None
-    for hash_id, b in block_library.items():
-        if b.metadata.name == block_name:
-            block = b
-            break
+    _, block = find_block(block_name)
     
     if block is None:
         raise HTTPException(status_code=404, detail=f"Block '{block_name}' not found")
@@ -5488,9 +5564,9 @@ async def run_microsoft_demo(request: Request):
         
         # Build block list for AI context
         blocks_with_inputs = []
-        for block in list(block_library.values())[:40]:
-            input_names = [i.name for i in block.interface.inputs] if block.interface and block.interface.inputs else []
-            blocks_with_inputs.append(f"- {block.metadata.name}({', '.join(input_names)})")
+        for _, header in islice(iter_block_headers(), 40):
+            input_names = [name for name, _ in header.input_types]
+            blocks_with_inputs.append(f"- {header.name}({', '.join(input_names)})")
         blocks_list = "\n".join(blocks_with_inputs)
         
         # Create system prompt for AI to follow script
@@ -5545,11 +5621,7 @@ Execute ONE step per response. Be precise with inputs."""
                     block_name = parsed.get("block", "")
                     inputs = parsed.get("inputs", {})
                     
-                    target_block = None
-                    for b in block_library.values():
-                        if b.metadata.name == block_name:
-                            target_block = b
-                            break
+                    _, target_block = find_block(block_name)
                     
                     if target_block:
                         from neurop_forge.runtime.executor import BlockExecutor
@@ -5675,9 +5747,9 @@ async def run_google_demo(request: Request):
         
         # Build block list for AI context
         blocks_with_inputs = []
-        for block in list(block_library.values())[:40]:
-            input_names = [i.name for i in block.interface.inputs] if block.interface and block.interface.inputs else []
-            blocks_with_inputs.append(f"- {block.metadata.name}({', '.join(input_names)})")
+        for _, header in islice(iter_block_headers(), 40):
+            input_names = [name for name, _ in header.input_types]
+            blocks_with_inputs.append(f"- {header.name}({', '.join(input_names)})")
         blocks_list = "\n".join(blocks_with_inputs)
         
         # Create system prompt for AI to follow script
@@ -5732,11 +5804,7 @@ Execute ONE step per response. Be precise with inputs."""
                     block_name = parsed.get("block", "")
                     inputs = parsed.get("inputs", {})
                     
-                    target_block = None
-                    for b in block_library.values():
-                        if b.metadata.name == block_name:
-                            target_block = b
-                            break
+                    _, target_block = find_block(block_name)
                     
                     if target_block:
                         from neurop_forge.runtime.executor import BlockExecutor
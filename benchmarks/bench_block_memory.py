@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Block memory benchmark
+======================
+Measures the memory retained per loaded block: the NeuropBlock object
+graph, its BlockIndexer entry and its BlockHeader. Blocks are parsed from
+the raw file contents inside the measurement and the parsed dicts are
+dropped, so strings count only when a loaded object keeps them.
+
+Memory is measured with tracemalloc after a full GC, as bytes retained
+by the loaded objects divided by the number of blocks. NeuropBlocks are
+measured first, in a fresh process, so records shared with an earlier
+load are not counted as free; "released" is what the shared-record
+tables still hold once those blocks are dropped.
+
+Usage:
+    python benchmarks/bench_block_memory.py
+    python benchmarks/bench_block_memory.py --library .neurop_expanded_library
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from neurop_forge.core.block_schema import NeuropBlock
+from neurop_forge.library.block_header import BlockHeader
+from neurop_forge.library.indexer import BlockIndexer
+
+
+def retained_bytes(build: Callable[[], Any]) -> Tuple[int, int]:
+    """
+    Bytes still allocated by build()'s result after a full collection,
+    and bytes still allocated once that result is dropped.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    del result
+    gc.collect()
+    released = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, released - before
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--library", "-l", default=".neurop_expanded_library")
+    args = parser.parse_args()
+
+    raw_files: List[bytes] = [
+        path.read_bytes() for path in sorted(Path(args.library).glob("*.json"))
+    ]
+    count = len(raw_files)
+    print(f"Library: {args.library} ({count} blocks)")
+    print()
+
+    blocks: List[NeuropBlock] = []
+
+    def build_index() -> BlockIndexer:
+        indexer = BlockIndexer()
+        for block in blocks:
+            indexer.index_block(block)
+        return indexer
+
+    measurements = [
+        ("NeuropBlock", lambda: [NeuropBlock.from_dict(json.loads(raw)) for raw in raw_files]),
+        ("BlockHeader", lambda: [BlockHeader.from_block_data(json.loads(raw)) for raw in raw_files]),
+        ("IndexEntry (+ indexes)", build_index),
+    ]
+
+    print(f"  {'object':<24}  {'total (MB)':>10}  {'bytes/block':>12}  {'released':>9}")
+    for label, build in measurements:
+        if label.startswith("IndexEntry"):
+            blocks.extend(NeuropBlock.from_dict(json.loads(raw)) for raw in raw_files)
+        total, released = retained_bytes(build)
+        print(f"  {label:<24}  {total / 1024 / 1024:>10.2f}  {total / count:>12.0f}  {released / count:>9.0f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Bytecode cache benchmark
+========================
+Measures the time a fresh process spends compiling every block of a
+library, without a bytecode cache, with an empty one (compile and write)
+and with a warm one (load only). Each run is a new interpreter, as a
+pool worker or CLI invocation would be.
+
+Usage:
+    python benchmarks/bench_bytecode_cache.py
+    python benchmarks/bench_bytecode_cache.py --library .neurop_expanded_library
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from neurop_forge.core.block_schema import NeuropBlock
+from neurop_forge.runtime.bytecode_cache import BytecodeCache
+from neurop_forge.runtime.compiled_cache import CompiledBlockCache
+from neurop_forge.runtime.executor import build_execution_namespace
+
+
+def compile_library(library: str, bytecode_dir: Optional[str]) -> None:
+    """Compile every block of a library and print the time it took, in ms."""
+    blocks = [
+        NeuropBlock.from_dict(json.loads(path.read_bytes()))
+        for path in sorted(Path(library).glob("*.json"))
+    ]
+    cache = CompiledBlockCache(
+        len(blocks), BytecodeCache(bytecode_dir) if bytecode_dir else None,
+    )
+    namespace = build_execution_namespace()
+    start = time.perf_counter()
+    for block in blocks:
+        try:
+            cache.get_or_compile(
+                block.get_identity_hash(), block.logic.strip(), block.metadata.name, namespace,
+            )
+        except Exception:
+            pass
+    print((time.perf_counter() - start) * 1000)
+
+
+def run_child(library: str, bytecode_dir: Optional[str]) -> float:
+    """Milliseconds a fresh interpreter spends compiling the library."""
+    output = subprocess.run(
+        [sys.executable, __file__, "--library", library, "--child", bytecode_dir or ""],
+        capture_output=True, text=True, check=True, cwd=ROOT,
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--library", "-l", default=".neurop_expanded_library")
+    parser.add_argument("--child", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        compile_library(args.library, args.child or None)
+        return 0
+
+    count = len(list(Path(args.library).glob("*.json")))
+    print(f"Library: {args.library} ({count} blocks)")
+    with tempfile.TemporaryDirectory() as bytecode_dir:
+        print(f"  {'no bytecode cache':<22}  {run_child(args.library, None):>9.1f} ms")
+        print(f"  {'empty cache (write)':<22}  {run_child(args.library, bytecode_dir):>9.1f} ms")
+        print(f"  {'warm cache (load)':<22}  {run_child(args.library, bytecode_dir):>9.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+ExecutionContext benchmark
+==========================
+Measures the two costs of a long session: the latency of
+ExecutionContext.set, and the time and memory of a checkpoint taken after
+a handful of writes to a context that holds many variables.
+
+Checkpoint memory is measured with tracemalloc, as bytes still allocated
+after checkpoint() returns; times are taken in separate runs without
+tracemalloc. A deep copy of the variable store (what a checkpoint used to
+cost) is measured the same way for comparison.
+
+Usage:
+    python benchmarks/bench_context.py
+    python benchmarks/bench_context.py --variables 10000 --changes 10
+"""
+
+import argparse
+import copy
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from neurop_forge.runtime.context import ExecutionContext
+
+
+def timed(build: Callable[[], Any]) -> float:
+    """Milliseconds taken by build()."""
+    start = time.perf_counter()
+    build()
+    return (time.perf_counter() - start) * 1000
+
+
+def retained_bytes(build: Callable[[], Any]) -> Tuple[int, Any]:
+    """(bytes still allocated, result) of build()."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--variables", "-n", type=int, default=10000)
+    parser.add_argument("--changes", "-c", type=int, default=10)
+    parser.add_argument("--checkpoints", "-k", type=int, default=20)
+    args = parser.parse_args()
+
+    context = ExecutionContext()
+    values = [{"value": i, "tags": ["a", "b"]} for i in range(args.variables)]
+
+    start = time.perf_counter()
+    for i, value in enumerate(values):
+        context.set(f"var_{i}", value)
+    set_us = (time.perf_counter() - start) * 1e6 / args.variables
+    print(f"Variables: {args.variables}")
+    print(f"  set latency: {set_us:.2f} us/call")
+    print()
+
+    context.checkpoint("initial")
+
+    print(f"  {'checkpoint':<22}  {'ms':>8}  {'KB retained':>12}")
+    checkpoint_ms = 0.0
+    checkpoint_bytes = 0
+    for k in range(2 * args.checkpoints):
+        for i in range(args.changes):
+            context.set(f"var_{(k * args.changes + i) % args.variables}", k)
+        if k % 2:
+            checkpoint_bytes += retained_bytes(lambda: context.checkpoint(f"step {k}"))[0]
+        else:
+            checkpoint_ms += timed(lambda: context.checkpoint(f"step {k}"))
+    print(
+        f"  {f'{args.changes} changed keys':<22}  {checkpoint_ms / args.checkpoints:>8.3f}"
+        f"  {checkpoint_bytes / args.checkpoints / 1024:>12.1f}"
+    )
+
+    variables = context.get_all_variables()
+    elapsed_ms = timed(lambda: copy.deepcopy(variables))
+    retained = retained_bytes(lambda: copy.deepcopy(variables))[0]
+    print(f"  {'deep copy (for ref.)':<22}  {elapsed_ms:>8.3f}  {retained / 1024:>12.1f}")
+    print()
+
+    print(f"History entries kept: {len(context.get_history())}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
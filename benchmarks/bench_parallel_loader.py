@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Parallel library loader benchmark
+=================================
+Measures wall time of loading the block library from JSON files
+(no packed archive) against the number of worker processes.
+
+Each configuration is run several times and the best time is reported,
+together with the speedup over the in-process (1 worker) load.
+
+Usage:
+    python benchmarks/bench_parallel_loader.py
+    python benchmarks/bench_parallel_loader.py --target header --repeat 5
+    python benchmarks/bench_parallel_loader.py --workers 1 2 4 8
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from neurop_forge.library.parallel_loader import (
+    LoadTarget,
+    default_worker_count,
+    load_library_files,
+)
+
+
+def bench(library: str, target: LoadTarget, workers: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = load_library_files(library, target=target, workers=workers)
+        best = min(best, time.perf_counter() - start)
+    if result.errors:
+        print(f"  ({len(result.errors)} files failed to load)")
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--library", "-l", default=".neurop_expanded_library")
+    parser.add_argument("--target", "-t", choices=[t.value for t in LoadTarget],
+                        default=LoadTarget.BLOCK.value)
+    parser.add_argument("--workers", "-w", type=int, nargs="+", default=None,
+                        help="Worker counts to try (default: 1, 2, 4, ... up to CPU count)")
+    parser.add_argument("--repeat", "-r", type=int, default=3)
+    args = parser.parse_args()
+
+    cpus = default_worker_count()
+    worker_counts = args.workers
+    if not worker_counts:
+        worker_counts = [1]
+        while worker_counts[-1] * 2 <= cpus:
+            worker_counts.append(worker_counts[-1] * 2)
+        if worker_counts[-1] != cpus:
+            worker_counts.append(cpus)
+
+    target = LoadTarget(args.target)
+    file_count = len(list(Path(args.library).glob("*.json")))
+    print(f"Library: {args.library} ({file_count} files), target: {target.value}, CPUs: {cpus}")
+    print()
+    print(f"  {'workers':>8}  {'wall (s)':>10}  {'speedup':>8}")
+
+    baseline = None
+    for workers in worker_counts:
+        elapsed = bench(args.library, target, workers, args.repeat)
+        if baseline is None:
+            baseline = elapsed
+        print(f"  {workers:>8}  {elapsed:>10.3f}  {baseline / elapsed:>7.2f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
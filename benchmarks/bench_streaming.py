@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Streaming execution benchmark
+=============================
+Measures time and peak memory of running a list block over inputs of
+growing length, once with the whole list passed to BlockExecutor.execute
+and once streamed from a generator with BlockExecutor.execute_stream.
+
+Peak memory is measured with tracemalloc and includes building the input
+list for execute; times are taken in separate runs without tracemalloc.
+
+Usage:
+    python benchmarks/bench_streaming.py
+    python benchmarks/bench_streaming.py --block sum_numbers --chunk-size 1000
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from neurop_forge.core.block_schema import NeuropBlock
+from neurop_forge.runtime.executor import BlockExecutor
+from neurop_forge.runtime.streaming import stream_profile_for
+
+
+def find_block(library: str, name: str) -> NeuropBlock:
+    for path in sorted(Path(library).glob("*.json")):
+        data = json.loads(path.read_bytes())
+        if data.get("metadata", {}).get("name") == name:
+            return NeuropBlock.from_dict(data)
+    raise SystemExit(f"No block named {name} in {library}")
+
+
+def measured(run: Callable[[], Any]) -> Tuple[float, int]:
+    """(milliseconds, peak bytes allocated) of run()."""
+    gc.collect()
+    start = time.perf_counter()
+    run()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    gc.collect()
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed_ms, peak
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--library", "-l", default=".neurop_expanded_library")
+    parser.add_argument("--block", "-b", default="sum_numbers")
+    parser.add_argument("--chunk-size", "-c", type=int, default=1000)
+    parser.add_argument("--sizes", "-n", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    block = find_block(args.library, args.block)
+    profile = stream_profile_for(block)
+    if profile is None:
+        raise SystemExit(f"{args.block} has no stream profile")
+    executor = BlockExecutor()
+
+    print(f"Block: {args.block} (chunk size {args.chunk_size})")
+    print(f"  {'items':>10}  {'whole ms':>10}  {'whole KB':>10}  {'stream ms':>10}  {'stream KB':>10}")
+    for size in args.sizes:
+        whole_ms, whole_peak = measured(
+            lambda: executor.execute(block, {profile.input_name: list(range(size))})
+        )
+        stream_ms, stream_peak = measured(
+            lambda: executor.execute_stream(block, iter(range(size)), chunk_size=args.chunk_size)
+        )
+        print(
+            f"  {size:>10}  {whole_ms:>10.1f}  {whole_peak / 1024:>10.1f}"
+            f"  {stream_ms:>10.1f}  {stream_peak / 1024:>10.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Vectorized execution benchmark
+==============================
+Measures throughput of BlockExecutor.execute_many over a numeric column,
+row by row and with vectorize=True (NumPy kernels, see
+runtime.vectorized), and the largest relative difference between the two
+results.
+
+Requires NumPy (pip install neurop-forge[vectorized]).
+
+Usage:
+    python benchmarks/bench_vectorized.py
+    python benchmarks/bench_vectorized.py --rows 1000000 --block celsius_to_fahrenheit
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from neurop_forge.core.block_schema import NeuropBlock
+from neurop_forge.runtime.executor import BlockExecutor
+from neurop_forge.runtime.vectorized import NUMPY_AVAILABLE, VECTOR_KERNELS
+
+DEFAULT_BLOCKS = [
+    "celsius_to_fahrenheit",
+    "calculate_tax_amount",
+    "clamp_value",
+    "calculate_compound_interest",
+    "is_even",
+]
+
+
+def find_blocks(library: str, names: List[str]) -> Dict[str, NeuropBlock]:
+    blocks: Dict[str, NeuropBlock] = {}
+    for path in sorted(Path(library).glob("*.json")):
+        data = json.loads(path.read_bytes())
+        name = data.get("metadata", {}).get("name")
+        if name in names and name not in blocks:
+            blocks[name] = NeuropBlock.from_dict(data)
+    return blocks
+
+
+def make_rows(block: NeuropBlock, count: int, rng: random.Random) -> List[Dict[str, Any]]:
+    """count rows of random values for the block's parameters."""
+    columns = {}
+    for param in block.interface.inputs:
+        if param.data_type.value == "integer":
+            columns[param.name] = [rng.randint(1, 12) for _ in range(count)]
+        else:
+            columns[param.name] = [rng.uniform(0.0, 100.0) for _ in range(count)]
+    return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+
+def max_relative_difference(expected: List[Any], actual: List[Any]) -> float:
+    worst = 0.0
+    for (outputs, error), (vector_outputs, _) in zip(expected, actual):
+        if error is not None:
+            continue
+        a = next(iter(outputs.values()))
+        b = next(iter(vector_outputs.values()))
+        worst = max(worst, abs(a - b) / max(abs(a), 1e-300) if a != b else 0.0)
+    return worst
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--library", "-l", default=".neurop_expanded_library")
+    parser.add_argument("--rows", "-n", type=int, default=1_000_000)
+    parser.add_argument("--block", "-b", action="append", dest="blocks")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if not NUMPY_AVAILABLE:
+        print("NumPy is not installed")
+        return 1
+
+    names = args.blocks or DEFAULT_BLOCKS
+    blocks = find_blocks(args.library, [name for name in names if name in VECTOR_KERNELS])
+    scalar = BlockExecutor()
+    vectorized = BlockExecutor(vectorize=True)
+    rng = random.Random(args.seed)
+
+    print(f"Rows: {args.rows}")
+    print(f"  {'block':<30}  {'scalar rows/s':>14}  {'vector rows/s':>14}  {'speedup':>8}  {'max rel diff':>12}")
+    for name, block in blocks.items():
+        rows = make_rows(block, args.rows, rng)
+
+        start = time.perf_counter()
+        expected = scalar.execute_many(block, rows)
+        scalar_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = vectorized.execute_many(block, rows)
+        vector_s = time.perf_counter() - start
+
+        print(
+            f"  {name:<30}  {args.rows / scalar_s:>14,.0f}  {args.rows / vector_s:>14,.0f}"
+            f"  {scalar_s / vector_s:>7.1f}x  {max_relative_difference(expected, actual):>12.2e}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,12 +5,12 @@ Clean interface for block execution, workflow composition, and block discovery.
 Production-grade with 2,060+ Tier-A deterministic blocks.
 """
 
-from typing import Any, Dict, List, Optional
-from pathlib import Path
-import json
+from typing import AbstractSet, Any, Dict, Iterable, List, Optional
 
 from neurop_forge.core.block_schema import NeuropBlock
 from neurop_forge.library.block_store import BlockStore
+from neurop_forge.library.packed_archive import ArchiveFlagSet, read_registry_names
+from neurop_forge.library.registry_bitsets import load_registry_bitsets
 from neurop_forge.runtime.executor import BlockExecutor
 from neurop_forge.runtime.reference_workflows import (
     ReferenceWorkflowRunner,
@@ -18,6 +18,10 @@ from neurop_forge.runtime.reference_workflows import (
 )
 
 
+LIBRARY_PATH = ".neurop_expanded_library"
+REGISTRY_DIR = ".neurop_verified"
+
+
 class NeuropForge:
     """
     Main API for Neurop Block Forge.
@@ -40,17 +44,36 @@ class NeuropForge:
         print(workflow)
     """
     
-    def __init__(self, auto_load: bool = True):
+    def __init__(
+        self,
+        auto_load: bool = True,
+        lazy: bool = True,
+        hydrated_cache_size: Optional[int] = 512,
+        shared_catalog: bool = True
+    ):
         """
         Initialize Neurop Forge.
         
         Args:
             auto_load: If True, automatically load the block library.
+            lazy: If True (default), load block headers only and build full
+                  blocks on first use.
+            hydrated_cache_size: Max fully built blocks kept in memory when
+                                 lazy (None = unbounded).
+            shared_catalog: If True (default), read headers, names and the
+                            verified/tier-A registries from the packed
+                            archive mapping when it is up to date, instead
+                            of keeping a copy in this process.
         """
-        self._block_store = BlockStore(storage_path=".neurop_expanded_library")
+        self._block_store = BlockStore(
+            storage_path=LIBRARY_PATH,
+            lazy=lazy,
+            hydrated_cache_size=hydrated_cache_size,
+            shared_catalog=shared_catalog,
+        )
         self._executor = BlockExecutor()
-        self._verified_ids: set = set()
-        self._tier_a_ids: set = set()
+        self._verified_ids: AbstractSet[str] = set()
+        self._tier_a_ids: AbstractSet[str] = set()
         self._name_to_id: Dict[str, str] = {}
         self._initialized = False
         
@@ -59,36 +82,54 @@ class NeuropForge:
     
     def _load_registries(self) -> None:
         """Load verified and tier registries from disk."""
-        registry_path = Path(".neurop_verified/registry.json")
-        tier_registry_path = Path(".neurop_verified/tier_registry.json")
-        
-        if registry_path.exists():
-            with open(registry_path) as f:
-                registry_data = json.load(f)
-            for block_id, block_data in registry_data.get("verified_blocks", {}).items():
-                if block_data.get("verified", False):
-                    self._verified_ids.add(block_id)
-                    if "block_name" in block_data:
-                        self._name_to_id[block_data["block_name"]] = block_id
-        
-        if tier_registry_path.exists():
-            with open(tier_registry_path) as f:
-                tier_data = json.load(f)
-                self._tier_a_ids = set(tier_data.get("tier_a", []))
-        
-        for block_id, block in self._block_store._blocks.items():
-            name = block.metadata.name
+        if self._attach_archive_registries():
+            self._initialized = True
+            return
+        
+        # Verified / tier-A membership as bitsets from the registry sidecar
+        # (rebuilt from the registry files when they or the library change).
+        registries = load_registry_bitsets(
+            REGISTRY_DIR, LIBRARY_PATH, headers=self._block_store.iter_headers
+        )
+        self._verified_ids = registries.flag("verified")
+        self._tier_a_ids = registries.flag("tier_a")
+        self._name_to_id = read_registry_names(REGISTRY_DIR)
+        
+        for header in self._block_store.iter_headers():
+            name = header.name
             if name and name not in self._name_to_id:
-                self._name_to_id[name] = block_id
+                self._name_to_id[name] = header.identity
         
         self._initialized = True
     
+    def _attach_archive_registries(self) -> bool:
+        """
+        Use the registry bitsets packed into the archive, if still current.
+        
+        Names then resolve through the archive's name index, which was
+        ordered by the same registry-first rule as _name_to_id.
+        """
+        catalog = self._block_store.shared_catalog
+        if catalog is None:
+            return False
+        archive = catalog.archive
+        if not all(archive.flag_is_fresh(flag) for flag in ("verified", "tier_a")):
+            return False
+        self._verified_ids = ArchiveFlagSet(archive, "verified")
+        self._tier_a_ids = ArchiveFlagSet(archive, "tier_a")
+        return True
+    
     def _resolve_block_id(self, block_id_or_name: str) -> str:
         """Resolve a block name or ID to its ID."""
-        if block_id_or_name in self._block_store._blocks:
+        if self._block_store.exists(block_id_or_name):
             return block_id_or_name
         if block_id_or_name in self._name_to_id:
             return self._name_to_id[block_id_or_name]
+        catalog = self._block_store.shared_catalog
+        if catalog is not None and isinstance(self._verified_ids, ArchiveFlagSet):
+            block_id = catalog.find_by_name(block_id_or_name)
+            if block_id is not None:
+                return block_id
         raise ValueError(f"Block '{block_id_or_name}' not found.")
     
     def execute_block(
@@ -115,6 +156,50 @@ class NeuropForge:
             result = forge.execute_block("reverse_string", {"s": "hello"})
             # Returns: {'result': 'olleh', 'success': True}
         """
+        block = self._get_executable_block(block_id_or_name, tier_a_only)
+        
+        try:
+            outputs, error = self._executor.execute(block, inputs)
+            return self._format_outputs(outputs, error)
+        except Exception as e:
+            return {"result": None, "success": False, "error": str(e)}
+    
+    def execute_block_batch(
+        self,
+        block_id_or_name: str,
+        rows: Iterable[Dict[str, Any]],
+        tier_a_only: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute a verified block once per input row.
+        
+        The block is resolved, tier-checked and compiled once, and trust
+        statistics are recorded once for the batch. A failing row does not
+        stop the batch.
+        
+        Args:
+            block_id_or_name: Block ID or name (e.g., "is_valid_email").
+            rows: Input dictionaries, one per execution.
+            tier_a_only: If True (default), only execute Tier-A deterministic blocks.
+        
+        Returns:
+            One result dictionary per row, in order, shaped like execute_block's.
+        
+        Example:
+            results = forge.execute_block_batch("reverse_string", [{"s": "ab"}, {"s": "cd"}])
+            # Returns: [{'result': 'ba', 'success': True}, {'result': 'dc', 'success': True}]
+        """
+        block = self._get_executable_block(block_id_or_name, tier_a_only)
+        rows = list(rows)
+        
+        try:
+            results = self._executor.execute_many(block, rows)
+        except Exception as e:
+            return [{"result": None, "success": False, "error": str(e)} for _ in rows]
+        return [self._format_outputs(outputs, error) for outputs, error in results]
+    
+    def _get_executable_block(self, block_id_or_name: str, tier_a_only: bool) -> NeuropBlock:
+        """Resolve a block and check it may be executed."""
         if not self._initialized:
             raise RuntimeError("Forge not initialized.")
         
@@ -129,18 +214,18 @@ class NeuropForge:
                 "Set tier_a_only=False to execute."
             )
         
-        block = self._block_store._blocks.get(block_id)
+        block = self._block_store.get(block_id)
         if not block:
             raise ValueError(f"Block '{block_id_or_name}' not found in store.")
-        
-        try:
-            outputs, error = self._executor.execute(block, inputs)
-            if error:
-                return {"result": None, "success": False, "error": error}
-            result = outputs.get("result", outputs.get("output", outputs))
-            return {"result": result, "success": True}
-        except Exception as e:
-            return {"result": None, "success": False, "error": str(e)}
+        return block
+    
+    @staticmethod
+    def _format_outputs(outputs: Dict[str, Any], error: Optional[str]) -> Dict[str, Any]:
+        """Shape executor outputs as an execute_block result."""
+        if error:
+            return {"result": None, "success": False, "error": error}
+        result = outputs.get("result", outputs.get("output", outputs))
+        return {"result": result, "success": True}
     
     def run_workflow(
         self,
@@ -168,7 +253,7 @@ class NeuropForge:
         if not self._initialized:
             raise RuntimeError("Forge not initialized.")
         
-        runner = ReferenceWorkflowRunner(self._block_store)
+        runner = ReferenceWorkflowRunner(self._block_store, verified_ids=self._verified_ids)
         
         available_ids = [w.id for w in runner.get_available_workflows()]
         if workflow_id not in available_ids:
@@ -210,10 +295,16 @@ class NeuropForge:
         if not self._initialized:
             raise RuntimeError("Forge not initialized.")
         
+        candidates = self._verified_ids
+        if tier and tier.upper() == "A":
+            candidates = candidates & self._tier_a_ids
+        elif tier and tier.upper() == "B":
+            candidates = candidates - self._tier_a_ids
+        
         results = []
-        for block_id in self._verified_ids:
-            block = self._block_store._blocks.get(block_id)
-            if not block:
+        for block_id in candidates:
+            header = self._block_store.get_header(block_id)
+            if not header:
                 continue
             
             block_tier = "A" if block_id in self._tier_a_ids else "B"
@@ -221,14 +312,14 @@ class NeuropForge:
             if tier and tier.upper() != block_tier:
                 continue
             
-            block_category = block.metadata.category if block.metadata else "utility"
+            block_category = header.category
             if category and block_category != category:
                 continue
             
             results.append({
                 "id": block_id,
-                "name": block.metadata.name if block.metadata else block_id[:8],
-                "description": block.metadata.description if block.metadata else "",
+                "name": header.name,
+                "description": header.description,
                 "category": block_category,
                 "tier": block_tier
             })
@@ -245,7 +336,7 @@ class NeuropForge:
         Returns:
             List of workflow metadata dictionaries.
         """
-        runner = ReferenceWorkflowRunner(self._block_store)
+        runner = ReferenceWorkflowRunner(self._block_store, verified_ids=self._verified_ids)
         available = runner.get_available_workflows()
         
         return [
@@ -269,7 +360,7 @@ class NeuropForge:
             Dictionary with block details.
         """
         block_id = self._resolve_block_id(block_id_or_name)
-        block = self._block_store._blocks.get(block_id)
+        block = self._block_store.get(block_id)
         
         if not block:
             raise ValueError(f"Block '{block_id_or_name}' not found.")
@@ -287,13 +378,31 @@ class NeuropForge:
             }
         }
     
+    def refresh_library(self) -> Dict[str, Any]:
+        """
+        Reload only the block files that changed since the last load.
+        
+        The registries and name map are rebuilt afterwards; that only reads
+        the registry files and block headers, not full blocks.
+        
+        Returns:
+            Dict with added, updated and removed block ids and load errors
+        """
+        result = self._block_store.refresh()
+        if result.has_changes():
+            self._verified_ids = set()
+            self._tier_a_ids = set()
+            self._name_to_id = {}
+            self._load_registries()
+        return result.to_dict()
+    
     @property
     def stats(self) -> Dict[str, int]:
         """Get library statistics."""
         verified_tier_a = len(self._verified_ids & self._tier_a_ids)
         verified_tier_b = len(self._verified_ids) - verified_tier_a
         return {
-            "total_blocks": len(self._block_store._blocks),
+            "total_blocks": self._block_store.count(),
             "total_verified": len(self._verified_ids),
             "tier_a": verified_tier_a,
             "tier_b": verified_tier_b
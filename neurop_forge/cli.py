@@ -10,11 +10,14 @@ Usage:
     neurop-forge info <block_id>
     neurop-forge workflows
     neurop-forge stats
+    neurop-forge pack [--library <path>] [--output <path>] [--registry <dir>]
+    neurop-forge sqlite [--library <path>] [--output <path>]
 """
 
 import argparse
 import json
 import sys
+from pathlib import Path
 from typing import Optional
 
 from neurop_forge import __version__
@@ -29,6 +32,8 @@ from neurop_forge.standardization import (
     InterfaceNormalizer,
     ParameterMapper,
 )
+from neurop_forge.library.packed_archive import write_packed_library
+from neurop_forge.library.sqlite_store import SQLiteBlockStore, default_database_path
 
 
 def cmd_execute(args) -> int:
@@ -243,7 +248,7 @@ def cmd_dedup(args) -> int:
     print()
     
     try:
-        processor = DeduplicationProcessor(policy=policy)
+        processor = DeduplicationProcessor(policy=policy, workers=args.workers)
         result = processor.run(execute=args.execute)
         report = DeduplicationReport(processor.get_hasher(), result)
         
@@ -272,7 +277,9 @@ def cmd_standardize(args) -> int:
     print()
     
     try:
-        normalizer = InterfaceNormalizer(library_path=".neurop_expanded_library")
+        normalizer = InterfaceNormalizer(
+            library_path=".neurop_expanded_library", workers=args.workers
+        )
         
         if args.execute:
             result = normalizer.normalize(execute=True, preserve_aliases=True)
@@ -321,6 +328,58 @@ def cmd_standardize(args) -> int:
         return 1
 
 
+def cmd_pack(args) -> int:
+    """Pack the block library into a single memory-mappable archive."""
+    print(f"Packing {args.library}...")
+    
+    try:
+        registry_dir = args.registry if Path(args.registry).is_dir() else None
+        result = write_packed_library(args.library, args.output, registry_dir=registry_dir)
+        
+        for err in result.errors[:5]:
+            print(f"  Skipped: {err}", file=sys.stderr)
+        if len(result.errors) > 5:
+            print(f"  ... and {len(result.errors) - 5} more", file=sys.stderr)
+        
+        if not result.is_success():
+            print("Error: No blocks were packed.", file=sys.stderr)
+            return 1
+        
+        print(f"Packed {result.block_count} blocks into {result.archive_path} "
+              f"({result.bytes_written / 1024 / 1024:.1f} MB)")
+        return 0
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
+def cmd_sqlite(args) -> int:
+    """Import the block library into a SQLite block store."""
+    output = args.output or default_database_path(args.library)
+    print(f"Importing {args.library} into {output}...")
+    
+    try:
+        store = SQLiteBlockStore(output)
+        try:
+            before = store.count()
+            loaded = store.import_library(args.library, workers=args.workers)
+            
+            for err in loaded.errors[:5]:
+                print(f"  Skipped: {err.path}: {err.error}", file=sys.stderr)
+            if len(loaded.errors) > 5:
+                print(f"  ... and {len(loaded.errors) - 5} more", file=sys.stderr)
+            
+            imported = store.count() - before
+            print(f"Imported {imported} blocks ({store.count()} total, "
+                  f"full-text search: {'yes' if store.has_fts else 'no'})")
+        finally:
+            store.close()
+        return 0
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
 def main() -> int:
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -380,6 +439,8 @@ def main() -> int:
                              help="Show detailed report with duplicate groups")
     dedup_parser.add_argument("--json", "-j", action="store_true",
                              help="Output JSON report")
+    dedup_parser.add_argument("--workers", "-w", type=int, default=None,
+                             help="Processes for loading block files (default: one per CPU)")
     dedup_parser.set_defaults(func=cmd_dedup)
     
     std_parser = subparsers.add_parser("standardize", help="Standardize parameter names")
@@ -387,8 +448,28 @@ def main() -> int:
                            help="Apply standardization (modifies blocks)")
     std_parser.add_argument("--detailed", "-d", action="store_true",
                            help="Show detailed mapping analysis")
+    std_parser.add_argument("--workers", "-w", type=int, default=None,
+                           help="Processes for loading block files (default: one per CPU)")
     std_parser.set_defaults(func=cmd_standardize)
     
+    pack_parser = subparsers.add_parser("pack", help="Pack the library into a single archive")
+    pack_parser.add_argument("--library", "-l", default=".neurop_expanded_library",
+                            help="Library directory to pack")
+    pack_parser.add_argument("--output", "-o", default=None,
+                            help="Archive path (default: <library>.pack)")
+    pack_parser.add_argument("--registry", "-r", default=".neurop_verified",
+                            help="Verification registry to pack as bitsets")
+    pack_parser.set_defaults(func=cmd_pack)
+    
+    sqlite_parser = subparsers.add_parser("sqlite", help="Import the library into a SQLite store")
+    sqlite_parser.add_argument("--library", "-l", default=".neurop_expanded_library",
+                              help="Library directory to import")
+    sqlite_parser.add_argument("--output", "-o", default=None,
+                              help="Database path (default: <library>.sqlite3)")
+    sqlite_parser.add_argument("--workers", "-w", type=int, default=None,
+                              help="Processes for loading block files (default: one per CPU)")
+    sqlite_parser.set_defaults(func=cmd_sqlite)
+    
     args = parser.parse_args()
     
     if not args.command:
@@ -12,6 +12,10 @@ Every block MUST conform to this schema or be rejected. The schema enforces:
 - Hash-consistent identity
 
 A NeuropBlock is PERFECT only if ALL required sections are present and valid.
+
+All records are slotted, and from_dict interns repeated strings and shares
+identical sub-records (see neurop_forge.core.compact), so a loaded library
+keeps one copy of each repeated value.
 """
 
 from dataclasses import dataclass, field
@@ -20,6 +24,8 @@ from enum import Enum
 from datetime import datetime
 import json
 
+from neurop_forge.core.compact import intern_str, intern_strs, shared, slotted
+
 
 class PurityLevel(Enum):
     """Declares the purity level of a block's logic."""
@@ -83,6 +89,7 @@ class RiskLevel(Enum):
     CRITICAL = "critical"
 
 
+@slotted(weakref=True)
 @dataclass(frozen=True)
 class TypedParameter:
     """A typed parameter for block interfaces."""
@@ -103,15 +110,16 @@ class TypedParameter:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TypedParameter":
-        return cls(
-            name=data["name"],
+        return shared(cls(
+            name=intern_str(data["name"]),
             data_type=DataType(data["data_type"]),
-            description=data["description"],
+            description=intern_str(data["description"]),
             optional=data.get("optional", False),
             default_value=data.get("default_value"),
-        )
+        ))
 
 
+@slotted
 @dataclass(frozen=True)
 class BlockInterface:
     """
@@ -134,12 +142,13 @@ class BlockInterface:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BlockInterface":
         return cls(
-            inputs=tuple(TypedParameter.from_dict(p) for p in data["inputs"]),
-            outputs=tuple(TypedParameter.from_dict(p) for p in data["outputs"]),
+            inputs=shared(tuple(TypedParameter.from_dict(p) for p in data["inputs"])),
+            outputs=shared(tuple(TypedParameter.from_dict(p) for p in data["outputs"])),
             description=data["description"],
         )
 
 
+@slotted(weakref=True)
 @dataclass(frozen=True)
 class BlockConstraints:
     """
@@ -168,17 +177,18 @@ class BlockConstraints:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BlockConstraints":
-        return cls(
+        return shared(cls(
             purity=PurityLevel(data["purity"]),
-            io_operations=frozenset(IOType(io) for io in data["io_operations"]),
-            side_effects=tuple(data["side_effects"]),
+            io_operations=shared(frozenset(IOType(io) for io in data["io_operations"])),
+            side_effects=intern_strs(data["side_effects"]),
             deterministic=data["deterministic"],
             thread_safe=data["thread_safe"],
             max_execution_time_ms=data.get("max_execution_time_ms"),
             max_memory_bytes=data.get("max_memory_bytes"),
-        )
+        ))
 
 
+@slotted
 @dataclass(frozen=True)
 class BlockMetadata:
     """
@@ -217,17 +227,18 @@ class BlockMetadata:
             name=data["name"],
             intent=data["intent"],
             description=data["description"],
-            category=data["category"],
-            tags=tuple(data["tags"]),
-            version=data["version"],
+            category=intern_str(data["category"]),
+            tags=intern_strs(data["tags"]),
+            version=intern_str(data["version"]),
             created_at=data["created_at"],
-            language=data["language"],
-            source_file=data.get("source_file"),
+            language=intern_str(data["language"]),
+            source_file=intern_str(data.get("source_file")),
             source_line_start=data.get("source_line_start"),
             source_line_end=data.get("source_line_end"),
         )
 
 
+@slotted(weakref=True)
 @dataclass(frozen=True)
 class BlockOwnership:
     """Ownership and license provenance for a NeuropBlock."""
@@ -250,16 +261,17 @@ class BlockOwnership:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BlockOwnership":
-        return cls(
+        return shared(cls(
             license_type=LicenseType(data["license_type"]),
-            license_url=data.get("license_url"),
-            original_author=data.get("original_author"),
-            original_repository=data.get("original_repository"),
+            license_url=intern_str(data.get("license_url")),
+            original_author=intern_str(data.get("original_author")),
+            original_repository=intern_str(data.get("original_repository")),
             attribution_required=data["attribution_required"],
             modifications_allowed=data["modifications_allowed"],
-        )
+        ))
 
 
+@slotted
 @dataclass(frozen=True)
 class ValidationRules:
     """Validation rules that must pass for the block to be valid."""
@@ -281,14 +293,15 @@ class ValidationRules:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ValidationRules":
         return cls(
-            input_validators=tuple(data["input_validators"]),
-            output_validators=tuple(data["output_validators"]),
-            invariants=tuple(data["invariants"]),
-            preconditions=tuple(data["preconditions"]),
-            postconditions=tuple(data["postconditions"]),
+            input_validators=intern_strs(data["input_validators"]),
+            output_validators=intern_strs(data["output_validators"]),
+            invariants=intern_strs(data["invariants"]),
+            preconditions=intern_strs(data["preconditions"]),
+            postconditions=intern_strs(data["postconditions"]),
         )
 
 
+@slotted
 @dataclass(frozen=True)
 class TrustScore:
     """Trust and risk assessment for a NeuropBlock."""
@@ -335,14 +348,15 @@ class TrustScore:
             license_score=data["license_score"],
             static_analysis_score=data["static_analysis_score"],
             risk_level=RiskLevel(data["risk_level"]),
-            risk_factors=tuple(data["risk_factors"]),
-            last_verified=data["last_verified"],
+            risk_factors=intern_strs(data["risk_factors"]),
+            last_verified=intern_str(data["last_verified"]),
             execution_count=data.get("execution_count", 0),
             success_count=data.get("success_count", 0),
             failure_count=data.get("failure_count", 0),
         )
 
 
+@slotted(weakref=True)
 @dataclass(frozen=True)
 class FailureModes:
     """Explicit declaration of how a block may fail."""
@@ -363,15 +377,16 @@ class FailureModes:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "FailureModes":
-        return cls(
+        return shared(cls(
             can_fail=data["can_fail"],
             failure_mode=FailureMode(data["failure_mode"]),
-            possible_exceptions=tuple(data["possible_exceptions"]),
-            error_conditions=tuple(data["error_conditions"]),
-            recovery_hints=tuple(data["recovery_hints"]),
-        )
+            possible_exceptions=intern_strs(data["possible_exceptions"]),
+            error_conditions=intern_strs(data["error_conditions"]),
+            recovery_hints=intern_strs(data["recovery_hints"]),
+        ))
 
 
+@slotted(weakref=True)
 @dataclass(frozen=True)
 class CompositionCompatibility:
     """Declares how this block can be composed with others."""
@@ -394,16 +409,17 @@ class CompositionCompatibility:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "CompositionCompatibility":
-        return cls(
+        return shared(cls(
             composable=data["composable"],
-            input_compatible_types=tuple(data["input_compatible_types"]),
-            output_compatible_types=tuple(data["output_compatible_types"]),
-            requires_blocks=tuple(data["requires_blocks"]),
-            conflicts_with=tuple(data["conflicts_with"]),
-            composition_notes=data["composition_notes"],
-        )
+            input_compatible_types=intern_strs(data["input_compatible_types"]),
+            output_compatible_types=intern_strs(data["output_compatible_types"]),
+            requires_blocks=intern_strs(data["requires_blocks"]),
+            conflicts_with=intern_strs(data["conflicts_with"]),
+            composition_notes=intern_str(data["composition_notes"]),
+        ))
 
 
+@slotted
 @dataclass(frozen=True)
 class NeuropBlock:
     """
@@ -481,7 +497,10 @@ class NeuropBlock:
     def from_dict(cls, data: Dict[str, Any]) -> "NeuropBlock":
         """Deserialize block from dictionary representation."""
         return cls(
-            identity=data["identity"],
+            identity={
+                intern_str(key): intern_str(value) if key != "hash_value" else value
+                for key, value in data["identity"].items()
+            },
             ownership=BlockOwnership.from_dict(data["ownership"]),
             metadata=BlockMetadata.from_dict(data["metadata"]),
             interface=BlockInterface.from_dict(data["interface"]),
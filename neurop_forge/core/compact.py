@@ -0,0 +1,122 @@
+"""
+Compact in-memory representation helpers.
+
+A loaded library holds thousands of blocks whose records repeat the same
+small values: categories, data types, license fields, exception names,
+recovery hints, and often whole failure-mode or composition records. These
+helpers keep one copy of each:
+
+- slotted: give a dataclass __slots__ (no per-instance __dict__)
+- intern_str / intern_strs: intern repeated strings
+- shared: return one canonical instance of an immutable value
+
+Only values that are immutable and compared by value are shared, so
+sharing never changes behaviour. The shared table does not keep records
+alive: a record is held weakly and dropped once no loaded block uses it,
+so a replaced library generation is freed. Tuples and frozensets cannot
+be weakly referenced and are kept in a bounded table instead.
+"""
+
+import sys
+import weakref
+from collections import OrderedDict
+from dataclasses import fields
+from typing import Any, Callable, Iterable, Optional, Tuple, TypeVar, Union
+
+
+T = TypeVar("T")
+
+# Canonical tuples and frozensets kept strongly (oldest dropped first)
+MAX_STRONG_SHARED = 4096
+
+_shared: "weakref.WeakValueDictionary[Any, Any]" = weakref.WeakValueDictionary()
+_shared_strong: "OrderedDict[Any, Any]" = OrderedDict()
+
+
+def slotted(
+    cls: Optional[type] = None,
+    *,
+    weakref: bool = False,
+) -> Union[type, Callable[[type], type]]:
+    """
+    Rebuild a dataclass with __slots__.
+
+    Equivalent to @dataclass(slots=True), which needs Python 3.10. Frozen
+    classes also get __getstate__/__setstate__ so instances still pickle
+    (the parallel loader ships blocks between processes). Use
+    @slotted(weakref=True) for records passed to shared().
+    """
+    if cls is None:
+        return lambda target: slotted(target, weakref=weakref)
+    field_names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in field_names:
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = field_names + (("__weakref__",) if weakref else ())
+
+    def __getstate__(self: Any) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in field_names)
+
+    def __setstate__(self: Any, state: Tuple[Any, ...]) -> None:
+        for name, value in zip(field_names, state):
+            object.__setattr__(self, name, value)
+
+    namespace["__getstate__"] = __getstate__
+    namespace["__setstate__"] = __setstate__
+
+    new_cls = type(cls)(cls.__name__, cls.__bases__, namespace)
+    new_cls.__qualname__ = cls.__qualname__
+    return new_cls
+
+
+def intern_str(value: Optional[str]) -> Optional[str]:
+    """Intern a string (None passes through)."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def intern_strs(values: Iterable[str]) -> Tuple[str, ...]:
+    """Tuple of interned strings, itself shared when an equal tuple exists."""
+    return shared(tuple(sys.intern(v) if isinstance(v, str) else v for v in values))
+
+
+def _shared_key(value: Any) -> Tuple[Any, ...]:
+    # Include member types so equal-but-different values (True vs 1,
+    # 1 vs 1.0) are never swapped for one another.
+    if isinstance(value, tuple):
+        return (tuple, tuple(type(v) for v in value), value)
+    # Records are keyed by their field values, not themselves, so the key
+    # does not keep a weakly held record alive.
+    names = getattr(value, "__dataclass_fields__", None)
+    if names is not None:
+        values = tuple(getattr(value, n) for n in names)
+        return (type(value), tuple(map(type, values)), values)
+    return (type(value), value)
+
+
+def shared(value: T) -> T:
+    """
+    Return the canonical instance equal to `value`.
+
+    Values that cannot be hashed (e.g. records holding a list default) are
+    returned unchanged.
+    """
+    try:
+        key = _shared_key(value)
+        if isinstance(value, (tuple, frozenset)):
+            existing = _shared_strong.get(key)
+            if existing is not None:
+                return existing
+            _shared_strong[key] = value
+            if len(_shared_strong) > MAX_STRONG_SHARED:
+                _shared_strong.popitem(last=False)
+            return value
+        return _shared.setdefault(key, value)
+    except TypeError:
+        return value
+
+
+def shared_count() -> int:
+    """Number of distinct values held by shared()."""
+    return len(_shared) + len(_shared_strong)
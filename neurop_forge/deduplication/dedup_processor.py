@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 
+from neurop_forge.library.packed_archive import iter_block_records
 from neurop_forge.deduplication.signature_hasher import SignatureHasher, DuplicateGroup
 from neurop_forge.deduplication.policy_engine import (
     PolicyEngine,
@@ -42,11 +43,13 @@ class DeduplicationProcessor:
         self,
         library_path: str = ".neurop_expanded_library",
         output_path: str = ".neurop_deduplicated_library",
-        policy: DeduplicationPolicy = DeduplicationPolicy.KEEP_BEST
+        policy: DeduplicationPolicy = DeduplicationPolicy.KEEP_BEST,
+        workers: Optional[int] = None
     ):
         self.library_path = Path(library_path)
         self.output_path = Path(output_path)
         self.policy = policy
+        self.workers = workers
         
         self._hasher = SignatureHasher()
         self._policy_engine = PolicyEngine(default_policy=policy)
@@ -60,17 +63,16 @@ class DeduplicationProcessor:
             return 0
         
         count = 0
-        for block_file in self.library_path.glob("*.json"):
+        for block_stem, block_data in iter_block_records(
+            self.library_path, self._result.errors, workers=self.workers
+        ):
             try:
-                with open(block_file) as f:
-                    block_data = json.load(f)
-                
-                block_id = block_data.get("identity", {}).get("hash_value", block_file.stem)
+                block_id = block_data.get("identity", {}).get("hash_value", block_stem)
                 self._blocks[block_id] = block_data
                 self._hasher.add_block(block_data)
                 count += 1
             except Exception as e:
-                self._result.errors.append(f"Error loading {block_file}: {e}")
+                self._result.errors.append(f"Error loading {block_stem}: {e}")
         
         self._result.original_count = count
         return count
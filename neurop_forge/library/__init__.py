@@ -1,15 +1,75 @@
 """Library modules for block storage, indexing, and AI fetch."""
 
-from neurop_forge.library.block_store import BlockStore, StoreResult
+from neurop_forge.library.block_store import (
+    BlockStore,
+    StoreResult,
+    RefreshResult,
+    LazyBlockMapping,
+)
+from neurop_forge.library.change_manifest import ChangeManifest, ManifestDiff
+from neurop_forge.library.block_header import BlockHeader
 from neurop_forge.library.indexer import BlockIndexer, IndexEntry
 from neurop_forge.library.fetch_engine import FetchEngine, FetchResult, BlockGraph
+from neurop_forge.library.packed_archive import (
+    ArchiveFlagSet,
+    ArchiveHeaderCatalog,
+    PackedLibrary,
+    PackResult,
+    write_packed_library,
+    open_library_archive,
+)
+from neurop_forge.library.registry_bitsets import (
+    BlockBitset,
+    OrdinalTable,
+    RegistryBitsets,
+    load_registry_bitsets,
+)
+from neurop_forge.library.generations import Generation, GenerationManager
+from neurop_forge.library.sqlite_store import SQLiteBlockIndexer, SQLiteBlockStore
+from neurop_forge.library.index_snapshot import (
+    IndexSnapshot,
+    load_index_snapshot,
+    write_index_snapshot,
+)
+from neurop_forge.library.parallel_loader import (
+    LoadError,
+    LoadResult,
+    LoadTarget,
+    load_library_files,
+)
 
 __all__ = [
     "BlockStore",
     "StoreResult",
+    "RefreshResult",
+    "LazyBlockMapping",
+    "ChangeManifest",
+    "ManifestDiff",
+    "BlockHeader",
     "BlockIndexer",
     "IndexEntry",
     "FetchEngine",
     "FetchResult",
     "BlockGraph",
+    "ArchiveFlagSet",
+    "ArchiveHeaderCatalog",
+    "PackedLibrary",
+    "PackResult",
+    "write_packed_library",
+    "open_library_archive",
+    "BlockBitset",
+    "OrdinalTable",
+    "RegistryBitsets",
+    "load_registry_bitsets",
+    "Generation",
+    "GenerationManager",
+    "SQLiteBlockStore",
+    "SQLiteBlockIndexer",
+    "IndexSnapshot",
+    "load_index_snapshot",
+    "write_index_snapshot",
+    "LoadError",
+    "LoadResult",
+    "LoadTarget",
+    "load_library_files",
 ]
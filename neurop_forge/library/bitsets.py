@@ -0,0 +1,81 @@
+"""
+Bitmap primitives shared by every block bitset.
+
+Registry flags packed into an archive (ArchiveFlagSet) and the in-memory
+registry and index masks (BlockBitset) both keep one bit per block
+position, least significant bit first within each byte. PositionBitset is
+the read-only set view over such a bitmap; subclasses only say how an
+identity maps to a position and back, and where the bytes live.
+
+A membership test reads one byte of the bitmap, never shifting a
+library-sized integer.
+"""
+
+from collections.abc import Set as AbstractSet
+from typing import Iterable, Iterator, Optional, Set
+
+# Set bit positions of every byte value, for iterating a bitmap.
+_BYTE_BITS = tuple(
+    tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256)
+)
+
+
+def popcount(bits: int) -> int:
+    """Number of set bits (int.bit_count() needs Python 3.10)."""
+    return bin(bits).count("1")
+
+
+def to_bitmap(bits: int) -> bytes:
+    """An integer mask as a bitmap (bit n = byte n // 8, bit n % 8)."""
+    return bits.to_bytes((bits.bit_length() + 7) // 8, "little") if bits > 0 else b""
+
+
+def bit_is_set(bitmap: bytes, position: int, offset: int = 0) -> bool:
+    """Whether a position's bit is set in a bitmap starting at byte offset."""
+    index = offset + (position >> 3)
+    return index < len(bitmap) and bool(bitmap[index] & (1 << (position & 7)))
+
+
+def iter_bit_positions(bitmap: bytes) -> Iterator[int]:
+    """Positions of the set bits of a bitmap, in ascending order."""
+    for index, value in enumerate(bitmap):
+        if value:
+            base = index * 8
+            for bit in _BYTE_BITS[value]:
+                yield base + bit
+
+
+class PositionBitset(AbstractSet):
+    """
+    Read-only set of block identities backed by a positional bitmap.
+
+    Subclasses implement _position, _identity_at and _bitmap. Set
+    operations with other sets produce ordinary sets.
+    """
+
+    __slots__ = ()
+
+    def _position(self, identity: str) -> Optional[int]:
+        raise NotImplementedError
+
+    def _identity_at(self, position: int) -> Optional[str]:
+        raise NotImplementedError
+
+    def _bitmap(self) -> bytes:
+        raise NotImplementedError
+
+    @classmethod
+    def _from_iterable(cls, iterable: Iterable[str]) -> Set[str]:
+        return set(iterable)
+
+    def __contains__(self, identity: object) -> bool:
+        if not isinstance(identity, str):
+            return False
+        position = self._position(identity)
+        return position is not None and bit_is_set(self._bitmap(), position)
+
+    def __iter__(self) -> Iterator[str]:
+        for position in iter_bit_positions(self._bitmap()):
+            identity = self._identity_at(position)
+            if identity is not None:
+                yield identity
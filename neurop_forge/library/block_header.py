@@ -0,0 +1,125 @@
+"""
+Lightweight block headers for lazy library loading.
+
+A full NeuropBlock carries ownership, constraints, validation rules, trust
+breakdown, failure modes and composition rules. Discovery (listing, name
+resolution, category and intent filtering) only needs a handful of fields.
+A BlockHeader holds exactly those, so a store can keep one per block and
+build the full NeuropBlock only when a block is actually used.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+from neurop_forge.core.block_schema import NeuropBlock
+from neurop_forge.core.compact import intern_str, intern_strs, shared, slotted
+
+
+@slotted
+@dataclass(frozen=True)
+class BlockHeader:
+    """Discovery fields of a block, without logic or provenance records."""
+    identity: str
+    name: str
+    category: str
+    description: str
+    intent: str
+    language: str
+    tags: Tuple[str, ...]
+    input_types: Tuple[Tuple[str, str], ...]
+    output_types: Tuple[Tuple[str, str], ...]
+    deterministic: bool
+    purity: str
+    trust_score: float
+
+    def matches_intent(self, keywords: List[str]) -> bool:
+        """Check keywords against intent, name and tags (BlockStore semantics)."""
+        intent = self.intent.lower()
+        name = self.name.lower()
+        tags = [t.lower() for t in self.tags]
+        for keyword in keywords:
+            kw = keyword.lower()
+            if kw in intent or kw in name or kw in tags:
+                return True
+        return False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "identity": self.identity,
+            "name": self.name,
+            "category": self.category,
+            "description": self.description,
+            "intent": self.intent,
+            "language": self.language,
+            "tags": list(self.tags),
+            "input_types": [list(p) for p in self.input_types],
+            "output_types": [list(p) for p in self.output_types],
+            "deterministic": self.deterministic,
+            "purity": self.purity,
+            "trust_score": self.trust_score,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BlockHeader":
+        return cls(
+            identity=data["identity"],
+            name=data["name"],
+            category=data["category"],
+            description=data["description"],
+            intent=data["intent"],
+            language=data["language"],
+            tags=tuple(data["tags"]),
+            input_types=tuple((p[0], p[1]) for p in data["input_types"]),
+            output_types=tuple((p[0], p[1]) for p in data["output_types"]),
+            deterministic=data["deterministic"],
+            purity=data["purity"],
+            trust_score=data["trust_score"],
+        )
+
+    @classmethod
+    def from_block_data(cls, data: Dict[str, Any]) -> "BlockHeader":
+        """Build a header straight from a serialized block dict."""
+        metadata = data["metadata"]
+        interface = data["interface"]
+        constraints = data["constraints"]
+        return cls(
+            identity=data["identity"]["hash_value"],
+            name=metadata["name"],
+            category=intern_str(metadata["category"]),
+            description=metadata["description"],
+            intent=metadata["intent"],
+            language=intern_str(metadata["language"]),
+            tags=intern_strs(metadata.get("tags", [])),
+            input_types=shared(tuple(
+                intern_strs((p["name"], p["data_type"])) for p in interface["inputs"]
+            )),
+            output_types=shared(tuple(
+                intern_strs((p["name"], p["data_type"])) for p in interface["outputs"]
+            )),
+            deterministic=constraints["deterministic"],
+            purity=intern_str(constraints["purity"]),
+            trust_score=data["trust_score"]["overall_score"],
+        )
+
+    @classmethod
+    def from_block(cls, block: NeuropBlock) -> "BlockHeader":
+        """Build a header from an already constructed block."""
+        metadata = block.metadata
+        return cls(
+            identity=block.get_identity_hash(),
+            name=metadata.name,
+            category=metadata.category,
+            description=metadata.description,
+            intent=metadata.intent,
+            language=metadata.language,
+            tags=tuple(metadata.tags),
+            input_types=tuple(
+                (p.name, p.data_type.value) for p in block.interface.inputs
+            ),
+            output_types=tuple(
+                (p.name, p.data_type.value) for p in block.interface.outputs
+            ),
+            deterministic=block.constraints.deterministic,
+            purity=block.constraints.purity.value,
+            trust_score=block.trust_score.overall_score,
+        )
@@ -5,16 +5,37 @@ This module provides persistent, immutable storage for validated blocks.
 Once stored, blocks cannot be modified - only new versions can be created.
 """
 
+import copy
 import json
 import hashlib
+import logging
 import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping, MutableMapping
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any, Tuple, Set
-from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Any, Tuple, Set
+from dataclasses import dataclass, field
 from pathlib import Path
 from enum import Enum
 
 from neurop_forge.core.block_schema import NeuropBlock
+from neurop_forge.library.block_header import BlockHeader
+from neurop_forge.library.change_manifest import ChangeManifest, scan_block_files
+from neurop_forge.library.packed_archive import (
+    ArchiveHeaderCatalog,
+    PackedLibrary,
+    open_library_archive,
+)
+from neurop_forge.library.parallel_loader import (
+    LoadError,
+    LoadTarget,
+    load_block_files,
+    load_library_files,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class StoreStatus(Enum):
@@ -47,6 +68,28 @@ class StoreResult:
         }
 
 
+@dataclass
+class RefreshResult:
+    """Result of an incremental reload (identities by kind of change)."""
+    added: List[str] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    errors: List[LoadError] = field(default_factory=list)
+    duration_ms: float = 0.0
+
+    def has_changes(self) -> bool:
+        return bool(self.added or self.updated or self.removed)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "added": self.added,
+            "updated": self.updated,
+            "removed": self.removed,
+            "errors": [e.to_dict() for e in self.errors],
+            "duration_ms": self.duration_ms,
+        }
+
+
 class BlockStore:
     """
     Immutable storage for validated NeuropBlocks.
@@ -56,45 +99,330 @@ class BlockStore:
     - Immutability enforcement
     - Integrity verification
     - Quarantine support for invalid blocks
+    - Packed archive loading (one mmap'd file instead of N JSON files)
+    - Lazy mode: only BlockHeaders are loaded at startup; the full
+      NeuropBlock is built on first get() and kept in a bounded LRU cache
+    - Parallel loading of JSON files across worker processes
+    - Per-file load error reporting
+    - Incremental refresh() driven by a (file, size, mtime, identity) manifest
     """
 
     def __init__(
         self,
         storage_path: str = ".neurop_library",
         quarantine_path: str = ".neurop_quarantine",
+        archive_path: Optional[str] = None,
+        lazy: bool = False,
+        hydrated_cache_size: Optional[int] = None,
+        workers: Optional[int] = 1,
+        shared_catalog: bool = False,
     ):
+        """
+        Args:
+            storage_path: Directory of block JSON files
+            quarantine_path: Directory of quarantined block files
+            archive_path: Packed archive to load from (defaults to <storage_path>.pack)
+            lazy: Load headers only and hydrate blocks on demand
+            hydrated_cache_size: Max hydrated blocks kept in lazy mode (None = unbounded)
+            workers: Processes for loading JSON files (None = one per CPU)
+            shared_catalog: In lazy mode with an archive, read headers from the
+                            archive mapping instead of copying them into this
+                            process (less memory per worker, slower scans)
+        """
         self._storage_path = Path(storage_path)
         self._quarantine_path = Path(quarantine_path)
-        self._blocks: Dict[str, NeuropBlock] = {}
+        self._archive_path = archive_path
+        self._workers = workers
+        self._lazy = lazy
+        self._hydrated_cache_size = hydrated_cache_size
+        self._shared_catalog = shared_catalog
+        # Eager mode: every block. Lazy mode: LRU of hydrated blocks.
+        self._blocks: Dict[str, NeuropBlock] = OrderedDict() if lazy else {}
         self._quarantine: Dict[str, NeuropBlock] = {}
         self._metadata: Dict[str, Dict[str, Any]] = {}
 
+        # Header of every block in both modes (eager mode derives them from
+        # the loaded blocks). Plain dict, or an ArchiveHeaderCatalog when the
+        # catalog is shared.
+        self._headers: MutableMapping[str, BlockHeader] = {}
+        self._block_files: Dict[str, Path] = {}
+        self._archive: Optional[PackedLibrary] = None
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        # Current load failures, keyed by path (replaced as files are retried)
+        self._load_errors: Dict[str, LoadError] = {}
+        self._manifest = ChangeManifest()
+        self._refresh_lock = threading.Lock()
+
         self._storage_path.mkdir(parents=True, exist_ok=True)
         self._quarantine_path.mkdir(parents=True, exist_ok=True)
 
         self._load_existing_blocks()
 
+    @property
+    def is_lazy(self) -> bool:
+        return self._lazy
+
+    @property
+    def archive(self) -> Optional[PackedLibrary]:
+        """The packed archive backing a lazy store, if any."""
+        return self._archive
+
+    @property
+    def shared_catalog(self) -> Optional[ArchiveHeaderCatalog]:
+        """The archive-backed header catalog, when the catalog is shared."""
+        if isinstance(self._headers, ArchiveHeaderCatalog):
+            return self._headers
+        return None
+
     def _load_existing_blocks(self) -> None:
         """Load existing blocks from storage."""
-        for block_file in self._storage_path.glob("*.json"):
-            try:
-                content = block_file.read_text()
-                data = json.loads(content)
-                block = NeuropBlock.from_dict(data)
-                identity = block.get_identity_hash()
-                self._blocks[identity] = block
-            except Exception:
-                pass
-
-        for block_file in self._quarantine_path.glob("*.json"):
-            try:
-                content = block_file.read_text()
-                data = json.loads(content)
-                block = NeuropBlock.from_dict(data)
-                identity = block.get_identity_hash()
-                self._quarantine[identity] = block
-            except Exception:
-                pass
+        if self._lazy:
+            self._load_headers()
+        else:
+            self._load_blocks()
+
+        loaded = load_library_files(self._quarantine_path, LoadTarget.BLOCK, workers=1)
+        self._record_errors(loaded.errors)
+        for _, block in loaded.records:
+            self._quarantine[block.get_identity_hash()] = block
+
+    def _record_errors(self, errors: List[LoadError]) -> None:
+        for error in errors:
+            self._load_errors[error.path] = error
+
+    def _archive_error(self, archive: PackedLibrary, identity: str, e: Exception) -> LoadError:
+        return LoadError(path=f"{archive.path}:{identity}", error=f"{type(e).__name__}: {e}")
+
+    def _load_headers(self) -> None:
+        """Build the header catalog without constructing any NeuropBlock."""
+        archive = open_library_archive(self._storage_path, self._archive_path)
+        if archive is not None:
+            if self._shared_catalog:
+                self._headers = ArchiveHeaderCatalog(archive)
+            else:
+                self._headers = archive.get_headers()
+            self._archive = archive
+            self._record_archive_manifest(list(self._headers))
+            return
+
+        self._load_files(self._scan_storage(), LoadTarget.HEADER)
+
+    def _load_blocks(self) -> None:
+        """Construct every block up front."""
+        archive = open_library_archive(self._storage_path, self._archive_path)
+        if archive is not None:
+            with archive:
+                for identity, data in archive.iter_records():
+                    try:
+                        self._put(identity, NeuropBlock.from_dict(data), None)
+                    except Exception as e:
+                        self._record_errors([self._archive_error(archive, identity, e)])
+            self._record_archive_manifest(list(self._blocks))
+        else:
+            self._load_files(self._scan_storage(), LoadTarget.BLOCK)
+
+    def _scan_storage(self) -> Dict[str, Tuple[int, int]]:
+        """Stat block files before reading them, so later edits are detected."""
+        return scan_block_files(self._storage_path)
+
+    def _load_files(
+        self,
+        scan: Dict[str, Tuple[int, int]],
+        target: LoadTarget,
+    ) -> Tuple[List[Tuple[str, Any]], List[LoadError]]:
+        """
+        Load scanned files into the store and record them in the manifest.
+        
+        Returns (file name, loaded block or header) for each loaded file,
+        and the errors of files that failed.
+        """
+        paths = [self._storage_path / name for name in sorted(scan)]
+        for path in paths:
+            self._load_errors.pop(str(path), None)
+        loaded = load_block_files(paths, target, workers=self._workers)
+        self._record_errors(loaded.errors)
+        results = []
+        for stem, item in loaded.records:
+            file_name = f"{stem}.json"
+            identity = item.identity if isinstance(item, BlockHeader) else item.get_identity_hash()
+            self._put(identity, item, self._storage_path / file_name)
+            size, mtime_ns = scan[file_name]
+            self._manifest.record(file_name, size, mtime_ns, identity)
+            results.append((file_name, item))
+        return results, loaded.errors
+
+    def _record_archive_manifest(self, identities: List[str]) -> None:
+        """Map the library files to identities loaded from the archive."""
+        scan = self._scan_storage()
+        by_prefix = {identity[:16]: identity for identity in identities}
+        unmatched = []
+        for file_name, (size, mtime_ns) in scan.items():
+            identity = by_prefix.get(file_name[:-len(".json")])
+            if identity is None:
+                unmatched.append(self._storage_path / file_name)
+            else:
+                self._manifest.record(file_name, size, mtime_ns, identity)
+        if unmatched:
+            known = set(identities)
+            loaded = load_block_files(unmatched, LoadTarget.DATA, workers=1)
+            for stem, data in loaded.records:
+                file_name = f"{stem}.json"
+                identity = data.get("identity", {}).get("hash_value", "")
+                if identity in known:
+                    size, mtime_ns = scan[file_name]
+                    self._manifest.record(file_name, size, mtime_ns, identity)
+
+    def _put(self, identity: str, item: Any, block_file: Optional[Path]) -> None:
+        """Add or replace a block's header, and the block itself in eager mode."""
+        header = item if isinstance(item, BlockHeader) else BlockHeader.from_block(item)
+        self._headers[identity] = header
+        if self._lazy:
+            if block_file is not None:
+                self._block_files[identity] = block_file
+            with self._cache_lock:
+                self._blocks.pop(identity, None)
+        else:
+            self._blocks[identity] = item
+
+    def _evict(self, identity: str) -> None:
+        """Remove a block from the store (its file is gone)."""
+        self._headers.pop(identity, None)
+        self._block_files.pop(identity, None)
+        self._metadata.pop(identity, None)
+        with self._cache_lock:
+            self._blocks.pop(identity, None)
+
+    def refresh(self) -> RefreshResult:
+        """
+        Reload only the block files that changed since the last load.
+        
+        The library directory is scanned (stat only) and diffed against
+        the manifest. New and modified files are loaded; blocks whose files
+        were removed, or whose file now holds a different identity, are
+        evicted. Files that fail to load are reported and retried on the
+        next refresh.
+        
+        Returns:
+            RefreshResult with added, updated and removed identities
+        """
+        start = time.perf_counter()
+        result = RefreshResult()
+        with self._refresh_lock:
+            scan = self._scan_storage()
+            diff = self._manifest.diff(scan)
+            if not diff.has_changes():
+                result.duration_ms = (time.perf_counter() - start) * 1000
+                return result
+
+            previous: Set[str] = set()
+            for file_name in diff.changed + diff.removed:
+                entry = self._manifest.forget(file_name)
+                if entry is not None:
+                    previous.add(entry.identity)
+
+            known = set(self.identities())
+            for file_name in diff.removed:
+                self._load_errors.pop(str(self._storage_path / file_name), None)
+
+            target = LoadTarget.HEADER if self._lazy else LoadTarget.BLOCK
+            changed_scan = {name: scan[name] for name in diff.added + diff.changed}
+            loaded, result.errors = self._load_files(changed_scan, target)
+            for file_name, _ in loaded:
+                identity = self._manifest.get(file_name).identity
+                if identity in known:
+                    result.updated.append(identity)
+                else:
+                    result.added.append(identity)
+
+            still_present = self._manifest.identities()
+            for identity in sorted(previous - still_present):
+                self._evict(identity)
+                result.removed.append(identity)
+
+        result.added = sorted(set(result.added))
+        result.updated = sorted(set(result.updated))
+        result.duration_ms = (time.perf_counter() - start) * 1000
+        return result
+
+    def _hydrate(self, identity: str) -> Optional[NeuropBlock]:
+        """
+        Build the full block for a catalogued identity.
+        
+        A block that fails to build is recorded in get_load_errors() (and
+        logged) like a file that fails to load, and None is returned.
+        """
+        block_file = self._block_files.get(identity)
+        archive = self._archive
+        try:
+            if block_file is not None:
+                data = json.loads(block_file.read_text())
+            elif archive is not None:
+                data = archive.get_data(identity)
+            else:
+                return None
+            if data is None:
+                return None
+            return NeuropBlock.from_dict(data)
+        except Exception as e:
+            if block_file is not None:
+                error = LoadError(path=str(block_file), error=f"{type(e).__name__}: {e}")
+            else:
+                error = self._archive_error(archive, identity, e)
+            self._record_errors([error])
+            logger.warning("Could not hydrate block %s: %s", identity, error)
+            return None
+
+    def _cache_block(self, identity: str, block: NeuropBlock) -> None:
+        """Insert a hydrated block, evicting the least recently used."""
+        with self._cache_lock:
+            self._blocks[identity] = block
+            self._blocks.move_to_end(identity)
+            if self._hydrated_cache_size is not None:
+                while len(self._blocks) > self._hydrated_cache_size:
+                    self._blocks.popitem(last=False)
+
+    def get_load_errors(self) -> List[LoadError]:
+        """Get the blocks that failed to load, one entry per file."""
+        return list(self._load_errors.values())
+
+    def copy(self) -> "BlockStore":
+        """
+        An independent store over the same library directory.
+        
+        Catalogs, manifest and hydrated blocks are copied (blocks and
+        headers are immutable and shared), so refresh() or store() on the
+        copy leaves this store exactly as it was; a library generation
+        can keep serving from this store while its successor is built on
+        the copy. A packed archive mapping is shared and stays open until
+        both stores are closed.
+        
+        In lazy mode, a block that was not hydrated yet is still read from
+        its file on first use, so a file changed on disk afterwards is seen
+        by both stores. Eager stores hold every block and are unaffected.
+        """
+        with self._refresh_lock, self._cache_lock:
+            store = copy.copy(self)
+            store._blocks = OrderedDict(self._blocks) if self._lazy else dict(self._blocks)
+            store._quarantine = dict(self._quarantine)
+            store._metadata = dict(self._metadata)
+            store._headers = self._headers.copy()
+            store._block_files = dict(self._block_files)
+            store._load_errors = dict(self._load_errors)
+            store._manifest = self._manifest.copy()
+            store._archive = self._archive.retain() if self._archive is not None else None
+        store._cache_lock = threading.Lock()
+        store._refresh_lock = threading.Lock()
+        store._cache_hits = 0
+        store._cache_misses = 0
+        return store
+
+    def close(self) -> None:
+        """Release the packed archive mapping held by a lazy store."""
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
 
     def store(self, block: NeuropBlock) -> StoreResult:
         """
@@ -109,7 +437,7 @@ class BlockStore:
         identity = block.get_identity_hash()
         timestamp = datetime.now(timezone.utc).isoformat()
 
-        if identity in self._blocks:
+        if self.exists(identity):
             return StoreResult(
                 status=StoreStatus.ALREADY_EXISTS,
                 block_identity=identity,
@@ -132,7 +460,10 @@ class BlockStore:
             block_json = block.to_json()
             block_path.write_text(block_json)
 
-            self._blocks[identity] = block
+            self._put(identity, block, block_path)
+            if self._lazy:
+                self._cache_block(identity, block)
+            self._manifest.record_path(block_path, identity)
             self._metadata[identity] = {
                 "stored_at": timestamp,
                 "file_path": str(block_path),
@@ -210,14 +541,73 @@ class BlockStore:
         Returns:
             NeuropBlock if found, None otherwise
         """
-        return self._blocks.get(identity)
+        if not self._lazy:
+            return self._blocks.get(identity)
+
+        with self._cache_lock:
+            block = self._blocks.get(identity)
+            if block is not None:
+                self._blocks.move_to_end(identity)
+                self._cache_hits += 1
+                return block
+            if identity not in self._headers:
+                return None
+            self._cache_misses += 1
+
+        block = self._hydrate(identity)
+        if block is not None:
+            self._cache_block(identity, block)
+        return block
+
+    def get_header(self, identity: str) -> Optional[BlockHeader]:
+        """Get the header of a block without hydrating it."""
+        return self._headers.get(identity)
+
+    def iter_headers(self) -> Iterator[BlockHeader]:
+        """Iterate headers of all stored blocks without hydrating them."""
+        yield from list(self._headers.values())
+
+    def find_by_name(self, name: str) -> Optional[str]:
+        """
+        Get the identity of a block by name, without hydrating any block.
+        
+        A shared catalog resolves the name from the archive's name table
+        (the registry's block wins when several share the name); otherwise
+        the first matching block in store order is returned.
+        """
+        catalog = self.shared_catalog
+        if catalog is not None:
+            return catalog.find_by_name(name)
+        for identity, header in list(self._headers.items()):
+            if header.name == name:
+                return identity
+        return None
+
+    def identities(self) -> List[str]:
+        """Get identities of all stored blocks."""
+        return list(self._headers if self._lazy else self._blocks)
+
+    def _get_many(self, identities: List[str]) -> List[NeuropBlock]:
+        blocks = []
+        for identity in identities:
+            block = self.get(identity)
+            if block is not None:
+                blocks.append(block)
+        return blocks
 
     def get_all(self) -> List[NeuropBlock]:
-        """Get all stored blocks."""
+        """Get all stored blocks (hydrates every block in lazy mode)."""
+        if self._lazy:
+            return self._get_many(list(self._headers))
         return list(self._blocks.values())
 
     def get_by_category(self, category: str) -> List[NeuropBlock]:
         """Get blocks by category."""
+        if self._lazy:
+            return self._get_many([
+                identity for identity, header in list(self._headers.items())
+                if header.category == category
+            ])
         return [
             block for block in self._blocks.values()
             if block.metadata.category == category
@@ -225,6 +615,12 @@ class BlockStore:
 
     def get_by_intent(self, intent_keywords: List[str]) -> List[NeuropBlock]:
         """Get blocks matching intent keywords."""
+        if self._lazy:
+            return self._get_many([
+                identity for identity, header in list(self._headers.items())
+                if header.matches_intent(intent_keywords)
+            ])
+
         matching = []
         for block in self._blocks.values():
             intent = block.metadata.intent.lower()
@@ -241,6 +637,8 @@ class BlockStore:
 
     def exists(self, identity: str) -> bool:
         """Check if a block exists."""
+        if self._lazy:
+            return identity in self._headers
         return identity in self._blocks
 
     def is_quarantined(self, identity: str) -> bool:
@@ -249,6 +647,8 @@ class BlockStore:
 
     def count(self) -> int:
         """Get total number of stored blocks."""
+        if self._lazy:
+            return len(self._headers)
         return len(self._blocks)
 
     def _get_block_path(self, identity: str) -> Path:
@@ -275,19 +675,107 @@ class BlockStore:
         languages: Dict[str, int] = {}
         total_trust = 0.0
 
-        for block in self._blocks.values():
-            cat = block.metadata.category
-            categories[cat] = categories.get(cat, 0) + 1
+        if self._lazy:
+            for header in list(self._headers.values()):
+                categories[header.category] = categories.get(header.category, 0) + 1
+                languages[header.language] = languages.get(header.language, 0) + 1
+                total_trust += header.trust_score
+        else:
+            for block in self._blocks.values():
+                cat = block.metadata.category
+                categories[cat] = categories.get(cat, 0) + 1
 
-            lang = block.metadata.language
-            languages[lang] = languages.get(lang, 0) + 1
+                lang = block.metadata.language
+                languages[lang] = languages.get(lang, 0) + 1
 
-            total_trust += block.trust_score.overall_score
+                total_trust += block.trust_score.overall_score
 
-        return {
-            "total_blocks": len(self._blocks),
+        total = self.count()
+        statistics = {
+            "total_blocks": total,
             "quarantined_blocks": len(self._quarantine),
+            "load_errors": len(self._load_errors),
             "categories": categories,
             "languages": languages,
-            "average_trust": total_trust / max(len(self._blocks), 1),
+            "average_trust": total_trust / max(total, 1),
         }
+        if self._lazy:
+            statistics["hydration"] = self.get_hydration_statistics()
+        return statistics
+
+    def get_hydration_statistics(self) -> Dict[str, Any]:
+        """Get lazy-mode cache statistics."""
+        with self._cache_lock:
+            lookups = self._cache_hits + self._cache_misses
+            return {
+                "lazy": self._lazy,
+                "hydrated_blocks": len(self._blocks),
+                "cache_size": self._hydrated_cache_size,
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+                "hit_rate": self._cache_hits / lookups if lookups else 0.0,
+            }
+
+
+class LazyBlockMapping(Mapping):
+    """
+    Read-only mapping of short block id (first 16 hex chars) to NeuropBlock.
+
+    Backed by a lazy BlockStore: len(), membership and key iteration use the
+    header catalog only; a block is hydrated when its value is read. Blocks
+    that fail to hydrate are skipped by items() and values(). With a shared
+    catalog, short ids are resolved against the archive index instead of a
+    per-process dict.
+    """
+
+    def __init__(self, store: BlockStore):
+        self._store = store
+        self._catalog = store.shared_catalog
+        self._ids: Dict[str, str] = {}
+        self.sync()
+
+    @property
+    def store(self) -> BlockStore:
+        return self._store
+
+    def sync(self) -> None:
+        """Pick up blocks added or removed by BlockStore.refresh()."""
+        if self._catalog is None:
+            self._ids = {identity[:16]: identity for identity in self._store.identities()}
+
+    def _resolve(self, key: object) -> Optional[str]:
+        if self._catalog is None:
+            return self._ids.get(key)  # type: ignore[arg-type]
+        if not isinstance(key, str) or len(key) != 16:
+            return None
+        return self._catalog.find_by_prefix(key)
+
+    def __getitem__(self, key: str) -> NeuropBlock:
+        identity = self._resolve(key)
+        block = self._store.get(identity) if identity is not None else None
+        if block is None:
+            raise KeyError(key)
+        return block
+
+    def __iter__(self) -> Iterator[str]:
+        if self._catalog is None:
+            return iter(self._ids)
+        return (identity[:16] for identity in self._catalog)
+
+    def __len__(self) -> int:
+        if self._catalog is None:
+            return len(self._ids)
+        return len(self._catalog)
+
+    def __contains__(self, key: object) -> bool:
+        return self._resolve(key) is not None
+
+    def items(self) -> Iterator[Tuple[str, NeuropBlock]]:  # type: ignore[override]
+        for identity in list(self._catalog if self._catalog is not None else self._ids.values()):
+            block = self._store.get(identity)
+            if block is not None:
+                yield identity[:16], block
+
+    def values(self) -> Iterator[NeuropBlock]:  # type: ignore[override]
+        for _, block in self.items():
+            yield block
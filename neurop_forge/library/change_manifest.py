@@ -0,0 +1,120 @@
+"""
+Change manifest for incremental library reloads.
+
+A BlockStore records, for every block file it has loaded, the file's size,
+modification time and the identity hash of the block inside. Diffing that
+manifest against a fresh directory scan tells the store exactly which
+files were added, changed or removed, so only those blocks are reloaded,
+evicted or re-indexed instead of the whole library.
+"""
+
+import hashlib
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """A loaded block file and the block identity it contained."""
+    file_name: str
+    size: int
+    mtime_ns: int
+    identity: str
+
+
+@dataclass
+class ManifestDiff:
+    """File-level changes between a manifest and a directory scan."""
+    added: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+    def has_changes(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+
+def scan_block_files(library_path: Union[str, Path]) -> Dict[str, Tuple[int, int]]:
+    """Map each *.json file name to (size, mtime_ns) without opening it."""
+    files: Dict[str, Tuple[int, int]] = {}
+    library = Path(library_path)
+    if not library.is_dir():
+        return files
+    with os.scandir(library) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".json") or not entry.is_file():
+                continue
+            stat = entry.stat()
+            files[entry.name] = (stat.st_size, stat.st_mtime_ns)
+    return files
+
+
+def scan_fingerprint(scan: Dict[str, Tuple[int, int]]) -> str:
+    """
+    Digest of a scan_block_files() result.
+
+    Any added, removed, renamed or rewritten file changes it, including a
+    file replaced by one with an older mtime.
+    """
+    digest = hashlib.sha256()
+    for file_name in sorted(scan):
+        size, mtime_ns = scan[file_name]
+        digest.update(f"{file_name}\0{size}\0{mtime_ns}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ChangeManifest:
+    """
+    In-memory manifest of loaded block files.
+
+    Files that failed to load are deliberately not recorded, so they show
+    up as added again on the next diff and are retried.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, ManifestEntry] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def copy(self) -> "ChangeManifest":
+        """An independent manifest with the same entries."""
+        manifest = ChangeManifest()
+        manifest._entries = dict(self._entries)
+        return manifest
+
+    def record(self, file_name: str, size: int, mtime_ns: int, identity: str) -> None:
+        """Record a successfully loaded file."""
+        self._entries[file_name] = ManifestEntry(file_name, size, mtime_ns, identity)
+
+    def record_path(self, path: Path, identity: str) -> None:
+        """Record a file by stat'ing it (e.g. right after the store wrote it)."""
+        stat = path.stat()
+        self.record(path.name, stat.st_size, stat.st_mtime_ns, identity)
+
+    def forget(self, file_name: str) -> Optional[ManifestEntry]:
+        """Drop a file from the manifest, returning its last entry."""
+        return self._entries.pop(file_name, None)
+
+    def get(self, file_name: str) -> Optional[ManifestEntry]:
+        return self._entries.get(file_name)
+
+    def identities(self) -> Set[str]:
+        """Identities still backed by at least one file."""
+        return {entry.identity for entry in self._entries.values()}
+
+    def entries(self) -> Iterable[ManifestEntry]:
+        return list(self._entries.values())
+
+    def diff(self, scan: Dict[str, Tuple[int, int]]) -> ManifestDiff:
+        """Compare against a scan_block_files() result."""
+        diff = ManifestDiff()
+        for file_name in sorted(scan):
+            entry = self._entries.get(file_name)
+            if entry is None:
+                diff.added.append(file_name)
+            elif (entry.size, entry.mtime_ns) != scan[file_name]:
+                diff.changed.append(file_name)
+        diff.removed = sorted(set(self._entries) - set(scan))
+        return diff
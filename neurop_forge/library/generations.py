@@ -0,0 +1,161 @@
+"""
+Copy-on-write library generations.
+
+A generation is one immutable build of everything derived from a library
+directory (store, indexes, registries). Readers pin the current generation
+for the duration of a request. A replacement is built separately, e.g. after
+deduplication rewrites the library, and published by swapping a single
+pointer. Readers never see a half-loaded library: requests that started
+before the swap finish on the old generation, and later requests see the
+new one. A retired generation is released (its store closed) once the last
+reader unpins it.
+"""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Generic, Iterator, List, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+
+class Generation(Generic[T]):
+    """One published library build and the readers currently pinning it."""
+
+    def __init__(self, number: int, value: T):
+        self.number = number
+        self.value = value
+        self.published_at = time.time()
+        self.readers = 0
+        self.retired = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "number": self.number,
+            "published_at": self.published_at,
+            "readers": self.readers,
+            "retired": self.retired,
+        }
+
+
+class GenerationManager(Generic[T]):
+    """
+    Holds the current generation and publishes replacements atomically.
+
+    Usage:
+        generations = GenerationManager(build(), release=close)
+        with generations.pin() as library:
+            ...  # library stays valid even if a new generation is published
+        generations.publish(build())
+    """
+
+    def __init__(self, initial: T, release: Optional[Callable[[T], None]] = None):
+        self._lock = threading.Lock()
+        self._release = release
+        self._current: Generation[T] = Generation(1, initial)
+        # Retired generations that still have readers.
+        self._draining: List[Generation[T]] = []
+        self._builder: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def current(self) -> Generation[T]:
+        """The generation new readers will pin."""
+        return self._current
+
+    @contextmanager
+    def pin(self) -> Iterator[T]:
+        """Pin the current generation for the duration of the block."""
+        with self._lock:
+            generation = self._current
+            generation.readers += 1
+        try:
+            yield generation.value
+        finally:
+            with self._lock:
+                generation.readers -= 1
+                drained = generation.retired and generation.readers == 0
+                if drained:
+                    self._draining.remove(generation)
+            if drained:
+                self._release_generation(generation)
+
+    def publish(self, value: T, replaces: Optional[T] = None) -> Optional[Generation[T]]:
+        """
+        Make a fully built value the current generation.
+
+        With replaces, publish only if that value is still current (it was
+        derived from it); returns None, publishing nothing, otherwise.
+        """
+        with self._lock:
+            if replaces is not None and self._current.value is not replaces:
+                return None
+            previous = self._current
+            self._current = Generation(previous.number + 1, value)
+            previous.retired = True
+            drained = previous.readers == 0
+            if not drained:
+                self._draining.append(previous)
+            published = self._current
+        if drained:
+            self._release_generation(previous)
+        return published
+
+    def build(self, builder: Callable[[], T], background: bool = False) -> "Future[Generation[T]]":
+        """
+        Build a new generation and publish it when complete.
+
+        With background=True the build runs on a dedicated thread (one
+        build at a time) and the returned future resolves to the published
+        generation. If the builder raises, nothing is published.
+        """
+        if not background:
+            future: "Future[Generation[T]]" = Future()
+            try:
+                future.set_result(self.publish(builder()))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+
+        with self._lock:
+            if self._builder is None:
+                self._builder = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="neurop-generation"
+                )
+            executor = self._builder
+        return executor.submit(lambda: self.publish(builder()))
+
+    def close(self) -> None:
+        """
+        Stop the background builder and retire the current generation.
+
+        A build in progress finishes first. The current generation is
+        released once its last reader unpins it.
+        """
+        with self._lock:
+            builder, self._builder = self._builder, None
+        if builder is not None:
+            builder.shutdown(wait=True)
+        with self._lock:
+            current = self._current
+            if current.retired:
+                return
+            current.retired = True
+            drained = current.readers == 0
+            if not drained:
+                self._draining.append(current)
+        if drained:
+            self._release_generation(current)
+
+    def _release_generation(self, generation: Generation[T]) -> None:
+        if self._release is not None:
+            self._release(generation.value)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Current generation and retired generations still draining."""
+        with self._lock:
+            return {
+                "current": self._current.to_dict(),
+                "draining": [g.to_dict() for g in self._draining],
+            }
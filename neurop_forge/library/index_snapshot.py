@@ -0,0 +1,146 @@
+"""
+Persisted snapshot of the block search indexes.
+
+Building the BlockIndexer keyword index and running semantic intent
+inference for every block dominates orchestrator startup. Both results
+depend only on block discovery fields and on the indexing code, so they
+are saved to one JSON snapshot keyed by a digest of both:
+
+- library digest: sha256 over every BlockHeader (sorted by identity), so
+  any added, removed or re-described block invalidates the snapshot
+- code digest: sha256 over the modules that derive index entries, so a
+  change to keyword or intent inference invalidates it too
+
+A snapshot whose digests or version do not match is ignored and rebuilt.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from neurop_forge.library.block_header import BlockHeader
+from neurop_forge.library.indexer import IndexEntry
+from neurop_forge.library.parallel_loader import gc_paused
+from neurop_forge.semantic.composer import SemanticIndexEntry
+
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_SUFFIX = ".index.json"
+
+_NEUROP_ROOT = Path(__file__).resolve().parent.parent
+# Modules whose logic shapes IndexEntry / SemanticIndexEntry contents.
+_INDEX_SOURCES = (
+    _NEUROP_ROOT / "library" / "indexer.py",
+    _NEUROP_ROOT / "semantic" / "intent_extractor.py",
+    _NEUROP_ROOT / "semantic" / "intent_schema.py",
+)
+
+
+@dataclass
+class IndexSnapshot:
+    """Index entries for a library, as built by BlockIndexer and SemanticComposer."""
+    library_digest: str
+    indexer_entries: List[IndexEntry] = field(default_factory=list)
+    semantic_entries: List[SemanticIndexEntry] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "snapshot_version": SNAPSHOT_VERSION,
+            "library_digest": self.library_digest,
+            "code_digest": compute_code_digest(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "indexer_entries": [e.to_dict() for e in self.indexer_entries],
+            "semantic_entries": [e.to_dict() for e in self.semantic_entries],
+        }
+
+
+def default_snapshot_path(library_path: Union[str, Path]) -> Path:
+    """Get the snapshot path that sits next to a library directory."""
+    library = Path(library_path)
+    return library.with_name(library.name + SNAPSHOT_SUFFIX)
+
+
+def compute_library_digest(headers: Iterable[BlockHeader]) -> str:
+    """Digest of every block's discovery fields, independent of load order."""
+    digest = hashlib.sha256()
+    for header in sorted(headers, key=lambda h: h.identity):
+        digest.update(json.dumps(header.to_dict(), sort_keys=True).encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+_code_digest: Optional[str] = None
+
+
+def compute_code_digest() -> str:
+    """Digest of the index-building modules (computed once per process)."""
+    global _code_digest
+    if _code_digest is None:
+        digest = hashlib.sha256()
+        for source in _INDEX_SOURCES:
+            try:
+                digest.update(source.read_bytes())
+            except OSError:
+                digest.update(source.name.encode("utf-8"))
+        _code_digest = digest.hexdigest()
+    return _code_digest
+
+
+def load_index_snapshot(
+    path: Union[str, Path],
+    library_digest: str,
+) -> Optional[IndexSnapshot]:
+    """
+    Load a snapshot if it exists and matches the library and code.
+
+    Returns None when the snapshot is missing, unreadable, from another
+    snapshot version, or built for a different library or indexing code.
+    """
+    snapshot_path = Path(path)
+    if not snapshot_path.is_file():
+        return None
+    try:
+        with open(snapshot_path) as f, gc_paused():
+            data = json.load(f)
+        if (
+            not isinstance(data, dict)
+            or data.get("snapshot_version") != SNAPSHOT_VERSION
+            or data.get("library_digest") != library_digest
+            or data.get("code_digest") != compute_code_digest()
+        ):
+            return None
+        with gc_paused():
+            return IndexSnapshot(
+                library_digest=library_digest,
+                indexer_entries=[IndexEntry.from_dict(e) for e in data["indexer_entries"]],
+                semantic_entries=[
+                    SemanticIndexEntry.from_dict(e) for e in data["semantic_entries"]
+                ],
+            )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def write_index_snapshot(path: Union[str, Path], snapshot: IndexSnapshot) -> bool:
+    """
+    Write a snapshot atomically (temp file + rename).
+
+    Returns False instead of raising when the location is not writable;
+    a missing snapshot only costs a rebuild on the next start.
+    """
+    target = Path(path)
+    tmp_path = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w") as f:
+            json.dump(snapshot.to_dict(), f, separators=(",", ":"))
+        os.replace(tmp_path, target)
+        return True
+    except OSError:
+        if tmp_path.exists():
+            tmp_path.unlink()
+        return False
@@ -14,8 +14,11 @@ from dataclasses import dataclass
 from collections import defaultdict
 
 from neurop_forge.core.block_schema import NeuropBlock, PurityLevel, DataType
+from neurop_forge.core.compact import intern_str, intern_strs, slotted
+from neurop_forge.library.registry_bitsets import OrdinalTable, popcount
 
 
+@slotted
 @dataclass
 class IndexEntry:
     """An entry in the block index."""
@@ -46,6 +49,56 @@ class IndexEntry:
             "language": self.language,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "IndexEntry":
+        return cls(
+            block_identity=data["block_identity"],
+            name=data["name"],
+            intent=data["intent"],
+            category=intern_str(data["category"]),
+            keywords=intern_strs(data["keywords"]),
+            input_types=intern_strs(data["input_types"]),
+            output_types=intern_strs(data["output_types"]),
+            is_pure=data["is_pure"],
+            is_deterministic=data["is_deterministic"],
+            trust_score=data["trust_score"],
+            language=intern_str(data["language"]),
+        )
+
+
+def extract_keywords(block: NeuropBlock) -> Tuple[str, ...]:
+    """Extract searchable keywords from a block."""
+    keywords: Set[str] = set()
+
+    name_words = re.findall(r'[a-z]+', block.metadata.name.lower())
+    keywords.update(name_words)
+
+    keywords.update(t.lower() for t in block.metadata.tags)
+
+    intent_words = re.findall(r'[a-z]+', block.metadata.intent.lower())
+    keywords.update(w for w in intent_words if len(w) > 2)
+
+    keywords.add(block.metadata.category)
+
+    return intern_strs(sorted(keywords))
+
+
+def build_index_entry(block: NeuropBlock) -> IndexEntry:
+    """Build the index entry for a block without adding it to any index."""
+    return IndexEntry(
+        block_identity=block.get_identity_hash(),
+        name=block.metadata.name,
+        intent=block.metadata.intent,
+        category=block.metadata.category,
+        keywords=extract_keywords(block),
+        input_types=intern_strs(p.data_type.value for p in block.interface.inputs),
+        output_types=intern_strs(p.data_type.value for p in block.interface.outputs),
+        is_pure=block.is_pure(),
+        is_deterministic=block.is_deterministic(),
+        trust_score=block.get_trust_level(),
+        language=block.metadata.language,
+    )
+
 
 class BlockIndexer:
     """
@@ -57,15 +110,38 @@ class BlockIndexer:
     - Type matching
     - Constraint filtering
     - Trust score filtering
+    
+    Every index maps a key to a bitmask over block ordinals, so combining
+    filters is a chain of bitwise ANDs.
     """
 
     def __init__(self):
         self._entries: Dict[str, IndexEntry] = {}
-        self._keyword_index: Dict[str, Set[str]] = defaultdict(set)
-        self._category_index: Dict[str, Set[str]] = defaultdict(set)
-        self._type_index: Dict[str, Set[str]] = defaultdict(set)
-        self._purity_index: Dict[bool, Set[str]] = defaultdict(set)
-        self._determinism_index: Dict[bool, Set[str]] = defaultdict(set)
+        self._ordinals = OrdinalTable()
+        self._all_bits = 0
+        self._keyword_index: Dict[str, int] = defaultdict(int)
+        self._category_index: Dict[str, int] = defaultdict(int)
+        self._type_index: Dict[str, int] = defaultdict(int)
+        self._purity_index: Dict[bool, int] = defaultdict(int)
+        self._determinism_index: Dict[bool, int] = defaultdict(int)
+
+    def copy(self) -> "BlockIndexer":
+        """
+        An independent indexer with the same entries.
+
+        Entries are immutable and shared; only the index maps are copied,
+        so a copy can be updated while the original keeps serving reads.
+        """
+        indexer = BlockIndexer()
+        indexer._entries = dict(self._entries)
+        indexer._ordinals = self._ordinals.copy()
+        indexer._all_bits = self._all_bits
+        indexer._keyword_index = self._keyword_index.copy()
+        indexer._category_index = self._category_index.copy()
+        indexer._type_index = self._type_index.copy()
+        indexer._purity_index = self._purity_index.copy()
+        indexer._determinism_index = self._determinism_index.copy()
+        return indexer
 
     def index_block(self, block: NeuropBlock) -> IndexEntry:
         """
@@ -77,58 +153,78 @@ class BlockIndexer:
         Returns:
             IndexEntry for the block
         """
-        identity = block.get_identity_hash()
-
-        keywords = self._extract_keywords(block)
-        input_types = tuple(p.data_type.value for p in block.interface.inputs)
-        output_types = tuple(p.data_type.value for p in block.interface.outputs)
-
-        entry = IndexEntry(
-            block_identity=identity,
-            name=block.metadata.name,
-            intent=block.metadata.intent,
-            category=block.metadata.category,
-            keywords=keywords,
-            input_types=input_types,
-            output_types=output_types,
-            is_pure=block.is_pure(),
-            is_deterministic=block.is_deterministic(),
-            trust_score=block.get_trust_level(),
-            language=block.metadata.language,
-        )
+        return self.add_entry(build_index_entry(block))
 
+    def add_entry(self, entry: IndexEntry) -> IndexEntry:
+        """
+        Add a prebuilt entry (e.g. from an index snapshot) to all indexes.
+        
+        Args:
+            entry: The entry to index
+            
+        Returns:
+            The same entry
+        """
+        identity = entry.block_identity
+        if identity in self._entries:
+            self.remove_block(identity)
         self._entries[identity] = entry
+        bit = 1 << self._ordinals.add(identity)
+        self._all_bits |= bit
 
-        for keyword in keywords:
-            self._keyword_index[keyword.lower()].add(identity)
-
-        self._category_index[block.metadata.category].add(identity)
-
-        for input_type in input_types:
-            self._type_index[f"input:{input_type}"].add(identity)
-        for output_type in output_types:
-            self._type_index[f"output:{output_type}"].add(identity)
-
-        self._purity_index[entry.is_pure].add(identity)
-        self._determinism_index[entry.is_deterministic].add(identity)
+        for index, key in self._index_keys(entry):
+            index[key] |= bit
 
         return entry
 
-    def _extract_keywords(self, block: NeuropBlock) -> Tuple[str, ...]:
-        """Extract searchable keywords from a block."""
-        keywords: Set[str] = set()
+    def _index_keys(self, entry: IndexEntry) -> List[Tuple[Dict[Any, int], Any]]:
+        """(index, key) pairs an entry is filed under."""
+        return (
+            [(self._keyword_index, keyword.lower()) for keyword in entry.keywords]
+            + [(self._category_index, entry.category)]
+            + [(self._type_index, f"input:{t}") for t in entry.input_types]
+            + [(self._type_index, f"output:{t}") for t in entry.output_types]
+            + [(self._purity_index, entry.is_pure)]
+            + [(self._determinism_index, entry.is_deterministic)]
+        )
 
-        name_words = re.findall(r'[a-z]+', block.metadata.name.lower())
-        keywords.update(name_words)
+    def _collect(self, bits: int, min_trust: float = 0.0) -> List[IndexEntry]:
+        """Entries whose bits are set and that meet the trust threshold."""
+        results = []
+        for identity in self._ordinals.iter_bits(bits):
+            entry = self._entries.get(identity)
+            if entry and entry.trust_score >= min_trust:
+                results.append(entry)
+        return results
 
-        keywords.update(t.lower() for t in block.metadata.tags)
+    def remove_block(self, identity: str) -> bool:
+        """
+        Remove a block from all indexes.
+        
+        Args:
+            identity: The block identity hash
+            
+        Returns:
+            True if the block was indexed
+        """
+        entry = self._entries.pop(identity, None)
+        if entry is None:
+            return False
 
-        intent_words = re.findall(r'[a-z]+', block.metadata.intent.lower())
-        keywords.update(w for w in intent_words if len(w) > 2)
+        clear = ~(1 << self._ordinals.discard(identity))
+        self._all_bits &= clear
+        for index, key in self._index_keys(entry):
+            bits = index.get(key, 0) & clear
+            if bits:
+                index[key] = bits
+            else:
+                index.pop(key, None)
 
-        keywords.add(block.metadata.category)
+        return True
 
-        return tuple(sorted(keywords))
+    def _extract_keywords(self, block: NeuropBlock) -> Tuple[str, ...]:
+        """Extract searchable keywords from a block."""
+        return extract_keywords(block)
 
     def search(
         self,
@@ -157,52 +253,42 @@ class BlockIndexer:
         Returns:
             List of matching IndexEntry objects
         """
-        candidate_ids: Optional[Set[str]] = None
+        candidate_bits: Optional[int] = None
 
         if query:
             query_words = query.lower().split()
             for word in query_words:
-                word_matches = set()
-                for keyword, ids in self._keyword_index.items():
+                word_bits = 0
+                for keyword, bits in self._keyword_index.items():
                     if word in keyword or keyword in word:
-                        word_matches.update(ids)
+                        word_bits |= bits
 
-                if candidate_ids is None:
-                    candidate_ids = word_matches
+                if candidate_bits is None:
+                    candidate_bits = word_bits
                 else:
-                    candidate_ids = candidate_ids.union(word_matches)
+                    candidate_bits |= word_bits
 
-        if candidate_ids is None:
-            candidate_ids = set(self._entries.keys())
+        if candidate_bits is None:
+            candidate_bits = self._all_bits
 
         if category:
-            category_ids = self._category_index.get(category, set())
-            candidate_ids = candidate_ids.intersection(category_ids)
+            candidate_bits &= self._category_index.get(category, 0)
 
         if require_pure:
-            pure_ids = self._purity_index.get(True, set())
-            candidate_ids = candidate_ids.intersection(pure_ids)
+            candidate_bits &= self._purity_index.get(True, 0)
 
         if require_deterministic:
-            det_ids = self._determinism_index.get(True, set())
-            candidate_ids = candidate_ids.intersection(det_ids)
+            candidate_bits &= self._determinism_index.get(True, 0)
 
         if input_types:
             for input_type in input_types:
-                type_ids = self._type_index.get(f"input:{input_type}", set())
-                candidate_ids = candidate_ids.intersection(type_ids)
+                candidate_bits &= self._type_index.get(f"input:{input_type}", 0)
 
         if output_types:
             for output_type in output_types:
-                type_ids = self._type_index.get(f"output:{output_type}", set())
-                candidate_ids = candidate_ids.intersection(type_ids)
-
-        results = []
-        for identity in candidate_ids:
-            entry = self._entries.get(identity)
-            if entry and entry.trust_score >= min_trust:
-                results.append(entry)
+                candidate_bits &= self._type_index.get(f"output:{output_type}", 0)
 
+        results = self._collect(candidate_bits, min_trust)
         results.sort(key=lambda e: e.trust_score, reverse=True)
 
         return results[:limit]
@@ -235,12 +321,7 @@ class BlockIndexer:
         Returns:
             List of entries in category
         """
-        ids = self._category_index.get(category, set())
-        results = []
-        for identity in ids:
-            entry = self._entries.get(identity)
-            if entry and entry.trust_score >= min_trust:
-                results.append(entry)
+        results = self._collect(self._category_index.get(category, 0), min_trust)
         return sorted(results, key=lambda e: e.trust_score, reverse=True)
 
     def search_compatible(
@@ -258,18 +339,21 @@ class BlockIndexer:
         Returns:
             List of compatible entries
         """
-        type_ids = self._type_index.get(f"input:{output_type}", set())
+        type_bits = self._type_index.get(f"input:{output_type}", 0)
 
         if category:
-            category_ids = self._category_index.get(category, set())
-            type_ids = type_ids.intersection(category_ids)
+            type_bits &= self._category_index.get(category, 0)
 
-        return [self._entries[id] for id in type_ids if id in self._entries]
+        return self._collect(type_bits)
 
     def get_entry(self, identity: str) -> Optional[IndexEntry]:
         """Get index entry by identity."""
         return self._entries.get(identity)
 
+    def get_entries(self) -> List[IndexEntry]:
+        """Get all index entries."""
+        return list(self._entries.values())
+
     def get_all_categories(self) -> List[str]:
         """Get all indexed categories."""
         return list(self._category_index.keys())
@@ -280,15 +364,17 @@ class BlockIndexer:
             "total_entries": len(self._entries),
             "total_keywords": len(self._keyword_index),
             "categories": {
-                cat: len(ids) for cat, ids in self._category_index.items()
+                cat: popcount(bits) for cat, bits in self._category_index.items()
             },
-            "pure_blocks": len(self._purity_index.get(True, set())),
-            "deterministic_blocks": len(self._determinism_index.get(True, set())),
+            "pure_blocks": popcount(self._purity_index.get(True, 0)),
+            "deterministic_blocks": popcount(self._determinism_index.get(True, 0)),
         }
 
     def clear(self) -> None:
         """Clear all indexes."""
         self._entries.clear()
+        self._ordinals = OrdinalTable()
+        self._all_bits = 0
         self._keyword_index.clear()
         self._category_index.clear()
         self._type_index.clear()
@@ -0,0 +1,860 @@
+"""
+Packed single-file archive for the block library.
+
+The expanded library is thousands of small JSON files. Opening and parsing
+them one by one dominates cold start, and every worker process pays it again.
+This module packs the library into ONE file that can be memory-mapped:
+
+    +----------------------------+  offset 0
+    | header (fixed size)        |  magic, version, counts, section offsets
+    +----------------------------+  HEADER_SIZE
+    | index (fixed-size entries) |  sha256 digest -> payload offset/length,
+    |                            |  sorted by digest for binary search
+    +----------------------------+  payload_offset
+    | payloads                   |  canonical compact JSON, one per block
+    +----------------------------+  manifest["headers_offset"]
+    | headers                    |  compact BlockHeader JSON, one per block
+    +----------------------------+  manifest["header_table_offset"]
+    | header table               |  header offset/length, in index order
+    +----------------------------+  manifest["names_offset"]
+    | names + name table         |  block names, table sorted by name
+    +----------------------------+  manifest["flags"][name]["offset"]
+    | flag bitsets               |  one bit per index position (e.g. verified)
+    +----------------------------+  manifest_offset
+    | manifest (JSON)            |  provenance and section offsets
+    +----------------------------+
+
+A reader maps the file read-only and fetches any block by identity hash
+without touching the rest of the archive. The page cache is shared, so
+every process that maps the same archive reads the same physical pages.
+Headers, the name index and the registry bitsets are also read from the
+mapping on demand (ArchiveHeaderCatalog), so API workers attached to one
+archive share the catalog as well as the payloads.
+"""
+
+import json
+import mmap
+import os
+import struct
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from neurop_forge.core.block_schema import NeuropBlock
+from neurop_forge.library.bitsets import PositionBitset, bit_is_set, iter_bit_positions
+from neurop_forge.library.block_header import BlockHeader
+from neurop_forge.library.change_manifest import scan_block_files, scan_fingerprint
+from neurop_forge.library.parallel_loader import LoadTarget, load_library_files
+
+
+ARCHIVE_MAGIC = b"NPFPACK\x00"
+ARCHIVE_FORMAT_VERSION = 2
+ARCHIVE_SUFFIX = ".pack"
+
+# magic, format_version, block_count, index_offset, payload_offset,
+# manifest_offset, manifest_length
+_HEADER = struct.Struct("<8sIIQQQQ")
+# sha256 digest, payload offset, payload length
+_INDEX_ENTRY = struct.Struct("<32sQQ")
+# header offset, header length (one per index position)
+_HEADER_SPAN = struct.Struct("<QI")
+# name offset, name length, index position (sorted by name)
+_NAME_ENTRY = struct.Struct("<QII")
+
+# Registry files whose ids are packed as flag bitsets, by flag name.
+REGISTRY_FLAG_FILES = {
+    "verified": "registry.json",
+    "tier_a": "tier_registry.json",
+    "tier_b": "tier_registry.json",
+    "quarantined": "tier_registry.json",
+}
+
+HEADER_SIZE = _HEADER.size
+INDEX_ENTRY_SIZE = _INDEX_ENTRY.size
+
+
+class ArchiveFormatError(ValueError):
+    """Raised when a file is not a valid packed library archive."""
+
+
+@dataclass
+class PackResult:
+    """Result of packing a library directory into an archive."""
+    archive_path: str
+    block_count: int
+    bytes_written: int
+    errors: List[str] = field(default_factory=list)
+
+    def is_success(self) -> bool:
+        return self.block_count > 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "archive_path": self.archive_path,
+            "block_count": self.block_count,
+            "bytes_written": self.bytes_written,
+            "errors": self.errors,
+        }
+
+
+def default_archive_path(library_path: Union[str, Path]) -> Path:
+    """Get the archive path that sits next to a library directory."""
+    library = Path(library_path)
+    return library.with_name(library.name + ARCHIVE_SUFFIX)
+
+
+def _identity_digest(identity: str) -> bytes:
+    """Convert a 64-char hex identity hash to its 32-byte digest."""
+    try:
+        digest = bytes.fromhex(identity)
+    except ValueError:
+        raise ArchiveFormatError(f"Identity is not a hex digest: {identity!r}")
+    if len(digest) != 32:
+        raise ArchiveFormatError(f"Identity is not a sha256 digest: {identity!r}")
+    return digest
+
+
+def read_registry_flags(registry_dir: Union[str, Path]) -> Dict[str, Set[str]]:
+    """
+    Read the verified, tier and quarantined block ids from a registry directory.
+
+    Missing or unreadable registry files give no flag at all (rather than
+    an empty one), so readers fall back to their own registry loading.
+    """
+    flags: Dict[str, Set[str]] = {}
+    registry = Path(registry_dir)
+    for flag, file_name in REGISTRY_FLAG_FILES.items():
+        try:
+            with open(registry / file_name) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if flag == "verified":
+            flags[flag] = {
+                block_id
+                for block_id, entry in data.get("verified_blocks", {}).items()
+                if entry.get("verified", False)
+            }
+        else:
+            flags[flag] = set(data.get(flag, []))
+    return flags
+
+
+def read_registry_names(registry_dir: Union[str, Path]) -> Dict[str, str]:
+    """Map block name -> id for verified registry entries (later entries win)."""
+    try:
+        with open(Path(registry_dir) / REGISTRY_FLAG_FILES["verified"]) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return {
+        entry["block_name"]: block_id
+        for block_id, entry in data.get("verified_blocks", {}).items()
+        if entry.get("verified", False) and "block_name" in entry
+    }
+
+
+def write_packed_library(
+    library_path: Union[str, Path],
+    archive_path: Optional[Union[str, Path]] = None,
+    registry_dir: Optional[Union[str, Path]] = None,
+) -> PackResult:
+    """
+    Pack every block JSON file in a library directory into one archive.
+
+    The archive is written to a temporary file and atomically renamed into
+    place, so readers never observe a half-written archive.
+
+    Args:
+        library_path: Directory containing block JSON files
+        archive_path: Output path (defaults to <library_path>.pack)
+        registry_dir: Verification registry directory whose verified and
+                      tier-A ids are packed as bitsets (optional)
+
+    Returns:
+        PackResult with block count and any per-file errors
+    """
+    library = Path(library_path)
+    target = Path(archive_path) if archive_path else default_archive_path(library)
+    result = PackResult(archive_path=str(target), block_count=0, bytes_written=0)
+
+    if not library.is_dir():
+        result.errors.append(f"Library path not found: {library}")
+        return result
+
+    source_files = scan_block_files(library)
+
+    payloads: Dict[bytes, bytes] = {}
+    headers: Dict[bytes, BlockHeader] = {}
+    for block_file in sorted(library.glob("*.json")):
+        try:
+            data = json.loads(block_file.read_text())
+            identity = data.get("identity", {}).get("hash_value", "")
+            digest = _identity_digest(identity)
+        except Exception as e:
+            result.errors.append(f"{block_file.name}: {e}")
+            continue
+        if digest in payloads:
+            result.errors.append(f"{block_file.name}: duplicate identity {identity}")
+            continue
+        try:
+            header = BlockHeader.from_block_data(data)
+        except (KeyError, TypeError, AttributeError) as e:
+            result.errors.append(f"{block_file.name}: no header ({e})")
+            continue
+        payloads[digest] = json.dumps(
+            data, sort_keys=True, separators=(",", ":")
+        ).encode("utf-8")
+        headers[digest] = header
+
+    digests = sorted(payloads)
+    positions = {digest: position for position, digest in enumerate(digests)}
+    index_offset = HEADER_SIZE
+    payload_offset = index_offset + len(digests) * INDEX_ENTRY_SIZE
+
+    sections = bytearray()
+    offset = payload_offset
+    for digest in digests:
+        length = len(payloads[digest])
+        sections += _INDEX_ENTRY.pack(digest, offset, length)
+        offset += length
+    index = bytes(sections)
+
+    # Headers, then their offset table (same order as the index).
+    sections = bytearray()
+    headers_offset = offset
+    spans = bytearray()
+    for digest in digests:
+        raw = json.dumps(
+            headers[digest].to_dict(), sort_keys=True, separators=(",", ":")
+        ).encode("utf-8")
+        spans += _HEADER_SPAN.pack(headers_offset + len(sections), len(raw))
+        sections += raw
+    headers_length = len(sections)
+    header_table_offset = headers_offset + len(sections)
+    sections += spans
+
+    # Block names, then the name table sorted by name. Among blocks sharing
+    # a name, the registry's block for that name sorts first, then index order.
+    registry = Path(registry_dir) if registry_dir else None
+    preferred = read_registry_names(registry) if registry is not None else {}
+    names_offset = headers_offset + len(sections)
+    name_table = []
+    for position, digest in enumerate(digests):
+        header = headers[digest]
+        raw = header.name.encode("utf-8")
+        rank = 0 if preferred.get(header.name) == header.identity else 1
+        name_table.append((raw, rank, position, headers_offset + len(sections)))
+        sections += raw
+    name_table_offset = headers_offset + len(sections)
+    for raw, _, position, name_offset in sorted(name_table):
+        sections += _NAME_ENTRY.pack(name_offset, len(raw), position)
+
+    # Registry flags as bitsets over index positions.
+    flags: Dict[str, Dict[str, Any]] = {}
+    if registry is not None:
+        for flag, ids in sorted(read_registry_flags(registry).items()):
+            bits = bytearray((len(digests) + 7) // 8)
+            count = 0
+            for block_id in ids:
+                try:
+                    position = positions.get(bytes.fromhex(block_id))
+                except ValueError:
+                    position = None
+                if position is not None:
+                    bits[position >> 3] |= 1 << (position & 7)
+                    count += 1
+            source = registry / REGISTRY_FLAG_FILES[flag]
+            flags[flag] = {
+                "offset": headers_offset + len(sections),
+                "count": count,
+                "source": str(source),
+                "source_mtime_ns": source.stat().st_mtime_ns,
+            }
+            sections += bits
+
+    offset = headers_offset + len(sections)
+
+    manifest = json.dumps({
+        "format_version": ARCHIVE_FORMAT_VERSION,
+        "block_count": len(digests),
+        "source_path": str(library),
+        "source_file_count": len(source_files),
+        "source_mtime_ns": max((mtime for _, mtime in source_files.values()), default=0),
+        "source_fingerprint": scan_fingerprint(source_files),
+        "headers_offset": headers_offset,
+        "headers_length": headers_length,
+        "header_table_offset": header_table_offset,
+        "names_offset": names_offset,
+        "name_table_offset": name_table_offset,
+        "flags": flags,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+    }, sort_keys=True).encode("utf-8")
+
+    header = _HEADER.pack(
+        ARCHIVE_MAGIC,
+        ARCHIVE_FORMAT_VERSION,
+        len(digests),
+        index_offset,
+        payload_offset,
+        offset,
+        len(manifest),
+    )
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(header)
+            f.write(index)
+            for digest in digests:
+                f.write(payloads[digest])
+            f.write(sections)
+            f.write(manifest)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, target)
+    except Exception as e:
+        if tmp_path.exists():
+            tmp_path.unlink()
+        result.errors.append(f"Error writing {target}: {e}")
+        return result
+
+    result.block_count = len(digests)
+    result.bytes_written = offset + len(manifest)
+    return result
+
+
+class PackedLibrary:
+    """
+    Read-only, memory-mapped view of a packed library archive.
+
+    Features:
+    - O(log n) lookup by identity hash via the sorted fixed-size index
+    - O(log n) lookup by block name and by short identity prefix
+    - Per-block headers and registry flags read without a full catalog
+    - Only the pages of requested blocks are ever read
+    - Safe to share between processes (read-only mapping)
+    """
+
+    def __init__(self, archive_path: Union[str, Path]):
+        self._path = Path(archive_path)
+        # Stores sharing this mapping; see retain().
+        self._owners = 1
+        self._owners_lock = threading.Lock()
+        self._file = open(self._path, "rb")
+        try:
+            if os.fstat(self._file.fileno()).st_size < HEADER_SIZE:
+                raise ArchiveFormatError(f"Archive too small: {self._path}")
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+
+        (
+            magic,
+            version,
+            self._count,
+            self._index_offset,
+            self._payload_offset,
+            self._manifest_offset,
+            self._manifest_length,
+        ) = _HEADER.unpack_from(self._mmap, 0)
+
+        if magic != ARCHIVE_MAGIC:
+            self.close()
+            raise ArchiveFormatError(f"Not a packed library archive: {self._path}")
+        if version != ARCHIVE_FORMAT_VERSION:
+            self.close()
+            raise ArchiveFormatError(
+                f"Unsupported archive version {version} in {self._path}"
+            )
+        if self._manifest_offset + self._manifest_length > len(self._mmap):
+            self.close()
+            raise ArchiveFormatError(f"Archive is truncated: {self._path}")
+
+        self._manifest: Optional[Dict[str, Any]] = None
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def manifest(self) -> Dict[str, Any]:
+        """Provenance of the packed library (parsed on first access)."""
+        if self._manifest is None:
+            start = self._manifest_offset
+            raw = self._mmap[start:start + self._manifest_length]
+            self._manifest = json.loads(raw.decode("utf-8"))
+        return self._manifest
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, identity: object) -> bool:
+        if not isinstance(identity, str):
+            return False
+        return self._find(identity) is not None
+
+    def __enter__(self) -> "PackedLibrary":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def retain(self) -> "PackedLibrary":
+        """
+        Register one more owner of this mapping (e.g. a copied store).
+
+        close() then only releases the mapping once every owner has
+        closed it.
+        """
+        with self._owners_lock:
+            self._owners += 1
+        return self
+
+    def close(self) -> None:
+        """Release the mapping and file handle (once the last owner closes)."""
+        with self._owners_lock:
+            self._owners = max(self._owners - 1, 0)
+            if self._owners:
+                return
+        if getattr(self, "_mmap", None) is not None and not self._mmap.closed:
+            self._mmap.close()
+        if not self._file.closed:
+            self._file.close()
+
+    def _entry(self, position: int) -> Tuple[bytes, int, int]:
+        return _INDEX_ENTRY.unpack_from(
+            self._mmap, self._index_offset + position * INDEX_ENTRY_SIZE
+        )
+
+    def _digest_at(self, position: int) -> bytes:
+        start = self._index_offset + position * INDEX_ENTRY_SIZE
+        return self._mmap[start:start + 32]
+
+    def _lower_bound(self, digest: bytes) -> int:
+        """First index position whose digest is >= digest."""
+        low, high = 0, self._count
+        while low < high:
+            mid = (low + high) // 2
+            if self._digest_at(mid) < digest:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def position(self, identity: str) -> Optional[int]:
+        """Index position of an identity, or None if it is not packed."""
+        try:
+            digest = bytes.fromhex(identity)
+        except ValueError:
+            return None
+        position = self._lower_bound(digest)
+        if position < self._count and self._digest_at(position) == digest:
+            return position
+        return None
+
+    def identity_at(self, position: int) -> str:
+        return self._digest_at(position).hex()
+
+    def _find(self, identity: str) -> Optional[Tuple[int, int]]:
+        """Binary search the index for an identity; return (offset, length)."""
+        position = self.position(identity)
+        if position is None:
+            return None
+        _, offset, length = self._entry(position)
+        return offset, length
+
+    def find_by_prefix(self, prefix: str) -> Optional[str]:
+        """
+        Resolve a short identity (e.g. the 16-char file stem) to a full one.
+
+        Returns the first packed identity starting with the prefix.
+        """
+        prefix = prefix.lower()
+        try:
+            digest = bytes.fromhex(prefix[:len(prefix) & ~1])
+        except ValueError:
+            return None
+        position = self._lower_bound(digest)
+        if position < self._count:
+            identity = self.identity_at(position)
+            if identity.startswith(prefix):
+                return identity
+        return None
+
+    def get_bytes(self, identity: str) -> Optional[bytes]:
+        """Get the raw JSON payload for a block."""
+        location = self._find(identity)
+        if location is None:
+            return None
+        offset, length = location
+        return self._mmap[offset:offset + length]
+
+    def get_data(self, identity: str) -> Optional[Dict[str, Any]]:
+        """Get the block dictionary for an identity."""
+        raw = self.get_bytes(identity)
+        if raw is None:
+            return None
+        return json.loads(raw.decode("utf-8"))
+
+    def get_block(self, identity: str) -> Optional[NeuropBlock]:
+        """Get a fully constructed NeuropBlock for an identity."""
+        data = self.get_data(identity)
+        if data is None:
+            return None
+        return NeuropBlock.from_dict(data)
+
+    def header_at(self, position: int) -> BlockHeader:
+        """Parse the header stored for an index position."""
+        table = self.manifest["header_table_offset"]
+        offset, length = _HEADER_SPAN.unpack_from(
+            self._mmap, table + position * _HEADER_SPAN.size
+        )
+        return BlockHeader.from_dict(
+            json.loads(self._mmap[offset:offset + length].decode("utf-8"))
+        )
+
+    def get_header(self, identity: str) -> Optional[BlockHeader]:
+        """Get one block's header without parsing its payload."""
+        position = self.position(identity)
+        if position is None:
+            return None
+        return self.header_at(position)
+
+    def iter_headers(self) -> Iterator[Tuple[str, BlockHeader]]:
+        """Iterate (identity, header) pairs in index order."""
+        table = self.manifest["header_table_offset"]
+        for position, (offset, length) in enumerate(
+            _HEADER_SPAN.iter_unpack(self._mmap[table:table + self._count * _HEADER_SPAN.size])
+        ):
+            yield self.identity_at(position), BlockHeader.from_dict(
+                json.loads(self._mmap[offset:offset + length].decode("utf-8"))
+            )
+
+    def get_headers(self) -> Dict[str, BlockHeader]:
+        """Get the header of every block, keyed by identity."""
+        return dict(self.iter_headers())
+
+    def _name_entry(self, rank: int) -> Tuple[bytes, int]:
+        name_offset, name_length, position = _NAME_ENTRY.unpack_from(
+            self._mmap, self.manifest["name_table_offset"] + rank * _NAME_ENTRY.size
+        )
+        return self._mmap[name_offset:name_offset + name_length], position
+
+    def find_all_by_name(self, name: str) -> List[str]:
+        """
+        Get the identities of every block with a name, best first.
+
+        The registry's block for that name comes first (if a registry was
+        packed), then the rest in index order.
+        """
+        target = name.encode("utf-8")
+        low, high = 0, self._count
+        while low < high:
+            mid = (low + high) // 2
+            if self._name_entry(mid)[0] < target:
+                low = mid + 1
+            else:
+                high = mid
+        found = []
+        while low < self._count:
+            raw, position = self._name_entry(low)
+            if raw != target:
+                break
+            found.append(self.identity_at(position))
+            low += 1
+        return found
+
+    def find_by_name(self, name: str) -> Optional[str]:
+        """
+        Get the identity of a block by name.
+
+        When several blocks share a name, the registry's block for that
+        name wins (if a registry was packed), otherwise the first in index
+        order.
+        """
+        found = self.find_all_by_name(name)
+        return found[0] if found else None
+
+    def registry_names(self) -> Dict[str, str]:
+        """Map block name -> preferred id from the registry packed with this archive."""
+        info = self.manifest.get("flags", {}).get("verified")
+        if info is None:
+            return {}
+        return read_registry_names(Path(info["source"]).parent)
+
+    def flag_names(self) -> List[str]:
+        """Registry flags packed into this archive (e.g. "verified")."""
+        return sorted(self.manifest.get("flags", {}))
+
+    def flag_is_fresh(self, flag: str) -> bool:
+        """Check that a flag's registry file is unchanged since packing."""
+        info = self.manifest.get("flags", {}).get(flag)
+        if info is None:
+            return False
+        try:
+            return os.stat(info["source"]).st_mtime_ns == info["source_mtime_ns"]
+        except OSError:
+            return False
+
+    def has_flag(self, flag: str, identity: str) -> bool:
+        """Check a block's bit in a flag bitset."""
+        info = self.manifest.get("flags", {}).get(flag)
+        if info is None:
+            return False
+        position = self.position(identity)
+        return position is not None and bit_is_set(self._mmap, position, info["offset"])
+
+    def flag_count(self, flag: str) -> int:
+        info = self.manifest.get("flags", {}).get(flag)
+        return info["count"] if info is not None else 0
+
+    def flag_bitmap(self, flag: str) -> bytes:
+        """A flag bitset, one bit per index position (empty if not packed)."""
+        info = self.manifest.get("flags", {}).get(flag)
+        if info is None:
+            return b""
+        start = info["offset"]
+        return self._mmap[start:start + (self._count + 7) // 8]
+
+    def iter_flagged(self, flag: str) -> Iterator[str]:
+        """Iterate the identities whose bit is set in a flag bitset."""
+        for position in iter_bit_positions(self.flag_bitmap(flag)):
+            yield self.identity_at(position)
+
+    def identities(self) -> Iterator[str]:
+        """Iterate block identities in index (digest) order."""
+        for position in range(self._count):
+            yield self._entry(position)[0].hex()
+
+    def iter_records(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Iterate (identity, block dict) pairs in index order."""
+        for position in range(self._count):
+            digest, offset, length = self._entry(position)
+            raw = self._mmap[offset:offset + length]
+            yield digest.hex(), json.loads(raw.decode("utf-8"))
+
+    def is_fresh(self, library_path: Union[str, Path]) -> bool:
+        """
+        Check whether the archive still matches a library directory.
+
+        Only directory entries are stat'ed; no block file is opened. The
+        (name, size, mtime) of every file must match the packed library,
+        so a file replaced by an older copy is caught too. A missing or
+        empty directory means the archive is the library (e.g. a
+        container image that ships only the archive).
+        """
+        library = Path(library_path)
+        if not library.is_dir():
+            return True
+        scan = scan_block_files(library)
+        if not scan:
+            return True
+        return scan_fingerprint(scan) == self.manifest.get("source_fingerprint")
+
+
+class ArchiveHeaderCatalog(MutableMapping):
+    """
+    Identity -> BlockHeader mapping read from an archive's mmap'd header table.
+
+    Nothing is materialized per process: every lookup parses one header from
+    the shared mapping. Changes made after the archive was packed (new,
+    re-described or removed blocks found by BlockStore.refresh) are kept in
+    a small in-process overlay.
+    """
+
+    def __init__(self, archive: PackedLibrary):
+        self._archive = archive
+        self._overlay: Dict[str, BlockHeader] = {}
+        self._removed: Set[str] = set()
+        self._registry_names: Optional[Dict[str, str]] = None
+
+    @property
+    def archive(self) -> PackedLibrary:
+        return self._archive
+
+    def copy(self) -> "ArchiveHeaderCatalog":
+        """A catalog over the same archive with its own overlay."""
+        catalog = ArchiveHeaderCatalog(self._archive)
+        catalog._overlay = dict(self._overlay)
+        catalog._removed = set(self._removed)
+        catalog._registry_names = self._registry_names
+        return catalog
+
+    def __getitem__(self, identity: str) -> BlockHeader:
+        header = self._overlay.get(identity)
+        if header is not None:
+            return header
+        if identity not in self._removed:
+            header = self._archive.get_header(identity)
+            if header is not None:
+                return header
+        raise KeyError(identity)
+
+    def __setitem__(self, identity: str, header: BlockHeader) -> None:
+        self._overlay[identity] = header
+        self._removed.discard(identity)
+
+    def __delitem__(self, identity: str) -> None:
+        if identity not in self:
+            raise KeyError(identity)
+        self._overlay.pop(identity, None)
+        if self._archive.position(identity) is not None:
+            self._removed.add(identity)
+
+    def __contains__(self, identity: object) -> bool:
+        if identity in self._overlay:
+            return True
+        return identity not in self._removed and identity in self._archive
+
+    def __iter__(self) -> Iterator[str]:
+        for identity in self._archive.identities():
+            if identity not in self._removed and identity not in self._overlay:
+                yield identity
+        yield from list(self._overlay)
+
+    def __len__(self) -> int:
+        added = sum(1 for i in self._overlay if self._archive.position(i) is None)
+        return len(self._archive) - len(self._removed) + added
+
+    def values(self) -> Iterator[BlockHeader]:  # type: ignore[override]
+        for _, header in self.items():
+            yield header
+
+    def items(self) -> Iterator[Tuple[str, BlockHeader]]:  # type: ignore[override]
+        for identity, header in self._archive.iter_headers():
+            if identity not in self._removed and identity not in self._overlay:
+                yield identity, header
+        yield from list(self._overlay.items())
+
+    def find_by_name(self, name: str) -> Optional[str]:
+        """
+        Identity of a block by name.
+
+        Uses the same rule as PackedLibrary.find_by_name over the archive
+        and the overlay together: the registry's block for the name wins,
+        otherwise the first in index order, with blocks added since packing
+        after every archived block.
+        """
+        packed = [
+            identity for identity in self._archive.find_all_by_name(name)
+            if identity not in self._removed and identity not in self._overlay
+        ]
+        refreshed = [identity for identity, header in self._overlay.items() if header.name == name]
+        if not refreshed:
+            return packed[0] if packed else None
+
+        if self._registry_names is None:
+            self._registry_names = self._archive.registry_names()
+        candidates = packed + refreshed
+        preferred = self._registry_names.get(name)
+        if preferred in candidates:
+            return preferred
+        added = len(self._archive)
+        order: Dict[str, int] = {}
+        for identity in candidates:
+            position = self._archive.position(identity)
+            if position is None:
+                position, added = added, added + 1
+            order[identity] = position
+        return min(candidates, key=order.__getitem__)
+
+    def find_by_prefix(self, prefix: str) -> Optional[str]:
+        """Full identity for a short identity prefix."""
+        for identity in self._overlay:
+            if identity.startswith(prefix):
+                return identity
+        identity = self._archive.find_by_prefix(prefix)
+        if identity is not None and identity not in self._removed:
+            return identity
+        return None
+
+
+class ArchiveFlagSet(PositionBitset):
+    """
+    Read-only set of the identities flagged in an archive bitset.
+
+    The bitset is copied out of the mapping on first use (one bit per
+    block), so membership is an index lookup plus one byte test.
+    """
+
+    __slots__ = ("_archive", "_flag", "_bits")
+
+    def __init__(self, archive: PackedLibrary, flag: str):
+        self._archive = archive
+        self._flag = flag
+        self._bits: Optional[bytes] = None
+
+    def _position(self, identity: str) -> Optional[int]:
+        return self._archive.position(identity)
+
+    def _identity_at(self, position: int) -> Optional[str]:
+        return self._archive.identity_at(position)
+
+    def _bitmap(self) -> bytes:
+        if self._bits is None:
+            self._bits = self._archive.flag_bitmap(self._flag)
+        return self._bits
+
+    def __len__(self) -> int:
+        return self._archive.flag_count(self._flag)
+
+
+def open_library_archive(
+    library_path: Union[str, Path],
+    archive_path: Optional[Union[str, Path]] = None,
+) -> Optional[PackedLibrary]:
+    """
+    Open the archive for a library if it exists and is up to date.
+
+    Returns None when there is no archive, it is unreadable, or the library
+    directory has changed since it was packed - callers then fall back to
+    reading the JSON files.
+    """
+    path = Path(archive_path) if archive_path else default_archive_path(library_path)
+    if not path.is_file():
+        return None
+    try:
+        archive = PackedLibrary(path)
+    except (OSError, ArchiveFormatError):
+        return None
+    try:
+        fresh = archive.is_fresh(library_path)
+    except (OSError, ValueError):
+        fresh = False
+    if not fresh:
+        archive.close()
+        return None
+    return archive
+
+
+def iter_block_records(
+    library_path: Union[str, Path],
+    errors: Optional[List[str]] = None,
+    workers: Optional[int] = 1,
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Iterate (file stem, block dict) for every block in a library.
+
+    Reads from the packed archive when one is available and fresh,
+    otherwise from the individual JSON files (in name order, across
+    `workers` processes). Unreadable files are reported into `errors`
+    when given.
+    """
+    archive = open_library_archive(library_path)
+    if archive is not None:
+        with archive:
+            for identity, data in archive.iter_records():
+                yield identity[:16], data
+        return
+
+    loaded = load_library_files(library_path, LoadTarget.DATA, workers=workers)
+    if errors is not None:
+        errors.extend(str(e) for e in loaded.errors)
+    yield from loaded.records
+
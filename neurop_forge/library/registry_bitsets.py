@@ -0,0 +1,422 @@
+"""
+Bitset-backed block registries.
+
+The verification and tier registries are per-block JSON objects keyed by
+64-char hex ids, and every consumer used to turn them into Python sets of
+those strings. Here each block gets a dense ordinal instead, and a
+registry flag (verified, tier A, ...) is one integer bitmask over those
+ordinals: a few hundred bytes for the whole library. Intersections and
+unions are single bitwise operations; a membership test is one ordinal
+lookup and one byte test (bitsets.PositionBitset, shared with the flag
+bitsets packed into an archive).
+
+- OrdinalTable:    identity <-> ordinal numbering (append-only)
+- BlockBitset:     read-only set view of a bitmask over an OrdinalTable
+- RegistryBitsets: every registry flag for a library, persisted as a
+                   binary sidecar next to the registry files
+                   (.neurop_verified/registry.bits) and rebuilt when the
+                   registry files or the library change
+"""
+
+import json
+import struct
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+from neurop_forge.core.block_schema import PurityLevel
+from neurop_forge.library.bitsets import (
+    PositionBitset,
+    iter_bit_positions,
+    popcount,
+    to_bitmap,
+)
+from neurop_forge.library.block_header import BlockHeader
+from neurop_forge.library.change_manifest import scan_block_files, scan_fingerprint
+from neurop_forge.library.packed_archive import REGISTRY_FLAG_FILES, read_registry_flags
+from neurop_forge.library.parallel_loader import LoadTarget, load_library_files
+
+
+SIDECAR_MAGIC = b"NPFBITS\x00"
+SIDECAR_FORMAT_VERSION = 1
+SIDECAR_NAME = "registry.bits"
+
+# Flags read from the registry files, then flags derived from block headers.
+REGISTRY_BITSET_FLAGS = tuple(REGISTRY_FLAG_FILES) + ("pure", "deterministic")
+
+# magic, format version, block count, manifest length
+_SIDECAR_HEADER = struct.Struct("<8sIII")
+_DIGEST_SIZE = 32
+
+class OrdinalTable:
+    """
+    Dense identity <-> ordinal numbering.
+
+    Ordinals are handed out in insertion order and never reused, so a
+    bitmask built against the table stays valid as blocks are added.
+    Discarded identities leave a hole that iteration skips.
+    """
+
+    def __init__(self, identities: Iterable[str] = ()):
+        self._ordinals: Dict[str, int] = {}
+        self._identities: List[Optional[str]] = []
+        for identity in identities:
+            self.add(identity)
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    def __contains__(self, identity: object) -> bool:
+        return identity in self._ordinals
+
+    @property
+    def capacity(self) -> int:
+        """Ordinals handed out so far (including holes)."""
+        return len(self._identities)
+
+    def add(self, identity: str) -> int:
+        """Get the ordinal of an identity, numbering it if new."""
+        ordinal = self._ordinals.get(identity)
+        if ordinal is None:
+            ordinal = len(self._identities)
+            self._ordinals[identity] = ordinal
+            self._identities.append(identity)
+        return ordinal
+
+    def discard(self, identity: str) -> Optional[int]:
+        """Forget an identity, returning its former ordinal."""
+        ordinal = self._ordinals.pop(identity, None)
+        if ordinal is not None:
+            self._identities[ordinal] = None
+        return ordinal
+
+    def get(self, identity: object) -> Optional[int]:
+        return self._ordinals.get(identity)  # type: ignore[arg-type]
+
+    def copy(self) -> "OrdinalTable":
+        """An independent table with the same numbering."""
+        table = OrdinalTable()
+        table._ordinals = dict(self._ordinals)
+        table._identities = list(self._identities)
+        return table
+
+    def identity(self, ordinal: int) -> Optional[str]:
+        if 0 <= ordinal < len(self._identities):
+            return self._identities[ordinal]
+        return None
+
+    def identities(self) -> List[str]:
+        """Numbered identities in ordinal order."""
+        return [identity for identity in self._identities if identity is not None]
+
+    def bit(self, identity: object) -> int:
+        """Mask with only this identity's bit set (0 if not numbered)."""
+        ordinal = self._ordinals.get(identity)  # type: ignore[arg-type]
+        return 0 if ordinal is None else 1 << ordinal
+
+    def mask(self, identities: Iterable[str]) -> int:
+        """Mask of the numbered identities among `identities`."""
+        if isinstance(identities, BlockBitset) and identities.table is self:
+            return identities.bits
+        bits = 0
+        for identity in identities:
+            ordinal = self._ordinals.get(identity)
+            if ordinal is not None:
+                bits |= 1 << ordinal
+        return bits
+
+    def iter_bits(self, bits: int) -> Iterator[str]:
+        """Identities whose bits are set, in ordinal order."""
+        identities = self._identities
+        for ordinal in iter_bit_positions(to_bitmap(bits)):
+            identity = identities[ordinal]
+            if identity is not None:
+                yield identity
+
+
+class BlockBitset(PositionBitset):
+    """
+    Read-only set of block identities backed by a bitmask.
+
+    &, |, - and ^ with another BlockBitset over the same table are single
+    bitwise operations; with any other set they fall back to the generic
+    set algorithms. Membership and iteration read the mask as bytes,
+    converted once on first use.
+    """
+
+    __slots__ = ("_table", "_bits", "_bytes")
+
+    def __init__(self, table: OrdinalTable, bits: int = 0):
+        self._table = table
+        self._bits = bits
+        self._bytes: Optional[bytes] = None
+
+    @property
+    def table(self) -> OrdinalTable:
+        return self._table
+
+    @property
+    def bits(self) -> int:
+        return self._bits
+
+    def _position(self, identity: str) -> Optional[int]:
+        return self._table.get(identity)
+
+    def _identity_at(self, ordinal: int) -> Optional[str]:
+        return self._table.identity(ordinal)
+
+    def _bitmap(self) -> bytes:
+        if self._bytes is None:
+            self._bytes = to_bitmap(self._bits)
+        return self._bytes
+
+    def __len__(self) -> int:
+        return popcount(self._bits)
+
+    def _same_table(self, other: object) -> bool:
+        return isinstance(other, BlockBitset) and other._table is self._table
+
+    def __and__(self, other):  # type: ignore[override]
+        if self._same_table(other):
+            return BlockBitset(self._table, self._bits & other._bits)
+        return super().__and__(other)
+
+    def __or__(self, other):  # type: ignore[override]
+        if self._same_table(other):
+            return BlockBitset(self._table, self._bits | other._bits)
+        return super().__or__(other)
+
+    def __sub__(self, other):  # type: ignore[override]
+        if self._same_table(other):
+            return BlockBitset(self._table, self._bits & ~other._bits)
+        return super().__sub__(other)
+
+    def __xor__(self, other):  # type: ignore[override]
+        if self._same_table(other):
+            return BlockBitset(self._table, self._bits ^ other._bits)
+        return super().__xor__(other)
+
+    __rand__ = __and__
+    __ror__ = __or__
+
+    def __eq__(self, other: object) -> bool:
+        if self._same_table(other):
+            return self._bits == other._bits  # type: ignore[union-attr]
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"BlockBitset({len(self)} blocks)"
+
+
+def _registry_sources(registry_dir: Path) -> Dict[str, List[int]]:
+    """(size, mtime_ns) of each registry file that exists."""
+    sources: Dict[str, List[int]] = {}
+    for file_name in sorted(set(REGISTRY_FLAG_FILES.values())):
+        try:
+            stat = (registry_dir / file_name).stat()
+        except OSError:
+            continue
+        sources[file_name] = [stat.st_size, stat.st_mtime_ns]
+    return sources
+
+
+def _library_source(library_path: Optional[Path]) -> Dict[str, Any]:
+    """Block file count and (name, size, mtime) fingerprint of a library directory."""
+    if library_path is None:
+        return {}
+    scan = scan_block_files(library_path)
+    return {
+        "path": str(library_path),
+        "files": len(scan),
+        "fingerprint": scan_fingerprint(scan),
+    }
+
+
+@dataclass
+class RegistryBitsets:
+    """Registry flags of one library as bitmasks over dense block ordinals."""
+    table: OrdinalTable
+    flags: Dict[str, int] = field(default_factory=dict)
+    sources: Dict[str, Any] = field(default_factory=dict)
+    _flag_sets: Dict[str, BlockBitset] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def flag(self, name: str) -> BlockBitset:
+        """The identities carrying a flag (empty if the flag is unknown)."""
+        bits = self.flags.get(name, 0)
+        bitset = self._flag_sets.get(name)
+        if bitset is None or bitset.bits is not bits:
+            bitset = BlockBitset(self.table, bits)
+            self._flag_sets[name] = bitset
+        return bitset
+
+    def has(self, name: str, identity: str) -> bool:
+        return identity in self.flag(name)
+
+    def is_fresh(self, registry_dir: Union[str, Path], library_path: Optional[Union[str, Path]]) -> bool:
+        """Check that neither the registry files nor the library changed."""
+        library = Path(library_path) if library_path is not None else None
+        return (
+            self.sources.get("registry") == _registry_sources(Path(registry_dir))
+            and self.sources.get("library") == _library_source(library)
+        )
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            "blocks": len(self.table),
+            "flags": {name: popcount(bits) for name, bits in sorted(self.flags.items())},
+            "bytes_per_flag": (self.table.capacity + 7) // 8,
+        }
+
+    def to_bytes(self) -> bytes:
+        """Serialize as: header, manifest JSON, sorted digests, bitsets."""
+        identities = self.table.identities()
+        if [self.table.get(identity) for identity in identities] != list(range(len(identities))):
+            # Compact holes so ordinals are dense again.
+            table = OrdinalTable(identities)
+            flags = {
+                name: table.mask(self.table.iter_bits(bits))
+                for name, bits in self.flags.items()
+            }
+            return RegistryBitsets(table, flags, self.sources).to_bytes()
+
+        width = (len(identities) + 7) // 8
+        flag_offsets: Dict[str, List[int]] = {}
+        bitsets = bytearray()
+        for name in sorted(self.flags):
+            flag_offsets[name] = [len(bitsets), width]
+            bitsets += self.flags[name].to_bytes(width, "little")
+        manifest = json.dumps(
+            {"sources": self.sources, "flags": flag_offsets}, sort_keys=True
+        ).encode("utf-8")
+        digests = b"".join(bytes.fromhex(identity) for identity in identities)
+        header = _SIDECAR_HEADER.pack(
+            SIDECAR_MAGIC, SIDECAR_FORMAT_VERSION, len(identities), len(manifest)
+        )
+        return header + manifest + digests + bytes(bitsets)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "RegistryBitsets":
+        magic, version, count, manifest_length = _SIDECAR_HEADER.unpack_from(data, 0)
+        if magic != SIDECAR_MAGIC:
+            raise ValueError("Not a registry bitset sidecar")
+        if version != SIDECAR_FORMAT_VERSION:
+            raise ValueError(f"Unsupported registry bitset version {version}")
+        offset = _SIDECAR_HEADER.size
+        manifest = json.loads(data[offset:offset + manifest_length])
+        offset += manifest_length
+        digest_end = offset + count * _DIGEST_SIZE
+        if len(data) < digest_end:
+            raise ValueError("Truncated registry bitset sidecar")
+        table = OrdinalTable(
+            data[start:start + _DIGEST_SIZE].hex()
+            for start in range(offset, digest_end, _DIGEST_SIZE)
+        )
+        flags = {
+            name: int.from_bytes(
+                data[digest_end + start:digest_end + start + length], "little"
+            )
+            for name, (start, length) in manifest["flags"].items()
+        }
+        return cls(table=table, flags=flags, sources=manifest["sources"])
+
+    def save(self, path: Union[str, Path]) -> bool:
+        """Write the sidecar atomically; returns False if it could not be written."""
+        path = Path(path)
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            tmp_path.write_bytes(self.to_bytes())
+            tmp_path.replace(path)
+            return True
+        except (OSError, ValueError):
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            return False
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> Optional["RegistryBitsets"]:
+        """Read a sidecar; None if it is missing or unreadable."""
+        try:
+            return cls.from_bytes(Path(path).read_bytes())
+        except (OSError, ValueError, KeyError, struct.error):
+            return None
+
+
+def build_registry_bitsets(
+    headers: Iterable[BlockHeader],
+    registry_dir: Union[str, Path] = ".neurop_verified",
+    library_path: Optional[Union[str, Path]] = None,
+) -> RegistryBitsets:
+    """
+    Number the blocks and build every registry flag.
+
+    Blocks are numbered in identity order; registry ids that are not in
+    the library are numbered after them so membership is preserved.
+    """
+    registry = Path(registry_dir)
+    headers = list(headers)
+    registry_flags = read_registry_flags(registry)
+
+    identities = sorted({header.identity for header in headers})
+    extra = set().union(*registry_flags.values()) - set(identities) if registry_flags else set()
+    table = OrdinalTable(identities + sorted(extra))
+
+    flags = {name: table.mask(ids) for name, ids in registry_flags.items()}
+    pure = PurityLevel.PURE.value
+    flags["pure"] = table.mask(h.identity for h in headers if h.purity == pure)
+    flags["deterministic"] = table.mask(h.identity for h in headers if h.deterministic)
+
+    library = Path(library_path) if library_path is not None else None
+    return RegistryBitsets(
+        table=table,
+        flags=flags,
+        sources={
+            "registry": _registry_sources(registry),
+            "library": _library_source(library),
+        },
+    )
+
+
+def load_registry_bitsets(
+    registry_dir: Union[str, Path] = ".neurop_verified",
+    library_path: Optional[Union[str, Path]] = ".neurop_expanded_library",
+    headers: Optional[Callable[[], Iterable[BlockHeader]]] = None,
+    write_sidecar: bool = True,
+) -> RegistryBitsets:
+    """
+    Load the registry bitsets sidecar, rebuilding it when stale.
+
+    Args:
+        registry_dir: Directory holding registry.json / tier_registry.json
+        library_path: Library directory the blocks come from (for staleness)
+        headers: Returns the library's block headers; only called on a
+                 rebuild (default: read them from library_path)
+        write_sidecar: Persist a rebuilt sidecar for the next process
+
+    Returns:
+        RegistryBitsets for the current registry files and library
+    """
+    sidecar = Path(registry_dir) / SIDECAR_NAME
+    bitsets = RegistryBitsets.load(sidecar)
+    if bitsets is not None and bitsets.is_fresh(registry_dir, library_path):
+        return bitsets
+
+    if headers is not None:
+        block_headers: Iterable[BlockHeader] = headers()
+    elif library_path is not None and Path(library_path).is_dir():
+        block_headers = [
+            header for _, header in
+            load_library_files(library_path, LoadTarget.HEADER, workers=1).records
+        ]
+    else:
+        block_headers = []
+
+    bitsets = build_registry_bitsets(block_headers, registry_dir, library_path)
+    if write_sidecar and Path(registry_dir).is_dir():
+        bitsets.save(sidecar)
+    return bitsets
@@ -0,0 +1,1011 @@
+"""
+SQLite-backed block storage.
+
+An alternative to the JSON-directory BlockStore that keeps the library in
+one local SQLite database:
+
+- blocks:      one row per block; header and interface fields in indexed
+               columns, the canonical block JSON in a blob
+- block_types:    (direction, data type) -> identity, for type matching
+- block_keywords: index keyword -> identity
+- block_tags:     tag -> identity
+- blocks_fts:     FTS5 trigram table over name, description, intent, tags
+                  and index keywords (rowid = blocks.rowid)
+- quarantine:     quarantined blocks and the reason
+
+Lookups by identity, category, intent and keyword are indexed queries
+instead of Python scans. The trigram tokenizer answers substring queries
+from the index, so matching keeps the in-memory semantics ("word in
+keyword", "kw in intent"). store() and quarantine() are single transactions,
+and any number of processes can read the database concurrently (WAL mode)
+with no external service. Blocks are hydrated from their blob on get() and
+kept in an LRU cache.
+
+SQLiteBlockIndexer runs BlockIndexer queries against the same database, so
+search() no longer needs per-process keyword indexes.
+
+If the SQLite build lacks FTS5 trigram support (SQLite < 3.34), and for
+terms shorter than three characters, substring queries fall back to scans.
+"""
+
+import copy
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from neurop_forge.core.block_schema import NeuropBlock
+from neurop_forge.library.block_header import BlockHeader
+from neurop_forge.library.block_store import RefreshResult, StoreResult, StoreStatus
+from neurop_forge.library.indexer import BlockIndexer, IndexEntry, build_index_entry
+from neurop_forge.library.parallel_loader import (
+    LoadError,
+    LoadResult,
+    LoadTarget,
+    load_library_files,
+)
+
+
+SCHEMA_VERSION = 1
+DATABASE_SUFFIX = ".sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS blocks (
+    rowid INTEGER PRIMARY KEY,
+    identity TEXT NOT NULL UNIQUE,
+    short_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    category TEXT NOT NULL,
+    description TEXT NOT NULL,
+    intent TEXT NOT NULL,
+    language TEXT NOT NULL,
+    tags TEXT NOT NULL,
+    keywords TEXT NOT NULL,
+    inputs TEXT NOT NULL,
+    outputs TEXT NOT NULL,
+    purity TEXT NOT NULL,
+    is_pure INTEGER NOT NULL,
+    deterministic INTEGER NOT NULL,
+    trust_score REAL NOT NULL,
+    stored_at TEXT NOT NULL,
+    payload BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS blocks_short_id ON blocks (short_id);
+CREATE INDEX IF NOT EXISTS blocks_name ON blocks (name);
+CREATE INDEX IF NOT EXISTS blocks_category ON blocks (category, trust_score DESC);
+CREATE INDEX IF NOT EXISTS blocks_trust ON blocks (trust_score DESC);
+CREATE TABLE IF NOT EXISTS block_types (
+    direction TEXT NOT NULL,
+    data_type TEXT NOT NULL,
+    identity TEXT NOT NULL,
+    PRIMARY KEY (direction, data_type, identity)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS block_types_identity ON block_types (identity);
+CREATE TABLE IF NOT EXISTS block_keywords (
+    keyword TEXT NOT NULL,
+    identity TEXT NOT NULL,
+    PRIMARY KEY (keyword, identity)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS block_tags (
+    tag TEXT NOT NULL,
+    identity TEXT NOT NULL,
+    PRIMARY KEY (tag, identity)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS quarantine (
+    identity TEXT PRIMARY KEY,
+    reason TEXT NOT NULL,
+    quarantined_at TEXT NOT NULL,
+    payload BLOB NOT NULL
+);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS blocks_fts USING fts5 (
+    name, description, intent, tags, keywords,
+    tokenize = 'trigram'
+);
+"""
+
+_HEADER_COLUMNS = (
+    "identity, name, category, description, intent, language, tags, "
+    "inputs, outputs, deterministic, purity, trust_score"
+)
+_ENTRY_COLUMNS = (
+    "identity, name, intent, category, keywords, inputs, outputs, "
+    "is_pure, deterministic, trust_score, language"
+)
+
+# Shortest term the trigram index can answer.
+_TRIGRAM = 3
+# Most substrings of the query words looked up in the keyword table per
+# search; words past the cap are matched with an instr() scan of it.
+_MAX_CONTAINED_TERMS = 256
+
+
+def default_database_path(library_path: Union[str, Path]) -> Path:
+    """Get the database path that sits next to a library directory."""
+    library = Path(library_path)
+    return library.with_name(library.name + DATABASE_SUFFIX)
+
+
+def _fts_phrase(text: str) -> str:
+    """Quote text as an FTS5 phrase (a substring query under trigram)."""
+    return '"' + text.replace('"', '""') + '"'
+
+
+def _substring_count(length: int, max_length: int) -> int:
+    """Number of substrings (with repeats) of up to max_length characters."""
+    return sum(length - size + 1 for size in range(1, min(length, max_length) + 1))
+
+
+def _substrings(word: str, max_length: int) -> Set[str]:
+    """Distinct substrings of a word of up to max_length characters."""
+    return {
+        word[start:start + size]
+        for size in range(1, min(len(word), max_length) + 1)
+        for start in range(len(word) - size + 1)
+    }
+
+
+class SQLiteBlockStore:
+    """
+    Block storage in a local SQLite database.
+
+    Drop-in alternative to BlockStore for the orchestrator: same store,
+    quarantine, get, header and statistics methods, plus search queries
+    used by SQLiteBlockIndexer.
+
+    Unlike BlockStore.refresh(), refresh() picks up blocks written by
+    other processes, not JSON files edited on disk; use import_library()
+    to load a directory.
+    """
+
+    def __init__(
+        self,
+        database_path: Union[str, Path] = ".neurop_library" + DATABASE_SUFFIX,
+        hydrated_cache_size: Optional[int] = None,
+    ):
+        """
+        Args:
+            database_path: SQLite database file (created if missing)
+            hydrated_cache_size: Max hydrated blocks kept (None = unbounded)
+        """
+        self._database_path = Path(database_path)
+        self._hydrated_cache_size = hydrated_cache_size
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._blocks: "OrderedDict[str, NeuropBlock]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._load_errors: Dict[str, LoadError] = {}
+        self._refresh_lock = threading.Lock()
+
+        self._database_path.parent.mkdir(parents=True, exist_ok=True)
+        self._has_fts = self._create_schema()
+        self._known: Set[str] = set()
+        self._known_rowid = 0
+        # Longest index keyword; no longer substring of a query word can match.
+        self._max_keyword_length = 0
+        self._sync_known()
+
+    @property
+    def database_path(self) -> Path:
+        return self._database_path
+
+    @property
+    def has_fts(self) -> bool:
+        """Whether keyword queries use FTS5 (False = LIKE fallback)."""
+        return self._has_fts
+
+    @property
+    def is_lazy(self) -> bool:
+        return True
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get this thread's connection (SQLite connections are per thread)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Closed from whichever thread calls close(); never shared otherwise.
+            conn = sqlite3.connect(
+                str(self._database_path), timeout=30.0, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def _create_schema(self) -> bool:
+        """Create tables and indexes; returns whether FTS5 is available."""
+        conn = self._connect()
+        with conn:
+            conn.executescript(_SCHEMA)
+            row = conn.execute(
+                "SELECT value FROM meta WHERE key = 'schema_version'"
+            ).fetchone()
+            if row is None:
+                conn.execute(
+                    "INSERT INTO meta (key, value) VALUES ('schema_version', ?)",
+                    (str(SCHEMA_VERSION),),
+                )
+            elif int(row[0]) != SCHEMA_VERSION:
+                raise ValueError(
+                    f"{self._database_path}: schema version {row[0]}, "
+                    f"expected {SCHEMA_VERSION}"
+                )
+        try:
+            with conn:
+                conn.executescript(_FTS_SCHEMA)
+            return True
+        except sqlite3.OperationalError:
+            return False
+
+    def _sync_known(self) -> Tuple[List[str], List[str]]:
+        """Update the known identities; returns (added, removed) since the last sync."""
+        conn = self._connect()
+        added = [
+            row[0] for row in conn.execute(
+                "SELECT identity FROM blocks WHERE rowid > ? ORDER BY rowid",
+                (self._known_rowid,),
+            )
+            if row[0] not in self._known
+        ]
+        self._known.update(added)
+        max_rowid = conn.execute("SELECT MAX(rowid) FROM blocks").fetchone()[0] or 0
+        self._known_rowid = max(self._known_rowid, max_rowid)
+
+        removed: List[str] = []
+        if len(self._known) != self.count():
+            current = {row[0] for row in conn.execute("SELECT identity FROM blocks")}
+            removed = sorted(self._known - current)
+            self._known = current
+        if added or removed:
+            self._max_keyword_length = conn.execute(
+                "SELECT COALESCE(MAX(length(keyword)), 0) FROM block_keywords"
+            ).fetchone()[0]
+        return added, removed
+
+    def _insert_block(
+        self,
+        conn: sqlite3.Connection,
+        block: NeuropBlock,
+        stored_at: str,
+    ) -> bool:
+        """Insert a block, its type rows and its FTS row; False if it exists."""
+        identity = block.get_identity_hash()
+        entry = build_index_entry(block)
+        metadata = block.metadata
+        inputs = [[p.name, p.data_type.value] for p in block.interface.inputs]
+        outputs = [[p.name, p.data_type.value] for p in block.interface.outputs]
+        payload = json.dumps(block.to_dict(), sort_keys=True, separators=(",", ":"))
+        try:
+            cursor = conn.execute(
+                "INSERT INTO blocks (identity, short_id, name, category, description, "
+                "intent, language, tags, keywords, inputs, outputs, purity, is_pure, "
+                "deterministic, trust_score, stored_at, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    identity,
+                    identity[:16],
+                    metadata.name,
+                    metadata.category,
+                    metadata.description,
+                    metadata.intent,
+                    metadata.language,
+                    json.dumps(list(metadata.tags)),
+                    json.dumps(list(entry.keywords)),
+                    json.dumps(inputs),
+                    json.dumps(outputs),
+                    block.constraints.purity.value,
+                    int(entry.is_pure),
+                    int(entry.is_deterministic),
+                    entry.trust_score,
+                    stored_at,
+                    payload.encode("utf-8"),
+                ),
+            )
+        except sqlite3.IntegrityError:
+            return False
+
+        conn.executemany(
+            "INSERT OR IGNORE INTO block_types (direction, data_type, identity) "
+            "VALUES (?, ?, ?)",
+            [("input", t, identity) for t in entry.input_types]
+            + [("output", t, identity) for t in entry.output_types],
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO block_keywords (keyword, identity) VALUES (?, ?)",
+            [(keyword.lower(), identity) for keyword in entry.keywords],
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO block_tags (tag, identity) VALUES (?, ?)",
+            [(tag.lower(), identity) for tag in metadata.tags],
+        )
+        if self._has_fts:
+            conn.execute(
+                "INSERT INTO blocks_fts (rowid, name, description, intent, tags, keywords) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    cursor.lastrowid,
+                    metadata.name,
+                    metadata.description,
+                    metadata.intent,
+                    " ".join(metadata.tags),
+                    " ".join(keyword.lower() for keyword in entry.keywords),
+                ),
+            )
+        return True
+
+    def store(self, block: NeuropBlock) -> StoreResult:
+        """
+        Store a validated block in one transaction.
+
+        Args:
+            block: The block to store
+
+        Returns:
+            StoreResult with operation status
+        """
+        identity = block.get_identity_hash()
+        timestamp = datetime.now(timezone.utc).isoformat()
+
+        if self.exists(identity):
+            return StoreResult(
+                status=StoreStatus.ALREADY_EXISTS,
+                block_identity=identity,
+                storage_path=str(self._database_path),
+                timestamp=timestamp,
+                error_message=None,
+            )
+
+        if not self._verify_integrity(block):
+            return StoreResult(
+                status=StoreStatus.VALIDATION_FAILED,
+                block_identity=identity,
+                storage_path=None,
+                timestamp=timestamp,
+                error_message="Block integrity verification failed",
+            )
+
+        try:
+            conn = self._connect()
+            with conn:
+                inserted = self._insert_block(conn, block, timestamp)
+            if inserted:
+                self._known.add(identity)
+                self._max_keyword_length = max(
+                    [self._max_keyword_length]
+                    + [len(keyword) for keyword in build_index_entry(block).keywords]
+                )
+                self._cache_block(identity, block)
+            return StoreResult(
+                status=StoreStatus.STORED if inserted else StoreStatus.ALREADY_EXISTS,
+                block_identity=identity,
+                storage_path=str(self._database_path),
+                timestamp=timestamp,
+                error_message=None,
+            )
+        except Exception as e:
+            return StoreResult(
+                status=StoreStatus.STORAGE_ERROR,
+                block_identity=identity,
+                storage_path=None,
+                timestamp=timestamp,
+                error_message=str(e),
+            )
+
+    def quarantine(self, block: NeuropBlock, reason: str) -> StoreResult:
+        """
+        Quarantine an invalid block in one transaction.
+
+        Quarantined blocks are never exposed to AI assembly.
+
+        Args:
+            block: The block to quarantine
+            reason: Reason for quarantine
+
+        Returns:
+            StoreResult with operation status
+        """
+        identity = block.get_identity_hash()
+        timestamp = datetime.now(timezone.utc).isoformat()
+
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO quarantine "
+                    "(identity, reason, quarantined_at, payload) VALUES (?, ?, ?, ?)",
+                    (identity, reason, timestamp, block.to_json().encode("utf-8")),
+                )
+            return StoreResult(
+                status=StoreStatus.STORED,
+                block_identity=identity,
+                storage_path=str(self._database_path),
+                timestamp=timestamp,
+                error_message=None,
+            )
+        except Exception as e:
+            return StoreResult(
+                status=StoreStatus.STORAGE_ERROR,
+                block_identity=identity,
+                storage_path=None,
+                timestamp=timestamp,
+                error_message=str(e),
+            )
+
+    def import_blocks(self, blocks: Iterable[NeuropBlock]) -> int:
+        """
+        Store many blocks in a single transaction.
+
+        Blocks that fail integrity checks or already exist are skipped.
+
+        Returns:
+            Number of blocks inserted
+        """
+        timestamp = datetime.now(timezone.utc).isoformat()
+        inserted = 0
+        conn = self._connect()
+        with conn:
+            for block in blocks:
+                if self._verify_integrity(block) and self._insert_block(conn, block, timestamp):
+                    inserted += 1
+        self._sync_known()
+        return inserted
+
+    def import_library(
+        self,
+        library_path: Union[str, Path],
+        workers: Optional[int] = 1,
+    ) -> LoadResult:
+        """
+        Import every *.json block file of a library directory.
+
+        Args:
+            library_path: Directory of block JSON files
+            workers: Processes for loading JSON files (None = one per CPU)
+
+        Returns:
+            LoadResult of the directory load (failed files are also
+            reported by get_load_errors())
+        """
+        loaded = load_library_files(library_path, LoadTarget.BLOCK, workers=workers)
+        for error in loaded.errors:
+            self._load_errors[error.path] = error
+        self.import_blocks(block for _, block in loaded.records)
+        return loaded
+
+    def refresh(self) -> RefreshResult:
+        """
+        Pick up blocks stored or deleted by other processes.
+
+        Rows are never updated in place (identity = content hash), so only
+        additions and removals need to be detected.
+        """
+        start = time.perf_counter()
+        result = RefreshResult()
+        with self._refresh_lock:
+            result.added, result.removed = self._sync_known()
+        with self._cache_lock:
+            for identity in result.removed:
+                self._blocks.pop(identity, None)
+        result.duration_ms = (time.perf_counter() - start) * 1000
+        return result
+
+    def _hydrate(self, identity: str) -> Optional[NeuropBlock]:
+        """Build the full block from its stored payload."""
+        row = self._connect().execute(
+            "SELECT payload FROM blocks WHERE identity = ?", (identity,)
+        ).fetchone()
+        if row is None:
+            return None
+        try:
+            return NeuropBlock.from_dict(json.loads(row[0]))
+        except Exception as e:
+            path = f"{self._database_path}:{identity}"
+            self._load_errors[path] = LoadError(path=path, error=f"{type(e).__name__}: {e}")
+            return None
+
+    def _cache_block(self, identity: str, block: NeuropBlock) -> None:
+        """Insert a hydrated block, evicting the least recently used."""
+        with self._cache_lock:
+            self._blocks[identity] = block
+            self._blocks.move_to_end(identity)
+            if self._hydrated_cache_size is not None:
+                while len(self._blocks) > self._hydrated_cache_size:
+                    self._blocks.popitem(last=False)
+
+    def get_load_errors(self) -> List[LoadError]:
+        """Get the blocks that failed to load or hydrate."""
+        return list(self._load_errors.values())
+
+    def copy(self) -> "SQLiteBlockStore":
+        """
+        Another store over the same database, with its own connections,
+        known-identity set and hydrated-block cache.
+
+        The rows themselves are shared (the database is the library), so
+        a block stored through either store is visible to both; refresh()
+        on the copy only advances the copy's view of what changed.
+        """
+        with self._refresh_lock, self._cache_lock:
+            store = copy.copy(self)
+            store._blocks = OrderedDict(self._blocks)
+            store._known = set(self._known)
+        store._local = threading.local()
+        store._connections = []
+        store._connections_lock = threading.Lock()
+        store._cache_lock = threading.Lock()
+        store._refresh_lock = threading.Lock()
+        store._cache_hits = 0
+        store._cache_misses = 0
+        store._load_errors = dict(self._load_errors)
+        return store
+
+    def close(self) -> None:
+        """Close every connection opened by this store."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+    def get(self, identity: str) -> Optional[NeuropBlock]:
+        """
+        Retrieve a block by identity.
+
+        Args:
+            identity: The block identity hash
+
+        Returns:
+            NeuropBlock if found, None otherwise
+        """
+        with self._cache_lock:
+            block = self._blocks.get(identity)
+            if block is not None:
+                self._blocks.move_to_end(identity)
+                self._cache_hits += 1
+                return block
+            self._cache_misses += 1
+
+        block = self._hydrate(identity)
+        if block is not None:
+            self._cache_block(identity, block)
+        return block
+
+    def find_by_prefix(self, short_id: str) -> Optional[str]:
+        """Resolve a short id (first 16 hex chars) to a full identity."""
+        row = self._connect().execute(
+            "SELECT identity FROM blocks WHERE short_id = ? LIMIT 1", (short_id,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def find_all_by_name(self, name: str) -> List[str]:
+        """Identities of blocks with this name, most trusted first."""
+        return [
+            row[0] for row in self._connect().execute(
+                "SELECT identity FROM blocks WHERE name = ? ORDER BY trust_score DESC",
+                (name,),
+            )
+        ]
+
+    def find_by_name(self, name: str) -> Optional[str]:
+        """Identity of the most trusted block with this name (BlockStore.find_by_name)."""
+        found = self.find_all_by_name(name)
+        return found[0] if found else None
+
+    def _header(self, row: Tuple[Any, ...]) -> BlockHeader:
+        return BlockHeader(
+            identity=row[0],
+            name=row[1],
+            category=row[2],
+            description=row[3],
+            intent=row[4],
+            language=row[5],
+            tags=tuple(json.loads(row[6])),
+            input_types=tuple((p[0], p[1]) for p in json.loads(row[7])),
+            output_types=tuple((p[0], p[1]) for p in json.loads(row[8])),
+            deterministic=bool(row[9]),
+            purity=row[10],
+            trust_score=row[11],
+        )
+
+    def get_header(self, identity: str) -> Optional[BlockHeader]:
+        """Get the header of a block without hydrating it."""
+        row = self._connect().execute(
+            f"SELECT {_HEADER_COLUMNS} FROM blocks WHERE identity = ?", (identity,)
+        ).fetchone()
+        return self._header(row) if row else None
+
+    def iter_headers(self) -> Iterator[BlockHeader]:
+        """Iterate headers of all stored blocks without hydrating them."""
+        rows = self._connect().execute(
+            f"SELECT {_HEADER_COLUMNS} FROM blocks ORDER BY rowid"
+        ).fetchall()
+        for row in rows:
+            yield self._header(row)
+
+    def identities(self) -> List[str]:
+        """Get identities of all stored blocks."""
+        return [
+            row[0] for row in
+            self._connect().execute("SELECT identity FROM blocks ORDER BY rowid")
+        ]
+
+    def _get_many(self, identities: List[str]) -> List[NeuropBlock]:
+        blocks = []
+        for identity in identities:
+            block = self.get(identity)
+            if block is not None:
+                blocks.append(block)
+        return blocks
+
+    def get_all(self) -> List[NeuropBlock]:
+        """Get all stored blocks (hydrates every block)."""
+        return self._get_many(self.identities())
+
+    def get_by_category(self, category: str) -> List[NeuropBlock]:
+        """Get blocks by category."""
+        return self._get_many([
+            row[0] for row in self._connect().execute(
+                "SELECT identity FROM blocks WHERE category = ? ORDER BY rowid",
+                (category,),
+            )
+        ])
+
+    def _substring_filter(
+        self,
+        terms: Iterable[str],
+        columns: Tuple[str, ...],
+    ) -> Tuple[str, List[Any]]:
+        """
+        SQL condition true when any term is a substring of any column.
+
+        Terms of three or more characters are answered by the trigram
+        index; shorter ones (or all, without FTS5) by instr() scans.
+        """
+        terms = sorted({t.lower() for t in terms if t})
+        clauses: List[str] = []
+        params: List[Any] = []
+        indexed = [t for t in terms if self._has_fts and len(t) >= _TRIGRAM]
+        if indexed:
+            clauses.append(
+                "rowid IN (SELECT rowid FROM blocks_fts WHERE blocks_fts MATCH ?)"
+            )
+            params.append(
+                "{" + " ".join(columns) + "} : ("
+                + " OR ".join(_fts_phrase(t) for t in indexed) + ")"
+            )
+        for term in terms:
+            if term in indexed:
+                continue
+            for column in columns:
+                clauses.append(f"instr(lower({column}), ?) > 0")
+                params.append(term)
+        if not clauses:
+            return "0", []
+        return "(" + " OR ".join(clauses) + ")", params
+
+    def _contained_keyword_filter(self, words: List[str]) -> Tuple[str, List[Any]]:
+        """
+        block_keywords condition true for keywords contained in any word.
+
+        A word's substrings no longer than the longest keyword are looked
+        up with the keyword primary key, up to _MAX_CONTAINED_TERMS in
+        total; remaining (long) words scan the keyword table with instr().
+        """
+        terms: Set[str] = set()
+        scanned: List[str] = []
+        budget = _MAX_CONTAINED_TERMS
+        for word in words:
+            count = _substring_count(len(word), self._max_keyword_length)
+            if count <= budget:
+                terms.update(_substrings(word, self._max_keyword_length))
+                budget -= count
+            else:
+                scanned.append(word)
+        clauses: List[str] = []
+        params: List[Any] = []
+        if terms:
+            clauses.append(f"keyword IN ({', '.join('?' * len(terms))})")
+            params.extend(sorted(terms))
+        for word in scanned:
+            clauses.append("instr(?, keyword) > 0")
+            params.append(word)
+        if not clauses:
+            return "0", []
+        return " OR ".join(clauses), params
+
+    def get_by_intent(self, intent_keywords: List[str]) -> List[NeuropBlock]:
+        """Get blocks matching intent keywords (BlockStore semantics)."""
+        keywords = [k.lower() for k in intent_keywords]
+        condition, params = self._substring_filter(keywords, ("intent", "name"))
+        if keywords:
+            placeholders = ", ".join("?" * len(keywords))
+            condition = (
+                f"({condition} OR identity IN "
+                f"(SELECT identity FROM block_tags WHERE tag IN ({placeholders})))"
+            )
+            params.extend(keywords)
+        return self._get_many([
+            row[0] for row in self._connect().execute(
+                f"SELECT identity FROM blocks WHERE {condition} ORDER BY rowid", params
+            )
+        ])
+
+    def _entry(self, row: Tuple[Any, ...]) -> IndexEntry:
+        return IndexEntry.from_dict({
+            "block_identity": row[0],
+            "name": row[1],
+            "intent": row[2],
+            "category": row[3],
+            "keywords": json.loads(row[4]),
+            "input_types": [p[1] for p in json.loads(row[5])],
+            "output_types": [p[1] for p in json.loads(row[6])],
+            "is_pure": bool(row[7]),
+            "is_deterministic": bool(row[8]),
+            "trust_score": row[9],
+            "language": row[10],
+        })
+
+    def search(
+        self,
+        query: str,
+        category: Optional[str] = None,
+        min_trust: float = 0.0,
+        require_pure: bool = False,
+        require_deterministic: bool = False,
+        input_types: Optional[List[str]] = None,
+        output_types: Optional[List[str]] = None,
+        limit: Optional[int] = 10,
+    ) -> List[IndexEntry]:
+        """
+        Search index entries (BlockIndexer.search semantics).
+
+        A query word matches a keyword that contains it (trigram index) or
+        that it contains (keyword table); all other criteria are indexed
+        column filters. Results are ordered by trust score, highest first.
+        """
+        conditions = ["trust_score >= ?"]
+        params: List[Any] = [min_trust]
+        words = sorted(set(query.lower().split())) if query else []
+        if words:
+            condition, keyword_params = self._substring_filter(words, ("keywords",))
+            contained_condition, contained_params = self._contained_keyword_filter(words)
+            conditions.append(
+                f"({condition} OR identity IN (SELECT identity FROM block_keywords "
+                f"WHERE {contained_condition}))"
+            )
+            params.extend(keyword_params)
+            params.extend(contained_params)
+        if category:
+            conditions.append("category = ?")
+            params.append(category)
+        if require_pure:
+            conditions.append("is_pure = 1")
+        if require_deterministic:
+            conditions.append("deterministic = 1")
+        for direction, types in (("input", input_types), ("output", output_types)):
+            for data_type in types or ():
+                conditions.append(
+                    "identity IN (SELECT identity FROM block_types "
+                    "WHERE direction = ? AND data_type = ?)"
+                )
+                params.extend([direction, data_type])
+
+        sql = (
+            f"SELECT {_ENTRY_COLUMNS} FROM blocks WHERE "
+            + " AND ".join(conditions)
+            + " ORDER BY trust_score DESC"
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [self._entry(row) for row in self._connect().execute(sql, params)]
+
+    def get_index_entry(self, identity: str) -> Optional[IndexEntry]:
+        """Get the index entry of a stored block."""
+        row = self._connect().execute(
+            f"SELECT {_ENTRY_COLUMNS} FROM blocks WHERE identity = ?", (identity,)
+        ).fetchone()
+        return self._entry(row) if row else None
+
+    def get_index_entries(self) -> List[IndexEntry]:
+        """Get the index entries of all stored blocks."""
+        return [
+            self._entry(row) for row in
+            self._connect().execute(f"SELECT {_ENTRY_COLUMNS} FROM blocks ORDER BY rowid")
+        ]
+
+    def get_categories(self) -> List[str]:
+        """Get all categories with at least one block."""
+        return [
+            row[0] for row in
+            self._connect().execute("SELECT DISTINCT category FROM blocks ORDER BY category")
+        ]
+
+    def exists(self, identity: str) -> bool:
+        """Check if a block exists."""
+        return self._connect().execute(
+            "SELECT 1 FROM blocks WHERE identity = ?", (identity,)
+        ).fetchone() is not None
+
+    def is_quarantined(self, identity: str) -> bool:
+        """Check if a block is quarantined."""
+        return self._connect().execute(
+            "SELECT 1 FROM quarantine WHERE identity = ?", (identity,)
+        ).fetchone() is not None
+
+    def count(self) -> int:
+        """Get total number of stored blocks."""
+        return self._connect().execute("SELECT COUNT(*) FROM blocks").fetchone()[0]
+
+    def _verify_integrity(self, block: NeuropBlock) -> bool:
+        """Verify block integrity."""
+        try:
+            if not block.identity:
+                return False
+            if not block.logic:
+                return False
+            if block.trust_score.overall_score <= 0:
+                return False
+            return True
+        except Exception:
+            return False
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get storage statistics."""
+        conn = self._connect()
+        total, average_trust = conn.execute(
+            "SELECT COUNT(*), AVG(trust_score) FROM blocks"
+        ).fetchone()
+        return {
+            "total_blocks": total,
+            "quarantined_blocks": conn.execute(
+                "SELECT COUNT(*) FROM quarantine"
+            ).fetchone()[0],
+            "load_errors": len(self._load_errors),
+            "categories": dict(conn.execute(
+                "SELECT category, COUNT(*) FROM blocks GROUP BY category"
+            ).fetchall()),
+            "languages": dict(conn.execute(
+                "SELECT language, COUNT(*) FROM blocks GROUP BY language"
+            ).fetchall()),
+            "average_trust": average_trust or 0.0,
+            "backend": "sqlite",
+            "database_path": str(self._database_path),
+            "full_text_search": self._has_fts,
+            "hydration": self.get_hydration_statistics(),
+        }
+
+    def get_index_statistics(self) -> Dict[str, Any]:
+        """Index statistics in BlockIndexer.get_statistics() form."""
+        conn = self._connect()
+        total, pure, deterministic = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(is_pure), 0), COALESCE(SUM(deterministic), 0) "
+            "FROM blocks"
+        ).fetchone()
+        keywords: Set[str] = set()
+        for (row,) in conn.execute("SELECT keywords FROM blocks"):
+            keywords.update(k.lower() for k in json.loads(row))
+        return {
+            "total_entries": total,
+            "total_keywords": len(keywords),
+            "categories": dict(conn.execute(
+                "SELECT category, COUNT(*) FROM blocks GROUP BY category"
+            ).fetchall()),
+            "pure_blocks": pure,
+            "deterministic_blocks": deterministic,
+        }
+
+    def get_hydration_statistics(self) -> Dict[str, Any]:
+        """Get hydrated-block cache statistics."""
+        with self._cache_lock:
+            lookups = self._cache_hits + self._cache_misses
+            return {
+                "lazy": True,
+                "hydrated_blocks": len(self._blocks),
+                "cache_size": self._hydrated_cache_size,
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+                "hit_rate": self._cache_hits / lookups if lookups else 0.0,
+            }
+
+
+class SQLiteBlockIndexer(BlockIndexer):
+    """
+    BlockIndexer backed by a SQLiteBlockStore.
+
+    The store already holds every index column, so nothing is kept in
+    memory: index_block() and add_entry() only build/return the entry, and
+    every query is answered by the database.
+    """
+
+    def __init__(self, store: SQLiteBlockStore):
+        super().__init__()
+        self._store = store
+
+    @property
+    def store(self) -> SQLiteBlockStore:
+        return self._store
+
+    def copy(self) -> "SQLiteBlockIndexer":
+        """Another indexer over the same store (the database is the index)."""
+        return SQLiteBlockIndexer(self._store)
+
+    def index_block(self, block: NeuropBlock) -> IndexEntry:
+        """Return the entry of a block; it is indexed when the store stores it."""
+        return build_index_entry(block)
+
+    def add_entry(self, entry: IndexEntry) -> IndexEntry:
+        """Snapshot entries are not needed; the database is the index."""
+        return entry
+
+    def remove_block(self, identity: str) -> bool:
+        """Rows belong to the store, so there is nothing to remove here."""
+        return False
+
+    def search(
+        self,
+        query: str,
+        category: Optional[str] = None,
+        min_trust: float = 0.0,
+        require_pure: bool = False,
+        require_deterministic: bool = False,
+        input_types: Optional[List[str]] = None,
+        output_types: Optional[List[str]] = None,
+        limit: int = 10,
+    ) -> List[IndexEntry]:
+        return self._store.search(
+            query,
+            category=category,
+            min_trust=min_trust,
+            require_pure=require_pure,
+            require_deterministic=require_deterministic,
+            input_types=input_types,
+            output_types=output_types,
+            limit=limit,
+        )
+
+    def search_by_category(
+        self,
+        category: str,
+        min_trust: float = 0.0,
+    ) -> List[IndexEntry]:
+        return self._store.search("", category=category, min_trust=min_trust, limit=None)
+
+    def search_compatible(
+        self,
+        output_type: str,
+        category: Optional[str] = None,
+    ) -> List[IndexEntry]:
+        return self._store.search(
+            "", category=category, input_types=[output_type], limit=None
+        )
+
+    def get_entry(self, identity: str) -> Optional[IndexEntry]:
+        return self._store.get_index_entry(identity)
+
+    def get_entries(self) -> List[IndexEntry]:
+        return self._store.get_index_entries()
+
+    def get_all_categories(self) -> List[str]:
+        return self._store.get_categories()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return self._store.get_index_statistics()
+
+    def clear(self) -> None:
+        """No-op: clearing the index would mean deleting stored blocks."""
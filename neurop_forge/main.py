@@ -22,16 +22,20 @@ AI is NOT allowed to:
 - Bypass trust rules
 """
 
+import asyncio
+import concurrent.futures
 import json
-from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Set, Tuple, Union
 from pathlib import Path
 from datetime import datetime, timezone
 
 from neurop_forge.core.identity import IdentityAuthority
 from neurop_forge.core.block_schema import (
-    NeuropBlock, BlockOwnership, LicenseType,
+    NeuropBlock, BlockOwnership, LicenseType, PurityLevel,
 )
 from neurop_forge.core.normalization import CodeNormalizer, NormalizationLevel
+from neurop_forge.core.compact import intern_strs, shared
 
 from neurop_forge.intake.source_fetcher import SourceFetcher
 from neurop_forge.intake.license_enforcer import LicenseEnforcer
@@ -49,9 +53,23 @@ from neurop_forge.validation.schema_enforcer import SchemaEnforcer
 
 from neurop_forge.scoring.trust_model import TrustCalculator
 
-from neurop_forge.library.block_store import BlockStore
+from neurop_forge.library.block_store import BlockStore, StoreResult, StoreStatus
 from neurop_forge.library.indexer import BlockIndexer
+from neurop_forge.library.block_header import BlockHeader
+from neurop_forge.library.index_snapshot import (
+    IndexSnapshot,
+    compute_library_digest,
+    default_snapshot_path,
+    load_index_snapshot,
+    write_index_snapshot,
+)
 from neurop_forge.library.fetch_engine import FetchEngine, BlockGraph
+from neurop_forge.library.generations import GenerationManager
+from neurop_forge.library.sqlite_store import (
+    SQLiteBlockIndexer,
+    SQLiteBlockStore,
+    default_database_path,
+)
 
 from neurop_forge.composition.compatibility import CompatibilityChecker
 from neurop_forge.composition.graph_rules import GraphValidator, CompositionGraph
@@ -61,9 +79,12 @@ from neurop_forge.semantic.intent_extractor import SemanticIntentExtractor
 from neurop_forge.semantic.composer import SemanticComposer, SemanticIndexEntry, SemanticGraph
 
 from neurop_forge.runtime.context import ExecutionContext
-from neurop_forge.runtime.executor import GraphExecutor
-from neurop_forge.runtime.result import ExecutionResult, ExecutionStatus
-from neurop_forge.runtime.guards import RetryPolicy
+from neurop_forge.runtime.executor import BlockExecutor, GraphExecutor
+from neurop_forge.runtime.async_executor import AsyncGraphExecutor
+from neurop_forge.runtime.result import ExecutionResult, ExecutionStatus, TraceMode
+from neurop_forge.runtime.guards import RetryPolicy, ExecutionGuard
+from neurop_forge.runtime.bytecode_cache import BytecodeCache, default_bytecode_cache_path
+from neurop_forge.runtime.compiled_cache import CompiledBlockCache
 
 from neurop_forge.deduplication import (
     DeduplicationProcessor,
@@ -72,6 +93,41 @@ from neurop_forge.deduplication import (
 )
 
 
+# Block storage backends accepted by NeuropForge(storage_backend=...)
+STORAGE_BACKENDS = ("files", "sqlite")
+
+
+@dataclass
+class LibraryView:
+    """Everything built from one load of the library; published as one generation."""
+    block_store: Union[BlockStore, SQLiteBlockStore]
+    indexer: BlockIndexer
+    fetch_engine: FetchEngine
+    semantic_composer: SemanticComposer
+    graph_executor: GraphExecutor
+
+    def derive(self, block_store: Union[BlockStore, SQLiteBlockStore]) -> "LibraryView":
+        """
+        A view over block_store (a copy of this view's store) with copies of
+        the indexes and registrations, to be updated and published as the
+        next generation while this one keeps serving.
+        """
+        indexer: BlockIndexer
+        if isinstance(block_store, SQLiteBlockStore):
+            indexer = SQLiteBlockIndexer(block_store)
+            graph_executor = self.graph_executor.copy(block_loader=block_store.get)
+        else:
+            indexer = self.indexer.copy()
+            graph_executor = self.graph_executor.copy()
+        return LibraryView(
+            block_store=block_store,
+            indexer=indexer,
+            fetch_engine=FetchEngine(block_store, indexer),
+            semantic_composer=self.semantic_composer.copy(),
+            graph_executor=graph_executor,
+        )
+
+
 class NeuropForge:
     """
     The main orchestrator for the Neurop Block Forge.
@@ -84,9 +140,46 @@ class NeuropForge:
         self,
         storage_path: str = ".neurop_library",
         strict_mode: bool = True,
+        use_index_snapshot: bool = True,
+        storage_backend: str = "files",
+        node_workers: int = 1,
+        trace_mode: TraceMode = TraceMode.FULL,
+        use_bytecode_cache: bool = False,
     ):
+        """
+        Args:
+            storage_path: Directory of block JSON files
+            strict_mode: Enforce strict license, analysis and schema rules
+            use_index_snapshot: Load/persist index entries in a snapshot file
+            storage_backend: "files" (JSON directory) or "sqlite" (database
+                             next to storage_path, imported from it when empty)
+            node_workers: Threads that run independent graph nodes
+                          concurrently (1 = run nodes one at a time in order)
+            trace_mode: How graph executions are traced (see TraceMode)
+            use_bytecode_cache: Load/persist compiled block bytecode in a
+                                directory next to storage_path, through a
+                                compiled block cache of this instance's own
+        """
+        if storage_backend not in STORAGE_BACKENDS:
+            raise ValueError(
+                f"Unknown storage backend {storage_backend!r}; "
+                f"expected one of {', '.join(STORAGE_BACKENDS)}"
+            )
         self._storage_path = storage_path
+        self._storage_backend = storage_backend
         self._strict_mode = strict_mode
+        self._index_snapshot_path = (
+            default_snapshot_path(storage_path) if use_index_snapshot else None
+        )
+        self._trace_mode = trace_mode
+        self._compiled_cache: Optional[CompiledBlockCache] = (
+            CompiledBlockCache(bytecode_cache=BytecodeCache(default_bytecode_cache_path(storage_path)))
+            if use_bytecode_cache else None
+        )
+        self._node_executor: Optional[concurrent.futures.Executor] = (
+            concurrent.futures.ThreadPoolExecutor(node_workers, thread_name_prefix="neurop-node")
+            if node_workers > 1 else None
+        )
 
         self._identity_authority = IdentityAuthority()
         self._normalizer = CodeNormalizer(NormalizationLevel.STANDARD)
@@ -110,30 +203,108 @@ class NeuropForge:
 
         self._trust_calculator = TrustCalculator()
 
-        self._block_store = BlockStore(storage_path=storage_path)
-        self._indexer = BlockIndexer()
-        self._fetch_engine = FetchEngine(self._block_store, self._indexer)
-
         self._compatibility_checker = CompatibilityChecker(strict_mode=strict_mode)
         self._graph_validator = GraphValidator(self._compatibility_checker)
 
         self._semantic_extractor = SemanticIntentExtractor()
-        self._semantic_composer = SemanticComposer()
-        
-        self._graph_executor = GraphExecutor(
-            block_library={},
-            retry_policy=RetryPolicy(max_retries=2),
-            default_timeout_ms=30000.0,
+        self._verified_filter: Optional[Set[str]] = None
+
+        # Store, indexes and executor registrations are built together and
+        # swapped as one generation; see reload_library().
+        self._library: GenerationManager[LibraryView] = GenerationManager(
+            self._build_library(),
+            release=lambda library: library.block_store.close(),
         )
 
-        self._load_existing_blocks()
+    def _build_library(self) -> LibraryView:
+        """
+        Load and index the blocks in storage into a new LibraryView.
+        
+        Index entries come from the index snapshot when it matches the
+        library; otherwise they are rebuilt and the snapshot is rewritten.
+        
+        The sqlite backend is never hydrated here: its database is the
+        keyword index, semantic entries are built from stored headers, and
+        the graph executor loads blocks from the store when a graph runs
+        them.
+        """
+        block_store: Union[BlockStore, SQLiteBlockStore]
+        block_loader = None
+        if self._storage_backend == "sqlite":
+            block_store = SQLiteBlockStore(default_database_path(self._storage_path))
+            if block_store.count() == 0 and Path(self._storage_path).is_dir():
+                block_store.import_library(self._storage_path)
+            indexer: BlockIndexer = SQLiteBlockIndexer(block_store)
+            block_loader = block_store.get
+        else:
+            block_store = BlockStore(storage_path=self._storage_path)
+            indexer = BlockIndexer()
+        semantic_composer = SemanticComposer()
+        if self._verified_filter is not None:
+            semantic_composer.set_verified_blocks(self._verified_filter)
+        library = LibraryView(
+            block_store=block_store,
+            indexer=indexer,
+            fetch_engine=FetchEngine(block_store, indexer),
+            semantic_composer=semantic_composer,
+            graph_executor=GraphExecutor(
+                block_library={},
+                retry_policy=RetryPolicy(max_retries=2),
+                default_timeout_ms=30000.0,
+                block_executor=(
+                    BlockExecutor(compiled_cache=self._compiled_cache)
+                    if self._compiled_cache is not None else None
+                ),
+                node_executor=self._node_executor,
+                trace_mode=self._trace_mode,
+                block_loader=block_loader,
+            ),
+        )
+        
+        # Eager stores hold every block already; the sqlite store is read
+        # through its headers only.
+        blocks = block_store.get_all() if block_loader is None else []
+        headers = list(block_store.iter_headers())
+        
+        snapshot = None
+        library_digest = ""
+        if self._index_snapshot_path is not None:
+            library_digest = compute_library_digest(headers)
+            snapshot = load_index_snapshot(self._index_snapshot_path, library_digest)
+        
+        if snapshot is not None:
+            for entry in snapshot.indexer_entries:
+                indexer.add_entry(entry)
+            for semantic_entry in snapshot.semantic_entries:
+                semantic_composer.index_block(semantic_entry)
+        else:
+            for block in blocks:
+                indexer.index_block(block)
+            for header in headers:
+                self._index_header_semantically(header, semantic_composer)
+            if headers:
+                self._write_index_snapshot(library, library_digest)
+        
+        for block in blocks:
+            library.graph_executor.register_block(block.get_identity_hash(), block)
+        
+        return library
 
-    def _load_existing_blocks(self) -> None:
-        """Load and index existing blocks from storage."""
-        for block in self._block_store.get_all():
-            self._indexer.index_block(block)
-            self._index_block_semantically(block)
-            self._graph_executor.register_block(block.get_identity_hash(), block)
+    def _write_index_snapshot(
+        self,
+        library: LibraryView,
+        library_digest: Optional[str] = None,
+    ) -> None:
+        """Persist a library's indexes, if index snapshots are enabled."""
+        if self._index_snapshot_path is None:
+            return
+        if library_digest is None:
+            library_digest = compute_library_digest(library.block_store.iter_headers())
+        write_index_snapshot(self._index_snapshot_path, IndexSnapshot(
+            library_digest=library_digest,
+            indexer_entries=library.indexer.get_entries(),
+            semantic_entries=library.semantic_composer.get_entries(),
+        ))
 
     def ingest_source(
         self,
@@ -256,10 +427,11 @@ class NeuropForge:
         if not static_result.passed:
             critical = static_result.get_critical_violations()
             if critical:
-                store_result = self._block_store.quarantine(
-                    block,
-                    f"Static analysis failed: {critical[0].message}",
-                )
+                with self._library.pin() as library:
+                    store_result = library.block_store.quarantine(
+                        block,
+                        f"Static analysis failed: {critical[0].message}",
+                    )
                 return {
                     "status": "quarantined",
                     "reason": critical[0].message,
@@ -274,12 +446,9 @@ class NeuropForge:
                 "reason": f"Schema validation failed: {', '.join(str(v.message) for v in enforcement_result.violations[:3])}",
             }
 
-        store_result = self._block_store.store(block)
+        store_result = self._store_block(block)
 
         if store_result.is_success():
-            self._indexer.index_block(block)
-            self._index_block_semantically(block)
-            self._graph_executor.register_block(block.get_identity_hash(), block)
             return {
                 "status": "stored",
                 "identity": block.get_identity_hash(),
@@ -290,6 +459,33 @@ class NeuropForge:
             "reason": store_result.error_message,
         }
 
+    def _store_block(self, block: NeuropBlock) -> StoreResult:
+        """
+        Store a block and publish a generation that indexes and registers it.
+        
+        The block is stored through a copy of the current generation's
+        store, and indexed into copies of its indexes, like
+        refresh_library(); the current generation is left untouched.
+        """
+        identity = block.get_identity_hash()
+        while True:
+            with self._library.pin() as library:
+                block_store = library.block_store.copy()
+                store_result = block_store.store(block)
+                if store_result.status != StoreStatus.STORED:
+                    block_store.close()
+                    return store_result
+                
+                updated = library.derive(block_store)
+                updated.indexer.index_block(block)
+                self._index_block_semantically(block, updated.semantic_composer)
+                updated.graph_executor.register_block(identity, block)
+                
+                if self._library.publish(updated, replaces=library) is not None:
+                    return store_result
+                block_store.close()
+            # Another generation was published meanwhile; store into that one.
+
     def search_by_intent(
         self,
         intent: str,
@@ -307,7 +503,8 @@ class NeuropForge:
         Returns:
             Search results with matching blocks
         """
-        result = self._fetch_engine.search_by_intent(intent, limit=limit)
+        with self._library.pin() as library:
+            result = library.fetch_engine.search_by_intent(intent, limit=limit)
         return result.to_dict()
 
     def compose_graph(self, intent: str) -> Dict[str, Any]:
@@ -323,7 +520,8 @@ class NeuropForge:
         Returns:
             BlockGraph structure if successful
         """
-        result = self._fetch_engine.compose_graph(intent)
+        with self._library.pin() as library:
+            result = library.fetch_engine.compose_graph(intent)
         return result.to_dict()
 
     def get_block_metadata(self, identity: str) -> Optional[Dict[str, Any]]:
@@ -336,19 +534,123 @@ class NeuropForge:
         Returns:
             Metadata dict or None
         """
-        return self._fetch_engine.get_block_metadata(identity)
+        with self._library.pin() as library:
+            return library.fetch_engine.get_block_metadata(identity)
 
     def get_library_statistics(self) -> Dict[str, Any]:
         """Get statistics about the block library."""
-        store_stats = self._block_store.get_statistics()
-        index_stats = self._indexer.get_statistics()
+        with self._library.pin() as library:
+            store_stats = library.block_store.get_statistics()
+            index_stats = library.indexer.get_statistics()
 
         return {
             "storage": store_stats,
             "index": index_stats,
+            "generations": self._library.get_statistics(),
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
 
+    def refresh_library(self) -> Dict[str, Any]:
+        """
+        Reload only the block files that changed on disk.
+        
+        Added and changed blocks are (re-)indexed and registered for
+        execution; removed blocks are dropped from every index. The index
+        snapshot is rewritten when anything changed.
+        
+        The changes are applied to copies of the current generation's
+        block store, indexes and registrations, which are published as a
+        new generation, so readers never see a half-updated library and
+        calls in progress keep reading the old one unchanged. This suits a
+        few edited files; use reload_library() when most of the library
+        changed.
+        
+        Returns:
+            RefreshResult as a dict (added, updated, removed, errors)
+        """
+        while True:
+            with self._library.pin() as library:
+                block_store = library.block_store.copy()
+                result = block_store.refresh()
+                if not result.has_changes():
+                    block_store.close()
+                    return result.to_dict()
+                
+                refreshed = library.derive(block_store)
+                for identity in result.removed + result.updated:
+                    refreshed.indexer.remove_block(identity)
+                    refreshed.semantic_composer.remove_block(identity)
+                    refreshed.graph_executor.unregister_block(identity)
+                
+                for identity in result.added + result.updated:
+                    block = block_store.get(identity)
+                    if block is None:
+                        continue
+                    refreshed.indexer.index_block(block)
+                    self._index_block_semantically(block, refreshed.semantic_composer)
+                    refreshed.graph_executor.register_block(identity, block)
+                
+                if self._library.publish(refreshed, replaces=library) is not None:
+                    self._write_index_snapshot(refreshed)
+                    return result.to_dict()
+                block_store.close()
+            # Another generation was published meanwhile; refresh that one.
+
+    def reload_library(self, background: bool = False) -> Dict[str, Any]:
+        """
+        Rebuild the whole library as a new generation and publish it.
+        
+        Calls already in progress finish on the generation they started
+        with; the new one is swapped in atomically once fully built, and the
+        old one is released after its last reader finishes.
+        
+        Args:
+            background: If True, return immediately and publish when built
+            
+        Returns:
+            Generation number and block count (or the build status)
+        """
+        future = self._library.build(self._build_library, background=background)
+        if background:
+            return {
+                "status": "building",
+                "current_generation": self._library.current.number,
+            }
+        generation = future.result()
+        return {
+            "status": "published",
+            "generation": generation.number,
+            "block_count": generation.value.block_store.count(),
+        }
+
+    def close(self) -> None:
+        """
+        Stop the graph node threads and library builder, and release the
+        library once calls in progress finish.
+        """
+        self._library.close()
+        if self._node_executor is not None:
+            self._node_executor.shutdown(wait=True)
+
+    def __enter__(self) -> "NeuropForge":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def set_verified_blocks(self, verified_ids: Optional[Set[str]]) -> None:
+        """
+        Restrict semantic composition to these block ids (None = all blocks).
+        
+        The filter is kept across library reloads.
+        """
+        self._verified_filter = set(verified_ids) if verified_ids is not None else None
+        with self._library.pin() as library:
+            if self._verified_filter is None:
+                library.semantic_composer.clear_verified_filter()
+            else:
+                library.semantic_composer.set_verified_blocks(self._verified_filter)
+
     def verify_graph(self, blocks: List[NeuropBlock]) -> Dict[str, Any]:
         """
         Verify a composition graph.
@@ -363,32 +665,44 @@ class NeuropForge:
         result = self._graph_validator.validate(graph)
         return result.to_dict()
 
-    def _index_block_semantically(self, block: NeuropBlock) -> None:
-        """Index a block in the semantic composer."""
-        param_names = [p.name for p in block.interface.inputs]
+    def _index_block_semantically(
+        self,
+        block: NeuropBlock,
+        semantic_composer: SemanticComposer,
+    ) -> None:
+        """Index a block in a semantic composer."""
+        self._index_header_semantically(BlockHeader.from_block(block), semantic_composer)
+
+    def _index_header_semantically(
+        self,
+        header: BlockHeader,
+        semantic_composer: SemanticComposer,
+    ) -> None:
+        """Index a block in a semantic composer from its header alone."""
+        param_names = [name for name, _ in header.input_types]
         
         semantic_intent = self._semantic_extractor.extract(
-            function_name=block.metadata.name,
-            docstring=block.metadata.description,
+            function_name=header.name,
+            docstring=header.description,
             param_names=param_names,
             return_type_hint=None,
-            category=block.metadata.category,
+            category=header.category,
         )
         
         entry = SemanticIndexEntry(
-            block_identity=block.get_identity_hash(),
-            name=block.metadata.name,
-            description=block.metadata.description,
-            category=block.metadata.category,
-            semantic_intent=semantic_intent,
-            input_data_types=tuple(p.data_type.value for p in block.interface.inputs),
-            output_data_types=tuple(p.data_type.value for p in block.interface.outputs),
-            trust_score=block.trust_score.overall_score,
-            is_pure=block.is_pure(),
-            is_deterministic=block.is_deterministic(),
+            block_identity=header.identity,
+            name=header.name,
+            description=header.description,
+            category=header.category,
+            semantic_intent=shared(semantic_intent),
+            input_data_types=intern_strs(data_type for _, data_type in header.input_types),
+            output_data_types=intern_strs(data_type for _, data_type in header.output_types),
+            trust_score=header.trust_score,
+            is_pure=header.purity == PurityLevel.PURE.value,
+            is_deterministic=header.deterministic,
         )
         
-        self._semantic_composer.index_block(entry)
+        semantic_composer.index_block(entry)
 
     def compose_semantic_graph(self, intent: str, min_trust: float = 0.2) -> Dict[str, Any]:
         """
@@ -406,12 +720,19 @@ class NeuropForge:
         Returns:
             SemanticGraph with validated composition
         """
-        graph = self._semantic_composer.compose(intent, min_trust=min_trust)
+        with self._library.pin() as library:
+            graph = library.semantic_composer.compose(intent, min_trust=min_trust)
         return graph.to_dict()
 
     def get_semantic_statistics(self) -> Dict[str, Any]:
         """Get statistics about the semantic index."""
-        return self._semantic_composer.get_statistics()
+        with self._library.pin() as library:
+            return library.semantic_composer.get_statistics()
+
+    def get_retry_statistics(self) -> Dict[str, Any]:
+        """Retries made by graph execution and the backoff waits avoided."""
+        with self._library.pin() as library:
+            return library.graph_executor.get_retry_statistics()
 
     def execute_intent(
         self,
@@ -436,19 +757,20 @@ class NeuropForge:
         Returns:
             ExecutionResult with status, outputs, and trace
         """
-        semantic_graph = self._semantic_composer.compose(intent, min_trust=min_trust)
-        
-        if not semantic_graph.nodes:
-            return {
-                "status": "failed",
-                "error": "No blocks matched the intent",
-                "query": intent,
-            }
-        
-        result = self._graph_executor.execute(
-            graph=semantic_graph,
-            initial_inputs=inputs or {},
-        )
+        with self._library.pin() as library:
+            semantic_graph = library.semantic_composer.compose(intent, min_trust=min_trust)
+            
+            if not semantic_graph.nodes:
+                return {
+                    "status": "failed",
+                    "error": "No blocks matched the intent",
+                    "query": intent,
+                }
+            
+            result = library.graph_executor.execute(
+                graph=semantic_graph,
+                initial_inputs=inputs or {},
+            )
         
         return result.to_dict()
 
@@ -467,10 +789,85 @@ class NeuropForge:
         Returns:
             ExecutionResult with full trace
         """
-        return self._graph_executor.execute(
-            graph=graph,
-            initial_inputs=inputs or {},
-        )
+        with self._library.pin() as library:
+            return library.graph_executor.execute(
+                graph=graph,
+                initial_inputs=inputs or {},
+            )
+
+    async def execute_intent_async(
+        self,
+        intent: str,
+        inputs: Optional[Dict[str, Any]] = None,
+        min_trust: float = 0.2,
+        guard: Optional[ExecutionGuard] = None,
+        executor: Optional[concurrent.futures.Executor] = None,
+    ) -> Dict[str, Any]:
+        """
+        Awaitable execute_intent for use inside an event loop.
+        
+        Composition and block calls run in executor (None = the loop's
+        default executor), so the loop is never blocked.
+        
+        Args:
+            intent: Natural language intent description
+            inputs: Initial input values for execution
+            min_trust: Minimum trust score for blocks
+            guard: ExecutionGuard to cancel or time out the run with
+            executor: concurrent.futures executor for composition and blocks
+            
+        Returns:
+            ExecutionResult with status, outputs, and trace
+        """
+        loop = asyncio.get_running_loop()
+        with self._library.pin() as library:
+            semantic_graph = await loop.run_in_executor(
+                executor,
+                lambda: library.semantic_composer.compose(intent, min_trust=min_trust),
+            )
+            
+            if not semantic_graph.nodes:
+                return {
+                    "status": "failed",
+                    "error": "No blocks matched the intent",
+                    "query": intent,
+                }
+            
+            async_executor = AsyncGraphExecutor.from_graph_executor(library.graph_executor, executor)
+            result = await async_executor.execute(
+                graph=semantic_graph,
+                initial_inputs=inputs or {},
+                guard=guard,
+            )
+        
+        return result.to_dict()
+
+    async def execute_graph_async(
+        self,
+        graph: SemanticGraph,
+        inputs: Optional[Dict[str, Any]] = None,
+        guard: Optional[ExecutionGuard] = None,
+        executor: Optional[concurrent.futures.Executor] = None,
+    ) -> ExecutionResult:
+        """
+        Awaitable execute_graph for use inside an event loop.
+        
+        Args:
+            graph: Composed SemanticGraph
+            inputs: Initial input values
+            guard: ExecutionGuard to cancel or time out the run with
+            executor: concurrent.futures executor for block calls
+            
+        Returns:
+            ExecutionResult with full trace
+        """
+        with self._library.pin() as library:
+            async_executor = AsyncGraphExecutor.from_graph_executor(library.graph_executor, executor)
+            return await async_executor.execute(
+                graph=graph,
+                initial_inputs=inputs or {},
+                guard=guard,
+            )
 
     def deduplicate_library(
         self,
@@ -520,7 +917,9 @@ class NeuropForge:
                     shutil.move(str(original_path), str(backup_path))
                 shutil.move(str(output_path), str(original_path))
                 
-                self._load_existing_blocks()
+                # The current generation is fully in memory and keeps serving
+                # until the rebuilt one is published.
+                self.reload_library()
         
         report = DeduplicationReport(processor.get_hasher(), result)
         
@@ -1027,7 +1426,8 @@ def run_production_validation():
     from neurop_forge.runtime import BlockExecutor
     block_executor = BlockExecutor()
     
-    all_blocks = list(forge._block_store.get_all())
+    with forge._library.pin() as library:
+        all_blocks = list(library.block_store.get_all())
     
     test_blocks = []
     for block in all_blocks[:200]:
@@ -1078,7 +1478,8 @@ def run_production_validation():
     from neurop_forge.runtime.block_verifier import BlockVerifier, get_verification_registry
     
     verifier = BlockVerifier()
-    all_blocks_for_verify = list(forge._block_store.get_all())
+    with forge._library.pin() as library:
+        all_blocks_for_verify = list(library.block_store.get_all())
     
     print(f"Verifying {len(all_blocks_for_verify)} blocks...")
     verify_result = verifier.verify_all(all_blocks_for_verify)
@@ -1089,7 +1490,7 @@ def run_production_validation():
     
     registry = get_verification_registry()
     verified_ids = set(registry.get_verified_ids())
-    forge._semantic_composer.set_verified_blocks(verified_ids)
+    forge.set_verified_blocks(verified_ids)
     print(f"Semantic Composer now using ONLY {len(verified_ids)} verified blocks")
     print()
     
@@ -1100,7 +1501,7 @@ def run_production_validation():
     print()
     
     tier_a_ids = set(tier_registry.tier_a.keys())
-    forge._semantic_composer.set_verified_blocks(tier_a_ids)
+    forge.set_verified_blocks(tier_a_ids)
     print(f"Production Mode: Using ONLY {len(tier_a_ids)} Tier-A blocks (deterministic)")
     print()
     
@@ -1158,7 +1559,8 @@ def run_production_validation():
     print("-" * 40)
     
     from neurop_forge.runtime.golden_validation import run_golden_validation, print_golden_validation_results
-    golden_results = run_golden_validation(forge._block_store)
+    with forge._library.pin() as library:
+        golden_results = run_golden_validation(library.block_store)
     print_golden_validation_results(golden_results)
     
     print()
@@ -1166,7 +1568,8 @@ def run_production_validation():
     print("-" * 40)
     
     from neurop_forge.runtime.reference_workflows import run_reference_workflows, print_reference_workflow_results
-    workflow_results = run_reference_workflows(forge._block_store)
+    with forge._library.pin() as library:
+        workflow_results = run_reference_workflows(library.block_store)
     print_reference_workflow_results(workflow_results)
     
     golden_blocks = golden_results.get("golden_blocks", {})
@@ -1205,6 +1608,7 @@ def run_production_validation():
     
     all_pass = (golden_failed == 0) and (workflows_passed == workflows_total)
     print(f"STATUS: {'READY FOR PACKAGING' if all_pass else 'NEEDS FIXES'}")
+    forge.close()
 
     return {
         "module_results": module_results,
@@ -8,6 +8,7 @@ Runtime Execution Layer - Phase 2 of Neurop Block Forge.
 This module provides:
 - ExecutionContext: Runtime state and data flow management
 - GraphExecutor: Deterministic graph execution engine
+- AsyncGraphExecutor: Awaitable graph execution for event loops
 - ExecutionResult: Full execution trace with timing
 
 The Runtime completes the loop:
@@ -24,20 +25,57 @@ from neurop_forge.runtime.executor import (
     NodeExecutionResult,
     BlockExecutor,
 )
+from neurop_forge.runtime.async_executor import AsyncGraphExecutor
+from neurop_forge.runtime.scheduler import GraphSchedule, build_schedule
+from neurop_forge.runtime.graph_compiler import CompiledGraph
+from neurop_forge.runtime.streaming import (
+    StreamKind,
+    StreamProfile,
+    StreamReducer,
+    StreamPipeline,
+    register_stream_profile,
+    stream_profile_for,
+)
+from neurop_forge.runtime.vectorized import (
+    NUMPY_AVAILABLE,
+    VectorKernel,
+    register_vector_kernel,
+)
 from neurop_forge.runtime.result import (
     ExecutionResult,
     ExecutionTrace,
     ExecutionStatus,
+    ResourceUsage,
+    TraceMode,
+)
+from neurop_forge.runtime.budgets import (
+    ResourceBudget,
+    ResourceBudgetExceeded,
+    CPUBudgetExceeded,
+    MemoryBudgetExceeded,
 )
 from neurop_forge.runtime.guards import (
     ExecutionGuard,
     RetryPolicy,
+    RetryStatistics,
     CircuitBreaker,
+    FailureKind,
+    classify_failure,
+)
+from neurop_forge.runtime.compiled_cache import (
+    CompiledBlock,
+    CompiledBlockCache,
+    get_compiled_block_cache,
+    configure_compiled_block_cache,
 )
+from neurop_forge.runtime.bytecode_cache import BytecodeCache, default_bytecode_cache_path
+from neurop_forge.runtime.process_pool import PooledBlockExecutor
+from neurop_forge.runtime.result_cache import ResultCache
 from neurop_forge.runtime.adapter import (
     FunctionAdapter,
     FunctionSignature,
     SemanticInputMapper,
+    BindingPlan,
 )
 from neurop_forge.runtime.reference_workflows import (
     ReferenceWorkflowRunner,
@@ -51,17 +89,48 @@ __all__ = [
     "ExecutionVariable",
     "ContextScope",
     "GraphExecutor",
+    "AsyncGraphExecutor",
+    "GraphSchedule",
+    "build_schedule",
+    "CompiledGraph",
+    "StreamKind",
+    "StreamProfile",
+    "StreamReducer",
+    "StreamPipeline",
+    "register_stream_profile",
+    "stream_profile_for",
+    "NUMPY_AVAILABLE",
+    "VectorKernel",
+    "register_vector_kernel",
     "NodeExecutionResult",
     "BlockExecutor",
+    "CompiledBlock",
+    "CompiledBlockCache",
+    "get_compiled_block_cache",
+    "configure_compiled_block_cache",
+    "BytecodeCache",
+    "default_bytecode_cache_path",
+    "PooledBlockExecutor",
+    "ResultCache",
     "ExecutionResult",
     "ExecutionTrace",
     "ExecutionStatus",
+    "TraceMode",
+    "ResourceUsage",
+    "ResourceBudget",
+    "ResourceBudgetExceeded",
+    "CPUBudgetExceeded",
+    "MemoryBudgetExceeded",
     "ExecutionGuard",
     "RetryPolicy",
+    "RetryStatistics",
+    "FailureKind",
+    "classify_failure",
     "CircuitBreaker",
     "FunctionAdapter",
     "FunctionSignature",
     "SemanticInputMapper",
+    "BindingPlan",
     "ReferenceWorkflowRunner",
     "run_reference_workflows",
     "print_reference_workflow_results",
@@ -19,11 +19,13 @@ With this layer:
 - Execution succeeds
 """
 
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional, Tuple, Set
 from dataclasses import dataclass, field
 import inspect
 import re
 import ast
+import threading
 
 from neurop_forge.standardization.canonical_names import (
     CANONICAL_BY_TYPE,
@@ -31,6 +33,9 @@ from neurop_forge.standardization.canonical_names import (
 )
 
 
+DEFAULT_PLAN_CACHE_SIZE = 4096
+
+
 @dataclass
 class FunctionSignature:
     """Represents a function's actual signature."""
@@ -170,6 +175,42 @@ class FunctionSignature:
         return object
 
 
+# Where a bound parameter's value comes from.
+BIND_INPUT = "input"        # the named incoming input
+BIND_CONSTANT = "constant"  # a fixed value (signature default, typed fallback)
+BIND_FACTORY = "factory"    # a fresh value per call (empty list/dict fallback)
+
+
+@dataclass(frozen=True)
+class BindingPlan:
+    """
+    Precomputed input binding for one block and one incoming key shape.
+    
+    Each step is (parameter, kind, payload): BIND_INPUT payloads are input
+    keys, BIND_CONSTANT payloads are values, BIND_FACTORY payloads are
+    zero-argument callables. Applying a plan skips the fuzzy matcher.
+    """
+    
+    steps: Tuple[Tuple[str, str, Any], ...]
+    missing: Tuple[str, ...] = ()
+    
+    def apply(self, available_inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Bind parameters from inputs that have this plan's key shape."""
+        bound = {}
+        for param, kind, payload in self.steps:
+            if kind == BIND_INPUT:
+                bound[param] = available_inputs[payload]
+            elif kind == BIND_CONSTANT:
+                bound[param] = payload
+            else:
+                bound[param] = payload()
+        return bound
+    
+    def with_steps(self, steps: List[Tuple[str, str, Any]]) -> "BindingPlan":
+        """Plan with extra steps appended and nothing left missing."""
+        return BindingPlan(steps=self.steps + tuple(steps))
+
+
 class SemanticInputMapper:
     """
     Maps semantic inputs to actual function parameters.
@@ -280,14 +321,24 @@ class SemanticInputMapper:
         Returns:
             Tuple of (mapped_inputs, missing_required_params)
         """
-        mapped = {}
-        missing = []
+        plan = self.plan_inputs(signature, tuple(available_inputs), interface_inputs)
+        return plan.apply(available_inputs), list(plan.missing)
+    
+    def plan_inputs(
+        self,
+        signature: FunctionSignature,
+        input_keys: Tuple[str, ...],
+        interface_inputs: Optional[List[Any]] = None,
+    ) -> BindingPlan:
+        """
+        Work out which input feeds each parameter for a given key shape.
         
-        interface_by_pos = {}
-        if interface_inputs:
-            for i, inp in enumerate(interface_inputs):
-                if hasattr(inp, 'name'):
-                    interface_by_pos[i] = inp
+        The plan depends on key order as well as the key set: generated
+        parameters (v1, v2, ...) fall back to inputs by position.
+        """
+        available = dict.fromkeys(input_keys)
+        steps: List[Tuple[str, str, Any]] = []
+        missing = []
         
         for i, param in enumerate(signature.parameters):
             if param in self.GENERATED_PARAMS:
@@ -295,29 +346,28 @@ class SemanticInputMapper:
                     interface_param = interface_inputs[i]
                     if hasattr(interface_param, 'name'):
                         interface_name = interface_param.name
-                        match = self.find_best_match(interface_name, available_inputs)
+                        match = self.find_best_match(interface_name, available)
                         if match is not None:
-                            mapped[param] = available_inputs[match]
+                            steps.append((param, BIND_INPUT, match))
                             continue
                 
-                if available_inputs:
-                    values = list(available_inputs.values())
-                    if i < len(values):
-                        mapped[param] = values[i]
+                if input_keys:
+                    if i < len(input_keys):
+                        steps.append((param, BIND_INPUT, input_keys[i]))
                     else:
-                        mapped[param] = values[0]
+                        steps.append((param, BIND_INPUT, input_keys[0]))
                     continue
             
-            match = self.find_best_match(param, available_inputs)
+            match = self.find_best_match(param, available)
             
             if match is not None:
-                mapped[param] = available_inputs[match]
+                steps.append((param, BIND_INPUT, match))
             elif param in signature.defaults:
-                mapped[param] = signature.defaults[param]
+                steps.append((param, BIND_CONSTANT, signature.defaults[param]))
             elif param in signature.required:
                 missing.append(param)
         
-        return mapped, missing
+        return BindingPlan(steps=tuple(steps), missing=tuple(missing))
 
 
 class FunctionAdapter:
@@ -328,12 +378,18 @@ class FunctionAdapter:
     - Extracts real signatures from block logic
     - Maps semantic inputs to actual params
     - Fills defaults
+    - Caches a binding plan per block and input key shape
     - Ensures successful execution
     """
     
-    def __init__(self):
+    def __init__(self, plan_cache_size: int = DEFAULT_PLAN_CACHE_SIZE):
         self._mapper = SemanticInputMapper()
         self._signature_cache: Dict[str, FunctionSignature] = {}
+        self._plan_cache: "OrderedDict[Tuple[str, Tuple[str, ...]], BindingPlan]" = OrderedDict()
+        self._plan_cache_size = max(0, plan_cache_size)
+        self._plan_lock = threading.Lock()
+        self._plan_hits = 0
+        self._plan_misses = 0
     
     def get_signature(
         self,
@@ -371,30 +427,84 @@ class FunctionAdapter:
         if not signature:
             return self._fallback_adapt(func_name, source_code, available_inputs)
         
-        mapped, missing = self._mapper.map_inputs(signature, available_inputs, interface_inputs)
-        
-        if missing:
-            for param in missing:
-                if available_inputs:
-                    first_val = list(available_inputs.values())[0]
-                    mapped[param] = first_val
-                else:
-                    if "str" in str(signature.annotations.get(param, "")):
-                        mapped[param] = ""
-                    elif "int" in str(signature.annotations.get(param, "")):
-                        mapped[param] = 0
-                    elif "float" in str(signature.annotations.get(param, "")):
-                        mapped[param] = 0.0
-                    elif "bool" in str(signature.annotations.get(param, "")):
-                        mapped[param] = False
-                    elif "list" in str(signature.annotations.get(param, "")):
-                        mapped[param] = []
-                    elif "dict" in str(signature.annotations.get(param, "")):
-                        mapped[param] = {}
-                    else:
-                        mapped[param] = None
+        plan = self.get_binding_plan(block_id, signature, available_inputs, interface_inputs)
+        return plan.apply(available_inputs), None
+    
+    def get_binding_plan(
+        self,
+        block_id: str,
+        signature: FunctionSignature,
+        available_inputs: Dict[str, Any],
+        interface_inputs: Optional[List[Any]] = None,
+    ) -> BindingPlan:
+        """
+        Get or build the binding plan for a block and an input key shape.
         
-        return mapped, None
+        Plans are cached (LRU) by (block_id, input keys in order), so the
+        fuzzy matcher runs once per shape. Missing required parameters are
+        filled as before: from the first input, or with an empty value of
+        the annotated type when there are no inputs.
+        """
+        input_keys = tuple(available_inputs)
+        key = (block_id, input_keys)
+        
+        with self._plan_lock:
+            plan = self._plan_cache.get(key)
+            if plan is not None:
+                self._plan_cache.move_to_end(key)
+                self._plan_hits += 1
+                return plan
+            self._plan_misses += 1
+        
+        plan = self._mapper.plan_inputs(signature, input_keys, interface_inputs)
+        if plan.missing:
+            plan = plan.with_steps([
+                self._missing_step(param, signature, input_keys)
+                for param in plan.missing
+            ])
+        
+        if self._plan_cache_size:
+            with self._plan_lock:
+                self._plan_cache[key] = plan
+                if len(self._plan_cache) > self._plan_cache_size:
+                    self._plan_cache.popitem(last=False)
+        return plan
+    
+    @staticmethod
+    def _missing_step(
+        param: str,
+        signature: FunctionSignature,
+        input_keys: Tuple[str, ...],
+    ) -> Tuple[str, str, Any]:
+        """Binding step for a required parameter no input matched."""
+        if input_keys:
+            return (param, BIND_INPUT, input_keys[0])
+        
+        annotation = str(signature.annotations.get(param, ""))
+        if "str" in annotation:
+            return (param, BIND_CONSTANT, "")
+        elif "int" in annotation:
+            return (param, BIND_CONSTANT, 0)
+        elif "float" in annotation:
+            return (param, BIND_CONSTANT, 0.0)
+        elif "bool" in annotation:
+            return (param, BIND_CONSTANT, False)
+        elif "list" in annotation:
+            return (param, BIND_FACTORY, list)
+        elif "dict" in annotation:
+            return (param, BIND_FACTORY, dict)
+        return (param, BIND_CONSTANT, None)
+    
+    def get_plan_statistics(self) -> Dict[str, Any]:
+        """Binding plan cache size and hit/miss counters."""
+        lookups = self._plan_hits + self._plan_misses
+        return {
+            "size": len(self._plan_cache),
+            "max_size": self._plan_cache_size,
+            "hits": self._plan_hits,
+            "misses": self._plan_misses,
+            "hit_rate": self._plan_hits / lookups if lookups else 0.0,
+        }
     
     def _fallback_adapt(
         self,
@@ -0,0 +1,275 @@
+"""
+Copyright © 2026 Lourens Wasserman. All Rights Reserved.
+Neurop Block Forge - https://neurop-forge.com
+Commercial use requires a license. See LICENSE file.
+
+AsyncGraphExecutor - Awaitable graph execution.
+
+GraphExecutor.execute runs every block call and every retry backoff on
+the calling thread, so calling it from an async def endpoint blocks the
+event loop for the whole graph. AsyncGraphExecutor.execute is a coroutine
+with the same node semantics (input gathering, retries, circuit breakers,
+traces):
+- Block calls run in a concurrent.futures executor (the loop's default
+  thread pool unless one is given), so the event loop stays free and many
+  graphs can run concurrently in one process
+- Retry backoff is awaited with asyncio.sleep (retry decisions are the
+  same as GraphExecutor's, see GraphExecutor._next_retry_delay)
+- ExecutionGuard.cancel() and the guard timeout interrupt the wait for a
+  running block or a backoff, not just the gap between nodes
+
+A block call that is interrupted cannot be stopped inside its worker
+thread; it finishes in the background and its result is discarded. Use a
+PooledBlockExecutor as block_executor when runaway blocks must be killed.
+"""
+
+import asyncio
+import concurrent.futures
+import time
+from typing import Any, Awaitable, Dict, List, Optional
+
+from neurop_forge.runtime.context import ExecutionContext
+from neurop_forge.runtime.executor import BlockExecutor, ExecutionRecorder, GraphExecutor, NodeExecutionResult
+from neurop_forge.runtime.result import ExecutionResult, ExecutionStatus, ResourceUsage, TraceMode
+from neurop_forge.runtime.guards import RetryPolicy, ExecutionGuard
+from neurop_forge.runtime.result_cache import ResultCache
+from neurop_forge.semantic.composer import SemanticGraph, CompositionNode
+from neurop_forge.core.block_schema import NeuropBlock
+
+
+class _ExecutionStopped(Exception):
+    """The guard was cancelled or timed out while a node was waiting."""
+
+    def __init__(self, status: ExecutionStatus, reason: str):
+        super().__init__(reason)
+        self.status = status
+        self.reason = reason
+
+
+class AsyncGraphExecutor(GraphExecutor):
+    """
+    GraphExecutor whose execute() is a coroutine.
+
+    Args:
+        executor: concurrent.futures executor for block calls (None = the
+            running loop's default executor)
+        Other arguments are those of GraphExecutor.
+    """
+
+    def __init__(
+        self,
+        block_library: Optional[Dict[str, NeuropBlock]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        default_timeout_ms: float = 30000.0,
+        block_executor: Optional[BlockExecutor] = None,
+        result_cache: Optional[ResultCache] = None,
+        executor: Optional[concurrent.futures.Executor] = None,
+        trace_mode: TraceMode = TraceMode.FULL,
+        trace_sample_every: int = 100,
+    ):
+        super().__init__(
+            block_library=block_library,
+            retry_policy=retry_policy,
+            default_timeout_ms=default_timeout_ms,
+            block_executor=block_executor,
+            result_cache=result_cache,
+            trace_mode=trace_mode,
+            trace_sample_every=trace_sample_every,
+        )
+        self._executor = executor
+
+    @classmethod
+    def from_graph_executor(
+        cls,
+        graph_executor: GraphExecutor,
+        executor: Optional[concurrent.futures.Executor] = None,
+    ) -> "AsyncGraphExecutor":
+        """
+        Async view of an existing GraphExecutor.
+
+        Shares its registered blocks, circuit breakers, retry policy and
+        block executor, so blocks registered on either are seen by both.
+        """
+        async_executor = cls(
+            retry_policy=graph_executor._retry_policy,
+            default_timeout_ms=graph_executor._default_timeout_ms,
+            block_executor=graph_executor._block_executor,
+            executor=executor,
+            trace_mode=graph_executor._trace_mode,
+            trace_sample_every=graph_executor._trace_sample_every,
+        )
+        async_executor._blocks = graph_executor._blocks
+        async_executor._block_loader = graph_executor._block_loader
+        async_executor._circuit_breakers = graph_executor._circuit_breakers
+        return async_executor
+
+    async def execute(
+        self,
+        graph: SemanticGraph,
+        initial_inputs: Optional[Dict[str, Any]] = None,
+        config: Optional[Dict[str, Any]] = None,
+        guard: Optional[ExecutionGuard] = None,
+        trace_mode: Optional[TraceMode] = None,
+    ) -> ExecutionResult:
+        """
+        Execute a semantic graph without blocking the event loop.
+
+        Args:
+            graph: Composed SemanticGraph
+            initial_inputs: Initial input values
+            config: Execution config passed to the context
+            guard: Guard to cancel or time out the run with (default: a new
+                guard with the executor's default timeout). It is started
+                here unless already started.
+            trace_mode: Overrides the executor's trace mode for this run
+        """
+        loop = asyncio.get_running_loop()
+        run = ExecutionRecorder(self._trace_mode_for_run(trace_mode))
+
+        context = ExecutionContext(
+            initial_inputs=initial_inputs or {},
+            config=config,
+        )
+
+        if guard is None:
+            guard = ExecutionGuard(timeout_ms=self._default_timeout_ms)
+        if not guard.is_started():
+            guard.start()
+
+        cancelled = asyncio.Event()
+
+        def on_cancel() -> None:
+            loop.call_soon_threadsafe(cancelled.set)
+
+        guard.add_cancel_callback(on_cancel)
+        if guard.is_cancelled():
+            cancelled.set()
+
+        error_message = None
+        stopped_status: Optional[ExecutionStatus] = None
+
+        try:
+            for node in graph.nodes:
+                can_continue, reason = guard.check()
+                if not can_continue:
+                    stopped_status = self._stopped_status(guard)
+                    error_message = reason
+                    break
+
+                node_result = await self._execute_node_async(node, context, guard, cancelled)
+                self._record_node(node, node_result, context, run)
+
+                if node_result.status in (ExecutionStatus.CANCELLED, ExecutionStatus.TIMEOUT):
+                    stopped_status = node_result.status
+                    error_message = node_result.error
+                    break
+        finally:
+            guard.remove_cancel_callback(on_cancel)
+
+        result = self._build_result(graph, context.execution_id, run, error_message)
+        if stopped_status is not None and (not run.results or result.status == ExecutionStatus.FAILED):
+            result.status = stopped_status
+        return result
+
+    async def _execute_node_async(
+        self,
+        node: CompositionNode,
+        context: ExecutionContext,
+        guard: ExecutionGuard,
+        cancelled: asyncio.Event,
+    ) -> NodeExecutionResult:
+        """Execute a single node with retry and circuit breaker, off the event loop."""
+        loop = asyncio.get_running_loop()
+        start_ts = time.perf_counter()
+
+        prepared = self._begin_node(node, context, start_ts)
+        if isinstance(prepared, NodeExecutionResult):
+            return prepared
+        block, circuit, inputs = prepared
+
+        attempt = 0
+        last_error = None
+        usages: List[Optional[ResourceUsage]] = []
+
+        try:
+            while attempt <= self._retry_policy.max_retries:
+                call = loop.run_in_executor(self._executor, self._call_block, block, inputs)
+                try:
+                    outputs, error, usage = await self._wait(call, guard, cancelled)
+                    usages.append(usage)
+
+                    if error is None:
+                        return self._end_node(
+                            node, context, circuit, start_ts, attempt,
+                            outputs=outputs, inputs=inputs, usage=ResourceUsage.total(usages),
+                        )
+
+                    last_error = error
+                    delay = self._next_retry_delay(block, error, Exception(error), attempt, guard)
+
+                except _ExecutionStopped:
+                    raise
+                except Exception as e:
+                    last_error = str(e)
+                    delay = self._next_retry_delay(block, f"{type(e).__name__}: {e}", e, attempt, guard)
+
+                if delay is None:
+                    break
+                await self._wait(asyncio.ensure_future(asyncio.sleep(delay / 1000.0)), guard, cancelled)
+                attempt += 1
+        except _ExecutionStopped as stopped:
+            context.exit_node()
+            return NodeExecutionResult(
+                node_id=node.block_identity,
+                block_name=node.block_name,
+                status=stopped.status,
+                outputs={},
+                duration_ms=(time.perf_counter() - start_ts) * 1000,
+                error=stopped.reason,
+                retry_count=attempt,
+                inputs=inputs,
+                started_at=start_ts,
+                resource_usage=ResourceUsage.total(usages),
+            )
+
+        return self._end_node(
+            node, context, circuit, start_ts, attempt,
+            error=last_error, inputs=inputs, usage=ResourceUsage.total(usages),
+        )
+
+    async def _wait(
+        self,
+        future: Awaitable[Any],
+        guard: ExecutionGuard,
+        cancelled: asyncio.Event,
+    ) -> Any:
+        """
+        Await a future unless the guard is cancelled or times out first.
+
+        Raises _ExecutionStopped (after cancelling the future) when it does.
+        """
+        future = asyncio.ensure_future(future)
+        cancel_wait = asyncio.ensure_future(cancelled.wait())
+        try:
+            done, _ = await asyncio.wait(
+                {future, cancel_wait},
+                timeout=guard.remaining_ms() / 1000.0,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            cancel_wait.cancel()
+            if not future.done():
+                future.cancel()
+
+        if future in done:
+            return future.result()
+
+        _, reason = guard.check()
+        raise _ExecutionStopped(
+            self._stopped_status(guard),
+            reason or f"Timeout exceeded ({guard.timeout_ms}ms)",
+        )
+
+    @staticmethod
+    def _stopped_status(guard: ExecutionGuard) -> ExecutionStatus:
+        return ExecutionStatus.CANCELLED if guard.is_cancelled() else ExecutionStatus.TIMEOUT
@@ -0,0 +1,207 @@
+"""
+Per-call CPU time and memory budgets for block logic.
+
+BlockConstraints.max_execution_time_ms and max_memory_bytes set a block's
+budgets (BlockExecutor can supply defaults for blocks that leave them
+unset). BlockExecutor runs block logic in the calling thread, so budgets
+are enforced cooperatively:
+
+- CPU time is the calling thread's CPU time (time.thread_time), so other
+  threads and time spent waiting do not count against a call.
+- Memory is the growth of memory traced by tracemalloc during the call.
+  tracemalloc only runs while a budgeted or measured call is in progress;
+  it traces the whole process, so concurrent calls see each other's
+  allocations.
+- While a budgeted call runs, a sys.settrace hook checks both budgets
+  every CHECK_INTERVAL trace events (calls and new lines of Python code)
+  and raises CPUBudgetExceeded or MemoryBudgetExceeded inside the block.
+  Work inside a single C call (one huge regex match, one giant
+  allocation) is not interrupted; the breach is reported when that call
+  returns. When another trace function is
+  installed (debugger, coverage) only the check after the call runs.
+
+A call that exceeds a budget fails, even if the block caught the
+exception or finished before a check. PooledBlockExecutor enforces the
+same constraints with hard rlimits in its worker processes; use it when a
+block must be stopped in the middle of a C call.
+"""
+
+import sys
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from neurop_forge.core.block_schema import NeuropBlock
+from neurop_forge.runtime.result import ResourceUsage
+
+
+# Trace events between budget checks while a budgeted call runs
+CHECK_INTERVAL = 64
+
+
+class ResourceBudgetExceeded(Exception):
+    """A block call used more than its CPU time or memory budget."""
+
+
+class CPUBudgetExceeded(ResourceBudgetExceeded):
+    """A block call used more CPU time than max_execution_time_ms."""
+
+
+class MemoryBudgetExceeded(ResourceBudgetExceeded):
+    """A block call allocated more than max_memory_bytes."""
+
+
+@dataclass(frozen=True)
+class ResourceBudget:
+    """CPU time and memory limits of one block call (None = unlimited)."""
+    cpu_ms: Optional[float] = None
+    memory_bytes: Optional[int] = None
+
+    @property
+    def is_limited(self) -> bool:
+        return self.cpu_ms is not None or self.memory_bytes is not None
+
+    @classmethod
+    def for_block(
+        cls,
+        block: NeuropBlock,
+        default_cpu_ms: Optional[float] = None,
+        default_memory_bytes: Optional[int] = None,
+    ) -> "ResourceBudget":
+        """Budget declared by a block's constraints, else the defaults."""
+        constraints = getattr(block, "constraints", None)
+        cpu_ms = getattr(constraints, "max_execution_time_ms", None)
+        memory_bytes = getattr(constraints, "max_memory_bytes", None)
+        return cls(
+            cpu_ms=cpu_ms if cpu_ms is not None else default_cpu_ms,
+            memory_bytes=memory_bytes if memory_bytes is not None else default_memory_bytes,
+        )
+
+    def check(self, usage: ResourceUsage) -> Optional[ResourceBudgetExceeded]:
+        """The budget breach in usage, or None if usage is within budget."""
+        if self.cpu_ms is not None and usage.cpu_ms > self.cpu_ms:
+            return CPUBudgetExceeded(
+                f"used {usage.cpu_ms:.1f}ms of CPU time (budget {self.cpu_ms}ms)"
+            )
+        if (
+            self.memory_bytes is not None
+            and usage.peak_memory_bytes is not None
+            and usage.peak_memory_bytes > self.memory_bytes
+        ):
+            return MemoryBudgetExceeded(
+                f"allocated {usage.peak_memory_bytes} bytes (budget {self.memory_bytes} bytes)"
+            )
+        return None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "cpu_ms": self.cpu_ms,
+            "memory_bytes": self.memory_bytes,
+        }
+
+
+UNLIMITED = ResourceBudget()
+
+
+_tracing_lock = threading.Lock()
+_tracing_users = 0
+_started_tracing = False
+
+
+def _start_tracing() -> None:
+    """Start tracemalloc for a call unless it is already running."""
+    global _tracing_users, _started_tracing
+    with _tracing_lock:
+        if _tracing_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _started_tracing = True
+        _tracing_users += 1
+
+
+def _stop_tracing() -> None:
+    """Stop tracemalloc after the last call that needed it, if we started it."""
+    global _tracing_users, _started_tracing
+    with _tracing_lock:
+        _tracing_users -= 1
+        if _tracing_users == 0 and _started_tracing:
+            tracemalloc.stop()
+            _started_tracing = False
+
+
+class _BudgetMonitor:
+    """sys.settrace hook that raises once a running call is over budget."""
+
+    def __init__(self, budget: ResourceBudget, cpu_start: float, memory_base: Optional[int]):
+        self._cpu_deadline = (
+            cpu_start + budget.cpu_ms / 1000.0 if budget.cpu_ms is not None else None
+        )
+        self._memory_limit = (
+            memory_base + budget.memory_bytes
+            if budget.memory_bytes is not None and memory_base is not None else None
+        )
+        self._budget = budget
+        self._events = 0
+
+    def trace(self, frame: Any, event: str, arg: Any) -> Callable[..., Any]:
+        self._events += 1
+        if self._events % CHECK_INTERVAL == 0:
+            if self._cpu_deadline is not None and time.thread_time() > self._cpu_deadline:
+                raise CPUBudgetExceeded(f"exceeded CPU time budget of {self._budget.cpu_ms}ms")
+            if self._memory_limit is not None and tracemalloc.get_traced_memory()[0] > self._memory_limit:
+                raise MemoryBudgetExceeded(
+                    f"exceeded memory budget of {self._budget.memory_bytes} bytes"
+                )
+        return self.trace
+
+
+def run_with_budget(
+    func: Callable[..., Any],
+    kwargs: Dict[str, Any],
+    budget: ResourceBudget = UNLIMITED,
+    measure_memory: bool = False,
+) -> Tuple[Any, Optional[Exception], ResourceUsage]:
+    """
+    Call func(**kwargs) within a budget and measure what it used.
+
+    Peak memory is measured when the budget limits memory or measure_memory
+    is set. Returns (result, None, usage), or (None, exception, usage) when
+    func raised or the call exceeded its budget.
+    """
+    track_memory = measure_memory or budget.memory_bytes is not None
+    memory_base: Optional[int] = None
+    if track_memory:
+        _start_tracing()
+        tracemalloc.reset_peak()
+        memory_base = tracemalloc.get_traced_memory()[0]
+
+    monitor: Optional[_BudgetMonitor] = None
+    cpu_start = time.thread_time()
+    if budget.is_limited and sys.gettrace() is None:
+        monitor = _BudgetMonitor(budget, cpu_start, memory_base)
+        sys.settrace(monitor.trace)
+
+    result: Any = None
+    error: Optional[Exception] = None
+    try:
+        result = func(**kwargs)
+    except Exception as e:
+        error = e
+    finally:
+        if monitor is not None:
+            sys.settrace(None)
+        cpu_ms = (time.thread_time() - cpu_start) * 1000
+        peak_memory: Optional[int] = None
+        if track_memory:
+            peak_memory = max(0, tracemalloc.get_traced_memory()[1] - memory_base)
+            _stop_tracing()
+
+    usage = ResourceUsage(cpu_ms=cpu_ms, peak_memory_bytes=peak_memory)
+    if not isinstance(error, ResourceBudgetExceeded):
+        breach = budget.check(usage)
+        if breach is not None:
+            return None, breach, usage
+    if error is not None:
+        return None, error, usage
+    return result, None, usage
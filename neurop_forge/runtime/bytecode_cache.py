@@ -0,0 +1,271 @@
+"""
+On-disk cache of compiled block bytecode.
+
+CompiledBlockCache keeps compiled blocks for the life of a process, but
+every new process (pool worker, CLI invocation, API worker) compiles each
+block's logic again. A BytecodeCache stores the marshalled code objects in
+a directory, much like __pycache__, so they can be loaded instead:
+
+    <directory>/<python magic>/<hash[:2]>/<block hash>.nbc
+
+Entries are keyed by block identity hash and by the interpreter's bytecode
+magic number (importlib.util.MAGIC_NUMBER), so interpreters that do not
+share a bytecode format never read each other's entries. Each file is
+
+    +----------------------------+
+    | header (fixed size)        |  magic, format version, python magic,
+    |                            |  block hash, source digest, MAC, length
+    +----------------------------+
+    | marshalled code object     |
+    +----------------------------+
+
+and is only used when every header field matches and the MAC checks out:
+
+- the block hash in the file is the one requested;
+- the source digest is sha256 over the function name and the logic being
+  compiled, so an entry is never used for different source even if a
+  block claims another block's hash;
+- the MAC is HMAC-SHA256 over header and code, keyed with a random key
+  kept in the cache directory (KEY_FILE, readable by its owner only).
+  It rejects truncated and corrupted files, and code written by anyone
+  who cannot read the key.
+
+marshal is not safe against crafted input, which is why nothing is
+unmarshalled before the MAC is checked. Entries are written to a
+temporary file and renamed into place, so readers see a whole file or
+none. A stale or rejected entry is not deleted: the caller compiles the
+logic and stores the new code over it with the same atomic rename.
+Failing to read or write the directory only costs a compile.
+"""
+
+import hashlib
+import hmac
+import importlib.util
+import marshal
+import os
+import secrets
+import struct
+import threading
+from pathlib import Path
+from types import CodeType
+from typing import Any, Dict, Optional, Union
+
+
+BYTECODE_MAGIC = b"NPFCODE\x00"
+BYTECODE_FORMAT_VERSION = 1
+BYTECODE_SUFFIX = ".nbc"
+KEY_FILE = "cache.key"
+KEY_SIZE = 32
+
+# magic, format_version, python magic, block hash, source digest, MAC,
+# code length
+_HEADER = struct.Struct("<8sI4s32s32s32sI")
+_MAC_OFFSET = _HEADER.size - 4 - 32
+
+
+def source_digest(logic: str, func_name: str) -> bytes:
+    """sha256 over what a block's code object is compiled from."""
+    digest = hashlib.sha256(func_name.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(logic.encode("utf-8"))
+    return digest.digest()
+
+
+def default_bytecode_cache_path(library_path: Union[str, Path]) -> Path:
+    """Get the bytecode cache directory that sits next to a library directory."""
+    library = Path(library_path)
+    return library.with_name(library.name + ".bytecode")
+
+
+class BytecodeCache:
+    """
+    Marshalled block code objects in a directory (see module docstring).
+
+    Thread-safe, and safe to share between processes.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        self._directory = Path(directory)
+        self._python_magic = importlib.util.MAGIC_NUMBER
+        self._entries = self._directory / self._python_magic.hex()
+        self._key: Optional[bytes] = None
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._rejected = 0
+        self._writes = 0
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def path_for(self, block_id: str) -> Path:
+        """Where a block's entry is stored for this interpreter."""
+        return self._entries / block_id[:2] / f"{block_id}{BYTECODE_SUFFIX}"
+
+    def load(self, block_id: str, logic: str, func_name: str) -> Optional[CodeType]:
+        """
+        The cached code for a block, or None when there is no valid entry.
+
+        Only an entry for this block hash, this source and this
+        interpreter, with a valid MAC, is returned.
+        """
+        block_hash = self._block_hash(block_id)
+        if block_hash is None:
+            return None
+        try:
+            data = self.path_for(block_id).read_bytes()
+        except OSError:
+            with self._lock:
+                self._misses += 1
+            return None
+
+        code = self._verified_code(data, block_hash, source_digest(logic, func_name))
+        with self._lock:
+            if code is None:
+                self._rejected += 1
+            else:
+                self._hits += 1
+        return code
+
+    def store(self, block_id: str, logic: str, func_name: str, code: CodeType) -> bool:
+        """
+        Write a block's code atomically (temp file + rename).
+
+        Returns False instead of raising when the entry cannot be written.
+        """
+        block_hash = self._block_hash(block_id)
+        key = self._load_key()
+        if block_hash is None or key is None:
+            return False
+        payload = marshal.dumps(code)
+        header = self._header(block_hash, source_digest(logic, func_name), bytes(32), len(payload))
+        mac = self._mac(key, header, payload)
+        header = header[:_MAC_OFFSET] + mac + header[_MAC_OFFSET + 32:]
+
+        target = self.path_for(block_id)
+        tmp_path = target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(header)
+                f.write(payload)
+            os.replace(tmp_path, target)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            return False
+        with self._lock:
+            self._writes += 1
+        return True
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Hit/miss/rejected/write counters."""
+        with self._lock:
+            return {
+                "directory": str(self._directory),
+                "hits": self._hits,
+                "misses": self._misses,
+                "rejected": self._rejected,
+                "writes": self._writes,
+            }
+
+    def _verified_code(self, data: bytes, block_hash: bytes, digest: bytes) -> Optional[CodeType]:
+        """The code in an entry's bytes if every check passes, else None."""
+        if len(data) < _HEADER.size:
+            return None
+        magic, version, python_magic, stored_hash, stored_digest, mac, length = _HEADER.unpack_from(data)
+        if (
+            magic != BYTECODE_MAGIC
+            or version != BYTECODE_FORMAT_VERSION
+            or python_magic != self._python_magic
+            or stored_hash != block_hash
+            or stored_digest != digest
+            or length != len(data) - _HEADER.size
+        ):
+            return None
+        key = self._load_key()
+        if key is None:
+            return None
+        header = data[:_HEADER.size]
+        payload = data[_HEADER.size:]
+        unsigned = header[:_MAC_OFFSET] + bytes(32) + header[_MAC_OFFSET + 32:]
+        if not hmac.compare_digest(mac, self._mac(key, unsigned, payload)):
+            return None
+        try:
+            code = marshal.loads(payload)
+        except (EOFError, ValueError, TypeError):
+            return None
+        return code if isinstance(code, CodeType) else None
+
+    def _header(self, block_hash: bytes, digest: bytes, mac: bytes, length: int) -> bytes:
+        return _HEADER.pack(
+            BYTECODE_MAGIC,
+            BYTECODE_FORMAT_VERSION,
+            self._python_magic,
+            block_hash,
+            digest,
+            mac,
+            length,
+        )
+
+    @staticmethod
+    def _mac(key: bytes, header: bytes, payload: bytes) -> bytes:
+        mac = hmac.new(key, header, hashlib.sha256)
+        mac.update(payload)
+        return mac.digest()
+
+    @staticmethod
+    def _block_hash(block_id: str) -> Optional[bytes]:
+        """A block identity hash as bytes (None if it is not a sha256 hex digest)."""
+        if len(block_id) != 64:
+            return None
+        try:
+            return bytes.fromhex(block_id)
+        except ValueError:
+            return None
+
+    def _load_key(self) -> Optional[bytes]:
+        """
+        The directory's MAC key, created on first use.
+
+        A new key is written to a temporary file and hard-linked into
+        place, so concurrent processes agree on whichever key was linked
+        first. None when the directory is not usable.
+        """
+        if self._key is not None:
+            return self._key
+        key_path = self._directory / KEY_FILE
+        try:
+            key = key_path.read_bytes()
+        except FileNotFoundError:
+            key = self._create_key(key_path)
+        except OSError:
+            return None
+        if key is None or len(key) != KEY_SIZE:
+            return None
+        self._key = key
+        return key
+
+    @staticmethod
+    def _create_key(key_path: Path) -> Optional[bytes]:
+        tmp_path = key_path.with_name(f".{key_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            key_path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(secrets.token_bytes(KEY_SIZE))
+            try:
+                os.link(tmp_path, key_path)
+            except FileExistsError:
+                pass
+            return key_path.read_bytes()
+        except OSError:
+            return None
+        finally:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
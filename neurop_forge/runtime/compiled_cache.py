@@ -0,0 +1,212 @@
+"""
+Compiled block cache for BlockExecutor.
+
+Executing a block used to copy the execution namespace, exec() the block
+source and rebuild the function object on every call. This cache keeps,
+per block identity hash, the compiled code object and the function bound
+to its own globals namespace, so repeat executions of the same block only
+pay for the call itself.
+
+The namespace a function is bound to is built once from the executor's
+base namespace when the block is first compiled and is not updated per
+call. Inputs reach the function as arguments only.
+
+The cache is bounded with LRU eviction. One process-wide cache is shared
+by every BlockExecutor (see get_compiled_block_cache), so executors that
+are created per request still reuse compiled blocks. With a BytecodeCache
+attached, code objects are also loaded from and saved to disk, so new
+processes skip compiling too.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping, Optional
+from types import CodeType
+
+from neurop_forge.runtime.bytecode_cache import BytecodeCache
+
+
+DEFAULT_COMPILED_CACHE_SIZE = 1024
+
+
+@dataclass
+class CompiledBlock:
+    """A block's compiled logic and the function it defines."""
+    block_id: str
+    func_name: str
+    code: CodeType
+    namespace: Dict[str, Any]
+    function: Optional[Callable[..., Any]]
+
+    @property
+    def found(self) -> bool:
+        """Whether the block logic defines its declared function."""
+        return self.function is not None
+
+
+def compile_block(
+    block_id: str,
+    logic: str,
+    func_name: str,
+    base_namespace: Mapping[str, Any],
+    bytecode_cache: Optional[BytecodeCache] = None,
+) -> CompiledBlock:
+    """
+    Compile block logic and bind its function to a fresh namespace.
+
+    With a bytecode cache, a valid cached code object is used instead of
+    compiling, and newly compiled code is stored in it.
+
+    Raises whatever compile() or the block's module-level code raises.
+    """
+    code = bytecode_cache.load(block_id, logic, func_name) if bytecode_cache is not None else None
+    if code is None:
+        code = compile(logic, f"<neurop-block {func_name}>", "exec")
+        if bytecode_cache is not None:
+            bytecode_cache.store(block_id, logic, func_name, code)
+    namespace = dict(base_namespace)
+    exec(code, namespace)
+    function = namespace.get(func_name)
+    if not callable(function):
+        function = None
+    return CompiledBlock(
+        block_id=block_id,
+        func_name=func_name,
+        code=code,
+        namespace=namespace,
+        function=function,
+    )
+
+
+class CompiledBlockCache:
+    """
+    LRU cache of CompiledBlock keyed by block identity hash.
+
+    Thread-safe. Two threads missing on the same block at once may both
+    compile it; the last one stored wins, which is harmless because both
+    results are equivalent.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_COMPILED_CACHE_SIZE,
+        bytecode_cache: Optional[BytecodeCache] = None,
+    ):
+        self._max_size = max(0, max_size)
+        self._bytecode_cache = bytecode_cache
+        self._entries: "OrderedDict[str, CompiledBlock]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @property
+    def bytecode_cache(self) -> Optional[BytecodeCache]:
+        """On-disk cache that misses are loaded from, if any."""
+        return self._bytecode_cache
+
+    def set_bytecode_cache(self, bytecode_cache: Optional[BytecodeCache]) -> None:
+        """Attach (or, with None, detach) an on-disk bytecode cache."""
+        self._bytecode_cache = bytecode_cache
+
+    def get(self, block_id: str) -> Optional[CompiledBlock]:
+        """Return the cached entry for a block, marking it recently used."""
+        with self._lock:
+            compiled = self._entries.get(block_id)
+            if compiled is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(block_id)
+            self._hits += 1
+            return compiled
+
+    def put(self, compiled: CompiledBlock) -> None:
+        """Store an entry, evicting the least recently used ones over the limit."""
+        if self._max_size == 0:
+            return
+        with self._lock:
+            self._entries[compiled.block_id] = compiled
+            self._entries.move_to_end(compiled.block_id)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def get_or_compile(
+        self,
+        block_id: str,
+        logic: str,
+        func_name: str,
+        base_namespace: Mapping[str, Any],
+    ) -> CompiledBlock:
+        """Return the cached entry for a block, compiling it on a miss."""
+        compiled = self.get(block_id)
+        if compiled is not None:
+            return compiled
+        compiled = compile_block(block_id, logic, func_name, base_namespace, self._bytecode_cache)
+        self.put(compiled)
+        return compiled
+
+    def invalidate(self, block_id: str) -> bool:
+        """Drop one block. Returns True if it was cached."""
+        with self._lock:
+            return self._entries.pop(block_id, None) is not None
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, block_id: object) -> bool:
+        return block_id in self._entries
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Size and hit/miss/eviction counters."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            stats = {
+                "size": len(self._entries),
+                "max_size": self._max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+        if self._bytecode_cache is not None:
+            stats["bytecode"] = self._bytecode_cache.get_statistics()
+        return stats
+
+
+_global_cache: Optional[CompiledBlockCache] = None
+_global_cache_lock = threading.Lock()
+
+
+def get_compiled_block_cache() -> CompiledBlockCache:
+    """Get the process-wide compiled block cache."""
+    global _global_cache
+    if _global_cache is None:
+        with _global_cache_lock:
+            if _global_cache is None:
+                _global_cache = CompiledBlockCache()
+    return _global_cache
+
+
+def configure_compiled_block_cache(
+    max_size: int,
+    bytecode_cache: Optional[BytecodeCache] = None,
+) -> CompiledBlockCache:
+    """Replace the process-wide cache with an empty one of the given size."""
+    global _global_cache
+    with _global_cache_lock:
+        _global_cache = CompiledBlockCache(max_size, bytecode_cache)
+    return _global_cache
@@ -10,15 +10,25 @@ The ExecutionContext is the memory of graph execution:
 - Manages variable scopes (global, graph, node)
 - Tracks execution history for debugging
 - Provides type-safe variable access
+
+History is a ring buffer of the last history_size writes, timestamped
+with time.perf_counter(). Checkpoints share structure: each one stores
+only the variables changed since the checkpoint it was built on, so
+taking one costs O(changed keys) rather than a copy of every variable.
+Checkpoints keep references to variable values; a value mutated in place
+after a checkpoint is not restored by rollback.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
 from enum import Enum
-from datetime import datetime
-import copy
+from datetime import datetime, timedelta
 import hashlib
 import json
+import time
+
+from neurop_forge.core.compact import slotted
 
 
 class ContextScope(Enum):
@@ -29,6 +39,7 @@ class ContextScope(Enum):
     TEMPORARY = "temporary"
 
 
+@slotted
 @dataclass
 class ExecutionVariable:
     """A typed variable in the execution context."""
@@ -62,14 +73,42 @@ class ExecutionVariable:
         return str(val)
 
 
+# Context writes kept in the history ring buffer
+DEFAULT_HISTORY_SIZE = 1000
+
+
 @dataclass
 class ContextCheckpoint:
-    """A snapshot of context state for rollback."""
+    """
+    A snapshot of context state for rollback.
+    
+    changes holds the variables set (or None for deleted) since parent,
+    the checkpoint this one was built on.
+    """
     checkpoint_id: str
     timestamp: str
-    variables: Dict[str, ExecutionVariable]
+    changes: Dict[str, Optional[ExecutionVariable]]
     node_position: int
     reason: str
+    parent: Optional["ContextCheckpoint"] = None
+    
+    @property
+    def variables(self) -> Dict[str, ExecutionVariable]:
+        """Every variable as of this checkpoint."""
+        chain: List[ContextCheckpoint] = []
+        checkpoint: Optional[ContextCheckpoint] = self
+        while checkpoint is not None:
+            chain.append(checkpoint)
+            checkpoint = checkpoint.parent
+        
+        variables: Dict[str, ExecutionVariable] = {}
+        for checkpoint in reversed(chain):
+            for name, var in checkpoint.changes.items():
+                if var is None:
+                    variables.pop(name, None)
+                else:
+                    variables[name] = var
+        return variables
 
 
 class ExecutionContext:
@@ -88,10 +127,15 @@ class ExecutionContext:
         self,
         initial_inputs: Optional[Dict[str, Any]] = None,
         config: Optional[Dict[str, Any]] = None,
+        history_size: int = DEFAULT_HISTORY_SIZE,
     ):
         self._variables: Dict[str, ExecutionVariable] = {}
         self._checkpoints: List[ContextCheckpoint] = []
-        self._history: List[Dict[str, Any]] = []
+        self._base_checkpoint: Optional[ContextCheckpoint] = None
+        self._changed: Set[str] = set()
+        self._history: Deque[Tuple[str, str, Optional[str], float]] = deque(maxlen=max(0, history_size))
+        self._started_at = datetime.now()
+        self._started_mono = time.perf_counter()
         self._config = config or {}
         self._execution_id = self._generate_execution_id()
         self._current_node: Optional[str] = None
@@ -140,13 +184,9 @@ class ExecutionContext:
         )
         
         self._variables[name] = var
+        self._changed.add(name)
         
-        self._history.append({
-            "action": "set",
-            "name": name,
-            "scope": scope.value,
-            "timestamp": datetime.now().isoformat(),
-        })
+        self._history.append(("set", name, scope.value, time.perf_counter()))
     
     def get(self, name: str, default: Any = None) -> Any:
         """Get a variable value from the context."""
@@ -172,11 +212,8 @@ class ExecutionContext:
             raise ValueError(f"Cannot delete readonly variable: {name}")
         
         del self._variables[name]
-        self._history.append({
-            "action": "delete",
-            "name": name,
-            "timestamp": datetime.now().isoformat(),
-        })
+        self._changed.add(name)
+        self._history.append(("delete", name, None, time.perf_counter()))
         return True
     
     def set_node_output(
@@ -232,6 +269,7 @@ class ExecutionContext:
         ]
         for name in temp_vars:
             del self._variables[name]
+        self._changed.update(temp_vars)
         
         self._current_node = None
     
@@ -242,33 +280,51 @@ class ExecutionContext:
         cp = ContextCheckpoint(
             checkpoint_id=checkpoint_id,
             timestamp=datetime.now().isoformat(),
-            variables=copy.deepcopy(self._variables),
+            changes={name: self._variables.get(name) for name in self._changed},
             node_position=len(self._node_outputs),
             reason=reason,
+            parent=self._base_checkpoint,
         )
         
         self._checkpoints.append(cp)
+        self._base_checkpoint = cp
+        self._changed = set()
         return checkpoint_id
     
     def rollback(self, checkpoint_id: str) -> bool:
         """Rollback to a specific checkpoint."""
         for cp in reversed(self._checkpoints):
             if cp.checkpoint_id == checkpoint_id:
-                self._variables = copy.deepcopy(cp.variables)
+                self._variables = cp.variables
+                self._base_checkpoint = cp
+                self._changed = set()
                 
                 nodes_to_remove = list(self._node_outputs.keys())[cp.node_position:]
                 for node_id in nodes_to_remove:
                     del self._node_outputs[node_id]
                 
-                self._history.append({
-                    "action": "rollback",
-                    "checkpoint_id": checkpoint_id,
-                    "timestamp": datetime.now().isoformat(),
-                })
+                self._history.append(("rollback", checkpoint_id, None, time.perf_counter()))
                 return True
         
         return False
     
+    def get_history(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """The most recent context writes (up to history_size), oldest first."""
+        entries = list(self._history)
+        if limit is not None:
+            entries = entries[-limit:] if limit > 0 else []
+        
+        history = []
+        for action, name, scope, instant in entries:
+            timestamp = (self._started_at + timedelta(seconds=instant - self._started_mono)).isoformat()
+            if action == "rollback":
+                history.append({"action": action, "checkpoint_id": name, "timestamp": timestamp})
+            elif scope is None:
+                history.append({"action": action, "name": name, "timestamp": timestamp})
+            else:
+                history.append({"action": action, "name": name, "scope": scope, "timestamp": timestamp})
+        return history
+    
     def get_all_variables(
         self,
         scope: Optional[ContextScope] = None
@@ -329,5 +385,5 @@ class ExecutionContext:
                 }
                 for cp in self._checkpoints
             ],
-            "history": self._history[-100:],
+            "history": self.get_history(100),
         }
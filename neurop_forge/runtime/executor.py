@@ -16,19 +16,47 @@ Intent -> Compose -> Execute -> Result
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, Tuple
-from datetime import datetime
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from datetime import datetime, timedelta
+import concurrent.futures
+import functools
+import itertools
+import threading
 import time
 import traceback
 
 from neurop_forge.runtime.context import ExecutionContext, ContextScope
-from neurop_forge.runtime.result import ExecutionResult, ExecutionTrace, ExecutionStatus
-from neurop_forge.runtime.guards import RetryPolicy, CircuitBreaker, ExecutionGuard
-from neurop_forge.runtime.adapter import FunctionAdapter
-from neurop_forge.runtime.trust_tracker import record_block_execution, get_trust_tracker
+from neurop_forge.runtime.result import ExecutionResult, ExecutionTrace, ExecutionStatus, ResourceUsage, TraceMode
+from neurop_forge.runtime.guards import (
+    RetryPolicy,
+    RetryStatistics,
+    CircuitBreaker,
+    ExecutionGuard,
+    FailureKind,
+    classify_failure,
+)
+from neurop_forge.runtime.adapter import BindingPlan, FunctionAdapter
+from neurop_forge.runtime.budgets import ResourceBudget, run_with_budget
+from neurop_forge.runtime.scheduler import GraphSchedule, build_schedule
+from neurop_forge.runtime.vectorized import VectorDispatcher, row_outputs
+from neurop_forge.runtime.result_cache import ResultCache, canonical_input_hash, is_cacheable_block
+from neurop_forge.runtime.compiled_cache import (
+    CompiledBlock,
+    CompiledBlockCache,
+    compile_block,
+    get_compiled_block_cache,
+)
+from neurop_forge.runtime.trust_tracker import (
+    record_block_batch,
+    record_block_execution,
+    get_trust_tracker,
+)
 from neurop_forge.semantic.composer import SemanticGraph, CompositionNode
 from neurop_forge.core.block_schema import NeuropBlock
 
+if TYPE_CHECKING:
+    from neurop_forge.runtime.graph_compiler import CompiledGraph
+
 
 @dataclass
 class NodeExecutionResult:
@@ -40,6 +68,151 @@ class NodeExecutionResult:
     duration_ms: float
     error: Optional[str] = None
     retry_count: int = 0
+    inputs: Dict[str, Any] = field(default_factory=dict)
+    started_at: float = field(default_factory=time.perf_counter)
+    resource_usage: Optional[ResourceUsage] = None
+
+
+class ExecutionRecorder:
+    """
+    Node results and traces of one graph run.
+    
+    Node start instants come from time.perf_counter() and are turned into
+    wall-clock timestamps relative to the start of the run, so trace
+    timestamps are real start/end instants and never go backwards.
+    """
+    
+    def __init__(self, trace_mode: TraceMode = TraceMode.FULL):
+        self.trace_mode = trace_mode
+        self.started_at = datetime.now()
+        self.started_mono = time.perf_counter()
+        self.results: List[NodeExecutionResult] = []
+        self.traces: List[ExecutionTrace] = []
+    
+    def timestamp(self, instant: float) -> str:
+        """ISO timestamp of a time.perf_counter() instant during the run."""
+        return (self.started_at + timedelta(seconds=instant - self.started_mono)).isoformat()
+    
+    def record(self, node: CompositionNode, node_result: NodeExecutionResult) -> None:
+        """Keep a finished node's result and trace it per the trace mode."""
+        self.results.append(node_result)
+        if self.trace_mode == TraceMode.OFF:
+            return
+        
+        full = self.trace_mode == TraceMode.FULL
+        started = node_result.started_at
+        self.traces.append(ExecutionTrace(
+            node_id=node.block_identity,
+            block_name=node.block_name,
+            status=node_result.status,
+            started_at=self.timestamp(started),
+            completed_at=self.timestamp(started + node_result.duration_ms / 1000.0),
+            duration_ms=node_result.duration_ms,
+            inputs=node_result.inputs if full else {},
+            outputs=node_result.outputs,
+            error=node_result.error,
+            retry_count=node_result.retry_count,
+            inputs_hash=None if full else canonical_input_hash(node_result.inputs),
+            resource_usage=node_result.resource_usage,
+        ))
+    
+    def build_result(
+        self,
+        query: str,
+        execution_id: str,
+        error_message: Optional[str],
+    ) -> ExecutionResult:
+        """Assemble the ExecutionResult for a finished (or stopped) run."""
+        results = self.results
+        
+        final_outputs: Dict[str, Any] = {}
+        if results and results[-1].status == ExecutionStatus.SUCCESS:
+            final_outputs = results[-1].outputs
+        
+        completed = time.perf_counter()
+        return ExecutionResult(
+            execution_id=execution_id,
+            query=query,
+            status=GraphExecutor._overall_status([r.status for r in results]),
+            started_at=self.started_at.isoformat(),
+            completed_at=self.timestamp(completed),
+            total_duration_ms=(completed - self.started_mono) * 1000,
+            traces=self.traces,
+            final_outputs=final_outputs,
+            error=error_message,
+            nodes_executed=len(results),
+            nodes_succeeded=sum(1 for r in results if r.status == ExecutionStatus.SUCCESS),
+            nodes_failed=sum(1 for r in results if r.status == ExecutionStatus.FAILED),
+            nodes_skipped=sum(1 for r in results if r.status == ExecutionStatus.SKIPPED),
+            resource_usage=ResourceUsage.total(r.resource_usage for r in results),
+        )
+
+
+def build_execution_namespace() -> Dict[str, Any]:
+    """Build the safe namespace block logic executes against."""
+    import math
+    import re
+    import json
+    import hashlib
+    import base64
+    from datetime import datetime, date, timedelta
+    from typing import Any, Dict, List, Optional, Tuple
+    
+    def round_to_cents(amount: float) -> float:
+        """Round amount to nearest cent."""
+        return round(amount, 2)
+    
+    def round_to_precision(value: float, decimals: int) -> float:
+        """Round value to specified decimal places."""
+        return round(value, decimals)
+    
+    return {
+        "math": math,
+        "re": re,
+        "json": json,
+        "hashlib": hashlib,
+        "base64": base64,
+        "datetime": datetime,
+        "date": date,
+        "timedelta": timedelta,
+        "Any": Any,
+        "Dict": Dict,
+        "List": List,
+        "Optional": Optional,
+        "Tuple": Tuple,
+        "len": len,
+        "str": str,
+        "int": int,
+        "float": float,
+        "bool": bool,
+        "list": list,
+        "dict": dict,
+        "tuple": tuple,
+        "set": set,
+        "frozenset": frozenset,
+        "sorted": sorted,
+        "reversed": reversed,
+        "enumerate": enumerate,
+        "zip": zip,
+        "map": map,
+        "filter": filter,
+        "sum": sum,
+        "min": min,
+        "max": max,
+        "abs": abs,
+        "round": round,
+        "range": range,
+        "isinstance": isinstance,
+        "hasattr": hasattr,
+        "getattr": getattr,
+        "setattr": setattr,
+        "type": type,
+        "True": True,
+        "False": False,
+        "None": None,
+        "round_to_cents": round_to_cents,
+        "round_to_precision": round_to_precision,
+    }
 
 
 class BlockExecutor:
@@ -48,82 +221,83 @@ class BlockExecutor:
     
     Features:
     - Safe execution sandbox
+    - Compiled-function cache keyed by block identity
+    - Batch execution over many input rows (optionally vectorized)
+    - Chunked streaming over large iterables (see runtime.streaming)
+    - Optional result cache for pure, deterministic blocks
+    - CPU time and memory budgets from block constraints (see
+      runtime.budgets), with per-call usage from last_usage()
     - FunctionAdapter for signature mapping
     - Type coercion for inputs
     - Output validation
     - Exception handling
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        compiled_cache: Optional[CompiledBlockCache] = None,
+        result_cache: Optional[ResultCache] = None,
+        default_max_execution_time_ms: Optional[float] = None,
+        default_max_memory_bytes: Optional[int] = None,
+        measure_memory: bool = False,
+        vectorize: bool = False,
+    ):
+        """
+        Args:
+            compiled_cache: Cache of compiled block functions (default: shared)
+            result_cache: Optional cache of pure block results
+            default_max_execution_time_ms: CPU time budget of blocks that
+                do not declare constraints.max_execution_time_ms
+            default_max_memory_bytes: Memory budget of blocks that do not
+                declare constraints.max_memory_bytes
+            measure_memory: Measure peak memory of every call, not only of
+                calls with a memory budget (slower: runs tracemalloc)
+            vectorize: Run numeric execute_many batches through verified
+                NumPy kernels when NumPy is installed (see runtime.vectorized)
+        """
         self._execution_namespace: Dict[str, Any] = {}
         self._adapter = FunctionAdapter()
+        self._compiled_cache = compiled_cache if compiled_cache is not None else get_compiled_block_cache()
+        self._result_cache = result_cache
+        self._default_cpu_ms = default_max_execution_time_ms
+        self._default_memory_bytes = default_max_memory_bytes
+        self._measure_memory = measure_memory
+        self._usage = threading.local()
+        self._vectorizer = VectorDispatcher() if vectorize else None
         self._setup_namespace()
     
+    @property
+    def compiled_cache(self) -> CompiledBlockCache:
+        """Cache of compiled block functions used by this executor."""
+        return self._compiled_cache
+    
+    @property
+    def result_cache(self) -> Optional[ResultCache]:
+        """Opt-in cache of pure block results (None when disabled)."""
+        return self._result_cache
+    
+    def budget_for(self, block: NeuropBlock) -> ResourceBudget:
+        """CPU time and memory budget of one call of a block."""
+        return ResourceBudget.for_block(block, self._default_cpu_ms, self._default_memory_bytes)
+    
+    def last_usage(self) -> Optional[ResourceUsage]:
+        """
+        Resources used by the last execute() call made on this thread.
+        
+        None when that call ran no block logic (result cache hit, binding
+        or compile error).
+        """
+        return getattr(self._usage, "last", None)
+    
+    def _result_key(self, block: NeuropBlock, block_id: Optional[str], inputs: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+        """Result cache key for a call, or None when the call is not cacheable."""
+        if self._result_cache is None or block_id is None or not is_cacheable_block(block):
+            return None
+        return self._result_cache.key_for(block_id, inputs)
+    
     def _setup_namespace(self) -> None:
         """Setup safe execution namespace."""
-        import math
-        import re
-        import json
-        import hashlib
-        import base64
-        from datetime import datetime, date, timedelta
-        from typing import Any, Dict, List, Optional, Tuple
-        
-        def round_to_cents(amount: float) -> float:
-            """Round amount to nearest cent."""
-            return round(amount, 2)
-        
-        def round_to_precision(value: float, decimals: int) -> float:
-            """Round value to specified decimal places."""
-            return round(value, decimals)
-        
-        self._execution_namespace = {
-            "math": math,
-            "re": re,
-            "json": json,
-            "hashlib": hashlib,
-            "base64": base64,
-            "datetime": datetime,
-            "date": date,
-            "timedelta": timedelta,
-            "Any": Any,
-            "Dict": Dict,
-            "List": List,
-            "Optional": Optional,
-            "Tuple": Tuple,
-            "len": len,
-            "str": str,
-            "int": int,
-            "float": float,
-            "bool": bool,
-            "list": list,
-            "dict": dict,
-            "tuple": tuple,
-            "set": set,
-            "frozenset": frozenset,
-            "sorted": sorted,
-            "reversed": reversed,
-            "enumerate": enumerate,
-            "zip": zip,
-            "map": map,
-            "filter": filter,
-            "sum": sum,
-            "min": min,
-            "max": max,
-            "abs": abs,
-            "round": round,
-            "range": range,
-            "isinstance": isinstance,
-            "hasattr": hasattr,
-            "getattr": getattr,
-            "setattr": setattr,
-            "type": type,
-            "True": True,
-            "False": False,
-            "None": None,
-            "round_to_cents": round_to_cents,
-            "round_to_precision": round_to_precision,
-        }
+        self._execution_namespace = build_execution_namespace()
     
     def execute(
         self,
@@ -134,29 +308,81 @@ class BlockExecutor:
         Execute a block's logic with given inputs.
         
         Uses FunctionAdapter to map semantic inputs to actual function params.
+        With a result cache, pure deterministic blocks are answered from it
+        when possible; cache hits are not recorded with the trust tracker.
         
         Returns:
             Tuple of (outputs dict, error message or None)
         """
         start_time = time.time()
+        self._usage.last = None
+        block_id = self._block_id(block)
+        result_key = self._result_key(block, block_id, inputs)
+        if result_key is not None:
+            cached = self._result_cache.get(result_key)
+            if cached is not None:
+                return cached, None
+        try:
+            block_id, compiled = self._compile(block, block_id)
+        except Exception as e:
+            return self._execution_error(block_id or str(id(block)), inputs, start_time, e)
+        return self._run_compiled(block, block_id, compiled, inputs, start_time, result_key)
+    
+    def bind(
+        self,
+        block: NeuropBlock,
+    ) -> Callable[[Dict[str, Any]], Tuple[Dict[str, Any], Optional[str]]]:
+        """
+        Callable that executes one block; equivalent to partial(execute, block).
+        
+        The block identity, result-cache eligibility and compiled function
+        are resolved once here instead of on every call. Subclasses that
+        override execute get partial(execute, block).
+        """
+        if type(self).execute is not BlockExecutor.execute:
+            return functools.partial(self.execute, block)
+        block_id = self._block_id(block)
+        cacheable = self._result_cache is not None and block_id is not None and is_cacheable_block(block)
+        try:
+            block_id, compiled = self._compile(block, block_id)
+        except Exception:
+            return functools.partial(self.execute, block)
+        return functools.partial(self._execute_bound, block, block_id, compiled, cacheable)
+    
+    def _execute_bound(
+        self,
+        block: NeuropBlock,
+        block_id: str,
+        compiled: CompiledBlock,
+        cacheable: bool,
+        inputs: Dict[str, Any],
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """execute() with the per-block lookups already done (see bind)."""
+        start_time = time.time()
+        self._usage.last = None
+        result_key = self._result_cache.key_for(block_id, inputs) if cacheable else None
+        if result_key is not None:
+            cached = self._result_cache.get(result_key)
+            if cached is not None:
+                return cached, None
+        return self._run_compiled(block, block_id, compiled, inputs, start_time, result_key)
+    
+    def _run_compiled(
+        self,
+        block: NeuropBlock,
+        block_id: str,
+        compiled: CompiledBlock,
+        inputs: Dict[str, Any],
+        start_time: float,
+        result_key: Optional[Tuple[str, str]],
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """Adapt inputs, call a compiled block function and record the outcome."""
         try:
-            local_namespace = dict(self._execution_namespace)
-            local_namespace.update(inputs)
-            
             logic = block.logic.strip()
-            func_name = block.metadata.name
-            
-            if hasattr(block.identity, 'content_hash'):
-                block_id = str(block.identity.content_hash)
-            elif isinstance(block.identity, dict):
-                block_id = str(block.identity.get('content_hash', id(block)))
-            else:
-                block_id = str(id(block))
-            
-            exec(logic, local_namespace)
+            func_name = compiled.func_name
             
-            if func_name in local_namespace:
-                func = local_namespace[func_name]
+            if compiled.found:
+                func = compiled.function
                 
                 adapted_inputs, adapt_error = self._adapter.adapt_inputs(
                     block_id=block_id,
@@ -171,11 +397,17 @@ class BlockExecutor:
                     record_block_execution(block_id, False, duration_ms, inputs, error=Exception(adapt_error))
                     return {}, adapt_error
                 
-                result = func(**adapted_inputs)
+                result, error, self._usage.last = run_with_budget(
+                    func, adapted_inputs, self.budget_for(block), self._measure_memory,
+                )
+                if error is not None:
+                    raise error
                 
                 outputs = self._prepare_outputs(block, result)
                 duration_ms = (time.time() - start_time) * 1000
                 record_block_execution(block_id, True, duration_ms, inputs, outputs=outputs)
+                if result_key is not None:
+                    self._result_cache.put(result_key, outputs)
                 return outputs, None
             else:
                 duration_ms = (time.time() - start_time) * 1000
@@ -184,11 +416,222 @@ class BlockExecutor:
                 return {"result": None}, error_msg
                 
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            return self._execution_error(block_id, inputs, start_time, e)
+    
+    @staticmethod
+    def _execution_error(
+        block_id: str,
+        inputs: Dict[str, Any],
+        start_time: float,
+        error: Exception,
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """Record a block that raised and return its (outputs, error) pair."""
+        duration_ms = (time.time() - start_time) * 1000
+        error_msg = f"{type(error).__name__}: {str(error)}"
+        record_block_execution(block_id, False, duration_ms, inputs, error=error)
+        return {}, error_msg
+    
+    def execute_many(
+        self,
+        block: NeuropBlock,
+        rows: Iterable[Dict[str, Any]],
+    ) -> List[Tuple[Dict[str, Any], Optional[str]]]:
+        """
+        Execute one block over many input rows.
+        
+        The block is compiled once and one binding plan is reused per input
+        key shape. Trust statistics are recorded once for the whole batch.
+        With vectorize=True, numeric batches of blocks that have a NumPy
+        kernel are computed in one call (see runtime.vectorized).
+        
+        Returns:
+            One (outputs dict, error message or None) per row, in order,
+            as execute() would return for that row.
+        """
+        start_time = time.time()
+        results: List[Tuple[Dict[str, Any], Optional[str]]] = []
+        rows = list(rows)
+        block_id = self._block_id(block)
+        
+        try:
+            block_id, compiled = self._compile(block, block_id)
+        except Exception as e:
             error_msg = f"{type(e).__name__}: {str(e)}"
-            block_id = block.identity.get('content_hash', id(block)) if isinstance(block.identity, dict) else id(block)
-            record_block_execution(str(block_id), False, duration_ms, inputs, error=e)
-            return {}, error_msg
+            results = [({}, error_msg) for _ in rows]
+            self._record_batch(block_id or str(id(block)), results, start_time, [type(e).__name__])
+            return results
+        
+        if not compiled.found:
+            error_msg = f"Function {compiled.func_name} not found in block logic"
+            results = [({"result": None}, error_msg) for _ in rows]
+            self._record_batch(block_id, results, start_time, ["Exception"])
+            return results
+        
+        func = compiled.function
+        logic = block.logic.strip()
+        interface_inputs = list(block.interface.inputs) if hasattr(block, 'interface') else None
+        signature = self._adapter.get_signature(block_id, logic, compiled.func_name)
+        plans: Dict[Tuple[str, ...], BindingPlan] = {}
+        error_types: List[str] = []
+        
+        cacheable = self._result_cache is not None and is_cacheable_block(block)
+        cached_rows = 0
+        budget = self.budget_for(block)
+        
+        vectorized = None
+        if self._vectorizer is not None and not cacheable and not budget.is_limited:
+            vectorized = self._vectorizer.run(block, block_id, func, rows)
+        scalar_rows = rows if vectorized is None else [rows[index] for index in sorted(vectorized[1])]
+        
+        for inputs in scalar_rows:
+            result_key = self._result_cache.key_for(block_id, inputs) if cacheable else None
+            if result_key is not None:
+                cached = self._result_cache.get(result_key)
+                if cached is not None:
+                    results.append((cached, None))
+                    cached_rows += 1
+                    continue
+            try:
+                if signature is None:
+                    adapted_inputs, adapt_error = self._adapter.adapt_inputs(
+                        block_id=block_id,
+                        source_code=logic,
+                        func_name=compiled.func_name,
+                        available_inputs=inputs,
+                        interface_inputs=interface_inputs,
+                    )
+                    if adapt_error:
+                        results.append(({}, adapt_error))
+                        continue
+                else:
+                    shape = tuple(inputs)
+                    plan = plans.get(shape)
+                    if plan is None:
+                        plan = self._adapter.get_binding_plan(
+                            block_id, signature, inputs, interface_inputs
+                        )
+                        plans[shape] = plan
+                    adapted_inputs = plan.apply(inputs)
+                
+                if budget.is_limited:
+                    result, error, _ = run_with_budget(func, adapted_inputs, budget)
+                    if error is not None:
+                        raise error
+                else:
+                    result = func(**adapted_inputs)
+                outputs = self._prepare_outputs(block, result)
+                if result_key is not None:
+                    self._result_cache.put(result_key, outputs)
+                results.append((outputs, None))
+            except Exception as e:
+                results.append(({}, f"{type(e).__name__}: {str(e)}"))
+                if type(e).__name__ not in error_types:
+                    error_types.append(type(e).__name__)
+        
+        if vectorized is not None:
+            values, fallback = vectorized
+            key = block.interface.outputs[0].name
+            merged: List[Tuple[Dict[str, Any], Optional[str]]] = row_outputs(key, values)
+            for index, result in zip(sorted(fallback), results):
+                merged[index] = result
+            results = merged
+        
+        self._record_batch(block_id, results, start_time, error_types, cached_rows)
+        return results
+    
+    def execute_stream(
+        self,
+        block: NeuropBlock,
+        items: Iterable[Any],
+        inputs: Optional[Dict[str, Any]] = None,
+        chunk_size: Optional[int] = None,
+        sink: Optional[Callable[[List[Any]], None]] = None,
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        Execute a block over an iterable in bounded chunks.
+        
+        items feeds the block's streamed list parameter and inputs holds
+        the other parameters (see runtime.streaming). Returns what
+        execute() returns for the whole list; a block that outputs lists
+        hands each output chunk to sink instead, when given, and returns
+        {"result": None}.
+        """
+        from neurop_forge.runtime.streaming import (
+            DEFAULT_CHUNK_SIZE,
+            StreamPipeline,
+            StreamStage,
+            stream_profile_for,
+        )
+        profile = stream_profile_for(block)
+        if profile is None:
+            return {}, f"StreamError: {block.metadata.name} has no stream profile"
+        
+        stage_inputs = dict(inputs or {})
+        stage_inputs.pop(profile.input_name, None)
+        pipeline = StreamPipeline(self, [StreamStage(block, profile, stage_inputs)], sink)
+        outcome = pipeline.run(items, chunk_size or DEFAULT_CHUNK_SIZE)
+        if outcome.error is not None:
+            return {}, outcome.error
+        return {"result": outcome.value}, None
+    
+    def _compile(
+        self,
+        block: NeuropBlock,
+        block_id: Optional[str],
+    ) -> Tuple[str, CompiledBlock]:
+        """Compiled logic for a block, cached when the block has an identity hash."""
+        logic = block.logic.strip()
+        func_name = block.metadata.name
+        if block_id is None:
+            block_id = str(id(block))
+            return block_id, compile_block(block_id, logic, func_name, self._execution_namespace)
+        return block_id, self._compiled_cache.get_or_compile(
+            block_id, logic, func_name, self._execution_namespace
+        )
+    
+    @staticmethod
+    def _record_batch(
+        block_id: str,
+        results: List[Tuple[Dict[str, Any], Optional[str]]],
+        start_time: float,
+        error_types: List[str],
+        cached_rows: int = 0,
+    ) -> None:
+        """
+        Record a batch's outcomes with the trust tracker in one update.
+        
+        cached_rows successful results came from the result cache and are
+        not counted as executions.
+        """
+        successes = -cached_rows
+        failures = timeouts = 0
+        for _, error in results:
+            if error is None:
+                successes += 1
+            elif "timeout" in error.lower():
+                timeouts += 1
+            else:
+                failures += 1
+        record_block_batch(
+            block_id,
+            success_count=successes,
+            failure_count=failures,
+            duration_ms=(time.time() - start_time) * 1000,
+            timeout_count=timeouts,
+            error_types=error_types,
+        )
+    
+    @staticmethod
+    def _block_id(block: NeuropBlock) -> Optional[str]:
+        """Identity hash used to key caches and trust records (None if absent)."""
+        identity = block.identity
+        if hasattr(identity, 'content_hash'):
+            return str(identity.content_hash)
+        if isinstance(identity, dict):
+            value = identity.get('content_hash') or identity.get('hash_value')
+            if value:
+                return str(value)
+        return None
     
     def _prepare_inputs(
         self,
@@ -233,6 +676,102 @@ class BlockExecutor:
         return {"result": result}
 
 
+_TYPE_ALIASES = {
+    "email": ["email", "email_address", "mail"],
+    "phone": ["phone", "phone_number", "telephone"],
+    "text": ["text", "input", "value", "data", "content", "string", "s", "str"],
+    "url": ["url", "uri", "link", "href"],
+    "name": ["name", "username", "user_name", "full_name"],
+    "password": ["password", "passwd", "secret"],
+    "number": ["number", "num", "n", "value", "amount", "count"],
+    "integer": ["integer", "int", "i", "n", "count"],
+    "float": ["float", "f", "decimal", "amount"],
+    "boolean": ["boolean", "bool", "flag", "is_active", "enabled"],
+    "list": ["list", "items", "array", "elements", "values"],
+    "dict": ["dict", "data", "obj", "object", "payload"],
+}
+
+
+# One input binding of a graph node: (parameter, available key or None, default)
+InputBinding = Tuple[Tuple[str, Optional[str], Any], ...]
+
+
+def output_value(outputs: Dict[str, Any]) -> Any:
+    """A node's output as ExecutionContext.get_node_output returns it."""
+    if len(outputs) == 1:
+        return next(iter(outputs.values()))
+    return outputs
+
+
+def add_source_output(available: Dict[str, Any], source_output: Any) -> None:
+    """Make a source node's output available for binding (dicts are merged)."""
+    if source_output is not None:
+        if isinstance(source_output, dict):
+            available.update(source_output)
+        else:
+            available["_previous"] = source_output
+            available["input"] = source_output
+            available["value"] = source_output
+            available["data"] = source_output
+
+
+def binding_for_keys(block: NeuropBlock, keys: Tuple[str, ...]) -> InputBinding:
+    """
+    Bind a block's interface parameters to available input names.
+    
+    Exact names win, then name containment and type aliases, then the
+    parameter default, then (for required parameters) the previous output
+    or the first available value. Depends only on the names and their
+    order, so a binding can be reused for inputs with the same keys.
+    """
+    bindings: List[Tuple[str, Optional[str], Any]] = []
+    
+    for param in block.interface.inputs:
+        param_name = param.name
+        
+        if param_name in keys:
+            bindings.append((param_name, param_name, None))
+            continue
+        
+        matched = False
+        for avail_name in keys:
+            avail_lower = avail_name.lower()
+            param_lower = param_name.lower()
+            
+            if param_lower in avail_lower or avail_lower in param_lower:
+                bindings.append((param_name, avail_name, None))
+                matched = True
+                break
+            
+            for sem_type, aliases in _TYPE_ALIASES.items():
+                if param_lower in aliases or any(a in param_lower for a in aliases):
+                    if avail_lower in aliases or any(a in avail_lower for a in aliases):
+                        bindings.append((param_name, avail_name, None))
+                        matched = True
+                        break
+            if matched:
+                break
+        
+        if not matched and param.optional:
+            if param.default_value is not None:
+                bindings.append((param_name, None, param.default_value))
+        elif not matched and not param.optional:
+            if "_previous" in keys:
+                bindings.append((param_name, "_previous", None))
+            elif keys:
+                bindings.append((param_name, keys[0], None))
+    
+    return tuple(bindings)
+
+
+def apply_input_binding(binding: InputBinding, available: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a block's inputs from available values with a binding."""
+    return {
+        param: available[key] if key is not None else default
+        for param, key, default in binding
+    }
+
+
 class GraphExecutor:
     """
     Executes semantic graphs deterministically.
@@ -243,6 +782,17 @@ class GraphExecutor:
     - Chains outputs to inputs
     - Handles errors with retries
     - Returns complete ExecutionResult
+    
+    With a node_executor, nodes that do not depend on each other (see
+    runtime.scheduler) run concurrently on it. Inputs are still gathered
+    and results still committed to the context in graph order, so outputs
+    and traces match sequential execution.
+    
+    trace_mode sets how runs are traced (see TraceMode); with
+    TraceMode.SAMPLED one run in trace_sample_every is traced in full.
+    
+    A block_loader (e.g. SQLiteBlockStore.get) supplies blocks that are not
+    registered, so a large library need not be hydrated up front.
     """
     
     def __init__(
@@ -250,22 +800,74 @@ class GraphExecutor:
         block_library: Optional[Dict[str, NeuropBlock]] = None,
         retry_policy: Optional[RetryPolicy] = None,
         default_timeout_ms: float = 30000.0,
+        block_executor: Optional[BlockExecutor] = None,
+        result_cache: Optional[ResultCache] = None,
+        node_executor: Optional[concurrent.futures.Executor] = None,
+        trace_mode: TraceMode = TraceMode.FULL,
+        trace_sample_every: int = 100,
+        block_loader: Optional[Callable[[str], Optional[NeuropBlock]]] = None,
     ):
         self._blocks = block_library or {}
+        self._block_loader = block_loader
         self._retry_policy = retry_policy or RetryPolicy()
         self._default_timeout_ms = default_timeout_ms
-        self._block_executor = BlockExecutor()
+        self._block_executor = block_executor or BlockExecutor(result_cache=result_cache)
+        self._node_executor = node_executor
         self._circuit_breakers: Dict[str, CircuitBreaker] = {}
+        self._retry_stats = RetryStatistics()
+        self._trace_mode = trace_mode
+        self._trace_sample_every = max(1, trace_sample_every)
+        self._run_counter = itertools.count()
+    
+    def copy(
+        self,
+        block_loader: Optional[Callable[[str], Optional[NeuropBlock]]] = None,
+    ) -> "GraphExecutor":
+        """
+        An executor with its own block registrations.
+
+        Block executor, retry policy, node executor, the state of each
+        circuit breaker and retry statistics are shared with this one.
+        block_loader replaces this executor's loader (e.g. with the get of
+        a copied store).
+        """
+        executor = GraphExecutor(
+            block_library=dict(self._blocks),
+            retry_policy=self._retry_policy,
+            default_timeout_ms=self._default_timeout_ms,
+            block_executor=self._block_executor,
+            node_executor=self._node_executor,
+            trace_mode=self._trace_mode,
+            trace_sample_every=self._trace_sample_every,
+            block_loader=block_loader or self._block_loader,
+        )
+        executor._circuit_breakers = dict(self._circuit_breakers)
+        executor._retry_stats = self._retry_stats
+        executor._run_counter = self._run_counter
+        return executor
     
     def register_block(self, block_id: str, block: NeuropBlock) -> None:
         """Register a block for execution."""
         self._blocks[block_id] = block
     
+    def unregister_block(self, block_id: str) -> bool:
+        """Unregister a block. Returns True if it was registered."""
+        self._circuit_breakers.pop(block_id, None)
+        return self._blocks.pop(block_id, None) is not None
+    
+    def _get_block(self, block_id: str) -> Optional[NeuropBlock]:
+        """A registered block, else the block loader's (None if neither has it)."""
+        block = self._blocks.get(block_id)
+        if block is None and self._block_loader is not None:
+            block = self._block_loader(block_id)
+        return block
+    
     def execute(
         self,
         graph: SemanticGraph,
         initial_inputs: Optional[Dict[str, Any]] = None,
         config: Optional[Dict[str, Any]] = None,
+        trace_mode: Optional[TraceMode] = None,
     ) -> ExecutionResult:
         """
         Execute a semantic graph.
@@ -275,9 +877,10 @@ class GraphExecutor:
         2. Execute each node in order
         3. Chain outputs to next node's inputs
         4. Return complete execution result
+        
+        trace_mode overrides the executor's trace mode for this run.
         """
-        start_time = datetime.now()
-        start_ts = time.time()
+        run = ExecutionRecorder(self._trace_mode_for_run(trace_mode))
         
         context = ExecutionContext(
             initial_inputs=initial_inputs or {},
@@ -287,63 +890,258 @@ class GraphExecutor:
         guard = ExecutionGuard(timeout_ms=self._default_timeout_ms)
         guard.start()
         
-        traces: List[ExecutionTrace] = []
-        overall_status = ExecutionStatus.SUCCESS
         error_message = None
         
+        if self._node_executor is not None and len(graph.nodes) > 1:
+            error_message = self._execute_scheduled(graph, context, guard, run)
+            return self._build_result(graph, context.execution_id, run, error_message)
+        
         for node in graph.nodes:
             can_continue, reason = guard.check()
             if not can_continue:
-                overall_status = ExecutionStatus.TIMEOUT
                 error_message = reason
                 break
             
             node_result = self._execute_node(node, context, guard)
-            
-            trace = ExecutionTrace(
+            self._record_node(node, node_result, context, run)
+        
+        return self._build_result(graph, context.execution_id, run, error_message)
+    
+    def _trace_mode_for_run(self, trace_mode: Optional[TraceMode] = None) -> TraceMode:
+        """Trace mode of the next run: FULL, OUTPUTS_ONLY or OFF (SAMPLED resolved)."""
+        mode = trace_mode or self._trace_mode
+        if mode == TraceMode.SAMPLED:
+            sampled = next(self._run_counter) % self._trace_sample_every == 0
+            return TraceMode.FULL if sampled else TraceMode.OFF
+        return mode
+    
+    def compile(self, graph: SemanticGraph) -> "CompiledGraph":
+        """
+        Prepare a graph for repeated execution (see runtime.graph_compiler).
+        
+        CompiledGraph.run() is equivalent to execute() but resolves blocks,
+        circuit breakers and input bindings once, builds no
+        ExecutionContext and only records traces when asked to.
+        """
+        from neurop_forge.runtime.graph_compiler import CompiledGraph
+        return CompiledGraph(self, graph)
+    
+    def execute_stream(
+        self,
+        graph: SemanticGraph,
+        items: Iterable[Any],
+        initial_inputs: Optional[Dict[str, Any]] = None,
+        chunk_size: Optional[int] = None,
+        sink: Optional[Callable[[List[Any]], None]] = None,
+        trace_mode: Optional[TraceMode] = None,
+    ) -> ExecutionResult:
+        """
+        Execute a graph with items streamed through it in bounded chunks.
+        
+        The leading nodes that can stream (see runtime.streaming), each
+        reading the node before it, form one StreamPipeline that items
+        are fed to; it ends at the first node with a reducer. Its result
+        is published as that node's output and the remaining nodes run as
+        in execute(). When the pipeline ends in list output, sink (if
+        given) receives each output chunk and the node's result is None.
+        
+        Raises ValueError if the first node cannot stream.
+        """
+        from neurop_forge.runtime.streaming import (
+            DEFAULT_CHUNK_SIZE,
+            StreamPipeline,
+            StreamStage,
+            stream_profile_for,
+        )
+        run = ExecutionRecorder(self._trace_mode_for_run(trace_mode))
+        initial_inputs = initial_inputs or {}
+        context = ExecutionContext(initial_inputs=initial_inputs)
+        
+        stages: List[StreamStage] = []
+        for index, node in enumerate(graph.nodes):
+            block = self._get_block(node.block_identity)
+            profile = stream_profile_for(block) if block is not None else None
+            if profile is None or not self._get_circuit_breaker(node.block_identity).can_execute():
+                break
+            if index > 0 and node.input_sources and tuple(node.input_sources) != (
+                graph.nodes[index - 1].block_identity,
+            ):
+                break
+            inputs = apply_input_binding(binding_for_keys(block, tuple(initial_inputs)), initial_inputs)
+            inputs.pop(profile.input_name, None)
+            stages.append(StreamStage(block, profile, inputs))
+            if profile.reducer is not None:
+                break
+        if not stages:
+            raise ValueError("The first node of the graph cannot stream")
+        
+        guard = ExecutionGuard(timeout_ms=self._default_timeout_ms)
+        guard.start()
+        
+        start_ts = time.perf_counter()
+        outcome = StreamPipeline(self._block_executor, stages, sink).run(
+            items, chunk_size or DEFAULT_CHUNK_SIZE, guard,
+        )
+        if outcome.error is not None and outcome.failed_stage is None:
+            result = self._build_result(graph, context.execution_id, run, outcome.error)
+            result.status = ExecutionStatus.CANCELLED if guard.is_cancelled() else ExecutionStatus.TIMEOUT
+            return result
+        
+        for index, stage in enumerate(stages):
+            node = graph.nodes[index]
+            failed = index == outcome.failed_stage
+            circuit = self._get_circuit_breaker(node.block_identity)
+            if failed:
+                circuit.record_failure()
+            else:
+                circuit.record_success()
+            last = index == len(stages) - 1
+            self._record_node(node, NodeExecutionResult(
                 node_id=node.block_identity,
                 block_name=node.block_name,
-                status=node_result.status,
-                started_at=datetime.now().isoformat(),
-                completed_at=datetime.now().isoformat(),
-                duration_ms=node_result.duration_ms,
-                inputs=context.get_all_variables(ContextScope.GRAPH),
-                outputs=node_result.outputs,
-                error=node_result.error,
-                retry_count=node_result.retry_count,
-            )
-            traces.append(trace)
+                status=ExecutionStatus.FAILED if failed else ExecutionStatus.SUCCESS,
+                outputs={"result": outcome.value} if last and outcome.error is None else {},
+                duration_ms=stage.duration_ms,
+                error=outcome.error if failed else None,
+                inputs=stage.inputs,
+                started_at=start_ts,
+            ), context, run)
+            if failed:
+                return self._build_result(graph, context.execution_id, run, outcome.error)
+        
+        error_message = None
+        for node in graph.nodes[len(stages):]:
+            can_continue, reason = guard.check()
+            if not can_continue:
+                error_message = reason
+                break
             
-            if node_result.status == ExecutionStatus.SUCCESS:
-                context.set_node_output(node.block_identity, node_result.outputs)
-            elif node_result.status == ExecutionStatus.FAILED:
-                overall_status = ExecutionStatus.PARTIAL_SUCCESS
+            node_result = self._execute_node(node, context, guard)
+            self._record_node(node, node_result, context, run)
         
-        if all(t.status == ExecutionStatus.SUCCESS for t in traces):
-            overall_status = ExecutionStatus.SUCCESS
-        elif any(t.status == ExecutionStatus.SUCCESS for t in traces):
-            overall_status = ExecutionStatus.PARTIAL_SUCCESS
-        elif traces:
-            overall_status = ExecutionStatus.FAILED
+        return self._build_result(graph, context.execution_id, run, error_message)
+    
+    def _execute_scheduled(
+        self,
+        graph: SemanticGraph,
+        context: ExecutionContext,
+        guard: ExecutionGuard,
+        run: ExecutionRecorder,
+    ) -> Optional[str]:
+        """
+        Execute graph nodes concurrently on the node executor.
         
-        end_time = datetime.now()
-        total_duration = (time.time() - start_ts) * 1000
+        A node starts once every node it depends on has been committed.
+        Nodes are committed (traced, outputs published) strictly in graph
+        order, and inputs and circuit breakers are only touched on this
+        thread; only block calls and their retries run on the executor.
         
-        final_outputs = {}
-        if traces and traces[-1].status == ExecutionStatus.SUCCESS:
-            final_outputs = traces[-1].outputs
+        Records nodes in graph order. Returns the guard's reason if it
+        stopped the run, else None.
+        """
+        nodes = graph.nodes
+        schedule = build_schedule(graph)
+        not_started = list(range(len(nodes)))
+        finished: Dict[int, NodeExecutionResult] = {}
+        running: Dict[concurrent.futures.Future, Tuple[int, CircuitBreaker, float, Dict[str, Any]]] = {}
+        committed = 0
+        stop_reason: Optional[str] = None
         
-        return ExecutionResult(
-            execution_id=context.execution_id,
-            query=graph.query,
-            status=overall_status,
-            started_at=start_time.isoformat(),
-            completed_at=end_time.isoformat(),
-            total_duration_ms=total_duration,
-            traces=traces,
-            final_outputs=final_outputs,
-            error=error_message,
-        )
+        while True:
+            progressed = True
+            while progressed:
+                if stop_reason is None:
+                    stop_reason = self._start_ready_nodes(
+                        nodes, schedule, committed, not_started, finished, running, context, guard,
+                    )
+                
+                progressed = committed in finished
+                while committed in finished:
+                    self._record_node(nodes[committed], finished.pop(committed), context, run)
+                    committed += 1
+            
+            # Without a stop, the next node to commit has always been started.
+            if committed == len(nodes) or not running:
+                break
+            
+            done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in sorted(done, key=lambda f: running[f][0]):
+                index, circuit, start_ts, inputs = running.pop(future)
+                outputs, error, attempt, usage = future.result()
+                finished[index] = self._end_node(
+                    nodes[index], context, circuit, start_ts, attempt,
+                    outputs=outputs, error=error, inputs=inputs, usage=usage,
+                )
+        
+        return stop_reason
+    
+    def _record_node(
+        self,
+        node: CompositionNode,
+        node_result: NodeExecutionResult,
+        context: Optional[ExecutionContext],
+        run: ExecutionRecorder,
+    ) -> None:
+        """Record a finished node and publish its outputs to the context."""
+        run.record(node, node_result)
+        
+        if context is not None and node_result.status == ExecutionStatus.SUCCESS:
+            context.set_node_output(node.block_identity, node_result.outputs)
+    
+    def _build_result(
+        self,
+        graph: SemanticGraph,
+        execution_id: str,
+        run: ExecutionRecorder,
+        error_message: Optional[str],
+    ) -> ExecutionResult:
+        """Assemble the ExecutionResult for a finished (or stopped) run."""
+        return run.build_result(graph.query, execution_id, error_message)
+    
+    def _start_ready_nodes(
+        self,
+        nodes: Tuple[CompositionNode, ...],
+        schedule: GraphSchedule,
+        committed: int,
+        not_started: List[int],
+        finished: Dict[int, NodeExecutionResult],
+        running: Dict[concurrent.futures.Future, Tuple[int, CircuitBreaker, float, Dict[str, Any]]],
+        context: ExecutionContext,
+        guard: ExecutionGuard,
+    ) -> Optional[str]:
+        """
+        Start every node whose dependencies are all committed.
+        
+        Nodes that run no block finish at once into finished; the others
+        are submitted to the node executor and tracked in running. Returns
+        the guard's reason if it stopped the run, else None.
+        """
+        for index in list(not_started):
+            if any(dep >= committed for dep in schedule.dependencies[index]):
+                continue
+            can_continue, reason = guard.check()
+            if not can_continue:
+                return reason
+            
+            not_started.remove(index)
+            start_ts = time.perf_counter()
+            prepared = self._begin_node(nodes[index], context, start_ts)
+            if isinstance(prepared, NodeExecutionResult):
+                finished[index] = prepared
+            else:
+                block, circuit, inputs = prepared
+                future = self._node_executor.submit(self._run_with_retries, block, inputs, None, guard)
+                running[future] = (index, circuit, start_ts, inputs)
+        return None
+    
+    @staticmethod
+    def _overall_status(statuses: List[ExecutionStatus]) -> ExecutionStatus:
+        """Status of a run from the statuses of the nodes it ran."""
+        if all(status == ExecutionStatus.SUCCESS for status in statuses):
+            return ExecutionStatus.SUCCESS
+        if any(status == ExecutionStatus.SUCCESS for status in statuses):
+            return ExecutionStatus.PARTIAL_SUCCESS
+        return ExecutionStatus.FAILED
     
     def _execute_node(
         self,
@@ -352,80 +1150,185 @@ class GraphExecutor:
         guard: ExecutionGuard,
     ) -> NodeExecutionResult:
         """Execute a single node with retry and circuit breaker."""
-        start_ts = time.time()
-        
-        block = self._blocks.get(node.block_identity)
-        
-        if block is None:
-            return self._execute_mock_node(node, context)
-        
-        circuit = self._get_circuit_breaker(node.block_identity)
-        
-        if not circuit.can_execute():
-            duration = (time.time() - start_ts) * 1000
-            return NodeExecutionResult(
-                node_id=node.block_identity,
-                block_name=node.block_name,
-                status=ExecutionStatus.SKIPPED,
-                outputs={},
-                duration_ms=duration,
-                error="Circuit breaker open",
-            )
+        start_ts = time.perf_counter()
         
-        context.enter_node(node.block_identity)
+        prepared = self._begin_node(node, context, start_ts)
+        if isinstance(prepared, NodeExecutionResult):
+            return prepared
+        block, circuit, inputs = prepared
         
-        inputs = self._gather_inputs(node, context, block)
+        outputs, error, attempt, usage = self._run_with_retries(block, inputs, guard=guard)
+        return self._end_node(
+            node, context, circuit, start_ts, attempt,
+            outputs=outputs, error=error, inputs=inputs, usage=usage,
+        )
+    
+    def _run_with_retries(
+        self,
+        block: NeuropBlock,
+        inputs: Dict[str, Any],
+        call: Optional[Callable[[Dict[str, Any]], Tuple[Dict[str, Any], Optional[str]]]] = None,
+        guard: Optional[ExecutionGuard] = None,
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str], int, Optional[ResourceUsage]]:
+        """
+        Call a block, retrying per the retry policy.
         
+        call is a BlockExecutor.bind() callable for the block (default:
+        the block executor's execute). Returns (outputs, None, attempt,
+        usage) on success, else (None, last_error, attempt, usage), where
+        usage totals every attempt. Touches no context or circuit state,
+        so it may run on a worker thread.
+        """
         attempt = 0
         last_error = None
+        usages: List[Optional[ResourceUsage]] = []
         
         while attempt <= self._retry_policy.max_retries:
             try:
-                outputs, error = self._block_executor.execute(block, inputs)
+                outputs, error, usage = self._call_block(block, inputs, call)
+                usages.append(usage)
                 
                 if error is None:
-                    circuit.record_success()
-                    context.exit_node()
-                    duration = (time.time() - start_ts) * 1000
-                    
-                    return NodeExecutionResult(
-                        node_id=node.block_identity,
-                        block_name=node.block_name,
-                        status=ExecutionStatus.SUCCESS,
-                        outputs=outputs,
-                        duration_ms=duration,
-                        retry_count=attempt,
-                    )
-                else:
-                    last_error = error
-                    if not self._retry_policy.should_retry(Exception(error), attempt):
-                        break
-                    
-                    delay = self._retry_policy.get_delay(attempt)
-                    time.sleep(delay / 1000.0)
-                    attempt += 1
-                    
+                    return outputs, None, attempt, ResourceUsage.total(usages)
+                last_error = error
+                delay = self._next_retry_delay(block, error, Exception(error), attempt, guard)
+                
             except Exception as e:
                 last_error = str(e)
-                if not self._retry_policy.should_retry(e, attempt):
-                    break
-                
-                delay = self._retry_policy.get_delay(attempt)
-                time.sleep(delay / 1000.0)
-                attempt += 1
+                delay = self._next_retry_delay(block, f"{type(e).__name__}: {e}", e, attempt, guard)
+            
+            if delay is None:
+                break
+            time.sleep(delay / 1000.0)
+            attempt += 1
+        
+        return None, last_error, attempt, ResourceUsage.total(usages)
+    
+    def _call_block(
+        self,
+        block: NeuropBlock,
+        inputs: Dict[str, Any],
+        call: Optional[Callable[[Dict[str, Any]], Tuple[Dict[str, Any], Optional[str]]]] = None,
+    ) -> Tuple[Dict[str, Any], Optional[str], Optional[ResourceUsage]]:
+        """One block call: (outputs, error, resources used) on the calling thread."""
+        if call is not None:
+            outputs, error = call(inputs)
+        else:
+            outputs, error = self._block_executor.execute(block, inputs)
+        return outputs, error, self._block_executor.last_usage()
+    
+    def _next_retry_delay(
+        self,
+        block: NeuropBlock,
+        error: str,
+        exception: Exception,
+        attempt: int,
+        guard: Optional[ExecutionGuard] = None,
+    ) -> Optional[float]:
+        """
+        Backoff in ms before retrying a failed block call, or None to stop.
+        
+        Deterministic failures (see classify_failure) are not retried
+        unless the policy allows it, and neither is a retry whose backoff
+        would outlast the guard's remaining time.
+        """
+        policy = self._retry_policy
+        if not policy.should_retry(exception, attempt):
+            return None
+        if not policy.retry_deterministic and (
+            classify_failure(error, is_cacheable_block(block)) == FailureKind.DETERMINISTIC
+        ):
+            self._retry_stats.record_skipped(True, policy.remaining_delay(attempt))
+            return None
+        delay = policy.get_delay(attempt)
+        if guard is not None and delay >= guard.remaining_ms():
+            self._retry_stats.record_skipped(False, policy.remaining_delay(attempt))
+            return None
+        self._retry_stats.record_retry(delay)
+        return delay
+    
+    def get_retry_statistics(self) -> Dict[str, Any]:
+        """Retries made, backoff slept, and retries skipped with the wait they saved."""
+        return self._retry_stats.to_dict()
+    
+    def _begin_node(
+        self,
+        node: CompositionNode,
+        context: ExecutionContext,
+        start_ts: float,
+    ) -> Union[NodeExecutionResult, Tuple[NeuropBlock, CircuitBreaker, Dict[str, Any]]]:
+        """
+        Set up a node for execution.
+        
+        Returns a finished NodeExecutionResult when the node does not run a
+        block (mock node, open circuit), else (block, circuit, inputs).
+        """
+        block = self._get_block(node.block_identity)
+        
+        if block is None:
+            return self._execute_mock_node(node, context)
         
-        circuit.record_failure()
+        circuit = self._get_circuit_breaker(node.block_identity)
+        
+        if not circuit.can_execute():
+            return self._circuit_open_result(node, start_ts)
+        
+        context.enter_node(node.block_identity)
+        
+        inputs = self._gather_inputs(node, context, block)
+        return block, circuit, inputs
+    
+    def _end_node(
+        self,
+        node: CompositionNode,
+        context: ExecutionContext,
+        circuit: CircuitBreaker,
+        start_ts: float,
+        attempt: int,
+        outputs: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+        inputs: Optional[Dict[str, Any]] = None,
+        usage: Optional[ResourceUsage] = None,
+    ) -> NodeExecutionResult:
+        """Close out a node that ran: succeeded with outputs, or failed with error."""
         context.exit_node()
-        duration = (time.time() - start_ts) * 1000
+        return self._node_outcome(node, circuit, start_ts, attempt, outputs, error, inputs, usage)
+    
+    @staticmethod
+    def _node_outcome(
+        node: CompositionNode,
+        circuit: CircuitBreaker,
+        start_ts: float,
+        attempt: int,
+        outputs: Optional[Dict[str, Any]],
+        error: Optional[str],
+        inputs: Optional[Dict[str, Any]] = None,
+        usage: Optional[ResourceUsage] = None,
+    ) -> NodeExecutionResult:
+        """
+        Update a node's circuit breaker and build its result.
+        
+        start_ts is the node's time.perf_counter() start instant; inputs
+        are the bound block inputs, kept by reference for tracing; usage
+        is what the node's block calls used.
+        """
+        if outputs is not None:
+            circuit.record_success()
+        else:
+            circuit.record_failure()
+        duration = (time.perf_counter() - start_ts) * 1000
         
         return NodeExecutionResult(
             node_id=node.block_identity,
             block_name=node.block_name,
-            status=ExecutionStatus.FAILED,
-            outputs={},
+            status=ExecutionStatus.SUCCESS if outputs is not None else ExecutionStatus.FAILED,
+            outputs=outputs if outputs is not None else {},
             duration_ms=duration,
-            error=last_error,
+            error=error,
             retry_count=attempt,
+            inputs=inputs if inputs is not None else {},
+            started_at=start_ts,
+            resource_usage=usage,
         )
     
     def _execute_mock_node(
@@ -434,8 +1337,11 @@ class GraphExecutor:
         context: ExecutionContext,
     ) -> NodeExecutionResult:
         """Execute a mock node when real block is not available."""
-        previous_output = context.get_previous_output()
-        
+        return self._mock_node_result(node, context.get_previous_output())
+    
+    @staticmethod
+    def _mock_node_result(node: CompositionNode, previous_output: Any) -> NodeExecutionResult:
+        """Result of a mock node given the previous node output."""
         mock_output = {
             "result": previous_output if previous_output else True,
             "block_name": node.block_name,
@@ -451,6 +1357,20 @@ class GraphExecutor:
             duration_ms=0.1,
         )
     
+    @staticmethod
+    def _circuit_open_result(node: CompositionNode, start_ts: float) -> NodeExecutionResult:
+        """Result of a node skipped because its circuit breaker is open."""
+        duration = (time.perf_counter() - start_ts) * 1000
+        return NodeExecutionResult(
+            node_id=node.block_identity,
+            block_name=node.block_name,
+            status=ExecutionStatus.SKIPPED,
+            outputs={},
+            duration_ms=duration,
+            error="Circuit breaker open",
+            started_at=start_ts,
+        )
+    
     def _gather_inputs(
         self,
         node: CompositionNode,
@@ -469,84 +1389,14 @@ class GraphExecutor:
         
         if node.input_sources:
             for source_id in node.input_sources:
-                source_output = context.get_node_output(source_id)
-                if source_output is not None:
-                    if isinstance(source_output, dict):
-                        available.update(source_output)
-                    else:
-                        available["_previous"] = source_output
-                        available["input"] = source_output
-                        available["value"] = source_output
-                        available["data"] = source_output
+                add_source_output(available, context.get_node_output(source_id))
         else:
-            previous = context.get_previous_output()
-            if previous is not None:
-                if isinstance(previous, dict):
-                    available.update(previous)
-                else:
-                    available["_previous"] = previous
-                    available["input"] = previous
-                    available["value"] = previous
-                    available["data"] = previous
+            add_source_output(available, context.get_previous_output())
         
         if block is None:
             return available
         
-        bound_inputs: Dict[str, Any] = {}
-        
-        for param in block.interface.inputs:
-            param_name = param.name
-            param_type = param.data_type.value
-            
-            if param_name in available:
-                bound_inputs[param_name] = available[param_name]
-                continue
-            
-            type_aliases = {
-                "email": ["email", "email_address", "mail"],
-                "phone": ["phone", "phone_number", "telephone"],
-                "text": ["text", "input", "value", "data", "content", "string", "s", "str"],
-                "url": ["url", "uri", "link", "href"],
-                "name": ["name", "username", "user_name", "full_name"],
-                "password": ["password", "passwd", "secret"],
-                "number": ["number", "num", "n", "value", "amount", "count"],
-                "integer": ["integer", "int", "i", "n", "count"],
-                "float": ["float", "f", "decimal", "amount"],
-                "boolean": ["boolean", "bool", "flag", "is_active", "enabled"],
-                "list": ["list", "items", "array", "elements", "values"],
-                "dict": ["dict", "data", "obj", "object", "payload"],
-            }
-            
-            matched = False
-            for avail_name, avail_value in available.items():
-                avail_lower = avail_name.lower()
-                param_lower = param_name.lower()
-                
-                if param_lower in avail_lower or avail_lower in param_lower:
-                    bound_inputs[param_name] = avail_value
-                    matched = True
-                    break
-                
-                for sem_type, aliases in type_aliases.items():
-                    if param_lower in aliases or any(a in param_lower for a in aliases):
-                        if avail_lower in aliases or any(a in avail_lower for a in aliases):
-                            bound_inputs[param_name] = avail_value
-                            matched = True
-                            break
-                if matched:
-                    break
-            
-            if not matched and param.optional:
-                if param.default_value is not None:
-                    bound_inputs[param_name] = param.default_value
-            elif not matched and not param.optional:
-                if "_previous" in available:
-                    bound_inputs[param_name] = available["_previous"]
-                elif available:
-                    first_val = list(available.values())[0]
-                    bound_inputs[param_name] = first_val
-        
-        return bound_inputs
+        return apply_input_binding(binding_for_keys(block, tuple(available)), available)
     
     def _get_circuit_breaker(self, block_id: str) -> CircuitBreaker:
         """Get or create circuit breaker for block."""
@@ -0,0 +1,180 @@
+"""
+Copyright © 2026 Lourens Wasserman. All Rights Reserved.
+Neurop Block Forge - https://neurop-forge.com
+Commercial use requires a license. See LICENSE file.
+
+Ahead-of-time compilation of semantic graphs.
+
+GraphExecutor.execute interprets a graph on every run: it rebuilds each
+node's available inputs from an ExecutionContext, matches every block
+parameter against the alias tables, looks up circuit breakers and records
+context variables and history for every node. GraphExecutor.compile does
+the per-graph work once and returns a CompiledGraph whose run() executes
+the whole chain with node outputs passed in local variables:
+- Blocks, circuit breakers and bound block callables (BlockExecutor.bind)
+  are resolved at compile time
+- Input bindings are resolved per node and cached by the names that are
+  available, which is all that binding depends on
+- No ExecutionContext is built; traces are recorded per TraceMode
+  (off by default)
+
+run() gives the same status, final outputs, node counts, retries,
+circuit breaker updates and trust records as GraphExecutor.execute. With
+TraceMode.FULL it also records the same traces; with TraceMode.OFF the
+result has no traces and no per-node performance summary.
+
+A CompiledGraph reflects the executor's blocks and circuit breakers at
+compile time; compile again after registering or unregistering blocks.
+Nodes always run one at a time in graph order.
+"""
+
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from neurop_forge.runtime.executor import (
+    ExecutionRecorder,
+    GraphExecutor,
+    InputBinding,
+    NodeExecutionResult,
+    add_source_output,
+    apply_input_binding,
+    binding_for_keys,
+    output_value,
+)
+from neurop_forge.runtime.guards import CircuitBreaker, ExecutionGuard
+from neurop_forge.runtime.result import ExecutionResult, ExecutionStatus, TraceMode
+from neurop_forge.semantic.composer import SemanticGraph, CompositionNode
+from neurop_forge.core.block_schema import NeuropBlock
+
+
+# Distinct input-name layouts whose bindings are kept per node
+MAX_BINDINGS_PER_NODE = 64
+
+
+@dataclass
+class _CompiledNode:
+    """One graph node with everything resolved that does not depend on inputs."""
+    node: CompositionNode
+    block: Optional[NeuropBlock]
+    circuit: Optional[CircuitBreaker]
+    call: Optional[Callable[[Dict[str, Any]], Tuple[Dict[str, Any], Optional[str]]]]
+    bindings: Dict[Tuple[str, ...], InputBinding] = field(default_factory=dict)
+
+    def binding(self, keys: Tuple[str, ...]) -> InputBinding:
+        binding = self.bindings.get(keys)
+        if binding is None:
+            binding = binding_for_keys(self.block, keys)
+            if len(self.bindings) < MAX_BINDINGS_PER_NODE:
+                self.bindings[keys] = binding
+        return binding
+
+
+def _previous_output(node_outputs: Dict[str, Dict[str, Any]]) -> Any:
+    """The most recent node output, as ExecutionContext.get_previous_output returns it."""
+    if not node_outputs:
+        return None
+    return output_value(node_outputs[next(reversed(node_outputs))])
+
+
+class CompiledGraph:
+    """
+    A SemanticGraph prepared for repeated execution.
+
+    Created by GraphExecutor.compile(graph).
+    """
+
+    def __init__(self, executor: GraphExecutor, graph: SemanticGraph):
+        self._executor = executor
+        self._graph = graph
+        nodes: List[_CompiledNode] = []
+        for node in graph.nodes:
+            block = executor._get_block(node.block_identity)
+            nodes.append(_CompiledNode(
+                node=node,
+                block=block,
+                circuit=executor._get_circuit_breaker(node.block_identity) if block is not None else None,
+                call=executor._block_executor.bind(block) if block is not None else None,
+            ))
+        self._nodes = tuple(nodes)
+
+    @property
+    def graph(self) -> SemanticGraph:
+        return self._graph
+
+    def run(
+        self,
+        initial_inputs: Optional[Dict[str, Any]] = None,
+        trace_mode: TraceMode = TraceMode.OFF,
+    ) -> ExecutionResult:
+        """
+        Execute the graph.
+
+        Args:
+            initial_inputs: Initial input values
+            trace_mode: How to trace the run (see TraceMode)
+        """
+        executor = self._executor
+        run = ExecutionRecorder(executor._trace_mode_for_run(trace_mode))
+
+        inputs = dict(initial_inputs or {})
+
+        guard = ExecutionGuard(timeout_ms=executor._default_timeout_ms)
+        guard.start()
+
+        node_outputs: Dict[str, Dict[str, Any]] = {}
+        error_message = None
+
+        for compiled in self._nodes:
+            can_continue, reason = guard.check()
+            if not can_continue:
+                error_message = reason
+                break
+
+            node_result = self._run_node(compiled, inputs, node_outputs, guard)
+            run.record(compiled.node, node_result)
+            if node_result.status == ExecutionStatus.SUCCESS:
+                node_outputs[compiled.node.block_identity] = node_result.outputs
+
+        return run.build_result(self._graph.query, uuid.uuid4().hex[:12], error_message)
+
+    def _run_node(
+        self,
+        compiled: _CompiledNode,
+        inputs: Dict[str, Any],
+        node_outputs: Dict[str, Dict[str, Any]],
+        guard: ExecutionGuard,
+    ) -> NodeExecutionResult:
+        """Execute one node with the same semantics as GraphExecutor._execute_node."""
+        node = compiled.node
+        start_ts = time.perf_counter()
+
+        if compiled.block is None:
+            return GraphExecutor._mock_node_result(node, _previous_output(node_outputs))
+
+        if not compiled.circuit.can_execute():
+            return GraphExecutor._circuit_open_result(node, start_ts)
+
+        available = dict(inputs)
+        if node.input_sources:
+            for source_id in node.input_sources:
+                add_source_output(available, output_value(node_outputs.get(source_id, {})))
+        else:
+            add_source_output(available, _previous_output(node_outputs))
+
+        block_inputs = apply_input_binding(compiled.binding(tuple(available)), available)
+        outputs, error, attempt, usage = self._executor._run_with_retries(
+            compiled.block, block_inputs, call=compiled.call, guard=guard,
+        )
+        return GraphExecutor._node_outcome(
+            node, compiled.circuit, start_ts, attempt, outputs, error, block_inputs, usage,
+        )
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Node count and cached input bindings."""
+        return {
+            "nodes": len(self._nodes),
+            "mock_nodes": sum(1 for compiled in self._nodes if compiled.block is None),
+            "cached_bindings": sum(len(compiled.bindings) for compiled in self._nodes),
+        }
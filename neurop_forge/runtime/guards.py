@@ -6,7 +6,8 @@ Commercial use requires a license. See LICENSE file.
 Execution Guards - Safety mechanisms for block execution.
 
 Provides:
-- RetryPolicy: Automatic retry with backoff
+- RetryPolicy: Automatic retry with backoff, jitter and failure classification
+- RetryStatistics: Retries made and backoff waits avoided
 - CircuitBreaker: Fail-fast for unhealthy blocks
 - ExecutionGuard: Timeout and resource limits
 """
@@ -15,6 +16,7 @@ from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, List, Optional, Tuple
 from enum import Enum
 from datetime import datetime
+import random
 import time
 import threading
 
@@ -26,6 +28,51 @@ class CircuitState(Enum):
     HALF_OPEN = "half_open"
 
 
+class FailureKind(Enum):
+    """Whether retrying a failed block call can change the outcome."""
+    DETERMINISTIC = "deterministic"
+    TRANSIENT = "transient"
+
+
+# Error types that depend on the environment rather than on the inputs.
+# A CPU or memory budget breach is reported as CPUBudgetExceeded /
+# MemoryBudgetExceeded in-thread (runtime.budgets) and as CPUTimeExceeded /
+# MemoryError in a pool worker (runtime.process_pool); both are transient.
+TRANSIENT_ERROR_TYPES = frozenset({
+    "TimeoutError",
+    "CPUTimeExceeded",
+    "MemoryError",
+    "ResourceBudgetExceeded",
+    "CPUBudgetExceeded",
+    "MemoryBudgetExceeded",
+    "WorkerError",
+    "ConnectionError",
+    "ConnectionResetError",
+    "BrokenPipeError",
+    "InterruptedError",
+    "BlockingIOError",
+})
+
+
+def classify_failure(error: str, deterministic_block: bool) -> FailureKind:
+    """
+    Classify a block failure from its error message ("Type: message").
+    
+    Timeouts, CPU time and memory limits (budgets enforced in-thread as
+    well as worker rlimits) and worker/IPC errors are transient: CPU time
+    varies with load, and in-thread memory is traced process-wide. Any
+    other failure of a pure, deterministic block is deterministic: the
+    same inputs fail the same way on every attempt. Failures of other
+    blocks are treated as transient.
+    """
+    error_type = error.split(":", 1)[0].strip()
+    if error_type in TRANSIENT_ERROR_TYPES or "timeout" in error.lower():
+        return FailureKind.TRANSIENT
+    if deterministic_block:
+        return FailureKind.DETERMINISTIC
+    return FailureKind.TRANSIENT
+
+
 @dataclass
 class RetryPolicy:
     """
@@ -34,19 +81,35 @@ class RetryPolicy:
     Supports:
     - Maximum retry count
     - Exponential backoff
+    - Jitter (each delay reduced by a random fraction of up to jitter)
     - Retry on specific exceptions
+    - No retries of deterministic failures (see classify_failure) unless
+      retry_deterministic is set
     """
     max_retries: int = 3
     initial_delay_ms: float = 100.0
     max_delay_ms: float = 5000.0
     exponential_base: float = 2.0
     retry_on_exceptions: Tuple[type, ...] = (Exception,)
+    jitter: float = 0.0
+    retry_deterministic: bool = False
     
     def get_delay(self, attempt: int) -> float:
         """Calculate delay for attempt number."""
+        delay = self.get_base_delay(attempt)
+        if self.jitter > 0:
+            delay -= delay * min(self.jitter, 1.0) * random.random()
+        return delay
+    
+    def get_base_delay(self, attempt: int) -> float:
+        """Delay for attempt number without jitter."""
         delay = self.initial_delay_ms * (self.exponential_base ** attempt)
         return min(delay, self.max_delay_ms)
     
+    def remaining_delay(self, attempt: int) -> float:
+        """Total backoff (without jitter) of every retry from attempt on."""
+        return sum(self.get_base_delay(a) for a in range(attempt, self.max_retries))
+    
     def should_retry(self, exception: Exception, attempt: int) -> bool:
         """Check if should retry given exception and attempt."""
         if attempt >= self.max_retries:
@@ -59,9 +122,51 @@ class RetryPolicy:
             "initial_delay_ms": self.initial_delay_ms,
             "max_delay_ms": self.max_delay_ms,
             "exponential_base": self.exponential_base,
+            "jitter": self.jitter,
+            "retry_deterministic": self.retry_deterministic,
         }
 
 
+class RetryStatistics:
+    """
+    Thread-safe counters of retry decisions.
+    
+    wait_saved_ms is the backoff (without jitter) that retries skipped as
+    deterministic or over the time budget would have slept.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.wait_ms = 0.0
+        self.deterministic_skipped = 0
+        self.budget_skipped = 0
+        self.wait_saved_ms = 0.0
+    
+    def record_retry(self, delay_ms: float) -> None:
+        with self._lock:
+            self.retries += 1
+            self.wait_ms += delay_ms
+    
+    def record_skipped(self, deterministic: bool, saved_ms: float) -> None:
+        with self._lock:
+            if deterministic:
+                self.deterministic_skipped += 1
+            else:
+                self.budget_skipped += 1
+            self.wait_saved_ms += saved_ms
+    
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "retries": self.retries,
+                "wait_ms": self.wait_ms,
+                "deterministic_skipped": self.deterministic_skipped,
+                "budget_skipped": self.budget_skipped,
+                "wait_saved_ms": self.wait_saved_ms,
+            }
+
+
 @dataclass
 class CircuitBreaker:
     """
@@ -164,6 +269,7 @@ class ExecutionGuard:
         self.max_memory_bytes = max_memory_bytes
         self._cancelled = threading.Event()
         self._start_time: Optional[float] = None
+        self._cancel_callbacks: List[Callable[[], None]] = []
     
     def start(self) -> None:
         """Start the guard timer."""
@@ -185,6 +291,17 @@ class ExecutionGuard:
     def cancel(self) -> None:
         """Cancel execution."""
         self._cancelled.set()
+        for callback in list(self._cancel_callbacks):
+            callback()
+    
+    def add_cancel_callback(self, callback: Callable[[], None]) -> None:
+        """Call callback (from the cancelling thread) when cancel() is called."""
+        self._cancel_callbacks.append(callback)
+    
+    def remove_cancel_callback(self, callback: Callable[[], None]) -> None:
+        """Stop calling a callback registered with add_cancel_callback."""
+        if callback in self._cancel_callbacks:
+            self._cancel_callbacks.remove(callback)
     
     def elapsed_ms(self) -> float:
         """Get elapsed time in milliseconds."""
@@ -201,6 +318,10 @@ class ExecutionGuard:
         """Check if cancelled."""
         return self._cancelled.is_set()
     
+    def is_started(self) -> bool:
+        """Check if the guard timer has been started."""
+        return self._start_time is not None
+    
     def execute_with_timeout(
         self,
         func: Callable[[], Any],
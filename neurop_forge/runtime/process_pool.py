@@ -0,0 +1,534 @@
+"""
+Process-pool execution backend for NeuropBlocks.
+
+BlockExecutor runs block logic in the calling thread, so a runaway block
+cannot be stopped: ExecutionGuard only checks its timeout between graph
+nodes, and execute_with_timeout abandons the thread it started. This
+module runs blocks in a pool of pre-started worker processes instead:
+
+- Each worker keeps its own compiled-block cache, optionally pre-loaded
+  and backed by the parent's on-disk bytecode cache.
+- Calls are dispatched over a pipe. Input binding and output shaping stay
+  in the parent, so results match BlockExecutor.
+- Every call has a hard wall-clock timeout. A worker that overruns is
+  killed and replaced.
+- Inside the worker, each call runs under CPU and address-space rlimits
+  taken from the block's constraints (where the resource module exists).
+
+PooledBlockExecutor is a BlockExecutor, so it can be passed anywhere a
+block executor is accepted. Its methods are thread-safe; callers use
+threads (or submit) to keep every worker busy.
+"""
+
+import math
+import multiprocessing
+import os
+import pickle
+import queue
+import signal
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from neurop_forge.core.block_schema import NeuropBlock
+from neurop_forge.runtime.bytecode_cache import BytecodeCache
+from neurop_forge.runtime.compiled_cache import CompiledBlockCache
+from neurop_forge.runtime.executor import BlockExecutor, build_execution_namespace
+from neurop_forge.runtime.result_cache import ResultCache
+from neurop_forge.runtime.trust_tracker import record_block_execution
+
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:
+    RESOURCE_AVAILABLE = False
+
+
+DEFAULT_TIMEOUT_MS = 30000.0
+# How long a new worker may take to import and pre-load its blocks.
+WORKER_START_TIMEOUT_S = 60.0
+# How often a call waiting for an idle worker re-checks that the pool is open.
+IDLE_POLL_INTERVAL_S = 0.5
+# Extra CPU seconds a call may use beyond its timeout before the worker's
+# own rlimit fires; normally the parent's wall-clock kill comes first.
+CPU_LIMIT_GRACE_SECONDS = 1
+
+
+class CPUTimeExceeded(Exception):
+    """Raised inside a worker when a call exceeds its CPU time limit."""
+
+
+def _raise_cpu_exceeded(signum: int, frame: Any) -> None:
+    raise CPUTimeExceeded("CPU time limit exceeded")
+
+
+def _current_address_space() -> Optional[int]:
+    """Virtual memory size of this process in bytes (Linux only)."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _apply_limits(cpu_seconds: Optional[int], memory_bytes: Optional[int]) -> None:
+    """Lower the soft CPU and address-space limits for one call."""
+    if cpu_seconds is not None:
+        used = resource.getrusage(resource.RUSAGE_SELF)
+        used_seconds = int(math.ceil(used.ru_utime + used.ru_stime))
+        _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+        soft = used_seconds + cpu_seconds
+        if hard == resource.RLIM_INFINITY or soft < hard:
+            resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+    if memory_bytes is not None:
+        current = _current_address_space()
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if current is not None:
+            soft = current + memory_bytes
+            if hard == resource.RLIM_INFINITY or soft < hard:
+                resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+
+
+def _reset_limits(original: Dict[int, Tuple[int, int]]) -> None:
+    """Restore the limits the worker started with."""
+    for limit, value in original.items():
+        resource.setrlimit(limit, value)
+
+
+def _worker_main(conn: Any, cache_size: int, bytecode_dir: Optional[str] = None) -> None:
+    """
+    Worker process loop.
+
+    Messages from the parent:
+    - ("load", [(block_id, logic, func_name), ...])
+    - ("exec", block_id, (logic, func_name) or None, kwargs, cpu_seconds, memory_bytes)
+    - ("stop",)
+
+    Sends ("ready",) once set up, then replies to each "exec" with
+    ("ok", value), ("missing", message) or ("error", message).
+    """
+    namespace = build_execution_namespace()
+    cache = CompiledBlockCache(
+        cache_size, BytecodeCache(bytecode_dir) if bytecode_dir is not None else None,
+    )
+    sources: Dict[str, Tuple[str, str]] = {}
+    original_limits: Dict[int, Tuple[int, int]] = {}
+    if RESOURCE_AVAILABLE:
+        for limit in (resource.RLIMIT_CPU, resource.RLIMIT_AS):
+            original_limits[limit] = resource.getrlimit(limit)
+        if hasattr(signal, "SIGXCPU"):
+            signal.signal(signal.SIGXCPU, _raise_cpu_exceeded)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    def compiled_for(block_id: str) -> Any:
+        logic, func_name = sources[block_id]
+        return cache.get_or_compile(block_id, logic, func_name, namespace)
+
+    conn.send(("ready",))
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            return
+        kind = message[0]
+
+        if kind == "stop":
+            return
+
+        if kind == "load":
+            for block_id, logic, func_name in message[1]:
+                sources[block_id] = (logic, func_name)
+                try:
+                    compiled_for(block_id)
+                except Exception:
+                    pass
+            continue
+
+        _, block_id, source, kwargs, cpu_seconds, memory_bytes = message
+        if source is not None:
+            sources[block_id] = source
+        try:
+            compiled = compiled_for(block_id)
+            if not compiled.found:
+                reply: Tuple[str, Any] = (
+                    "missing", f"Function {compiled.func_name} not found in block logic"
+                )
+            else:
+                if RESOURCE_AVAILABLE:
+                    _apply_limits(cpu_seconds, memory_bytes)
+                try:
+                    reply = ("ok", compiled.function(**kwargs))
+                finally:
+                    if RESOURCE_AVAILABLE:
+                        _reset_limits(original_limits)
+        except BaseException as e:
+            if isinstance(e, (KeyboardInterrupt, SystemExit)):
+                raise
+            reply = ("error", f"{type(e).__name__}: {str(e)}")
+
+        try:
+            conn.send(reply)
+        except Exception as e:
+            conn.send(("error", f"Result could not be returned: {type(e).__name__}: {str(e)}"))
+
+
+class _Worker:
+    """Parent-side handle for one worker process."""
+
+    def __init__(self, context: Any, cache_size: int, bytecode_dir: Optional[str] = None):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child_conn, cache_size, bytecode_dir),
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.loaded: Set[str] = set()
+
+    def wait_ready(self, timeout: float) -> bool:
+        """Wait for the worker's start-up message."""
+        try:
+            return self.conn.poll(timeout) and self.conn.recv() == ("ready",)
+        except (EOFError, OSError):
+            return False
+
+    def kill(self) -> None:
+        """Kill the process without waiting for it to finish its call."""
+        try:
+            self.process.kill()
+        except Exception:
+            pass
+        self.process.join(1.0)
+        self.conn.close()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """Ask the process to exit, killing it if it does not."""
+        try:
+            self.conn.send(("stop",))
+        except Exception:
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.kill()
+        else:
+            self.conn.close()
+
+
+@dataclass
+class PoolStatistics:
+    """Counters for a PooledBlockExecutor."""
+    workers: int
+    executions: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    respawns: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "executions": self.executions,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "respawns": self.respawns,
+        }
+
+
+class PooledBlockExecutor(BlockExecutor):
+    """
+    BlockExecutor that runs block logic in pre-started worker processes.
+
+    Args:
+        workers: Worker processes to start (0 = one per CPU).
+        preload: Blocks every worker compiles at start-up (and on respawn).
+        default_timeout_ms: Per-call timeout for blocks that do not declare
+            constraints.max_execution_time_ms.
+        default_max_memory_bytes: Per-call memory limit for blocks that do
+            not declare constraints.max_memory_bytes (None = unlimited).
+        worker_cache_size: Compiled blocks kept per worker.
+        bytecode_cache_dir: On-disk bytecode cache the workers load compiled
+            blocks from (default: that of the parent's compiled block cache,
+            if it has one).
+        start_method: multiprocessing start method (default "spawn", which
+            is safe to use from a threaded server).
+        result_cache: Optional cache of pure block results, kept in the parent.
+    """
+
+    def __init__(
+        self,
+        workers: int = 0,
+        preload: Optional[Iterable[NeuropBlock]] = None,
+        default_timeout_ms: float = DEFAULT_TIMEOUT_MS,
+        default_max_memory_bytes: Optional[int] = None,
+        worker_cache_size: int = 1024,
+        start_method: str = "spawn",
+        result_cache: Optional[ResultCache] = None,
+        bytecode_cache_dir: Optional[str] = None,
+    ):
+        super().__init__(result_cache=result_cache)
+        if bytecode_cache_dir is None and self._compiled_cache.bytecode_cache is not None:
+            bytecode_cache_dir = str(self._compiled_cache.bytecode_cache.directory)
+        self._bytecode_cache_dir = bytecode_cache_dir
+        self._workers_count = workers or os.cpu_count() or 1
+        self._default_timeout_ms = default_timeout_ms
+        self._default_max_memory_bytes = default_max_memory_bytes
+        self._worker_cache_size = worker_cache_size
+        self._context = multiprocessing.get_context(start_method)
+        self._preload: List[Tuple[str, str, str]] = []
+        for block in preload or ():
+            block_id = self._block_id(block)
+            if block_id is not None:
+                self._preload.append((block_id, block.logic.strip(), block.metadata.name))
+
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._all: List[_Worker] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._stats = PoolStatistics(workers=self._workers_count)
+        self._dispatcher: Optional[ThreadPoolExecutor] = None
+
+        started = [self._spawn() for _ in range(self._workers_count)]
+        for worker in started:
+            if not worker.wait_ready(WORKER_START_TIMEOUT_S):
+                for other in started:
+                    other.kill()
+                raise RuntimeError("Worker process failed to start.")
+            self._idle.put(worker)
+
+    @property
+    def workers(self) -> int:
+        return self._workers_count
+
+    def _spawn(self) -> _Worker:
+        worker = _Worker(self._context, self._worker_cache_size, self._bytecode_cache_dir)
+        if self._preload:
+            worker.conn.send(("load", self._preload))
+            worker.loaded.update(block_id for block_id, _, _ in self._preload)
+        with self._lock:
+            self._all.append(worker)
+        return worker
+
+    def _replace(self, worker: _Worker) -> None:
+        """Kill a worker and start its replacement in the background."""
+        worker.kill()
+        with self._lock:
+            if worker in self._all:
+                self._all.remove(worker)
+            self._stats.respawns += 1
+        threading.Thread(target=self._start_replacement, daemon=True).start()
+
+    def _start_replacement(self) -> None:
+        # Keeps retrying so the pool never permanently loses capacity.
+        while not self._closed:
+            try:
+                worker = self._spawn()
+            except Exception:
+                time.sleep(1.0)
+                continue
+            if worker.wait_ready(WORKER_START_TIMEOUT_S):
+                if self._closed:
+                    worker.stop()
+                else:
+                    self._idle.put(worker)
+                return
+            worker.kill()
+            with self._lock:
+                if worker in self._all:
+                    self._all.remove(worker)
+
+    def _acquire(self, timeout_s: float) -> Tuple[Optional[_Worker], Optional[str]]:
+        """
+        Take an idle worker, waiting at most timeout_s.
+
+        Returns (worker, None), or (None, error message) if the pool is
+        closed or no worker became idle in time (for example while
+        replacements fail to start).
+        """
+        deadline = time.monotonic() + timeout_s
+        while True:
+            if self._closed:
+                return None, "WorkerError: process pool is closed"
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None, f"WorkerError: no worker became available within {timeout_s:g}s"
+            try:
+                return self._idle.get(timeout=min(remaining, IDLE_POLL_INTERVAL_S)), None
+            except queue.Empty:
+                continue
+
+    def _limits(self, block: NeuropBlock) -> Tuple[float, Optional[int]]:
+        constraints = getattr(block, "constraints", None)
+        timeout_ms = getattr(constraints, "max_execution_time_ms", None) or self._default_timeout_ms
+        memory_bytes = getattr(constraints, "max_memory_bytes", None) or self._default_max_memory_bytes
+        return float(timeout_ms), memory_bytes
+
+    def _run(
+        self,
+        block: NeuropBlock,
+        inputs: Dict[str, Any],
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """Execute one call in a worker without recording trust."""
+        if self._closed:
+            raise RuntimeError("Process pool is closed.")
+
+        block_id = self._block_id(block) or str(id(block))
+        logic = block.logic.strip()
+        func_name = block.metadata.name
+
+        adapted_inputs, adapt_error = self._adapter.adapt_inputs(
+            block_id=block_id,
+            source_code=logic,
+            func_name=func_name,
+            available_inputs=inputs,
+            interface_inputs=list(block.interface.inputs) if hasattr(block, 'interface') else None,
+        )
+        if adapt_error:
+            return {}, adapt_error
+
+        timeout_ms, memory_bytes = self._limits(block)
+        cpu_seconds = int(math.ceil(timeout_ms / 1000.0)) + CPU_LIMIT_GRACE_SECONDS
+
+        worker, acquire_error = self._acquire(max(timeout_ms / 1000.0, WORKER_START_TIMEOUT_S))
+        if worker is None:
+            return {}, acquire_error
+        source = None if block_id in worker.loaded else (logic, func_name)
+        try:
+            worker.conn.send(("exec", block_id, source, adapted_inputs, cpu_seconds, memory_bytes))
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            # Pickling fails before anything is written, so the worker is fine.
+            self._idle.put(worker)
+            return {}, f"Inputs could not be sent: {type(e).__name__}: {str(e)}"
+        except OSError as e:
+            self._replace(worker)
+            return {}, f"{type(e).__name__}: {str(e)}"
+        worker.loaded.add(block_id)
+        ready = worker.conn.poll(timeout_ms / 1000.0)
+
+        if not ready:
+            self._replace(worker)
+            with self._lock:
+                self._stats.timeouts += 1
+            return {}, f"Timeout after {timeout_ms}ms"
+
+        try:
+            status, value = worker.conn.recv()
+        except (EOFError, OSError):
+            self._replace(worker)
+            return {}, "WorkerError: worker process exited during execution"
+
+        if self._closed:
+            worker.stop()
+        else:
+            self._idle.put(worker)
+
+        if status == "ok":
+            return self._prepare_outputs(block, value), None
+        if status == "missing":
+            return {"result": None}, value
+        return {}, value
+
+    def execute(
+        self,
+        block: NeuropBlock,
+        inputs: Dict[str, Any],
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        Execute a block's logic in a worker process.
+
+        Returns:
+            Tuple of (outputs dict, error message or None)
+        """
+        start_time = time.time()
+        result_key = self._result_key(block, self._block_id(block), inputs)
+        if result_key is not None:
+            cached = self._result_cache.get(result_key)
+            if cached is not None:
+                return cached, None
+        block_id = self._block_id(block) or str(id(block))
+        outputs, error = self._run(block, inputs)
+        if error is None and result_key is not None:
+            self._result_cache.put(result_key, outputs)
+        duration_ms = (time.time() - start_time) * 1000
+
+        with self._lock:
+            self._stats.executions += 1
+            if error is not None:
+                self._stats.errors += 1
+
+        if error is None:
+            record_block_execution(block_id, True, duration_ms, inputs, outputs=outputs)
+        else:
+            record_block_execution(block_id, False, duration_ms, inputs, error=Exception(error))
+        return outputs, error
+
+    def submit(self, block: NeuropBlock, inputs: Dict[str, Any]) -> "Future[Tuple[Dict[str, Any], Optional[str]]]":
+        """Schedule execute() on the pool and return a Future."""
+        with self._lock:
+            if self._dispatcher is None:
+                self._dispatcher = ThreadPoolExecutor(
+                    max_workers=self._workers_count,
+                    thread_name_prefix="neurop-pool",
+                )
+            dispatcher = self._dispatcher
+        return dispatcher.submit(self.execute, block, inputs)
+
+    def execute_many(
+        self,
+        block: NeuropBlock,
+        rows: Iterable[Dict[str, Any]],
+    ) -> List[Tuple[Dict[str, Any], Optional[str]]]:
+        """
+        Execute one block over many input rows, spread across the workers.
+
+        Trust statistics are recorded once for the whole batch.
+        """
+        start_time = time.time()
+        rows = list(rows)
+        block_id = self._block_id(block) or str(id(block))
+
+        with ThreadPoolExecutor(max_workers=self._workers_count) as dispatcher:
+            results = list(dispatcher.map(lambda inputs: self._run(block, inputs), rows))
+
+        error_types: List[str] = []
+        for _, error in results:
+            if error is not None:
+                error_type = error.split(":", 1)[0]
+                if error_type not in error_types:
+                    error_types.append(error_type)
+
+        with self._lock:
+            self._stats.executions += len(results)
+            self._stats.errors += sum(1 for _, error in results if error is not None)
+        self._record_batch(block_id, results, start_time, error_types)
+        return results
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Pool size and execution, timeout and respawn counters."""
+        with self._lock:
+            return self._stats.to_dict()
+
+    def close(self) -> None:
+        """
+        Stop every worker. Calls in progress finish first; calls waiting
+        for a worker return a WorkerError.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            dispatcher, self._dispatcher = self._dispatcher, None
+        if dispatcher is not None:
+            dispatcher.shutdown(wait=True)
+        while True:
+            try:
+                self._idle.get_nowait().stop()
+            except queue.Empty:
+                break
+
+    def __enter__(self) -> "PooledBlockExecutor":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
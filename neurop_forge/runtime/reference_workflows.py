@@ -14,11 +14,11 @@ This module provides 5 production-ready workflow templates that:
 Each workflow is a semantic graph that can be executed end-to-end.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import AbstractSet, Dict, List, Any, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 
-from neurop_forge.core.block_schema import NeuropBlock, DataType
+from neurop_forge.core.block_schema import DataType
 from neurop_forge.runtime.executor import BlockExecutor, GraphExecutor
 from neurop_forge.runtime.block_verifier import BlockVerifier, get_verification_registry
 from neurop_forge.runtime.trust_tracker import get_trust_tracker
@@ -138,23 +138,28 @@ REFERENCE_WORKFLOWS = [
 class ReferenceWorkflowRunner:
     """Executes production reference workflows using verified blocks."""
 
-    def __init__(self, block_store):
+    def __init__(self, block_store, verified_ids: Optional[AbstractSet[str]] = None):
+        """
+        Args:
+            block_store: Store to resolve workflow blocks from
+            verified_ids: Verified block ids, e.g. the caller's registry
+                          bitset (default: read from the verification registry)
+        """
         self._block_store = block_store
         self._executor = BlockExecutor()
         self._registry = get_verification_registry()
         self._tracker = get_trust_tracker()
-        self._verified_blocks: Dict[str, NeuropBlock] = {}
-        self._discover_verified_blocks()
+        self._verified_blocks: Dict[str, str] = {}
+        self._discover_verified_blocks(verified_ids)
 
-    def _discover_verified_blocks(self) -> None:
-        """Discover all verified blocks from the store."""
-        verified_ids = set(self._registry.get_verified_ids())
+    def _discover_verified_blocks(self, verified_ids: Optional[AbstractSet[str]] = None) -> None:
+        """Discover all verified blocks from the store (name -> block ID)."""
+        if verified_ids is None:
+            verified_ids = set(self._registry.get_verified_ids())
         
-        for block in self._block_store.get_all():
-            block_id = block.get_identity_hash()
-            if block_id in verified_ids:
-                if hasattr(block.metadata, 'name'):
-                    self._verified_blocks[block.metadata.name] = block
+        for header in self._block_store.iter_headers():
+            if header.identity in verified_ids:
+                self._verified_blocks[header.name] = header.identity
 
     def get_verified_block_count(self) -> int:
         """Get count of discovered verified blocks."""
@@ -219,7 +224,15 @@ class ReferenceWorkflowRunner:
                 })
                 continue
             
-            block = self._verified_blocks[step.block_name]
+            block = self._block_store.get(self._verified_blocks[step.block_name])
+            if block is None:
+                step_traces.append({
+                    "step": step.name,
+                    "block": step.block_name,
+                    "status": "skipped",
+                    "error": f"Block '{step.block_name}' could not be loaded"
+                })
+                continue
             
             step_inputs = {}
             for param_name, source in step.input_mapping.items():
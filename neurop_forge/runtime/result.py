@@ -14,7 +14,7 @@ Provides full visibility into:
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from enum import Enum
 from datetime import datetime
 import json
@@ -30,6 +30,55 @@ class ExecutionStatus(Enum):
     SKIPPED = "skipped"
 
 
+class TraceMode(Enum):
+    """
+    How much of a graph run is traced.
+    
+    FULL records every node with its bound inputs (by reference) and
+    outputs. SAMPLED traces one run in N in full and the others not at all.
+    OUTPUTS_ONLY records a canonical hash of each node's inputs instead of
+    the inputs. OFF records no traces; node counts, status and final
+    outputs are still reported.
+    """
+    FULL = "full"
+    SAMPLED = "sampled"
+    OUTPUTS_ONLY = "outputs_only"
+    OFF = "off"
+
+
+@dataclass
+class ResourceUsage:
+    """
+    CPU time and peak traced memory of one or more block calls.
+    
+    peak_memory_bytes is None when memory was not measured (see
+    runtime.budgets).
+    """
+    cpu_ms: float = 0.0
+    peak_memory_bytes: Optional[int] = None
+    calls: int = 1
+    
+    @classmethod
+    def total(cls, usages: Iterable[Optional["ResourceUsage"]]) -> Optional["ResourceUsage"]:
+        """Summed CPU time and largest peak of several usages (None if none measured)."""
+        measured = [usage for usage in usages if usage is not None]
+        if not measured:
+            return None
+        peaks = [usage.peak_memory_bytes for usage in measured if usage.peak_memory_bytes is not None]
+        return cls(
+            cpu_ms=sum(usage.cpu_ms for usage in measured),
+            peak_memory_bytes=max(peaks) if peaks else None,
+            calls=sum(usage.calls for usage in measured),
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "cpu_ms": self.cpu_ms,
+            "peak_memory_bytes": self.peak_memory_bytes,
+            "calls": self.calls,
+        }
+
+
 @dataclass
 class ExecutionTrace:
     """Trace of a single block execution."""
@@ -44,6 +93,8 @@ class ExecutionTrace:
     error: Optional[str] = None
     retry_count: int = 0
     skipped_reason: Optional[str] = None
+    inputs_hash: Optional[str] = None
+    resource_usage: Optional[ResourceUsage] = None
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -58,6 +109,8 @@ class ExecutionTrace:
             "error": self.error,
             "retry_count": self.retry_count,
             "skipped_reason": self.skipped_reason,
+            "inputs_hash": self.inputs_hash,
+            "resource_usage": self.resource_usage.to_dict() if self.resource_usage else None,
         }
     
     def _safe_serialize(self, data: Any) -> Any:
@@ -82,6 +135,7 @@ class ExecutionResult:
     - Timing information
     - Error details if any
     - Performance metrics
+    - CPU time and memory used by block calls
     """
     execution_id: str
     query: str
@@ -96,6 +150,7 @@ class ExecutionResult:
     nodes_succeeded: int = 0
     nodes_failed: int = 0
     nodes_skipped: int = 0
+    resource_usage: Optional[ResourceUsage] = None
     
     def __post_init__(self):
         if not self.nodes_executed:
@@ -178,6 +233,7 @@ class ExecutionResult:
             "traces": [t.to_dict() for t in self.traces],
             "final_outputs": self._safe_serialize(self.final_outputs),
             "performance": self.get_performance_summary(),
+            "resource_usage": self.resource_usage.to_dict() if self.resource_usage else None,
         }
     
     def _safe_serialize(self, data: Any) -> Any:
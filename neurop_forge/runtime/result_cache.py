@@ -0,0 +1,236 @@
+"""
+Result cache for pure, deterministic NeuropBlocks.
+
+A block declared purity == PURE and deterministic == True returns the same
+outputs for the same inputs, so repeated calls (agent retries, validating
+the same value again) can be answered from memory. The cache is opt-in:
+pass a ResultCache to BlockExecutor or GraphExecutor.
+
+Entries are keyed by (block identity hash, canonical hash of the inputs).
+Inputs are canonicalised with their types, so 1, 1.0, True, [1] and (1,)
+never share an entry. Dict key order is kept, because input binding and
+blocks that iterate a dict can depend on it. Inputs that contain anything
+other than None, bool, int, float, str, bytes, list, tuple or dict (with
+str keys), or whose canonical form is larger than max_input_bytes, are
+not cached.
+
+Outputs are stored pickled, which bounds the cache by bytes and hands
+every hit a fresh copy that callers may mutate. Outputs that cannot be
+pickled are not cached. Only successful executions are cached.
+"""
+
+import hashlib
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from neurop_forge.core.block_schema import NeuropBlock, PurityLevel
+
+
+DEFAULT_MAX_ENTRIES = 4096
+DEFAULT_MAX_INPUT_BYTES = 4096
+
+
+class _Uncacheable(Exception):
+    """Inputs contain a value the cache cannot canonicalise."""
+
+
+def _canonical(value: Any, out: List[str]) -> None:
+    """Append a type-tagged canonical encoding of value to out."""
+    if value is None:
+        out.append("N")
+    elif value is True or value is False:
+        out.append("T" if value else "F")
+    elif type(value) is int:
+        out.append(f"i{value};")
+    elif type(value) is float:
+        out.append(f"f{value!r};")
+    elif type(value) is str:
+        out.append(f"s{len(value)}:{value}")
+    elif type(value) is bytes:
+        out.append(f"b{value.hex()};")
+    elif type(value) in (list, tuple):
+        out.append("l[" if type(value) is list else "t[")
+        for item in value:
+            _canonical(item, out)
+        out.append("]")
+    elif type(value) is dict:
+        out.append("d{")
+        for key, item in value.items():
+            if type(key) is not str:
+                raise _Uncacheable()
+            out.append(f"{len(key)}:{key}")
+            _canonical(item, out)
+        out.append("}")
+    else:
+        raise _Uncacheable()
+
+
+def canonical_input_hash(inputs: Dict[str, Any], max_bytes: Optional[int] = None) -> Optional[str]:
+    """
+    Hash of inputs that is stable across processes, or None when the inputs
+    cannot be cached (unsupported types, or larger than max_bytes).
+    """
+    parts: List[str] = []
+    try:
+        _canonical(inputs, parts)
+    except (_Uncacheable, RecursionError):
+        return None
+    encoded = "".join(parts).encode("utf-8", "surrogatepass")
+    if max_bytes is not None and len(encoded) > max_bytes:
+        return None
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def is_cacheable_block(block: NeuropBlock) -> bool:
+    """Whether a block declares itself pure and deterministic."""
+    constraints = getattr(block, "constraints", None)
+    return (
+        constraints is not None
+        and constraints.purity == PurityLevel.PURE
+        and constraints.deterministic is True
+    )
+
+
+@dataclass
+class _Entry:
+    payload: bytes
+    expires_at: Optional[float]
+
+
+class ResultCache:
+    """
+    LRU cache of block outputs, bounded by entry count and optionally bytes.
+
+    Args:
+        max_entries: Maximum cached results.
+        max_bytes: Maximum total size of pickled outputs (None = no limit).
+        ttl_seconds: Lifetime of an entry (None = until evicted).
+        max_input_bytes: Inputs whose canonical form is larger are not cached.
+        max_output_bytes: Outputs whose pickled form is larger are not
+            cached (None = max_bytes, when set).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        max_input_bytes: int = DEFAULT_MAX_INPUT_BYTES,
+        max_output_bytes: Optional[int] = None,
+    ):
+        self._max_entries = max(0, max_entries)
+        self._max_bytes = max_bytes
+        self._ttl_seconds = ttl_seconds
+        self._max_input_bytes = max_input_bytes
+        self._max_output_bytes = max_output_bytes if max_output_bytes is not None else max_bytes
+        self._entries: "OrderedDict[Tuple[str, str], _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._skipped = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def key_for(self, block_id: str, inputs: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+        """Cache key for a call, or None (counted as skipped) if inputs are not cacheable."""
+        input_hash = canonical_input_hash(inputs, self._max_input_bytes)
+        if input_hash is None:
+            with self._lock:
+                self._skipped += 1
+            return None
+        return (block_id, input_hash)
+
+    def get(self, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        """Cached outputs for a key (a fresh copy), or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at is not None and entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self._expirations += 1
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            payload = entry.payload
+        return pickle.loads(payload)
+
+    def put(self, key: Tuple[str, str], outputs: Dict[str, Any]) -> bool:
+        """Cache outputs for a key. Returns False if they were not cacheable."""
+        if self._max_entries == 0:
+            return False
+        try:
+            payload = pickle.dumps(outputs, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            with self._lock:
+                self._skipped += 1
+            return False
+        if self._max_output_bytes is not None and len(payload) > self._max_output_bytes:
+            with self._lock:
+                self._skipped += 1
+            return False
+
+        expires_at = time.monotonic() + self._ttl_seconds if self._ttl_seconds else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _Entry(payload=payload, expires_at=expires_at)
+            self._bytes += len(payload)
+            while self._entries and (
+                len(self._entries) > self._max_entries
+                or (self._max_bytes is not None and self._bytes > self._max_bytes)
+            ):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._evictions += 1
+        return True
+
+    def _remove(self, key: Tuple[str, str]) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= len(entry.payload)
+
+    def invalidate_block(self, block_id: str) -> int:
+        """Drop every result of one block. Returns the number dropped."""
+        with self._lock:
+            keys = [key for key in self._entries if key[0] == block_id]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._skipped = 0
+            self._evictions = 0
+            self._expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Size, byte usage and hit/miss/skip/eviction counters."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self._max_entries,
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+                "ttl_seconds": self._ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "skipped": self._skipped,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,83 @@
+"""
+Copyright © 2026 Lourens Wasserman. All Rights Reserved.
+Neurop Block Forge - https://neurop-forge.com
+Commercial use requires a license. See LICENSE file.
+
+Dependency scheduling for semantic graphs.
+
+GraphExecutor walks graph.nodes in order. Most nodes only read the
+outputs of the nodes named in their input_sources, so nodes that do not
+(transitively) feed each other can run at the same time. build_schedule
+turns a SemanticGraph into that dependency DAG.
+
+A node waits for:
+- every earlier node named in its input_sources or in an edge into it
+- the previous node with the same block identity (circuit breaker state
+  and node outputs are keyed by block identity)
+- every earlier node, when it declares no input_sources: it reads the
+  most recent node output, which depends on which earlier nodes succeeded
+
+Dependencies only ever point at earlier nodes, so graph order is always a
+valid execution order and the DAG never has cycles. A source that is not
+an earlier node in the graph is ignored; sequential execution would not
+find its output either.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Set, Tuple
+
+from neurop_forge.semantic.composer import SemanticGraph
+
+
+@dataclass(frozen=True)
+class GraphSchedule:
+    """Dependency DAG of a graph's nodes, by node index."""
+    dependencies: Tuple[Tuple[int, ...], ...]
+    levels: Tuple[Tuple[int, ...], ...]
+
+    @property
+    def width(self) -> int:
+        """Most nodes that can run at the same time."""
+        return max((len(level) for level in self.levels), default=0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "dependencies": [list(deps) for deps in self.dependencies],
+            "levels": [list(level) for level in self.levels],
+            "width": self.width,
+        }
+
+
+def build_schedule(graph: SemanticGraph) -> GraphSchedule:
+    """Build the dependency DAG of a graph (see module docstring)."""
+    incoming: Dict[str, Set[str]] = {}
+    for source, target, _ in graph.edges:
+        incoming.setdefault(target, set()).add(source)
+
+    latest: Dict[str, int] = {}
+    dependencies: List[Tuple[int, ...]] = []
+    depths: List[int] = []
+
+    for index, node in enumerate(graph.nodes):
+        if not node.input_sources:
+            deps = set(range(index))
+        else:
+            deps = set()
+            for source in set(node.input_sources) | incoming.get(node.block_identity, set()):
+                if source in latest:
+                    deps.add(latest[source])
+            if node.block_identity in latest:
+                deps.add(latest[node.block_identity])
+
+        dependencies.append(tuple(sorted(deps)))
+        depths.append(1 + max((depths[d] for d in deps), default=-1))
+        latest[node.block_identity] = index
+
+    levels: List[List[int]] = [[] for _ in range(max(depths, default=-1) + 1)]
+    for index, depth in enumerate(depths):
+        levels[depth].append(index)
+
+    return GraphSchedule(
+        dependencies=tuple(dependencies),
+        levels=tuple(tuple(level) for level in levels),
+    )
@@ -0,0 +1,438 @@
+"""
+Streaming execution of list blocks over large iterables.
+
+Many library blocks take a whole list and return a whole list or a single
+value (filters, flatten, deduplication, sorting, statistics, CSV rows).
+Executed normally, a million-row input is materialised in full on the way
+in and again on the way out. A block with a StreamProfile can instead be
+fed an iterable in bounded chunks:
+
+- CHUNK blocks are called once per chunk of the streamed list parameter.
+  Without a reducer their output is a list that is passed on chunk by
+  chunk (filters, flatten); with one, the partial results are merged by
+  a StreamReducer (sum, min, max, mean, ...).
+- MAP blocks take one element (a CSV line, a row) and are called for every
+  element of a chunk with BlockExecutor.execute_many.
+
+A StreamPipeline pushes chunks through consecutive stages, so peak memory
+depends on the chunk size, not on the length of the input, as long as the
+result is reduced or handed to a sink. The reducers that build lists
+(unique, merge_sorted) hold their result and are marked bounded=False.
+
+Profiles are registered by block name in STREAM_PROFILES (see
+register_stream_profile) and apply to a block only if it has the streamed
+parameter. Streamed calls are not retried.
+"""
+
+import heapq
+import itertools
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from neurop_forge.core.block_schema import NeuropBlock
+from neurop_forge.runtime.executor import output_value
+from neurop_forge.runtime.guards import ExecutionGuard
+
+if TYPE_CHECKING:
+    from neurop_forge.runtime.executor import BlockExecutor
+
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+class StreamKind(Enum):
+    """How a streamed block consumes its list parameter."""
+    CHUNK = "chunk"
+    MAP = "map"
+
+
+def _first(partial: Any, items: int) -> Any:
+    return partial
+
+
+def _identity(state: Any) -> Any:
+    return state
+
+
+def _mean_start(partial: Any, items: int) -> Tuple[float, int]:
+    return (partial * items, items)
+
+
+def _mean_merge(state: Tuple[float, int], partial: Any, items: int) -> Tuple[float, int]:
+    return (state[0] + partial * items, state[1] + items)
+
+
+def _mean_finish(state: Tuple[float, int]) -> float:
+    total, count = state
+    return total / count if count else 0.0
+
+
+def _unique_merge(state: Tuple[List[Any], set], partial: Any, items: int) -> Tuple[List[Any], set]:
+    result, seen = state
+    for item in partial:
+        try:
+            if item in seen:
+                continue
+            seen.add(item)
+        except TypeError:
+            if item in result:
+                continue
+        result.append(item)
+    return state
+
+
+def _unique_start(partial: Any, items: int) -> Tuple[List[Any], set]:
+    return _unique_merge(([], set()), partial, items)
+
+
+def _runs_start(partial: Any, items: int) -> List[List[Any]]:
+    return [partial]
+
+
+def _runs_merge(state: List[List[Any]], partial: Any, items: int) -> List[List[Any]]:
+    state.append(partial)
+    return state
+
+
+@dataclass(frozen=True)
+class StreamReducer:
+    """
+    Merges the partial results of one block over successive chunks.
+
+    start(partial, items) turns the first chunk's result into a state,
+    merge(state, partial, items) folds in the next one (items is the
+    number of input elements in the chunk) and finish(state) returns the
+    block's result. bounded is False when the state grows with the input.
+    """
+    name: str
+    merge: Callable[[Any, Any, int], Any]
+    start: Callable[[Any, int], Any] = _first
+    finish: Callable[[Any], Any] = _identity
+    bounded: bool = True
+
+
+REDUCERS: Dict[str, StreamReducer] = {
+    reducer.name: reducer
+    for reducer in (
+        StreamReducer("sum", lambda state, partial, items: state + partial),
+        StreamReducer("product", lambda state, partial, items: state * partial),
+        StreamReducer("min", lambda state, partial, items: min(state, partial)),
+        StreamReducer("max", lambda state, partial, items: max(state, partial)),
+        StreamReducer("all", lambda state, partial, items: state and partial),
+        StreamReducer("any", lambda state, partial, items: state or partial),
+        StreamReducer("mean", _mean_merge, start=_mean_start, finish=_mean_finish),
+        StreamReducer(
+            "unique", _unique_merge, start=_unique_start,
+            finish=lambda state: state[0], bounded=False,
+        ),
+        StreamReducer(
+            "merge_sorted", _runs_merge, start=_runs_start,
+            finish=lambda runs: list(heapq.merge(*runs)), bounded=False,
+        ),
+        StreamReducer(
+            "merge_sorted_desc", _runs_merge, start=_runs_start,
+            finish=lambda runs: list(heapq.merge(*runs, reverse=True)), bounded=False,
+        ),
+    )
+}
+
+
+@dataclass(frozen=True)
+class StreamProfile:
+    """
+    How a block can be streamed.
+
+    input_name is the streamed parameter (None = the block's first list
+    parameter). reducer names an entry of REDUCERS; without one, a CHUNK
+    block's list output (or a MAP block's per-element results) is passed
+    on. chunk_multiple_of names an integer parameter that chunk lengths
+    must be a multiple of (e.g. chunk_list's chunk_size).
+    """
+    kind: StreamKind = StreamKind.CHUNK
+    reducer: Optional[str] = None
+    input_name: Optional[str] = None
+    chunk_multiple_of: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind.value,
+            "reducer": self.reducer,
+            "input_name": self.input_name,
+            "chunk_multiple_of": self.chunk_multiple_of,
+        }
+
+
+_PASS = StreamProfile()
+
+STREAM_PROFILES: Dict[str, StreamProfile] = {
+    # Element-wise list -> list
+    "flatten": _PASS,
+    "flatten_list": _PASS,
+    "flatten_matrix": _PASS,
+    "filter_empty_strings": _PASS,
+    "filter_none_values": _PASS,
+    "filter_by_field": _PASS,
+    "filter_by_range": _PASS,
+    "filter_events_by_type": _PASS,
+    "filter_logs_by_level": _PASS,
+    "filter_unread": _PASS,
+    "chunk": StreamProfile(chunk_multiple_of="size"),
+    "chunk_list": StreamProfile(chunk_multiple_of="chunk_size"),
+    # Associative reductions
+    "sum_numbers": StreamProfile(reducer="sum"),
+    "sum_amounts": StreamProfile(reducer="sum"),
+    "calculate_subtotal": StreamProfile(reducer="sum"),
+    "count_true": StreamProfile(reducer="sum"),
+    "count_false": StreamProfile(reducer="sum"),
+    "count_element": StreamProfile(reducer="sum"),
+    "count_occurrences": StreamProfile(reducer="sum"),
+    "product_numbers": StreamProfile(reducer="product"),
+    "min_value": StreamProfile(reducer="min"),
+    "max_value": StreamProfile(reducer="max"),
+    "min_amount": StreamProfile(reducer="min"),
+    "max_amount": StreamProfile(reducer="max"),
+    "set_min": StreamProfile(reducer="min"),
+    "set_max": StreamProfile(reducer="max"),
+    "all_true": StreamProfile(reducer="all"),
+    "any_true": StreamProfile(reducer="any"),
+    "mean": StreamProfile(reducer="mean"),
+    "calculate_mean": StreamProfile(reducer="mean"),
+    "deduplicate": StreamProfile(reducer="unique"),
+    "unique": StreamProfile(reducer="unique"),
+    "sort_ascending": StreamProfile(reducer="merge_sorted"),
+    "sort_descending": StreamProfile(reducer="merge_sorted_desc"),
+    # One element per call
+    "parse_csv_line": StreamProfile(kind=StreamKind.MAP, input_name="line"),
+    "to_csv_line": StreamProfile(kind=StreamKind.MAP, input_name="values"),
+    "format_csv_row": StreamProfile(kind=StreamKind.MAP, input_name="values"),
+}
+
+
+def register_stream_profile(block_name: str, profile: StreamProfile) -> None:
+    """Declare how blocks with this name can be streamed."""
+    if profile.reducer is not None and profile.reducer not in REDUCERS:
+        raise ValueError(f"Unknown stream reducer: {profile.reducer}")
+    STREAM_PROFILES[block_name] = profile
+
+
+def stream_profile_for(block: NeuropBlock) -> Optional[StreamProfile]:
+    """
+    The block's stream profile with input_name resolved, or None if the
+    block cannot be streamed.
+    """
+    profile = STREAM_PROFILES.get(block.metadata.name)
+    if profile is None:
+        return None
+    params = block.interface.inputs
+    if profile.input_name is None:
+        for param in params:
+            if param.data_type.value == "list":
+                return StreamProfile(
+                    kind=profile.kind,
+                    reducer=profile.reducer,
+                    input_name=param.name,
+                    chunk_multiple_of=profile.chunk_multiple_of,
+                )
+        return None
+    if any(param.name == profile.input_name for param in params):
+        return profile
+    return None
+
+
+def iter_chunks(items: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    """Successive lists of up to chunk_size elements of items."""
+    iterator = iter(items)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+@dataclass
+class StreamStage:
+    """One block of a StreamPipeline, with its non-streamed inputs."""
+    block: NeuropBlock
+    profile: StreamProfile
+    inputs: Dict[str, Any] = field(default_factory=dict)
+    calls: int = 0
+    items: int = 0
+    duration_ms: float = 0.0
+    _carry: List[Any] = field(default_factory=list, repr=False)
+    _state: Any = field(default=None, repr=False)
+    _reduced: bool = field(default=False, repr=False)
+
+    def multiple(self) -> int:
+        """Chunk lengths this stage needs to be a multiple of (1 = any)."""
+        name = self.profile.chunk_multiple_of
+        value = self.inputs.get(name) if name else None
+        return value if isinstance(value, int) and value > 0 else 1
+
+
+@dataclass
+class StreamOutcome:
+    """Result of running a StreamPipeline."""
+    value: Any = None
+    chunks: int = 0
+    items: int = 0
+    error: Optional[str] = None
+    failed_stage: Optional[int] = None
+
+
+class _StageFailed(Exception):
+    def __init__(self, index: int, error: str):
+        super().__init__(error)
+        self.index = index
+        self.error = error
+
+
+class StreamPipeline:
+    """
+    Chunked execution of consecutive streamable blocks.
+
+    Every stage but the last must pass lists on (no reducer). The output
+    of the last stage is its reduced value, or, without a reducer, its
+    output lists: each handed to sink when one is given, else collected
+    into one list.
+    """
+
+    def __init__(
+        self,
+        executor: "BlockExecutor",
+        stages: Sequence[StreamStage],
+        sink: Optional[Callable[[List[Any]], None]] = None,
+    ):
+        if not stages:
+            raise ValueError("A stream pipeline needs at least one stage")
+        for stage in stages[:-1]:
+            if stage.profile.reducer is not None:
+                raise ValueError(f"Only the last stage may reduce ({stage.block.metadata.name})")
+        self._executor = executor
+        self._stages = list(stages)
+        self._sink = sink
+        self._collected: List[Any] = []
+
+    @property
+    def stages(self) -> List[StreamStage]:
+        return self._stages
+
+    def run(
+        self,
+        items: Iterable[Any],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        guard: Optional[ExecutionGuard] = None,
+    ) -> StreamOutcome:
+        """Stream items through every stage in chunks of chunk_size."""
+        chunk_size = max(1, chunk_size)
+        first = self._stages[0].multiple()
+        chunk_size += -chunk_size % first
+
+        outcome = StreamOutcome()
+        try:
+            for chunk in iter_chunks(items, chunk_size):
+                if guard is not None:
+                    can_continue, reason = guard.check()
+                    if not can_continue:
+                        outcome.error = reason
+                        return outcome
+                outcome.chunks += 1
+                outcome.items += len(chunk)
+                self._push(0, chunk)
+            for index in range(len(self._stages)):
+                self._flush(index)
+            outcome.value = self._result()
+        except _StageFailed as failed:
+            outcome.error = failed.error
+            outcome.failed_stage = failed.index
+        return outcome
+
+    def _push(self, index: int, chunk: List[Any]) -> None:
+        """Feed a chunk to a stage, buffering to the stage's chunk multiple."""
+        stage = self._stages[index]
+        multiple = stage.multiple()
+        if multiple > 1:
+            chunk = stage._carry + chunk
+            cut = len(chunk) - len(chunk) % multiple
+            stage._carry = chunk[cut:]
+            chunk = chunk[:cut]
+        if chunk:
+            self._run_stage(index, chunk)
+
+    def _flush(self, index: int) -> None:
+        """Run a stage on what it still buffers once the input has ended."""
+        stage = self._stages[index]
+        carry, stage._carry = stage._carry, []
+        if carry:
+            self._run_stage(index, carry)
+
+    def _run_stage(self, index: int, chunk: List[Any]) -> None:
+        stage = self._stages[index]
+        partial = self._call(index, chunk)
+
+        if index + 1 < len(self._stages):
+            if partial:
+                self._push(index + 1, partial)
+            return
+
+        reducer = REDUCERS.get(stage.profile.reducer) if stage.profile.reducer else None
+        if reducer is not None:
+            if stage._reduced:
+                stage._state = reducer.merge(stage._state, partial, len(chunk))
+            else:
+                stage._state = reducer.start(partial, len(chunk))
+                stage._reduced = True
+        elif self._sink is not None:
+            self._sink(partial)
+        else:
+            self._collected.extend(partial)
+
+    def _call(self, index: int, chunk: List[Any]) -> Any:
+        """One stage's result for one chunk (raises _StageFailed on error)."""
+        stage = self._stages[index]
+        start = time.perf_counter()
+        name = stage.profile.input_name
+        try:
+            if stage.profile.kind == StreamKind.MAP:
+                rows = [dict(stage.inputs, **{name: item}) for item in chunk]
+                results = self._executor.execute_many(stage.block, rows)
+                for _, error in results:
+                    if error is not None:
+                        raise _StageFailed(index, error)
+                partial: Any = [output_value(outputs) for outputs, _ in results]
+            else:
+                outputs, error = self._executor.execute(stage.block, dict(stage.inputs, **{name: chunk}))
+                if error is not None:
+                    raise _StageFailed(index, error)
+                partial = output_value(outputs)
+                if stage.profile.reducer is None and not isinstance(partial, list):
+                    raise _StageFailed(
+                        index, f"StreamError: {stage.block.metadata.name} did not return a list",
+                    )
+        finally:
+            stage.calls += 1
+            stage.items += len(chunk)
+            stage.duration_ms += (time.perf_counter() - start) * 1000
+        return partial
+
+    def _result(self) -> Any:
+        """The last stage's value once every chunk has been pushed."""
+        stage = self._stages[-1]
+        if stage.profile.reducer is None:
+            return None if self._sink is not None else self._collected
+        if not stage._reduced:
+            # Nothing reached the reducer: the block's own answer for [].
+            return self._call(len(self._stages) - 1, [])
+        return REDUCERS[stage.profile.reducer].finish(stage._state)
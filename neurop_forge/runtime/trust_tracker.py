@@ -14,6 +14,7 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 from enum import Enum
 import json
+import threading
 
 
 class ExecutionOutcome(Enum):
@@ -91,6 +92,7 @@ class TrustTracker:
         self._stats: Dict[str, BlockExecutionStats] = {}
         self._decay_rate = decay_rate
         self._base_trust = 0.36
+        self._lock = threading.Lock()
 
     def record_execution(
         self,
@@ -123,29 +125,73 @@ class TrustTracker:
             error_type=type(error).__name__ if error else None,
         )
 
-        if block_hash not in self._stats:
-            self._stats[block_hash] = BlockExecutionStats(block_hash=block_hash)
-
-        stats = self._stats[block_hash]
-        stats.execution_count += 1
-        stats.total_duration_ms += duration_ms
-        stats.last_execution = timestamp
-
-        if outcome == ExecutionOutcome.SUCCESS:
-            stats.success_count += 1
-            stats.last_success = timestamp
-        elif outcome == ExecutionOutcome.FAILURE or outcome == ExecutionOutcome.ERROR:
-            stats.failure_count += 1
-            stats.last_failure = timestamp
-            if record.error_type and record.error_type not in stats.failure_patterns:
-                stats.failure_patterns.append(record.error_type)
-        elif outcome == ExecutionOutcome.TIMEOUT:
-            stats.timeout_count += 1
-            stats.failure_count += 1
-            stats.last_failure = timestamp
+        with self._lock:
+            if block_hash not in self._stats:
+                self._stats[block_hash] = BlockExecutionStats(block_hash=block_hash)
+
+            stats = self._stats[block_hash]
+            stats.execution_count += 1
+            stats.total_duration_ms += duration_ms
+            stats.last_execution = timestamp
+
+            if outcome == ExecutionOutcome.SUCCESS:
+                stats.success_count += 1
+                stats.last_success = timestamp
+            elif outcome == ExecutionOutcome.FAILURE or outcome == ExecutionOutcome.ERROR:
+                stats.failure_count += 1
+                stats.last_failure = timestamp
+                if record.error_type and record.error_type not in stats.failure_patterns:
+                    stats.failure_patterns.append(record.error_type)
+            elif outcome == ExecutionOutcome.TIMEOUT:
+                stats.timeout_count += 1
+                stats.failure_count += 1
+                stats.last_failure = timestamp
 
         return record
 
+    def record_batch(
+        self,
+        block_hash: str,
+        success_count: int,
+        failure_count: int,
+        duration_ms: float,
+        timeout_count: int = 0,
+        error_types: Optional[List[str]] = None,
+    ) -> BlockExecutionStats:
+        """
+        Record many executions of one block in a single update.
+        
+        failure_count covers failures and errors; timeouts are counted
+        separately and also count as failures, as in record_execution.
+        No per-execution records are built.
+        """
+        executions = success_count + failure_count + timeout_count
+        with self._lock:
+            if block_hash not in self._stats:
+                self._stats[block_hash] = BlockExecutionStats(block_hash=block_hash)
+            
+            stats = self._stats[block_hash]
+            if executions == 0:
+                return stats
+            
+            timestamp = datetime.utcnow().isoformat() + "Z"
+            stats.execution_count += executions
+            stats.success_count += success_count
+            stats.failure_count += failure_count + timeout_count
+            stats.timeout_count += timeout_count
+            stats.total_duration_ms += duration_ms
+            stats.last_execution = timestamp
+            
+            if success_count:
+                stats.last_success = timestamp
+            if failure_count or timeout_count:
+                stats.last_failure = timestamp
+            for error_type in error_types or ():
+                if error_type not in stats.failure_patterns:
+                    stats.failure_patterns.append(error_type)
+        
+        return stats
+
     def get_execution_stats(self, block_hash: str) -> Optional[BlockExecutionStats]:
         """Get execution statistics for a block."""
         return self._stats.get(block_hash)
@@ -240,3 +286,22 @@ def record_block_execution(
         outputs=outputs,
         error=error,
     )
+
+
+def record_block_batch(
+    block_hash: str,
+    success_count: int,
+    failure_count: int,
+    duration_ms: float,
+    timeout_count: int = 0,
+    error_types: Optional[List[str]] = None,
+) -> None:
+    """Convenience function to record a batch of executions of one block."""
+    get_trust_tracker().record_batch(
+        block_hash=block_hash,
+        success_count=success_count,
+        failure_count=failure_count,
+        duration_ms=duration_ms,
+        timeout_count=timeout_count,
+        error_types=error_types,
+    )
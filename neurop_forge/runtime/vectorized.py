@@ -0,0 +1,318 @@
+"""
+Vectorized NumPy execution of numeric element-wise blocks.
+
+Most arithmetic, conversion and financial blocks compute one number from
+a few numbers. BlockExecutor.execute_many calls such a block once per
+row; with vectorize=True, a batch whose rows all carry exactly the
+block's parameters as finite int or float values is computed in one call
+of a NumPy kernel instead:
+
+- Kernels are registered by block name in VECTOR_KERNELS (see
+  register_vector_kernel) and take one array per block parameter.
+- Before a kernel is used for a block, it is verified against the
+  block's own function on the first VERIFY_ROWS rows of the batch.
+  A block whose results differ by more than the kernel's tolerance
+  (rtol, atol as in math.isclose; default 1e-9 and 1e-12) is never
+  vectorized again by that executor.
+- Rows whose vectorized result is not finite (a division by zero, the
+  power of a negative number), and rows selected by the kernel's
+  scalar_when mask (the block's own special cases, such as a zero
+  divisor), are executed by the block's function, so errors and special
+  cases are those of the scalar block.
+- Columns of ints stay int64, so int and float results follow Python's
+  arithmetic. Inputs must be within +/- MAX_ABS_INPUT, and an int64
+  result is only used where the kernel computed over float64 columns
+  stays below INT_RESULT_LIMIT; other rows, whose Python ints would
+  overflow int64, are executed by the block's function.
+
+Results match the scalar block within the kernel's tolerance. They have
+its types when every row has the same types: an all-int batch returns
+the block's ints, and a zero divisor or other special case returns what
+the block returns. Where a column mixes ints and floats it is computed
+in float64, and where a clamping kernel mixes int and float parameters
+it returns floats; an int result may then come back as an equal float.
+Batches smaller than MIN_ROWS, budgeted blocks and the result cache are
+left to the scalar path. NumPy is optional: without it,
+execute_many always runs row by row.
+"""
+
+import math
+import threading
+from operator import itemgetter
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from neurop_forge.core.block_schema import NeuropBlock
+from neurop_forge.library.parallel_loader import gc_paused
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+# Rows below which a batch is run row by row
+MIN_ROWS = 64
+# Rows compared against the block's function before its kernel is used
+VERIFY_ROWS = 16
+# Largest input magnitude handed to a kernel
+MAX_ABS_INPUT = 2 ** 31
+# Magnitude from which an int64 result is recomputed by the block's function
+INT_RESULT_LIMIT = 2 ** 62
+
+
+@dataclass(frozen=True)
+class VectorKernel:
+    """
+    A NumPy equivalent of a block and the tolerance it is verified to.
+
+    scalar_when, if set, takes the same columns as func and returns a
+    mask of the rows to execute with the block's function instead.
+    """
+    func: Callable[..., Any]
+    rtol: float = 1e-9
+    atol: float = 1e-12
+    scalar_when: Optional[Callable[..., Any]] = None
+
+
+def _where(condition: Any, value: Any, otherwise: Any) -> Any:
+    return np.where(condition, value, otherwise)
+
+
+VECTOR_KERNELS: Dict[str, VectorKernel] = {
+    name: VectorKernel(func)
+    for name, func in {
+        # Arithmetic
+        "absolute_value": lambda value: np.abs(value),
+        "sign": lambda value: np.sign(value),
+        "floor": lambda value: np.floor(value),
+        "ceiling_value": lambda value: np.ceil(value),
+        "square_root": lambda value: _where(value < 0, 0.0, np.sqrt(np.maximum(value, 0))),
+        "lerp": lambda start, end, t: start + (end - start) * t,
+        "denormalize_from_range": lambda normalized, min_val, max_val: (
+            min_val + normalized * (max_val - min_val)
+        ),
+        "clamp_value": lambda value, min_val, max_val: _where(
+            value < min_val, min_val, _where(value > max_val, max_val, value),
+        ),
+        "clamp_amount": lambda amount, min_amount, max_amount: np.maximum(
+            min_amount, np.minimum(amount, max_amount),
+        ),
+        "cap_delay": lambda delay, max_delay: np.minimum(delay, max_delay),
+        # Rates and percentages
+        "calculate_error_rate": lambda error_count, processed_count: _where(
+            processed_count <= 0, 0.0,
+            (error_count / _where(processed_count <= 0, 1, processed_count)) * 100.0,
+        ),
+        "calculate_uptime_percentage": lambda uptime_seconds, total_seconds: _where(
+            total_seconds <= 0, 100.0,
+            (uptime_seconds / _where(total_seconds <= 0, 1, total_seconds)) * 100,
+        ),
+        # Financial
+        "calculate_tax_amount": lambda amount, tax_rate: amount * (tax_rate / 100),
+        "calculate_after_tax": lambda amount, tax_rate: amount * (1 - tax_rate / 100),
+        "calculate_simple_interest": lambda principal, rate, years: principal * rate * years,
+        "calculate_compound_interest": lambda principal, rate, compounds_per_year, years: _where(
+            compounds_per_year == 0, np.nan,
+            principal * ((1 + (rate / 100) / compounds_per_year) ** (compounds_per_year * years))
+            - principal,
+        ),
+        "calculate_profit_margin": lambda revenue, cost: _where(
+            revenue <= 0, 0.0, ((revenue - cost) / _where(revenue <= 0, 1, revenue)) * 100,
+        ),
+        "calculate_cagr": lambda start_value, end_value, years: _where(
+            (start_value <= 0) | (years <= 0), 0.0,
+            ((end_value / _where(start_value <= 0, 1, start_value))
+             ** (1 / _where(years <= 0, 1, years)) - 1) * 100,
+        ),
+        # Unit conversions
+        "celsius_to_fahrenheit": lambda celsius: (celsius * 9 / 5) + 32,
+        "fahrenheit_to_celsius": lambda fahrenheit: (fahrenheit - 32) * 5 / 9,
+        "kilometers_to_miles": lambda km: km / 1.60934,
+        "miles_to_kilometers": lambda miles: miles * 1.60934,
+        "feet_to_meters": lambda feet: feet / 3.28084,
+        "inches_to_centimeters": lambda inches: inches * 2.54,
+        "centimeters_to_inches": lambda cm: cm / 2.54,
+        "hectares_to_acres": lambda hectares: hectares / 0.404686,
+        # Predicates
+        "is_even": lambda value: value % 2 == 0,
+        "is_odd": lambda value: value % 2 != 0,
+        "is_negative_number": lambda value: value < 0,
+    }.items()
+}
+# Special cases whose block result has another type than the other rows'
+# (an int 0 among float quotients) are left to the block
+VECTOR_KERNELS.update({
+    "inverse_lerp": VectorKernel(
+        lambda start, end, value: (value - start) / _where(start == end, 1, end - start),
+        scalar_when=lambda start, end, value: start == end,
+    ),
+    "normalize_to_range": VectorKernel(
+        lambda value, min_val, max_val: (value - min_val) / _where(max_val == min_val, 1, max_val - min_val),
+        scalar_when=lambda value, min_val, max_val: max_val == min_val,
+    ),
+    "get_taxable_amount": VectorKernel(
+        lambda total, exemption: total - exemption,
+        scalar_when=lambda total, exemption: total <= exemption,
+    ),
+    "modulo": VectorKernel(
+        lambda a, b: np.mod(a, _where(b == 0, 1, b)),
+        scalar_when=lambda a, b: b == 0,
+    ),
+    "safe_divide": VectorKernel(
+        lambda numerator, denominator, default: numerator / _where(denominator == 0, 1, denominator),
+        scalar_when=lambda numerator, denominator, default: denominator == 0,
+    ),
+})
+
+
+def register_vector_kernel(
+    block_name: str,
+    func: Callable[..., Any],
+    rtol: float = 1e-9,
+    atol: float = 1e-12,
+    scalar_when: Optional[Callable[..., Any]] = None,
+) -> None:
+    """
+    Register a NumPy equivalent of the blocks with this name.
+
+    func takes one array per block parameter, by parameter name, and
+    returns an array of results (or a scalar for all rows). scalar_when,
+    called the same way, returns a mask of rows left to the block.
+    """
+    VECTOR_KERNELS[block_name] = VectorKernel(func, rtol, atol, scalar_when)
+
+
+def _column(values: List[Any]) -> Optional[Any]:
+    """values as an int64 or float64 array, or None if they cannot be vectorized."""
+    types = set(map(type, values))
+    if types == {int}:
+        dtype = np.int64
+    elif types <= {int, float}:
+        dtype = np.float64
+    else:
+        return None
+    if max(values) > MAX_ABS_INPUT or min(values) < -MAX_ABS_INPUT:
+        return None
+    column = np.asarray(values, dtype=dtype)
+    if dtype is np.float64 and not np.isfinite(column).all():
+        return None
+    return column
+
+
+def row_outputs(key: str, values: List[Any]) -> List[Tuple[Dict[str, Any], None]]:
+    """One ({key: value}, None) result per value, as execute_many returns them."""
+    with gc_paused():
+        return [({key: value}, None) for value in values]
+
+
+class VectorDispatcher:
+    """Runs execute_many batches through verified kernels (see module docstring)."""
+
+    def __init__(self):
+        self._verified: Dict[str, bool] = {}
+        self._lock = threading.Lock()
+
+    def is_verified(self, block_id: str) -> Optional[bool]:
+        """Whether a block's kernel passed verification (None = not yet checked)."""
+        return self._verified.get(block_id)
+
+    def run(
+        self,
+        block: NeuropBlock,
+        block_id: str,
+        func: Callable[..., Any],
+        rows: List[Dict[str, Any]],
+    ) -> Optional[Tuple[List[Any], Set[int]]]:
+        """
+        Vectorized results of func over rows.
+
+        Returns (results, scalar_rows), where the rows in scalar_rows
+        still need to be executed by func, or None if the batch cannot
+        be vectorized.
+        """
+        if not NUMPY_AVAILABLE or len(rows) < MIN_ROWS:
+            return None
+        kernel = VECTOR_KERNELS.get(block.metadata.name)
+        if kernel is None or self._verified.get(block_id) is False:
+            return None
+
+        names = [param.name for param in block.interface.inputs]
+        if set(map(len, rows)) != {len(names)}:
+            return None
+        columns: Dict[str, Any] = {}
+        try:
+            for name in names:
+                column = _column(list(map(itemgetter(name), rows)))
+                if column is None:
+                    return None
+                columns[name] = column
+        except KeyError:
+            return None
+
+        output_type = block.interface.outputs[0].data_type.value if len(block.interface.outputs) == 1 else None
+        if output_type not in ("integer", "float", "number", "boolean"):
+            return None
+
+        shape = (len(rows),)
+        try:
+            with np.errstate(all="ignore"):
+                values = np.broadcast_to(np.asarray(kernel.func(**columns)), shape)
+                scalar = np.zeros(shape, dtype=bool)
+                if kernel.scalar_when is not None:
+                    scalar |= np.broadcast_to(np.asarray(kernel.scalar_when(**columns), dtype=bool), shape)
+                if values.dtype.kind in "iu":
+                    estimate = np.broadcast_to(np.asarray(kernel.func(**{
+                        name: column.astype(np.float64) for name, column in columns.items()
+                    })), shape)
+                    scalar |= ~(np.abs(estimate) < INT_RESULT_LIMIT)
+                elif values.dtype.kind == "f":
+                    scalar |= ~np.isfinite(values)
+        except Exception:
+            self._verified[block_id] = False
+            return None
+
+        scalar_rows: Set[int] = set()
+        if scalar.any():
+            scalar_rows = set(np.flatnonzero(scalar).tolist())
+            values = np.where(scalar, np.zeros((), dtype=values.dtype), values)
+        if values.dtype.kind == "f" and output_type == "integer":
+            values = values.astype(np.int64)
+        if output_type == "boolean":
+            values = values.astype(bool)
+        results = values.tolist()
+
+        if block_id not in self._verified:
+            with self._lock:
+                if block_id not in self._verified:
+                    self._verified[block_id] = self._verify(kernel, func, rows, results, scalar_rows)
+            if not self._verified[block_id]:
+                return None
+        return results, scalar_rows
+
+    @staticmethod
+    def _verify(
+        kernel: VectorKernel,
+        func: Callable[..., Any],
+        rows: List[Dict[str, Any]],
+        results: List[Any],
+        scalar_rows: Set[int],
+    ) -> bool:
+        """Whether results match func on the first VERIFY_ROWS rows."""
+        for index in range(min(VERIFY_ROWS, len(rows))):
+            if index in scalar_rows:
+                continue
+            try:
+                expected = func(**rows[index])
+            except Exception:
+                return False
+            if isinstance(expected, bool) or isinstance(results[index], bool):
+                if expected is not results[index]:
+                    return False
+            elif not isinstance(expected, (int, float)) or not math.isclose(
+                results[index], expected, rel_tol=kernel.rtol, abs_tol=kernel.atol,
+            ):
+                return False
+        return True
@@ -13,10 +13,12 @@ Instead of keyword matching, it uses:
 4. Pre/postcondition satisfaction
 """
 
-from typing import Dict, List, Optional, Tuple, Set, Any
+from typing import AbstractSet, Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from enum import Enum
 
+from neurop_forge.core.compact import intern_str, intern_strs, slotted
+from neurop_forge.library.registry_bitsets import OrdinalTable, popcount
 from neurop_forge.semantic.intent_schema import (
     SemanticIntent,
     SemanticDomain,
@@ -28,6 +30,7 @@ from neurop_forge.semantic.intent_schema import (
 )
 
 
+@slotted
 @dataclass
 class SemanticIndexEntry:
     """Index entry with full semantic information."""
@@ -56,6 +59,21 @@ class SemanticIndexEntry:
             "is_deterministic": self.is_deterministic,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SemanticIndexEntry":
+        return cls(
+            block_identity=data["block_identity"],
+            name=data["name"],
+            description=data["description"],
+            category=intern_str(data["category"]),
+            semantic_intent=SemanticIntent.from_dict(data["semantic_intent"]),
+            input_data_types=intern_strs(data["input_data_types"]),
+            output_data_types=intern_strs(data["output_data_types"]),
+            trust_score=data["trust_score"],
+            is_pure=data["is_pure"],
+            is_deterministic=data["is_deterministic"],
+        )
+
 
 @dataclass
 class CompositionNode:
@@ -288,42 +306,75 @@ class SemanticComposer:
 
     def __init__(self):
         self._semantic_index: Dict[str, SemanticIndexEntry] = {}
-        self._domain_index: Dict[SemanticDomain, Set[str]] = {}
-        self._operation_index: Dict[SemanticOperation, Set[str]] = {}
-        self._semantic_type_index: Dict[SemanticType, Set[str]] = {}
+        # Domain, operation and type indexes are bitmasks over block ordinals,
+        # so filtering by the verified set is one bitwise AND.
+        self._ordinals = OrdinalTable()
+        self._domain_index: Dict[SemanticDomain, int] = {}
+        self._operation_index: Dict[SemanticOperation, int] = {}
+        self._semantic_type_index: Dict[SemanticType, int] = {}
         self._query_parser = QueryIntentParser()
-        self._verified_block_ids: Optional[Set[str]] = None
+        self._verified_block_ids: Optional[AbstractSet[str]] = None
+        self._verified_bits = 0
     
-    def set_verified_blocks(self, verified_ids: Set[str]) -> None:
+    def copy(self) -> "SemanticComposer":
+        """An independent composer with the same entries and verified filter."""
+        composer = SemanticComposer()
+        composer._semantic_index = dict(self._semantic_index)
+        composer._ordinals = self._ordinals.copy()
+        composer._domain_index = dict(self._domain_index)
+        composer._operation_index = dict(self._operation_index)
+        composer._semantic_type_index = dict(self._semantic_type_index)
+        composer._verified_block_ids = self._verified_block_ids
+        composer._verified_bits = self._verified_bits
+        return composer
+
+    def set_verified_blocks(self, verified_ids: AbstractSet[str]) -> None:
         """Set the list of verified block IDs. Only these will be used in composition."""
         self._verified_block_ids = verified_ids
+        self._verified_bits = self._ordinals.mask(verified_ids)
     
     def clear_verified_filter(self) -> None:
         """Clear the verified filter to use all blocks."""
         self._verified_block_ids = None
+        self._verified_bits = 0
 
     def index_block(self, entry: SemanticIndexEntry) -> None:
         """Index a block for semantic search."""
-        self._semantic_index[entry.block_identity] = entry
-        
-        domain = entry.semantic_intent.domain
-        if domain not in self._domain_index:
-            self._domain_index[domain] = set()
-        self._domain_index[domain].add(entry.block_identity)
-        
-        operation = entry.semantic_intent.operation
-        if operation not in self._operation_index:
-            self._operation_index[operation] = set()
-        self._operation_index[operation].add(entry.block_identity)
-        
-        for sem_type in entry.semantic_intent.input_semantic_types:
-            if sem_type not in self._semantic_type_index:
-                self._semantic_type_index[sem_type] = set()
-            self._semantic_type_index[sem_type].add(entry.block_identity)
-        for sem_type in entry.semantic_intent.output_semantic_types:
-            if sem_type not in self._semantic_type_index:
-                self._semantic_type_index[sem_type] = set()
-            self._semantic_type_index[sem_type].add(entry.block_identity)
+        identity = entry.block_identity
+        if identity in self._semantic_index:
+            self.remove_block(identity)
+        self._semantic_index[identity] = entry
+        bit = 1 << self._ordinals.add(identity)
+        
+        for index, key in self._index_keys(entry):
+            index[key] = index.get(key, 0) | bit
+        if self._verified_block_ids is not None and identity in self._verified_block_ids:
+            self._verified_bits |= bit
+
+    def _index_keys(self, entry: SemanticIndexEntry) -> List[Tuple[Dict[Any, int], Any]]:
+        intent = entry.semantic_intent
+        return (
+            [(self._domain_index, intent.domain), (self._operation_index, intent.operation)]
+            + [(self._semantic_type_index, t) for t in intent.input_semantic_types]
+            + [(self._semantic_type_index, t) for t in intent.output_semantic_types]
+        )
+
+    def remove_block(self, block_identity: str) -> bool:
+        """Remove a block from the semantic index. Returns True if it was indexed."""
+        entry = self._semantic_index.pop(block_identity, None)
+        if entry is None:
+            return False
+        
+        ordinal = self._ordinals.discard(block_identity)
+        clear = ~(1 << ordinal)
+        for index, key in self._index_keys(entry):
+            bits = index.get(key, 0) & clear
+            if bits:
+                index[key] = bits
+            else:
+                index.pop(key, None)
+        self._verified_bits &= clear
+        return True
 
     def compose(
         self,
@@ -433,20 +484,20 @@ class SemanticComposer:
         query_words: Optional[List[str]] = None,
     ) -> List[SemanticIndexEntry]:
         """Find blocks matching a semantic domain, with text matching against query words."""
-        block_ids = self._domain_index.get(domain, set())
+        block_bits = self._domain_index.get(domain, 0)
         
-        if not block_ids:
+        if not block_bits:
             fallback_domains = self._get_fallback_domains(domain)
             for fallback in fallback_domains:
-                block_ids = self._domain_index.get(fallback, set())
-                if block_ids:
+                block_bits = self._domain_index.get(fallback, 0)
+                if block_bits:
                     break
         
         if self._verified_block_ids is not None:
-            block_ids = block_ids.intersection(self._verified_block_ids)
+            block_bits &= self._verified_bits
         
         candidates: List[SemanticIndexEntry] = []
-        for block_id in block_ids:
+        for block_id in self._ordinals.iter_bits(block_bits):
             entry = self._semantic_index.get(block_id)
             if entry and entry.trust_score >= min_trust:
                 candidates.append(entry)
@@ -566,16 +617,23 @@ class SemanticComposer:
         }
         return fallback_map.get(domain, [SemanticDomain.UTILITY])
 
+    def get_entries(self) -> List[SemanticIndexEntry]:
+        """Get all semantic index entries."""
+        return list(self._semantic_index.values())
+
     def get_blocks_by_domain(self, domain: SemanticDomain) -> List[SemanticIndexEntry]:
         """Get all blocks in a semantic domain."""
-        block_ids = self._domain_index.get(domain, set())
-        return [self._semantic_index[bid] for bid in block_ids if bid in self._semantic_index]
+        block_bits = self._domain_index.get(domain, 0)
+        return [
+            self._semantic_index[bid] for bid in self._ordinals.iter_bits(block_bits)
+            if bid in self._semantic_index
+        ]
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get semantic index statistics."""
         return {
             "total_blocks": len(self._semantic_index),
-            "domains": {d.value: len(ids) for d, ids in self._domain_index.items()},
-            "operations": {o.value: len(ids) for o, ids in self._operation_index.items()},
-            "semantic_types": {t.value: len(ids) for t, ids in self._semantic_type_index.items()},
+            "domains": {d.value: popcount(bits) for d, bits in self._domain_index.items()},
+            "operations": {o.value: popcount(bits) for o, bits in self._operation_index.items()},
+            "semantic_types": {t.value: popcount(bits) for t, bits in self._semantic_type_index.items()},
         }
@@ -16,6 +16,8 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional, Any, Tuple, Set
 from enum import Enum
 
+from neurop_forge.core.compact import shared, slotted
+
 
 class SemanticDomain(Enum):
     """Semantic domain of functionality."""
@@ -110,6 +112,7 @@ class SemanticType(Enum):
     GENERIC = "generic"
 
 
+@slotted(weakref=True)
 @dataclass(frozen=True)
 class SemanticIntent:
     """
@@ -146,7 +149,7 @@ class SemanticIntent:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "SemanticIntent":
-        return cls(
+        return shared(cls(
             domain=SemanticDomain(data["domain"]),
             operation=SemanticOperation(data["operation"]),
             input_semantic_types=tuple(SemanticType(t) for t in data["input_semantic_types"]),
@@ -155,7 +158,7 @@ class SemanticIntent:
             postconditions=tuple(data["postconditions"]),
             can_chain_from=tuple(SemanticDomain(d) for d in data["can_chain_from"]),
             can_chain_to=tuple(SemanticDomain(d) for d in data["can_chain_to"]),
-        )
+        ))
 
 
 DOMAIN_CHAIN_RULES = {
@@ -10,6 +10,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+from neurop_forge.library.packed_archive import iter_block_records
+from neurop_forge.library.parallel_loader import LoadTarget, load_library_files
 from neurop_forge.standardization.parameter_mapper import (
     ParameterMapper,
     BlockMappingResult,
@@ -37,10 +39,12 @@ class InterfaceNormalizer:
         library_path: str = ".neurop_expanded_library",
         output_path: Optional[str] = None,
         min_confidence: MappingConfidence = MappingConfidence.MEDIUM,
+        workers: Optional[int] = None,
     ):
         self.library_path = Path(library_path)
         self.output_path = Path(output_path) if output_path else self.library_path
         self.min_confidence = min_confidence
+        self.workers = workers
         self._mapper = ParameterMapper()
         self._result = NormalizationResult()
     
@@ -61,11 +65,8 @@ class InterfaceNormalizer:
         mapping_results: List[BlockMappingResult] = []
         blocks_with_changes = 0
         
-        for block_file in self.library_path.glob("*.json"):
+        for _, block_data in iter_block_records(self.library_path, workers=self.workers):
             try:
-                with open(block_file) as f:
-                    block_data = json.load(f)
-                
                 block_id = block_data.get("identity", {}).get("hash_value", "")
                 block_name = block_data.get("metadata", {}).get("name", "")
                 inputs = block_data.get("interface", {}).get("inputs", [])
@@ -121,24 +122,27 @@ class InterfaceNormalizer:
         if execute and self.output_path != self.library_path:
             self.output_path.mkdir(parents=True, exist_ok=True)
         
-        for block_file in self.library_path.glob("*.json"):
+        loaded = load_library_files(self.library_path, LoadTarget.DATA, workers=self.workers)
+        for error in loaded.errors:
+            self._result.errors.append(f"{Path(error.path).name}: {error.error}")
+        
+        for block_stem, block_data in loaded.records:
+            file_name = f"{block_stem}.json"
             try:
-                self._process_block(block_file, execute, preserve_aliases)
+                self._process_block(file_name, block_data, execute, preserve_aliases)
             except Exception as e:
-                self._result.errors.append(f"{block_file.name}: {str(e)}")
+                self._result.errors.append(f"{file_name}: {str(e)}")
         
         return self._result
     
     def _process_block(
         self,
-        block_file: Path,
+        file_name: str,
+        block_data: Dict[str, Any],
         execute: bool,
         preserve_aliases: bool,
     ) -> None:
-        """Process a single block file."""
-        with open(block_file) as f:
-            block_data = json.load(f)
-        
+        """Process a single block (loaded from library_path/file_name)."""
         self._result.blocks_processed += 1
         
         block_id = block_data.get("identity", {}).get("hash_value", "")
@@ -152,7 +156,7 @@ class InterfaceNormalizer:
         
         if not mapping_result.has_changes:
             if execute and self.output_path != self.library_path:
-                output_file = self.output_path / block_file.name
+                output_file = self.output_path / file_name
                 with open(output_file, "w") as f:
                     json.dump(block_data, f, indent=2)
             return
@@ -164,7 +168,7 @@ class InterfaceNormalizer:
         
         if not high_confidence_mappings:
             if execute and self.output_path != self.library_path:
-                output_file = self.output_path / block_file.name
+                output_file = self.output_path / file_name
                 with open(output_file, "w") as f:
                     json.dump(block_data, f, indent=2)
             return
@@ -190,7 +194,7 @@ class InterfaceNormalizer:
                 inp["original_name"] = param_name
         
         if execute:
-            output_file = self.output_path / block_file.name
+            output_file = self.output_path / file_name
             with open(output_file, "w") as f:
                 json.dump(block_data, f, indent=2)
     
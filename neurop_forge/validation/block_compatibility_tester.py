@@ -8,12 +8,15 @@ Tests all Tier-A blocks for:
 - Input/output validation
 """
 
-import json
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import AbstractSet, Dict, List, Any, Optional, Tuple
 from collections import defaultdict
 from dataclasses import dataclass, field
 
+from neurop_forge.library.block_header import BlockHeader
+from neurop_forge.library.packed_archive import iter_block_records
+from neurop_forge.library.registry_bitsets import load_registry_bitsets
+
 
 @dataclass
 class BlockTestResult:
@@ -59,8 +62,8 @@ class BlockCompatibilityTester:
         self.library_path = Path(library_path)
         self.registry_path = Path(registry_path)
         self._blocks: Dict[str, Any] = {}
-        self._verified_ids: set = set()
-        self._tier_a_ids: set = set()
+        self._verified_ids: AbstractSet[str] = set()
+        self._tier_a_ids: AbstractSet[str] = set()
         self._name_to_ids: Dict[str, List[str]] = defaultdict(list)
         
     def load_blocks(self) -> int:
@@ -69,11 +72,9 @@ class BlockCompatibilityTester:
             return 0
             
         count = 0
-        for block_file in self.library_path.glob("*.json"):
+        for block_stem, block_data in iter_block_records(self.library_path):
             try:
-                with open(block_file) as f:
-                    block_data = json.load(f)
-                block_id = block_data.get("identity", {}).get("hash_value", block_file.stem)
+                block_id = block_data.get("identity", {}).get("hash_value", block_stem)
                 self._blocks[block_id] = block_data
                 
                 name = block_data.get("metadata", {}).get("name", "")
@@ -83,24 +84,26 @@ class BlockCompatibilityTester:
             except Exception:
                 continue
         
-        registry_file = self.registry_path / "registry.json"
-        if registry_file.exists():
-            with open(registry_file) as f:
-                registry = json.load(f)
-            verified_blocks = registry.get("verified_blocks", [])
-            if isinstance(verified_blocks, dict):
-                self._verified_ids = set(verified_blocks.keys())
-            else:
-                self._verified_ids = set(verified_blocks)
-        
-        tier_file = self.registry_path / "tier_registry.json"
-        if tier_file.exists():
-            with open(tier_file) as f:
-                tier_data = json.load(f)
-            self._tier_a_ids = set(tier_data.get("tier_a", []))
+        registries = load_registry_bitsets(
+            self.registry_path,
+            self.library_path,
+            headers=self._iter_headers,
+        )
+        self._verified_ids = registries.flag("verified")
+        self._tier_a_ids = registries.flag("tier_a")
                 
         return count
     
+    def _iter_headers(self) -> List[BlockHeader]:
+        """Headers of the loaded blocks (malformed blocks are skipped)."""
+        headers = []
+        for block_data in self._blocks.values():
+            try:
+                headers.append(BlockHeader.from_block_data(block_data))
+            except (KeyError, TypeError):
+                continue
+        return headers
+    
     def find_duplicate_names(self) -> Dict[str, List[str]]:
         """Find blocks that share the same name."""
         duplicates = {}
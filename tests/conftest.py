@@ -0,0 +1,112 @@
+"""
+Shared fixtures for Neurop Forge unit tests.
+"""
+import copy
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import pytest
+
+from neurop_forge.core.block_schema import NeuropBlock
+from neurop_forge.runtime.executor import BlockExecutor
+from neurop_forge.semantic.composer import CompositionNode, SemanticGraph
+from neurop_forge.semantic.intent_schema import SemanticDomain, SemanticIntent, SemanticOperation
+
+LIBRARY_PATH = Path(__file__).resolve().parent.parent / ".neurop_expanded_library"
+
+NODE_INTENT = SemanticIntent(
+    domain=SemanticDomain.CALCULATION,
+    operation=SemanticOperation.TRANSFORM,
+    input_semantic_types=(),
+    output_semantic_types=(),
+    preconditions=(),
+    postconditions=(),
+    can_chain_from=(),
+    can_chain_to=(),
+)
+
+
+def make_graph(*nodes: Any) -> SemanticGraph:
+    """Graph of (identity, input_sources) nodes, in order."""
+    return SemanticGraph(
+        query="test",
+        intent_analysis={},
+        nodes=tuple(
+            CompositionNode(
+                block_identity=identity,
+                block_name=identity,
+                semantic_intent=NODE_INTENT,
+                position=position,
+                why_selected="test",
+                input_sources=tuple(sources),
+                output_targets=(),
+            )
+            for position, (identity, sources) in enumerate(nodes)
+        ),
+        edges=(),
+        is_valid=True,
+        validation_details=(),
+        total_trust_score=1.0,
+        composition_confidence=1.0,
+    )
+
+
+class ScriptedExecutor(BlockExecutor):
+    """Returns the scripted errors for the first calls, then runs blocks."""
+
+    def __init__(self, errors: Iterable[str] = (), **kwargs: Any):
+        super().__init__(**kwargs)
+        self.errors = list(errors)
+        self.calls = 0
+
+    def execute(self, block, inputs):
+        self.calls += 1
+        if self.errors:
+            return {}, self.errors.pop(0)
+        return super().execute(block, inputs)
+
+
+@pytest.fixture(scope="session")
+def library_block():
+    """Load the first library block with a given name (and parameter names)."""
+    cache = {}
+
+    def load(name: str, inputs: Optional[List[str]] = None) -> NeuropBlock:
+        key = (name, tuple(inputs) if inputs is not None else None)
+        if key not in cache:
+            for path in sorted(LIBRARY_PATH.glob("*.json")):
+                data = json.loads(path.read_bytes())
+                if data.get("metadata", {}).get("name") != name:
+                    continue
+                params = [param["name"] for param in data["interface"]["inputs"]]
+                if inputs is None or params == list(inputs):
+                    cache[key] = NeuropBlock.from_dict(data)
+                    break
+            else:
+                pytest.skip(f"block {name} not in library")
+        return cache[key]
+
+    return load
+
+
+@pytest.fixture(scope="session")
+def custom_block(library_block):
+    """
+    Build a block with its own logic from the absolute_value template.
+
+    The logic defines a function named like the block with one parameter,
+    value; constraints overrides fields of the block's constraints.
+    """
+    template = library_block("absolute_value").to_dict()
+
+    def build(name: str, logic: str, **constraints: Any) -> NeuropBlock:
+        data: Dict[str, Any] = copy.deepcopy(template)
+        data["metadata"]["name"] = name
+        data["logic"] = logic
+        data["identity"]["hash_value"] = hashlib.sha256(logic.encode()).hexdigest()
+        data["constraints"].update(constraints)
+        return NeuropBlock.from_dict(data)
+
+    return build
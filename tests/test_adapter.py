@@ -0,0 +1,145 @@
+"""
+Tests for cached input-binding plans (runtime.adapter).
+"""
+import json
+
+import pytest
+
+from neurop_forge.core.block_schema import NeuropBlock
+from neurop_forge.runtime.adapter import FunctionAdapter, FunctionSignature, SemanticInputMapper
+from tests.conftest import LIBRARY_PATH
+
+MISSING_FALLBACKS = (("str", ""), ("int", 0), ("float", 0.0), ("bool", False), ("list", []), ("dict", {}))
+
+
+def reference_adapt(signature, available_inputs, interface_inputs):
+    """Per-call binding as FunctionAdapter did it before binding plans."""
+    mapper = SemanticInputMapper()
+    mapped, missing = {}, []
+    for i, param in enumerate(signature.parameters):
+        if param in mapper.GENERATED_PARAMS:
+            if interface_inputs and i < len(interface_inputs):
+                match = mapper.find_best_match(interface_inputs[i].name, available_inputs)
+                if match is not None:
+                    mapped[param] = available_inputs[match]
+                    continue
+            if available_inputs:
+                values = list(available_inputs.values())
+                mapped[param] = values[i] if i < len(values) else values[0]
+                continue
+        match = mapper.find_best_match(param, available_inputs)
+        if match is not None:
+            mapped[param] = available_inputs[match]
+        elif param in signature.defaults:
+            mapped[param] = signature.defaults[param]
+        elif param in signature.required:
+            missing.append(param)
+    for param in missing:
+        if available_inputs:
+            mapped[param] = list(available_inputs.values())[0]
+            continue
+        annotation = str(signature.annotations.get(param, ""))
+        mapped[param] = next(
+            (value for name, value in MISSING_FALLBACKS if name in annotation), None
+        )
+    return mapped
+
+
+def input_shapes(names):
+    """Input dicts of several key shapes for a block's interface names."""
+    yield {name: f"{name}-value" for name in names}
+    yield {name: index for index, name in enumerate(reversed(names))}
+    yield {name.upper(): index for index, name in enumerate(names)}
+    yield {"text": "hello", "value": 3, "items": [1, 2]}
+    yield {"unrelated": 1}
+    yield {}
+
+
+def library_sample(count=300):
+    for path in sorted(LIBRARY_PATH.glob("*.json"))[:count]:
+        yield NeuropBlock.from_dict(json.loads(path.read_bytes()))
+
+
+class TestBindingPlanParity:
+    """Cached plans bind exactly what the per-call matcher bound."""
+
+    def test_library_blocks(self):
+        adapter = FunctionAdapter()
+        checked = 0
+        for block in library_sample():
+            block_id = block.get_identity_hash()
+            logic = block.logic.strip()
+            func_name = block.metadata.name
+            signature = adapter.get_signature(block_id, logic, func_name)
+            if signature is None:
+                continue
+            interface = list(block.interface.inputs)
+            for inputs in input_shapes([param.name for param in interface]):
+                expected = reference_adapt(signature, inputs, interface)
+                for _ in range(2):
+                    adapted, error = adapter.adapt_inputs(block_id, logic, func_name, inputs, interface)
+                    assert error is None
+                    assert adapted == expected
+                    assert list(adapted) == list(expected)
+                checked += 1
+        assert checked > 1000
+        assert adapter.get_plan_statistics()["hits"] >= checked
+
+    def test_plan_binds_new_values_of_the_same_shape(self):
+        adapter = FunctionAdapter()
+        source = "def scale(value, factor=2):\n    return value * factor\n"
+        first, _ = adapter.adapt_inputs("scale", source, "scale", {"value": 1})
+        second, _ = adapter.adapt_inputs("scale", source, "scale", {"value": 5})
+        assert first == {"value": 1, "factor": 2}
+        assert second == {"value": 5, "factor": 2}
+        assert adapter.get_plan_statistics()["hits"] == 1
+
+
+class TestPlanKeying:
+    """Plans are keyed by block and by input keys in order."""
+
+    SOURCE = "def pair(v1, v2):\n    return (v1, v2)\n"
+
+    def test_key_order_changes_generated_bindings(self):
+        adapter = FunctionAdapter()
+        forward, _ = adapter.adapt_inputs("pair", self.SOURCE, "pair", {"a": 1, "b": 2})
+        backward, _ = adapter.adapt_inputs("pair", self.SOURCE, "pair", {"b": 2, "a": 1})
+        assert forward == {"v1": 1, "v2": 2}
+        assert backward == {"v1": 2, "v2": 1}
+        assert adapter.get_plan_statistics()["misses"] == 2
+
+    def test_plans_are_per_block(self):
+        adapter = FunctionAdapter()
+        other = "def pair(x, v2=0):\n    return (x, v2)\n"
+        adapter.adapt_inputs("pair", self.SOURCE, "pair", {"a": 1})
+        adapted, _ = adapter.adapt_inputs("other", other, "pair", {"a": 1})
+        assert adapted == {"x": 1, "v2": 1}
+        assert adapter.get_plan_statistics()["misses"] == 2
+
+    def test_fresh_fallback_values(self):
+        adapter = FunctionAdapter()
+        source = "def collect(items: list):\n    items.append(1)\n    return items\n"
+        first, _ = adapter.adapt_inputs("collect", source, "collect", {})
+        first["items"].append("mutated")
+        second, _ = adapter.adapt_inputs("collect", source, "collect", {})
+        assert second == {"items": []}
+
+    def test_cache_is_bounded(self):
+        adapter = FunctionAdapter(plan_cache_size=2)
+        for key in ("a", "b", "c"):
+            adapter.adapt_inputs("pair", self.SOURCE, "pair", {key: 1})
+        assert adapter.get_plan_statistics()["size"] == 2
+
+    def test_cache_can_be_disabled(self):
+        adapter = FunctionAdapter(plan_cache_size=0)
+        for _ in range(2):
+            assert adapter.adapt_inputs("pair", self.SOURCE, "pair", {"a": 1})[0] == {"v1": 1, "v2": 1}
+        assert adapter.get_plan_statistics()["size"] == 0
+
+    @pytest.mark.parametrize("inputs", [{"email_address": "a@b.c"}, {"mail": "a@b.c"}, {"EMAIL": "a@b.c"}])
+    def test_map_inputs_uses_the_same_plan(self, inputs):
+        mapper = SemanticInputMapper()
+        signature = FunctionSignature.from_source("def check(email):\n    return email\n", "check")
+        mapped, missing = mapper.map_inputs(signature, inputs)
+        assert mapped == reference_adapt(signature, inputs, None)
+        assert missing == []
@@ -0,0 +1,172 @@
+"""
+Tests for awaitable graph execution (runtime.async_executor).
+"""
+import asyncio
+import threading
+import time
+
+from neurop_forge.runtime.async_executor import AsyncGraphExecutor
+from neurop_forge.runtime.executor import BlockExecutor, GraphExecutor
+from neurop_forge.runtime.guards import ExecutionGuard, RetryPolicy
+from neurop_forge.runtime.result import ExecutionStatus
+from tests.conftest import ScriptedExecutor, make_graph
+
+DOUBLE = '''def double_value(value):
+    return value * 2
+'''
+
+DIVIDE = '''def invert_value(value):
+    return 1 / value
+'''
+
+
+class BlockingExecutor(BlockExecutor):
+    """Block calls wait until released (or five seconds pass)."""
+
+    def __init__(self):
+        super().__init__()
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def execute(self, block, inputs):
+        self.started.set()
+        self.release.wait(5.0)
+        return super().execute(block, inputs)
+
+
+def traced(result):
+    return [
+        (t.node_id, t.status, t.inputs, t.outputs, t.error, t.retry_count)
+        for t in result.traces
+    ]
+
+
+def register(executor, blocks):
+    for identity, block in blocks.items():
+        executor.register_block(identity, block)
+    return executor
+
+
+async def cancel_when(event, guard):
+    """Cancel the guard once a threading.Event is set."""
+    await asyncio.get_running_loop().run_in_executor(None, event.wait, 5.0)
+    guard.cancel()
+
+
+class TestParity:
+    """execute() gives what GraphExecutor.execute gives."""
+
+    def test_chain_with_mock_and_failed_nodes(self, custom_block):
+        blocks = {
+            "a": custom_block("double_value", DOUBLE),
+            "b": custom_block("invert_value", DIVIDE),
+        }
+        graph = make_graph(("a", []), ("missing", []), ("b", ["a"]), ("a", ["a"]))
+        for inputs in ({"value": 2}, {"value": 0}):
+            expected = register(GraphExecutor(), blocks).execute(graph, inputs)
+            actual = asyncio.run(register(AsyncGraphExecutor(), blocks).execute(graph, inputs))
+            assert actual.status == expected.status
+            assert actual.final_outputs == expected.final_outputs
+            assert traced(actual) == traced(expected)
+
+    def test_view_shares_blocks_and_circuits(self, custom_block):
+        graph_executor = GraphExecutor()
+        async_executor = AsyncGraphExecutor.from_graph_executor(graph_executor)
+        graph_executor.register_block("a", custom_block("double_value", DOUBLE))
+        result = asyncio.run(async_executor.execute(make_graph(("a", [])), {"value": 4}))
+        assert result.final_outputs == {"result": 8}
+        assert async_executor._get_circuit_breaker("a") is graph_executor._get_circuit_breaker("a")
+
+
+class TestCancellation:
+    """The guard interrupts a node that is waiting."""
+
+    def test_cancel_while_a_block_runs(self, custom_block):
+        block_executor = BlockingExecutor()
+        executor = register(
+            AsyncGraphExecutor(block_executor=block_executor),
+            {"a": custom_block("double_value", DOUBLE)},
+        )
+        guard = ExecutionGuard(timeout_ms=10000)
+
+        async def main():
+            canceller = asyncio.ensure_future(cancel_when(block_executor.started, guard))
+            started = time.perf_counter()
+            try:
+                result = await executor.execute(make_graph(("a", []), ("a", [])), {"value": 1}, guard=guard)
+            finally:
+                block_executor.release.set()
+            await canceller
+            return result, time.perf_counter() - started
+
+        result, elapsed = asyncio.run(main())
+        assert elapsed < 2.0
+        assert result.status == ExecutionStatus.CANCELLED
+        assert [t.status for t in result.traces] == [ExecutionStatus.CANCELLED]
+        assert result.error == "Execution cancelled"
+
+    def test_timeout_while_a_block_runs(self, custom_block):
+        block_executor = BlockingExecutor()
+        executor = register(
+            AsyncGraphExecutor(block_executor=block_executor, default_timeout_ms=100),
+            {"a": custom_block("double_value", DOUBLE)},
+        )
+
+        async def main():
+            started = time.perf_counter()
+            try:
+                result = await executor.execute(make_graph(("a", [])), {"value": 1})
+            finally:
+                block_executor.release.set()
+            return result, time.perf_counter() - started
+
+        result, elapsed = asyncio.run(main())
+        assert elapsed < 2.0
+        assert result.status == ExecutionStatus.TIMEOUT
+        assert result.traces[0].status == ExecutionStatus.TIMEOUT
+
+    def test_cancel_during_backoff(self, custom_block):
+        block_executor = ScriptedExecutor(["ConnectionError: reset"] * 3)
+        executor = register(
+            AsyncGraphExecutor(
+                block_executor=block_executor,
+                retry_policy=RetryPolicy(max_retries=3, initial_delay_ms=5000.0),
+            ),
+            {"a": custom_block("double_value", DOUBLE)},
+        )
+        guard = ExecutionGuard(timeout_ms=20000)
+
+        async def main():
+            async def cancel_after_first_call():
+                while block_executor.calls == 0:
+                    await asyncio.sleep(0.01)
+                guard.cancel()
+
+            canceller = asyncio.ensure_future(cancel_after_first_call())
+            result = await executor.execute(make_graph(("a", [])), {"value": 1}, guard=guard)
+            await canceller
+            return result
+
+        started = time.perf_counter()
+        result = asyncio.run(main())
+        assert time.perf_counter() - started < 2.0
+        assert block_executor.calls == 1
+        assert result.status == ExecutionStatus.CANCELLED
+        assert executor.get_retry_statistics()["retries"] == 1
+
+    def test_backoff_past_the_timeout_fails_without_sleeping(self, custom_block):
+        block_executor = ScriptedExecutor(["ConnectionError: reset"] * 3)
+        executor = register(
+            AsyncGraphExecutor(
+                block_executor=block_executor,
+                default_timeout_ms=300,
+                retry_policy=RetryPolicy(max_retries=3, initial_delay_ms=1000.0),
+            ),
+            {"a": custom_block("double_value", DOUBLE)},
+        )
+        started = time.perf_counter()
+        result = asyncio.run(executor.execute(make_graph(("a", [])), {"value": 1}))
+        assert time.perf_counter() - started < 0.3
+        assert result.status == ExecutionStatus.FAILED
+        assert result.traces[0].error == "ConnectionError: reset"
+        assert executor.get_retry_statistics()["budget_skipped"] == 1
@@ -0,0 +1,138 @@
+"""
+Tests for batch execution over many input rows (BlockExecutor.execute_many
+and NeuropForge.execute_block_batch), on the scalar path.
+
+Every batch result must be what execute() returns for that row.
+"""
+import pytest
+
+from neurop_forge.api import NeuropForge
+from neurop_forge.library.block_store import BlockStore
+from neurop_forge.runtime.executor import BlockExecutor
+from neurop_forge.runtime.result_cache import ResultCache
+from neurop_forge.runtime.trust_tracker import get_trust_tracker
+
+INVERT = '''def invert_batch_value(value):
+    return 1 / value
+'''
+
+WRAP = '''def wrap_batch_value(value):
+    return [value]
+'''
+
+
+def execution_counts(block):
+    stats = get_trust_tracker().get_execution_stats(block.get_identity_hash())
+    if stats is None:
+        return 0, 0
+    return stats.success_count, stats.failure_count
+
+
+class TestExecuteMany:
+    """execute_many() over rows, compiled once."""
+
+    def test_matches_execute_in_order(self, custom_block):
+        block = custom_block("invert_batch_value", INVERT)
+        rows = [{"value": value} for value in (1, 2, 4, 5, 8, 10)]
+        rows.append({"value": 16, "unused": True})
+        executor = BlockExecutor()
+        assert executor.execute_many(block, rows) == [executor.execute(block, row) for row in rows]
+
+    def test_failing_rows_do_not_stop_the_batch(self, custom_block):
+        block = custom_block("invert_batch_value", INVERT)
+        rows = [{"value": 2}, {"value": 0}, {"value": 4}, {"value": "x"}, {"value": 5}]
+        results = BlockExecutor().execute_many(block, rows)
+        assert [error is None for _, error in results] == [True, False, True, False, True]
+        assert results[1] == ({}, "ZeroDivisionError: division by zero")
+        assert results[3][1].startswith("TypeError")
+        assert [outputs for outputs, _ in results][::2] == [{"result": 0.5}, {"result": 0.25}, {"result": 0.2}]
+
+    def test_trust_recorded_once_per_row(self, custom_block):
+        block = custom_block("invert_batch_value", INVERT)
+        before = execution_counts(block)
+        BlockExecutor().execute_many(block, [{"value": 1}, {"value": 0}, {"value": 2}])
+        after = execution_counts(block)
+        assert (after[0] - before[0], after[1] - before[1]) == (2, 1)
+
+    def test_missing_function_fails_every_row(self, custom_block):
+        block = custom_block("not_defined_here", "def defined_elsewhere(value):\n    return value\n")
+        results = BlockExecutor().execute_many(block, [{"value": 1}, {"value": 2}])
+        assert results == [({"result": None}, "Function not_defined_here not found in block logic")] * 2
+
+    def test_compile_error_fails_every_row(self, custom_block):
+        block = custom_block("broken_batch", "def broken_batch(value):\n    return (\n")
+        results = BlockExecutor().execute_many(block, [{"value": 1}, {"value": 2}])
+        assert [outputs for outputs, _ in results] == [{}, {}]
+        assert all(error.startswith("SyntaxError") for _, error in results)
+
+    def test_empty_batch(self, custom_block):
+        assert BlockExecutor().execute_many(custom_block("wrap_batch_value", WRAP), []) == []
+
+
+class TestExecuteManyResultCache:
+    """Rows of pure blocks are answered from the result cache."""
+
+    def test_repeated_rows_hit_the_cache(self, custom_block):
+        cache = ResultCache()
+        executor = BlockExecutor(result_cache=cache)
+        block = custom_block("wrap_batch_value", WRAP)
+        rows = [{"value": 1}, {"value": 2}, {"value": 1}, {"value": 1.0}]
+        first = executor.execute_many(block, rows)
+        assert first == [({"result": [value]}, None) for value in (1, 2, 1, 1.0)]
+        stats = cache.get_statistics()
+        assert (stats["hits"], stats["entries"]) == (1, 3)
+
+        before = execution_counts(block)
+        assert executor.execute_many(block, rows) == first
+        assert cache.get_statistics()["hits"] == 5
+        assert execution_counts(block) == before
+
+    def test_cached_outputs_are_copies(self, custom_block):
+        executor = BlockExecutor(result_cache=ResultCache())
+        block = custom_block("wrap_batch_value", WRAP)
+        (outputs, _), = executor.execute_many(block, [{"value": 3}])
+        outputs["result"].append("mutated")
+        assert executor.execute_many(block, [{"value": 3}]) == [({"result": [3]}, None)]
+
+    def test_failures_are_not_cached(self, custom_block):
+        cache = ResultCache()
+        executor = BlockExecutor(result_cache=cache)
+        block = custom_block("invert_batch_value", INVERT)
+        executor.execute_many(block, [{"value": 0}, {"value": 0}])
+        assert len(cache) == 0
+
+
+@pytest.fixture
+def forge(tmp_path, custom_block):
+    """A NeuropForge API over a store holding the invert and wrap blocks."""
+    store = BlockStore(storage_path=str(tmp_path / "library"))
+    invert = custom_block("invert_batch_value", INVERT)
+    wrap = custom_block("wrap_batch_value", WRAP)
+    for block in (invert, wrap):
+        store.store(block)
+    api = NeuropForge(auto_load=False)
+    api._block_store = store
+    api._verified_ids = {invert.get_identity_hash(), wrap.get_identity_hash()}
+    api._tier_a_ids = {invert.get_identity_hash()}
+    api._name_to_id = {"invert_batch_value": invert.get_identity_hash()}
+    api._initialized = True
+    return api
+
+
+class TestExecuteBlockBatch:
+    """The public batch API formats each row like execute_block."""
+
+    def test_rows_in_order_with_errors(self, forge):
+        rows = [{"value": 4}, {"value": 0}, {"value": 2}]
+        results = forge.execute_block_batch("invert_batch_value", rows)
+        assert results == [forge.execute_block("invert_batch_value", row) for row in rows]
+        assert results[0] == {"result": 0.25, "success": True}
+        assert results[1]["success"] is False
+        assert "ZeroDivisionError" in results[1]["error"]
+
+    def test_tier_check_applies_to_the_batch(self, forge):
+        wrap_id = next(iter(forge._verified_ids - forge._tier_a_ids))
+        with pytest.raises(ValueError, match="Tier-B"):
+            forge.execute_block_batch(wrap_id, [{"value": 1}])
+        results = forge.execute_block_batch(wrap_id, [{"value": 1}], tier_a_only=False)
+        assert results == [{"result": [1], "success": True}]
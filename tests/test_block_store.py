@@ -0,0 +1,240 @@
+"""
+Tests for BlockStore (library.block_store).
+"""
+import json
+import shutil
+
+import pytest
+
+from neurop_forge.library.block_header import BlockHeader
+from neurop_forge.library.block_store import BlockStore
+from neurop_forge.library.packed_archive import write_packed_library
+from tests.conftest import LIBRARY_PATH
+
+
+@pytest.fixture
+def library(tmp_path):
+    """A library directory of ten blocks copied from the expanded library."""
+    path = tmp_path / "library"
+    path.mkdir()
+    for source in sorted(LIBRARY_PATH.glob("*.json"))[:10]:
+        shutil.copy(source, path / source.name)
+    return path
+
+
+def open_store(library, tmp_path, **options):
+    return BlockStore(
+        storage_path=str(library),
+        quarantine_path=str(tmp_path / "quarantine"),
+        **options,
+    )
+
+
+def identity_of(path):
+    return json.loads(path.read_bytes())["identity"]["hash_value"]
+
+
+class TestLazyHydration:
+    """Lazy stores build blocks on first use and report blocks that fail."""
+
+    def test_blocks_hydrate_on_demand(self, library, tmp_path):
+        store = open_store(library, tmp_path, lazy=True, hydrated_cache_size=3)
+        for path in sorted(library.glob("*.json")):
+            identity = identity_of(path)
+            assert store.get(identity).get_identity_hash() == identity
+        stats = store.get_statistics()
+        assert stats["load_errors"] == 0
+        assert store.get_load_errors() == []
+
+    def test_unreadable_file_is_reported(self, library, tmp_path, caplog):
+        store = open_store(library, tmp_path, lazy=True)
+        path = sorted(library.glob("*.json"))[0]
+        identity = identity_of(path)
+        path.write_text("{not json")
+
+        with caplog.at_level("WARNING", logger="neurop_forge.library.block_store"):
+            assert store.get(identity) is None
+        errors = store.get_load_errors()
+        assert [error.path for error in errors] == [str(path)]
+        assert errors[0].error.startswith("JSONDecodeError")
+        assert identity in caplog.text
+
+    def test_invalid_block_is_reported(self, library, tmp_path):
+        store = open_store(library, tmp_path, lazy=True)
+        path = sorted(library.glob("*.json"))[0]
+        identity = identity_of(path)
+        data = json.loads(path.read_bytes())
+        del data["interface"]
+        path.write_text(json.dumps(data))
+
+        assert store.get(identity) is None
+        assert [error.path for error in store.get_load_errors()] == [str(path)]
+
+    def test_refresh_clears_a_fixed_file(self, library, tmp_path):
+        store = open_store(library, tmp_path, lazy=True)
+        path = sorted(library.glob("*.json"))[0]
+        identity = identity_of(path)
+        original = path.read_bytes()
+        path.write_text("{not json")
+        assert store.get(identity) is None
+
+        path.write_bytes(original)
+        store.refresh()
+        assert store.get_load_errors() == []
+        assert store.get(identity).get_identity_hash() == identity
+
+    def test_archive_blocks_hydrate_from_the_mapping(self, library, tmp_path):
+        write_packed_library(library)
+        store = open_store(library, tmp_path, lazy=True, shared_catalog=True)
+        assert store.archive is not None
+        identity = identity_of(sorted(library.glob("*.json"))[0])
+        assert store.get(identity).get_identity_hash() == identity
+        store.close()
+
+
+def rewrite(path, edit):
+    data = json.loads(path.read_bytes())
+    edit(data)
+    path.write_text(json.dumps(data))
+    return data
+
+
+def describe(data):
+    data["metadata"]["description"] += " (edited)"
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+class TestRefresh:
+    """refresh() reloads only the files that changed since the last load."""
+
+    def test_no_changes(self, library, tmp_path, lazy):
+        store = open_store(library, tmp_path, lazy=lazy)
+        assert not store.refresh().has_changes()
+
+    def test_added_updated_removed(self, library, tmp_path, lazy):
+        store = open_store(library, tmp_path, lazy=lazy)
+        files = sorted(library.glob("*.json"))
+        removed = identity_of(files[1])
+        extra = sorted(LIBRARY_PATH.glob("*.json"))[10]
+        shutil.copy(extra, library / extra.name)
+        data = rewrite(files[0], describe)
+        files[1].unlink()
+
+        result = store.refresh()
+        assert result.added == [identity_of(extra)]
+        assert result.updated == [identity_of(files[0])]
+        assert result.removed == [removed]
+        assert store.get(identity_of(extra)) is not None
+        assert store.get(identity_of(files[0])).metadata.description == data["metadata"]["description"]
+        assert store.get(removed) is None
+        assert not store.refresh().has_changes()
+
+    def test_file_holding_a_new_identity(self, library, tmp_path, lazy):
+        store = open_store(library, tmp_path, lazy=lazy)
+        path = sorted(library.glob("*.json"))[0]
+        old = identity_of(path)
+        new = rewrite(path, lambda data: data["identity"].update(hash_value="f" * 64))
+        result = store.refresh()
+        assert result.added == [new["identity"]["hash_value"]]
+        assert result.removed == [old]
+        assert not store.exists(old)
+
+    def test_bad_file_is_retried(self, library, tmp_path, lazy):
+        store = open_store(library, tmp_path, lazy=lazy)
+        extra = sorted(LIBRARY_PATH.glob("*.json"))[10]
+        (library / extra.name).write_text("{not json")
+        result = store.refresh()
+        assert not result.has_changes()
+        assert [error.path for error in result.errors] == [str(library / extra.name)]
+
+        shutil.copy(extra, library / extra.name)
+        result = store.refresh()
+        assert result.added == [identity_of(extra)]
+        assert store.get_load_errors() == []
+
+
+STORE_MODES = {
+    "eager": {},
+    "lazy": {"lazy": True},
+    "shared": {"lazy": True, "shared_catalog": True},
+}
+
+
+@pytest.mark.parametrize("mode", sorted(STORE_MODES))
+class TestHeaders:
+    """Headers and name lookups are served without hydrating blocks."""
+
+    def open(self, library, tmp_path, mode):
+        if mode == "shared":
+            write_packed_library(library)
+        return open_store(library, tmp_path, **STORE_MODES[mode])
+
+    def test_headers_match_blocks(self, library, tmp_path, mode):
+        store = self.open(library, tmp_path, mode)
+        headers = {header.identity: header for header in store.iter_headers()}
+        assert store.get_hydration_statistics()["hydrated_blocks"] == (
+            10 if mode == "eager" else 0
+        )
+        assert sorted(headers) == sorted(identity_of(path) for path in library.glob("*.json"))
+        for identity, header in headers.items():
+            assert store.get_header(identity) == header
+            assert BlockHeader.from_block(store.get(identity)) == header
+        store.close()
+
+    def test_find_by_name(self, library, tmp_path, mode):
+        store = self.open(library, tmp_path, mode)
+        for header in store.iter_headers():
+            identity = store.find_by_name(header.name)
+            assert store.get_header(identity).name == header.name
+        assert store.find_by_name("no_such_block") is None
+        store.close()
+
+    def test_headers_follow_refresh(self, library, tmp_path, mode):
+        store = self.open(library, tmp_path, mode)
+        files = sorted(library.glob("*.json"))
+        data = rewrite(files[0], describe)
+        removed = identity_of(files[1])
+        files[1].unlink()
+
+        store.refresh()
+        assert store.get_header(identity_of(files[0])).description == data["metadata"]["description"]
+        assert store.get_header(removed) is None
+        assert removed not in {header.identity for header in store.iter_headers()}
+        store.close()
+
+
+@pytest.mark.parametrize("mode", sorted(STORE_MODES))
+class TestCopy:
+    """A copied store can be refreshed without touching the original."""
+
+    def test_refresh_on_copy_leaves_original(self, library, tmp_path, mode):
+        if mode == "shared":
+            write_packed_library(library)
+        store = open_store(library, tmp_path, **STORE_MODES[mode])
+        files = sorted(library.glob("*.json"))
+        removed = identity_of(files[0])
+        extra = sorted(LIBRARY_PATH.glob("*.json"))[10]
+        shutil.copy(extra, library / extra.name)
+        files[0].unlink()
+
+        copied = store.copy()
+        result = copied.refresh()
+        assert result.added == [identity_of(extra)]
+        assert result.removed == [removed]
+        assert not copied.exists(removed)
+        assert store.exists(removed)
+        assert not store.exists(identity_of(extra))
+        assert store.count() == 10
+        # The original still diffs against its own manifest.
+        assert store.refresh().removed == [removed]
+        copied.close()
+        store.close()
+
+    def test_archive_stays_open_until_both_close(self, library, tmp_path, mode):
+        write_packed_library(library)
+        store = open_store(library, tmp_path, **STORE_MODES[mode])
+        copied = store.copy()
+        identity = identity_of(sorted(library.glob("*.json"))[-1])
+        store.close()
+        assert copied.get(identity).get_identity_hash() == identity
+        copied.close()
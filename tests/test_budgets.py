@@ -0,0 +1,97 @@
+"""
+Tests for per-call CPU time and memory budgets (runtime.budgets) and how
+their breaches are classified for retries (runtime.guards).
+"""
+import pytest
+
+from neurop_forge.runtime.executor import BlockExecutor
+from neurop_forge.runtime.guards import FailureKind, classify_failure
+from neurop_forge.runtime.process_pool import PooledBlockExecutor
+
+SPIN = '''def spin_forever(value):
+    while True:
+        value += 1
+'''
+
+HOG = '''def allocate_lists(value):
+    chunks = [[0] * 1000 for _ in range(value)]
+    return len(chunks)
+'''
+
+SWALLOW = '''def swallow_breach(value):
+    try:
+        while True:
+            value += 1
+    except Exception:
+        return value
+'''
+
+HOG_BYTES = '''def allocate_bytes(value):
+    return len(bytearray(value))
+'''
+
+
+class TestInThreadBudgets:
+    """BlockExecutor stops calls that run over their budget."""
+
+    def test_cpu_budget_breach(self, custom_block):
+        block = custom_block("spin_forever", SPIN, max_execution_time_ms=50)
+        executor = BlockExecutor()
+        outputs, error = executor.execute(block, {"value": 1})
+        assert outputs == {}
+        assert error.startswith("CPUBudgetExceeded")
+        assert executor.last_usage().cpu_ms >= 50
+
+    def test_memory_budget_breach(self, custom_block):
+        block = custom_block("allocate_lists", HOG, max_memory_bytes=200_000)
+        outputs, error = BlockExecutor().execute(block, {"value": 1000})
+        assert outputs == {}
+        assert error.startswith("MemoryBudgetExceeded")
+
+    def test_caught_breach_still_fails(self, custom_block):
+        block = custom_block("swallow_breach", SWALLOW, max_execution_time_ms=50)
+        _, error = BlockExecutor().execute(block, {"value": 1})
+        assert error.startswith("CPUBudgetExceeded")
+
+    def test_within_budget(self, custom_block):
+        block = custom_block("allocate_lists", HOG, max_memory_bytes=10_000_000)
+        executor = BlockExecutor(measure_memory=True)
+        outputs, error = executor.execute(block, {"value": 10})
+        assert error is None
+        assert outputs["result"] == 10
+        assert executor.last_usage().peak_memory_bytes > 0
+
+    def test_executor_default_budget(self, custom_block):
+        block = custom_block("spin_forever", SPIN)
+        executor = BlockExecutor(default_max_execution_time_ms=50)
+        _, error = executor.execute(block, {"value": 1})
+        assert error.startswith("CPUBudgetExceeded")
+
+
+class TestPooledBudgets:
+    """PooledBlockExecutor enforces memory budgets with worker rlimits."""
+
+    def test_memory_limit_breach(self, custom_block):
+        block = custom_block("allocate_bytes", HOG_BYTES, max_memory_bytes=64 * 1024 * 1024)
+        with PooledBlockExecutor(workers=1, default_timeout_ms=5000.0) as pool:
+            outputs, error = pool.execute(block, {"value": 1024 * 1024 * 1024})
+            assert outputs == {}
+            assert error.startswith("MemoryError")
+            assert pool.execute(block, {"value": 1024})[0]["result"] == 1024
+
+
+class TestBreachClassification:
+    """A breach is classified the same way wherever it was enforced."""
+
+    @pytest.mark.parametrize("in_thread, in_pool", [
+        ("CPUBudgetExceeded: used 60.0ms of CPU time (budget 50ms)", "CPUTimeExceeded: CPU time limit exceeded"),
+        ("MemoryBudgetExceeded: allocated 300000 bytes (budget 200000 bytes)", "MemoryError: "),
+    ])
+    def test_same_kind_in_thread_and_in_pool(self, in_thread, in_pool):
+        for deterministic in (True, False):
+            assert classify_failure(in_thread, deterministic) == FailureKind.TRANSIENT
+            assert classify_failure(in_pool, deterministic) == FailureKind.TRANSIENT
+
+    def test_logic_errors_of_deterministic_blocks(self):
+        assert classify_failure("ZeroDivisionError: division by zero", True) == FailureKind.DETERMINISTIC
+        assert classify_failure("ZeroDivisionError: division by zero", False) == FailureKind.TRANSIENT
@@ -0,0 +1,92 @@
+"""
+Tests for the on-disk bytecode cache (runtime.bytecode_cache).
+"""
+import hashlib
+import os
+import stat
+
+import pytest
+
+from neurop_forge.main import NeuropForge
+from neurop_forge.runtime.bytecode_cache import KEY_FILE, BytecodeCache, default_bytecode_cache_path
+from neurop_forge.runtime.compiled_cache import get_compiled_block_cache
+
+LOGIC = "def add_one(value):\n    return value + 1\n"
+BLOCK_ID = hashlib.sha256(LOGIC.encode()).hexdigest()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = BytecodeCache(tmp_path / "bytecode")
+    assert cache.store(BLOCK_ID, LOGIC, "add_one", compile(LOGIC, "<block>", "exec"))
+    return cache
+
+
+class TestRoundTrip:
+    """Stored code is loaded back for the same block and source only."""
+
+    def test_load_stored_code(self, cache):
+        namespace = {}
+        exec(cache.load(BLOCK_ID, LOGIC, "add_one"), namespace)
+        assert namespace["add_one"](1) == 2
+        assert cache.get_statistics()["hits"] == 1
+
+    def test_other_source_is_rejected(self, cache):
+        assert cache.load(BLOCK_ID, LOGIC.replace("+ 1", "+ 2"), "add_one") is None
+        assert cache.load(BLOCK_ID, LOGIC, "other_name") is None
+
+    def test_other_block_hash_misses(self, cache):
+        assert cache.load("0" * 64, LOGIC, "add_one") is None
+
+    def test_key_is_owner_only(self, cache):
+        mode = stat.S_IMODE(os.stat(cache.directory / KEY_FILE).st_mode)
+        assert mode == 0o600
+
+
+class TestTamperRejection:
+    """Modified entries are never unmarshalled."""
+
+    def test_flipped_code_byte(self, cache):
+        path = cache.path_for(BLOCK_ID)
+        data = bytearray(path.read_bytes())
+        data[-1] ^= 0xFF
+        path.write_bytes(bytes(data))
+        assert cache.load(BLOCK_ID, LOGIC, "add_one") is None
+        assert cache.get_statistics()["rejected"] == 1
+
+    def test_truncated_entry(self, cache):
+        path = cache.path_for(BLOCK_ID)
+        path.write_bytes(path.read_bytes()[:-4])
+        assert cache.load(BLOCK_ID, LOGIC, "add_one") is None
+
+    def test_entry_written_with_another_key(self, cache, tmp_path):
+        other = BytecodeCache(tmp_path / "other")
+        other.store(BLOCK_ID, LOGIC, "add_one", compile("def add_one(value):\n    return 0\n", "<x>", "exec"))
+        cache.path_for(BLOCK_ID).write_bytes(other.path_for(BLOCK_ID).read_bytes())
+        assert cache.load(BLOCK_ID, LOGIC, "add_one") is None
+
+
+class TestNeuropForgeWiring:
+    """NeuropForge never touches the process-wide compiled block cache."""
+
+    def test_off_by_default(self, tmp_path):
+        storage = tmp_path / "library"
+        before = get_compiled_block_cache().bytecode_cache
+        forge = NeuropForge(storage_path=str(storage), use_index_snapshot=False)
+        forge.close()
+        assert get_compiled_block_cache().bytecode_cache is before
+        assert not default_bytecode_cache_path(storage).exists()
+
+    def test_instances_keep_their_own_cache(self, tmp_path):
+        before = get_compiled_block_cache().bytecode_cache
+        first = NeuropForge(storage_path=str(tmp_path / "a"), use_index_snapshot=False, use_bytecode_cache=True)
+        second = NeuropForge(storage_path=str(tmp_path / "b"), use_index_snapshot=False, use_bytecode_cache=True)
+        try:
+            assert first._compiled_cache.bytecode_cache.directory == default_bytecode_cache_path(tmp_path / "a")
+            assert second._compiled_cache.bytecode_cache.directory == default_bytecode_cache_path(tmp_path / "b")
+            with first._library.pin() as library:
+                assert library.graph_executor._block_executor.compiled_cache is first._compiled_cache
+            assert get_compiled_block_cache().bytecode_cache is before
+        finally:
+            first.close()
+            second.close()
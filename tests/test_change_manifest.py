@@ -0,0 +1,90 @@
+"""
+Tests for the change manifest behind incremental reloads
+(library.change_manifest).
+"""
+from neurop_forge.library.change_manifest import (
+    ChangeManifest,
+    scan_block_files,
+    scan_fingerprint,
+)
+
+
+def manifest_of(scan):
+    manifest = ChangeManifest()
+    for file_name, (size, mtime_ns) in scan.items():
+        manifest.record(file_name, size, mtime_ns, f"id-{file_name}")
+    return manifest
+
+
+class TestDiff:
+    """diff() sorts files into added, changed and removed."""
+
+    def test_unchanged_scan(self):
+        scan = {"a.json": (10, 1), "b.json": (20, 2)}
+        assert not manifest_of(scan).diff(dict(scan)).has_changes()
+
+    def test_added_changed_removed(self):
+        manifest = manifest_of({"a.json": (10, 1), "b.json": (20, 2), "c.json": (30, 3)})
+        diff = manifest.diff({"a.json": (10, 1), "b.json": (20, 5), "d.json": (40, 4)})
+        assert diff.added == ["d.json"]
+        assert diff.changed == ["b.json"]
+        assert diff.removed == ["c.json"]
+
+    def test_size_change_with_same_mtime(self):
+        diff = manifest_of({"a.json": (10, 1)}).diff({"a.json": (11, 1)})
+        assert diff.changed == ["a.json"]
+
+    def test_forgotten_file_is_added_again(self):
+        manifest = manifest_of({"a.json": (10, 1)})
+        assert manifest.forget("a.json").identity == "id-a.json"
+        assert manifest.diff({"a.json": (10, 1)}).added == ["a.json"]
+        assert manifest.forget("a.json") is None
+
+    def test_identities_backed_by_any_file(self):
+        manifest = ChangeManifest()
+        manifest.record("a.json", 1, 1, "same")
+        manifest.record("b.json", 1, 1, "same")
+        manifest.forget("a.json")
+        assert manifest.identities() == {"same"}
+
+
+class TestScan:
+    """scan_block_files() stats JSON files only."""
+
+    def test_scan(self, tmp_path):
+        (tmp_path / "a.json").write_text("{}")
+        (tmp_path / "notes.txt").write_text("x")
+        (tmp_path / "dir.json").mkdir()
+        scan = scan_block_files(tmp_path)
+        assert list(scan) == ["a.json"]
+        assert scan["a.json"][0] == 2
+
+    def test_missing_directory(self, tmp_path):
+        assert scan_block_files(tmp_path / "missing") == {}
+
+    def test_record_path(self, tmp_path):
+        path = tmp_path / "a.json"
+        path.write_text("{}")
+        manifest = ChangeManifest()
+        manifest.record_path(path, "id")
+        assert not manifest.diff(scan_block_files(tmp_path)).has_changes()
+
+
+class TestFingerprint:
+    """scan_fingerprint() changes with any file's name, size or mtime."""
+
+    def test_order_independent(self):
+        scan = {"a.json": (10, 1), "b.json": (20, 2)}
+        reordered = {"b.json": (20, 2), "a.json": (10, 1)}
+        assert scan_fingerprint(scan) == scan_fingerprint(reordered)
+
+    def test_any_change_is_detected(self):
+        scan = {"a.json": (10, 5), "b.json": (20, 6)}
+        fingerprint = scan_fingerprint(scan)
+        for changed in (
+            {"a.json": (10, 4), "b.json": (20, 6)},  # older mtime
+            {"a.json": (11, 5), "b.json": (20, 6)},  # size only
+            {"c.json": (10, 5), "b.json": (20, 6)},  # renamed
+            {"a.json": (10, 5)},                      # removed
+        ):
+            assert scan_fingerprint(changed) != fingerprint
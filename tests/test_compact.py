@@ -0,0 +1,54 @@
+"""
+Tests for compact record helpers (core.compact).
+"""
+import gc
+import pickle
+
+from neurop_forge.core import compact
+from neurop_forge.core.block_schema import NeuropBlock, TypedParameter
+
+
+class TestShared:
+    """shared() deduplicates without keeping records alive."""
+
+    def test_equal_records_share_one_instance(self, library_block):
+        block = library_block("absolute_value")
+        data = block.to_dict()
+        first = NeuropBlock.from_dict(data)
+        second = NeuropBlock.from_dict(data)
+        assert first.constraints is second.constraints
+        assert first.failure_modes is second.failure_modes
+        assert first.interface.inputs is second.interface.inputs
+
+    def test_near_unique_records_are_not_interned(self, library_block):
+        data = library_block("absolute_value").to_dict()
+        first = NeuropBlock.from_dict(data)
+        second = NeuropBlock.from_dict(data)
+        assert first.trust_score == second.trust_score
+        assert first.trust_score is not second.trust_score
+
+    def test_unused_records_are_released(self, library_block):
+        data = library_block("absolute_value").to_dict()["interface"]["inputs"][0]
+        data = dict(data, name="released_parameter_name")
+        record = TypedParameter.from_dict(data)
+        key = compact._shared_key(record)
+        assert key in compact._shared
+        del record
+        gc.collect()
+        assert key not in compact._shared
+
+    def test_strong_table_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(compact, "MAX_STRONG_SHARED", 8)
+        monkeypatch.setattr(compact, "_shared_strong", compact.OrderedDict())
+        values = [compact.shared(("bounded", index)) for index in range(20)]
+        assert len(compact._shared_strong) == 8
+        assert compact.shared(("bounded", 19)) is values[19]
+
+    def test_equal_but_differently_typed_values_stay_apart(self):
+        assert compact.shared((1, True)) == (1, True)
+        assert type(compact.shared((True, 1))[0]) is bool
+        assert type(compact.shared((1.0,))[0]) is float
+
+    def test_weakref_records_still_pickle(self, library_block):
+        block = library_block("absolute_value")
+        assert pickle.loads(pickle.dumps(block.constraints)) == block.constraints
@@ -0,0 +1,169 @@
+"""
+Tests for the compiled block cache (runtime.compiled_cache) and its use by
+BlockExecutor.
+"""
+import pytest
+
+from neurop_forge.runtime import compiled_cache
+from neurop_forge.runtime.compiled_cache import (
+    CompiledBlockCache,
+    compile_block,
+    configure_compiled_block_cache,
+    get_compiled_block_cache,
+)
+from neurop_forge.runtime.executor import BlockExecutor
+
+NAMESPACE = {"__builtins__": __builtins__, "SCALE": 3}
+
+
+def logic_for(index):
+    return f"def scaled_{index}(value):\n    return value * SCALE + {index}\n"
+
+
+def compiled(index):
+    return compile_block(f"block{index}", logic_for(index), f"scaled_{index}", NAMESPACE)
+
+
+def lookup(cache, index):
+    return cache.get_or_compile(f"block{index}", logic_for(index), f"scaled_{index}", NAMESPACE)
+
+
+class TestCompileBlock:
+    """compile_block() binds the function to its own namespace."""
+
+    def test_function_uses_the_base_namespace(self):
+        block = compiled(2)
+        assert block.found
+        assert block.function(5) == 17
+        assert block.namespace is not NAMESPACE
+        assert "scaled_2" not in NAMESPACE
+
+    def test_missing_function(self):
+        block = compile_block("b", logic_for(1), "other_name", NAMESPACE)
+        assert not block.found
+
+    def test_syntax_error_raises(self):
+        with pytest.raises(SyntaxError):
+            compile_block("b", "def broken(:\n", "broken", NAMESPACE)
+
+
+class TestCompiledBlockCache:
+    """An LRU of compiled blocks with hit, miss and eviction counters."""
+
+    def test_hit_returns_the_same_entry(self):
+        cache = CompiledBlockCache(max_size=4)
+        first = lookup(cache, 1)
+        assert lookup(cache, 1) is first
+        stats = cache.get_statistics()
+        assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+        assert stats["hit_rate"] == 0.5
+
+    def test_least_recently_used_is_evicted(self):
+        cache = CompiledBlockCache(max_size=3)
+        for index in range(3):
+            lookup(cache, index)
+        lookup(cache, 0)
+        lookup(cache, 3)
+        assert "block1" not in cache
+        assert all(f"block{index}" in cache for index in (0, 2, 3))
+        assert len(cache) == 3
+        assert cache.get_statistics()["evictions"] == 1
+
+    def test_put_existing_entry_does_not_evict(self):
+        cache = CompiledBlockCache(max_size=2)
+        cache.put(compiled(0))
+        cache.put(compiled(1))
+        cache.put(compiled(0))
+        cache.put(compiled(2))
+        assert "block1" not in cache
+        assert cache.get_statistics()["evictions"] == 1
+
+    def test_zero_size_caches_nothing(self):
+        cache = CompiledBlockCache(max_size=0)
+        block = lookup(cache, 1)
+        assert block.function(1) == 4
+        assert len(cache) == 0
+        assert lookup(cache, 1) is not block
+
+    def test_negative_size_is_zero(self):
+        assert CompiledBlockCache(max_size=-5).max_size == 0
+
+    def test_invalidate(self):
+        cache = CompiledBlockCache()
+        first = lookup(cache, 1)
+        assert cache.invalidate("block1")
+        assert not cache.invalidate("block1")
+        assert lookup(cache, 1) is not first
+
+    def test_clear_resets_counters(self):
+        cache = CompiledBlockCache()
+        lookup(cache, 1)
+        lookup(cache, 1)
+        cache.clear()
+        stats = cache.get_statistics()
+        assert (stats["size"], stats["hits"], stats["misses"], stats["evictions"]) == (0, 0, 0, 0)
+        assert stats["hit_rate"] == 0.0
+
+    def test_failed_compile_is_not_cached(self):
+        cache = CompiledBlockCache()
+        with pytest.raises(SyntaxError):
+            cache.get_or_compile("bad", "def bad(:\n", "bad", NAMESPACE)
+        assert "bad" not in cache
+
+
+class TestGlobalCache:
+    """One cache shared by every BlockExecutor unless one is passed."""
+
+    @pytest.fixture(autouse=True)
+    def restore_global_cache(self, monkeypatch):
+        monkeypatch.setattr(compiled_cache, "_global_cache", None)
+
+    def test_shared_by_default(self):
+        assert BlockExecutor().compiled_cache is get_compiled_block_cache()
+        assert BlockExecutor().compiled_cache is BlockExecutor().compiled_cache
+
+    def test_configure_replaces_the_shared_cache(self):
+        old = get_compiled_block_cache()
+        new = configure_compiled_block_cache(7)
+        assert new is not old
+        assert new.max_size == 7
+        assert BlockExecutor().compiled_cache is new
+
+
+class TestExecutorCaching:
+    """BlockExecutor compiles each block once, keyed by identity."""
+
+    def test_repeat_executions_hit(self, custom_block):
+        cache = CompiledBlockCache()
+        executor = BlockExecutor(compiled_cache=cache)
+        block = custom_block("cached_increment", "def cached_increment(value):\n    return value + 1\n")
+        outputs = [executor.execute(block, {"value": value}) for value in range(5)]
+        assert outputs == [({"result": value + 1}, None) for value in range(5)]
+        stats = cache.get_statistics()
+        assert (stats["misses"], stats["hits"], stats["size"]) == (1, 4, 1)
+        assert block.get_identity_hash() in cache
+
+    def test_executors_sharing_a_cache_compile_once(self, custom_block):
+        cache = CompiledBlockCache()
+        block = custom_block("cached_negate", "def cached_negate(value):\n    return -value\n")
+        BlockExecutor(compiled_cache=cache).execute(block, {"value": 1})
+        assert BlockExecutor(compiled_cache=cache).execute(block, {"value": 2}) == ({"result": -2}, None)
+        assert cache.get_statistics()["misses"] == 1
+
+    def test_inputs_do_not_leak_into_the_namespace(self, custom_block):
+        cache = CompiledBlockCache()
+        executor = BlockExecutor(compiled_cache=cache)
+        block = custom_block("cached_echo", "def cached_echo(value):\n    return value\n")
+        executor.execute(block, {"value": "secret"})
+        assert "value" not in cache.get(block.get_identity_hash()).namespace
+
+    def test_eviction_recompiles(self, custom_block):
+        cache = CompiledBlockCache(max_size=1)
+        executor = BlockExecutor(compiled_cache=cache)
+        first = custom_block("cached_first", "def cached_first(value):\n    return value\n")
+        second = custom_block("cached_second", "def cached_second(value):\n    return value * 2\n")
+        for block in (first, second, first):
+            executor.execute(block, {"value": 1})
+        stats = cache.get_statistics()
+        assert (stats["misses"], stats["evictions"]) == (3, 2)
+        assert first.get_identity_hash() in cache
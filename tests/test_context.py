@@ -0,0 +1,160 @@
+"""
+Tests for ExecutionContext checkpoints and history (runtime.context).
+
+Rollback is checked against a baseline that copies every variable at each
+checkpoint.
+"""
+import random
+
+import pytest
+
+from neurop_forge.runtime.context import ContextScope, ExecutionContext
+
+
+def values(context):
+    return {name: var.value for name, var in context.get_all_variables().items()}
+
+
+class TestRollback:
+    """Rollback restores the variables as of the checkpoint."""
+
+    def test_set_and_overwrite(self):
+        context = ExecutionContext({"input": 1})
+        context.set("a", 1)
+        checkpoint = context.checkpoint()
+        context.set("a", 2)
+        context.set("b", 3)
+        assert context.rollback(checkpoint)
+        assert values(context) == {"input": 1, "a": 1}
+
+    def test_delete(self):
+        context = ExecutionContext()
+        context.set("a", 1)
+        context.set("b", 2)
+        first = context.checkpoint()
+        context.delete("a")
+        second = context.checkpoint()
+        context.set("a", 3)
+        assert context.rollback(second)
+        assert values(context) == {"b": 2}
+        assert context.rollback(first)
+        assert values(context) == {"a": 1, "b": 2}
+
+    def test_delete_then_recreate_before_checkpoint(self):
+        context = ExecutionContext()
+        context.set("a", 1)
+        context.checkpoint()
+        context.delete("a")
+        context.set("a", 2)
+        checkpoint = context.checkpoint()
+        context.delete("a")
+        assert context.rollback(checkpoint)
+        assert values(context) == {"a": 2}
+
+    def test_temporary_scope_cleanup(self):
+        context = ExecutionContext()
+        context.enter_node("n")
+        context.set("tmp", 1, scope=ContextScope.TEMPORARY)
+        context.set("kept", 2)
+        during = context.checkpoint()
+        context.exit_node()
+        after = context.checkpoint()
+        assert values(context) == {"kept": 2}
+        context.set("late", 3)
+        assert context.rollback(after)
+        assert values(context) == {"kept": 2}
+        assert context.rollback(during)
+        assert values(context) == {"tmp": 1, "kept": 2}
+        assert context.get_typed("kept").source_node == "n"
+
+    def test_rollback_drops_later_node_outputs(self):
+        context = ExecutionContext()
+        context.set_node_output("a", {"result": 1})
+        checkpoint = context.checkpoint()
+        context.set_node_output("b", {"result": 2})
+        assert context.rollback(checkpoint)
+        assert context.get_previous_output() == 1
+        assert not context.has("b.result")
+
+    def test_unknown_checkpoint(self):
+        context = ExecutionContext()
+        context.set("a", 1)
+        assert not context.rollback("cp_missing")
+        assert values(context) == {"a": 1}
+
+    def test_readonly_inputs_survive_rollback(self):
+        context = ExecutionContext({"input": 1})
+        checkpoint = context.checkpoint()
+        assert context.rollback(checkpoint)
+        with pytest.raises(ValueError):
+            context.set("input", 2)
+
+    def test_checkpoints_store_only_changes(self):
+        context = ExecutionContext({name: index for index, name in enumerate("abcdefgh")})
+        context.checkpoint()
+        context.set("x", 1)
+        context.checkpoint()
+        first, second = context._checkpoints
+        assert len(first.changes) == 8
+        assert list(second.changes) == ["x"]
+        assert second.parent is first
+
+    def test_matches_full_copy_baseline(self):
+        rng = random.Random(21)
+        context = ExecutionContext()
+        live = {}
+        snapshots = {}
+        names = [f"v{index}" for index in range(6)]
+        for step in range(400):
+            action = rng.random()
+            name = rng.choice(names)
+            if action < 0.45:
+                context.set(name, step)
+                live[name] = step
+            elif action < 0.65:
+                assert context.delete(name) == (name in live)
+                live.pop(name, None)
+            elif action < 0.8:
+                snapshots[context.checkpoint()] = dict(live)
+            elif snapshots:
+                checkpoint = rng.choice(sorted(snapshots))
+                assert context.rollback(checkpoint)
+                live = dict(snapshots[checkpoint])
+            assert values(context) == live
+        checkpoints = {cp.checkpoint_id: cp for cp in context._checkpoints}
+        for checkpoint, snapshot in snapshots.items():
+            variables = checkpoints[checkpoint].variables
+            assert {name: var.value for name, var in variables.items()} == snapshot
+
+
+class TestHistory:
+    """History is a ring buffer of the last history_size writes."""
+
+    def test_history_is_bounded(self):
+        context = ExecutionContext(history_size=5)
+        for index in range(12):
+            context.set(f"v{index}", index)
+        history = context.get_history()
+        assert [entry["name"] for entry in history] == [f"v{index}" for index in range(7, 12)]
+        assert [entry["name"] for entry in context.get_history(2)] == ["v10", "v11"]
+        assert context.get_history(0) == []
+
+    def test_history_entries(self):
+        context = ExecutionContext(history_size=10)
+        context.set("a", 1)
+        checkpoint = context.checkpoint()
+        context.delete("a")
+        context.rollback(checkpoint)
+        history = context.get_history()
+        assert [entry["action"] for entry in history] == ["set", "delete", "rollback"]
+        assert history[0]["scope"] == "graph"
+        assert "scope" not in history[1]
+        assert history[2]["checkpoint_id"] == checkpoint
+        timestamps = [entry["timestamp"] for entry in history]
+        assert timestamps == sorted(timestamps)
+
+    def test_history_disabled(self):
+        context = ExecutionContext(history_size=0)
+        context.set("a", 1)
+        assert context.get_history() == []
+        assert context.to_dict()["history"] == []
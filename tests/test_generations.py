@@ -0,0 +1,165 @@
+"""
+Tests for copy-on-write library generations (library.generations) and
+NeuropForge's generation-based refresh.
+"""
+import json
+import shutil
+
+import pytest
+
+from neurop_forge.library.generations import GenerationManager
+from neurop_forge.main import NeuropForge
+from tests.conftest import LIBRARY_PATH
+
+
+class TestGenerationManager:
+    """Pinned generations stay valid until their last reader leaves."""
+
+    def test_pinned_generation_survives_publish(self):
+        released = []
+        generations = GenerationManager("first", release=released.append)
+        with generations.pin() as value:
+            generations.publish("second")
+            assert value == "first"
+            assert released == []
+            with generations.pin() as newer:
+                assert newer == "second"
+        assert released == ["first"]
+        assert generations.current.number == 2
+
+    def test_unpinned_generation_released_on_publish(self):
+        released = []
+        generations = GenerationManager("first", release=released.append)
+        generations.publish("second")
+        assert released == ["first"]
+        assert generations.get_statistics()["draining"] == []
+
+    def test_publish_replacing_a_stale_value_is_refused(self):
+        generations = GenerationManager("first")
+        generations.publish("second")
+        assert generations.publish("derived", replaces="first") is None
+        assert generations.current.value == "second"
+        assert generations.publish("derived", replaces="second").value == "derived"
+
+    def test_failed_build_publishes_nothing(self):
+        generations = GenerationManager("first")
+
+        def fail():
+            raise RuntimeError("build failed")
+
+        with pytest.raises(RuntimeError):
+            generations.build(fail).result()
+        assert generations.current.value == "first"
+
+    def test_background_build_and_close(self):
+        released = []
+        generations = GenerationManager("first", release=released.append)
+        assert generations.build(lambda: "second", background=True).result().value == "second"
+        generations.close()
+        assert released == ["first", "second"]
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """A small library directory copied from the expanded library."""
+    path = tmp_path / "library"
+    path.mkdir()
+    for source in sorted(LIBRARY_PATH.glob("*.json"))[:20]:
+        shutil.copy(source, path / source.name)
+    return path
+
+
+class TestRefreshLibrary:
+    """refresh_library() publishes the delta as a new generation."""
+
+    def test_readers_of_the_old_generation_are_untouched(self, storage):
+        extra = sorted(LIBRARY_PATH.glob("*.json"))[20]
+        with NeuropForge(storage_path=str(storage), use_index_snapshot=False) as forge:
+            first = forge._library.current.number
+            with forge._library.pin() as old:
+                old_entries = {entry.block_identity for entry in old.indexer.get_entries()}
+                shutil.copy(extra, storage / extra.name)
+                result = forge.refresh_library()
+                assert len(result["added"]) == 1
+                assert {entry.block_identity for entry in old.indexer.get_entries()} == old_entries
+
+            assert forge._library.current.number == first + 1
+            with forge._library.pin() as new:
+                identity = result["added"][0]
+                assert new.indexer.get_entry(identity) is not None
+                assert identity in new.graph_executor._blocks
+
+    def test_updated_block_is_never_missing(self, storage):
+        path = sorted(storage.glob("*.json"))[0]
+        with NeuropForge(storage_path=str(storage), use_index_snapshot=False) as forge:
+            data = json.loads(path.read_text())
+            identity = data["identity"]["hash_value"]
+            with forge._library.pin() as old:
+                data["metadata"]["description"] += " (edited)"
+                path.write_text(json.dumps(data))
+                result = forge.refresh_library()
+                assert result["updated"] == [identity]
+                assert old.indexer.get_entry(identity) is not None
+                assert identity in old.graph_executor._blocks
+            with forge._library.pin() as new:
+                assert new.indexer.get_entry(identity) is not None
+                assert identity in new.graph_executor._blocks
+
+    def test_removed_block_leaves_new_generation_only(self, storage):
+        path = sorted(storage.glob("*.json"))[0]
+        identity = json.loads(path.read_text())["identity"]["hash_value"]
+        with NeuropForge(storage_path=str(storage), use_index_snapshot=False) as forge:
+            with forge._library.pin() as old:
+                path.unlink()
+                assert forge.refresh_library()["removed"] == [identity]
+                assert old.indexer.get_entry(identity) is not None
+                assert old.block_store.get(identity) is not None
+            with forge._library.pin() as new:
+                assert new.indexer.get_entry(identity) is None
+                assert new.block_store.get(identity) is None
+
+    def test_no_changes_publishes_nothing(self, storage):
+        with NeuropForge(storage_path=str(storage), use_index_snapshot=False) as forge:
+            number = forge._library.current.number
+            assert forge.refresh_library()["added"] == []
+            assert forge._library.current.number == number
+
+    def test_each_generation_has_its_own_store(self, storage):
+        extra = sorted(LIBRARY_PATH.glob("*.json"))[20]
+        with NeuropForge(storage_path=str(storage), use_index_snapshot=False) as forge:
+            with forge._library.pin() as old:
+                shutil.copy(extra, storage / extra.name)
+                forge.refresh_library()
+                with forge._library.pin() as new:
+                    assert new.block_store is not old.block_store
+                    assert new.block_store.count() == 21
+                assert old.block_store.count() == 20
+
+
+class TestStoreBlock:
+    """Stored blocks are published as a new generation."""
+
+    def test_stored_block_leaves_old_generation_untouched(self, storage, custom_block):
+        block = custom_block("negate_value", "def negate_value(value):\n    return -value\n")
+        identity = block.get_identity_hash()
+        with NeuropForge(storage_path=str(storage), use_index_snapshot=False) as forge:
+            number = forge._library.current.number
+            with forge._library.pin() as old:
+                assert forge._store_block(block).status.value == "stored"
+                assert not old.block_store.exists(identity)
+                assert old.indexer.get_entry(identity) is None
+                assert identity not in old.graph_executor._blocks
+
+            assert forge._library.current.number == number + 1
+            with forge._library.pin() as new:
+                assert new.block_store.get(identity) is not None
+                assert new.indexer.get_entry(identity) is not None
+                assert identity in new.graph_executor._blocks
+
+    def test_existing_block_publishes_nothing(self, storage, custom_block):
+        block = custom_block("negate_value", "def negate_value(value):\n    return -value\n")
+        with NeuropForge(storage_path=str(storage), use_index_snapshot=False) as forge:
+            forge._store_block(block)
+            number = forge._library.current.number
+            assert forge._store_block(block).status.value == "already_exists"
+            assert forge._library.current.number == number
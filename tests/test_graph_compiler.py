@@ -0,0 +1,180 @@
+"""
+Tests for ahead-of-time graph compilation (runtime.graph_compiler).
+
+CompiledGraph.run() must give what GraphExecutor.execute() gives for the
+same graph: the two are run side by side on separate executors.
+"""
+import time
+
+from neurop_forge.runtime.executor import GraphExecutor
+from neurop_forge.runtime.guards import CircuitState, RetryPolicy
+from neurop_forge.runtime.result import ExecutionStatus, TraceMode
+from tests.conftest import ScriptedExecutor, make_graph
+
+DOUBLE = '''def double_value(value):
+    return value * 2
+'''
+
+DIVIDE = '''def invert_value(value):
+    return 1 / value
+'''
+
+FAST_RETRIES = RetryPolicy(max_retries=3, initial_delay_ms=1.0)
+
+
+def summary(result):
+    """What run() and execute() must agree on."""
+    return {
+        "status": result.status,
+        "final_outputs": result.final_outputs,
+        "counts": (
+            result.nodes_executed, result.nodes_succeeded,
+            result.nodes_failed, result.nodes_skipped,
+        ),
+        "traces": [
+            (t.node_id, t.status, t.inputs, t.outputs, t.error, t.retry_count)
+            for t in result.traces
+        ],
+    }
+
+
+def executors(blocks, **kwargs):
+    """Two executors with the same blocks registered."""
+    pair = []
+    for _ in range(2):
+        executor = GraphExecutor(**kwargs)
+        for identity, block in blocks.items():
+            executor.register_block(identity, block)
+        pair.append(executor)
+    return pair
+
+
+def run_both(graph, blocks, inputs, trace_mode=TraceMode.FULL, **kwargs):
+    interpreted, compiling = executors(blocks, **kwargs)
+    expected = interpreted.execute(graph, inputs, trace_mode=trace_mode)
+    actual = compiling.compile(graph).run(inputs, trace_mode=trace_mode)
+    return expected, actual
+
+
+class TestParity:
+    """run() matches execute()."""
+
+    def test_chain_with_full_traces(self, custom_block):
+        block = custom_block("double_value", DOUBLE)
+        graph = make_graph(("a", []), ("b", ["a"]), ("c", ["b"]))
+        expected, actual = run_both(graph, {"a": block, "b": block, "c": block}, {"value": 3})
+        assert actual.final_outputs == {"result": 24}
+        assert summary(actual) == summary(expected)
+
+    def test_trace_off_keeps_status_and_outputs(self, custom_block):
+        block = custom_block("double_value", DOUBLE)
+        graph = make_graph(("a", []), ("b", ["a"]))
+        expected, actual = run_both(graph, {"a": block, "b": block}, {"value": 5}, TraceMode.OFF)
+        assert actual.traces == [] and expected.traces == []
+        assert summary(actual) == summary(expected)
+        assert actual.nodes_succeeded == 2
+
+    def test_repeated_identity(self, custom_block):
+        block = custom_block("double_value", DOUBLE)
+        graph = make_graph(("a", []), ("a", []), ("a", ["a"]))
+        expected, actual = run_both(graph, {"a": block}, {"value": 1})
+        assert actual.final_outputs == {"result": 8}
+        assert summary(actual) == summary(expected)
+
+    def test_mock_nodes(self, custom_block):
+        block = custom_block("double_value", DOUBLE)
+        graph = make_graph(("a", []), ("missing", []), ("b", []))
+        expected, actual = run_both(graph, {"a": block, "b": block}, {"value": 2})
+        assert actual.traces[1].outputs["block_name"] == "missing"
+        assert summary(actual) == summary(expected)
+
+    def test_failed_node(self, custom_block):
+        double = custom_block("double_value", DOUBLE)
+        divide = custom_block("invert_value", DIVIDE)
+        graph = make_graph(("a", []), ("b", ["a"]))
+        expected, actual = run_both(graph, {"a": divide, "b": double}, {"value": 0})
+        assert actual.status == ExecutionStatus.PARTIAL_SUCCESS
+        assert actual.traces[0].error.startswith("ZeroDivisionError")
+        assert summary(actual) == summary(expected)
+
+
+class TestCircuitsAndRetries:
+    """Circuit breakers and the retry policy apply as in execute()."""
+
+    def test_open_circuit_skips_node(self, custom_block):
+        block = custom_block("double_value", DOUBLE)
+        graph = make_graph(("a", []), ("b", ["a"]))
+        interpreted, compiling = executors({"a": block, "b": block})
+        for executor in (interpreted, compiling):
+            circuit = executor._get_circuit_breaker("a")
+            circuit.state = CircuitState.OPEN
+            circuit.last_failure_time = time.time()
+        expected = interpreted.execute(graph, {"value": 1})
+        actual = compiling.compile(graph).run({"value": 1}, trace_mode=TraceMode.FULL)
+        assert actual.traces[0].status == ExecutionStatus.SKIPPED
+        assert actual.traces[0].error == "Circuit breaker open"
+        assert summary(actual) == summary(expected)
+
+    def test_failures_update_the_executor_circuit(self, custom_block):
+        block = custom_block("invert_value", DIVIDE)
+        executor = GraphExecutor()
+        executor.register_block("a", block)
+        compiled = executor.compile(make_graph(("a", [])))
+        for _ in range(5):
+            compiled.run({"value": 0})
+        assert executor._get_circuit_breaker("a").state == CircuitState.OPEN
+        assert compiled.run({"value": 0}).nodes_skipped == 1
+
+    def test_transient_failure_is_retried(self, custom_block):
+        block = custom_block("double_value", DOUBLE)
+        graph = make_graph(("a", []))
+        results = []
+        for compiled in (False, True):
+            block_executor = ScriptedExecutor(["ConnectionError: reset", "TimeoutError: slow"])
+            executor = GraphExecutor(retry_policy=FAST_RETRIES, block_executor=block_executor)
+            executor.register_block("a", block)
+            if compiled:
+                result = executor.compile(graph).run({"value": 4}, trace_mode=TraceMode.FULL)
+            else:
+                result = executor.execute(graph, {"value": 4})
+            assert block_executor.calls == 3
+            assert executor.get_retry_statistics()["retries"] == 2
+            results.append(result)
+        assert results[1].traces[0].retry_count == 2
+        assert results[1].final_outputs == {"result": 8}
+        assert summary(results[1]) == summary(results[0])
+
+    def test_deterministic_failure_is_not_retried(self, custom_block):
+        block = custom_block("invert_value", DIVIDE)
+        executor = GraphExecutor(retry_policy=FAST_RETRIES)
+        executor.register_block("a", block)
+        result = executor.compile(make_graph(("a", []))).run({"value": 0}, trace_mode=TraceMode.FULL)
+        assert result.traces[0].retry_count == 0
+        assert executor.get_retry_statistics()["deterministic_skipped"] == 1
+
+
+class TestCompile:
+    """What compile() resolves up front."""
+
+    def test_statistics(self, custom_block):
+        block = custom_block("double_value", DOUBLE)
+        executor = GraphExecutor()
+        executor.register_block("a", block)
+        compiled = executor.compile(make_graph(("a", []), ("missing", [])))
+        compiled.run({"value": 1})
+        compiled.run({"value": 2})
+        assert compiled.get_statistics() == {"nodes": 2, "mock_nodes": 1, "cached_bindings": 1}
+
+    def test_blocks_come_from_the_block_loader(self, custom_block):
+        block = custom_block("double_value", DOUBLE)
+        loaded = []
+
+        def loader(identity):
+            loaded.append(identity)
+            return block if identity == "a" else None
+
+        executor = GraphExecutor(block_loader=loader)
+        compiled = executor.compile(make_graph(("a", [])))
+        assert loaded == ["a"]
+        assert compiled.run({"value": 6}).final_outputs == {"result": 12}
+        assert loaded == ["a"]
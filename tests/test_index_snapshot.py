@@ -0,0 +1,223 @@
+"""
+Tests for the persisted index snapshot (library.index_snapshot) and its use
+when NeuropForge builds a library.
+"""
+import json
+import shutil
+
+import pytest
+
+from neurop_forge.core.block_schema import NeuropBlock
+from neurop_forge.library import index_snapshot
+from neurop_forge.library.block_header import BlockHeader
+from neurop_forge.library.index_snapshot import (
+    IndexSnapshot,
+    compute_code_digest,
+    compute_library_digest,
+    default_snapshot_path,
+    load_index_snapshot,
+    write_index_snapshot,
+)
+from neurop_forge.library.indexer import BlockIndexer
+from neurop_forge.main import NeuropForge
+from neurop_forge.semantic.composer import SemanticIndexEntry
+from tests.conftest import LIBRARY_PATH, NODE_INTENT
+
+
+def library_data(count=5):
+    return [json.loads(path.read_bytes()) for path in sorted(LIBRARY_PATH.glob("*.json"))[:count]]
+
+
+def headers_of(datas):
+    return [BlockHeader.from_block_data(data) for data in datas]
+
+
+def make_snapshot(datas):
+    indexer = BlockIndexer()
+    semantic_entries = []
+    for data in datas:
+        block = NeuropBlock.from_dict(data)
+        indexer.index_block(block)
+        header = BlockHeader.from_block_data(data)
+        semantic_entries.append(SemanticIndexEntry(
+            block_identity=header.identity,
+            name=header.name,
+            description=header.description,
+            category=header.category,
+            semantic_intent=NODE_INTENT,
+            input_data_types=("int",),
+            output_data_types=("int",),
+            trust_score=0.5,
+            is_pure=True,
+            is_deterministic=True,
+        ))
+    return IndexSnapshot(
+        library_digest=compute_library_digest(headers_of(datas)),
+        indexer_entries=indexer.get_entries(),
+        semantic_entries=semantic_entries,
+    )
+
+
+@pytest.fixture
+def written(tmp_path):
+    """A snapshot written for a small library, with its path and block data."""
+    datas = library_data()
+    snapshot = make_snapshot(datas)
+    path = tmp_path / "library.index.json"
+    assert write_index_snapshot(path, snapshot)
+    return path, snapshot, datas
+
+
+class TestLibraryDigest:
+    """The library digest covers every block's discovery fields."""
+
+    def test_independent_of_order(self):
+        headers = headers_of(library_data())
+        assert compute_library_digest(headers) == compute_library_digest(reversed(headers))
+
+    def test_changes_with_a_description(self):
+        datas = library_data()
+        before = compute_library_digest(headers_of(datas))
+        datas[2]["metadata"]["description"] += " (edited)"
+        assert compute_library_digest(headers_of(datas)) != before
+
+    def test_changes_with_added_or_removed_blocks(self):
+        headers = headers_of(library_data(6))
+        digest = compute_library_digest(headers[:5])
+        assert compute_library_digest(headers) != digest
+        assert compute_library_digest(headers[1:5]) != digest
+
+
+class TestLoadSnapshot:
+    """A snapshot loads only for the library and code it was built for."""
+
+    def test_round_trip(self, written):
+        path, snapshot, _ = written
+        loaded = load_index_snapshot(path, snapshot.library_digest)
+        assert [e.to_dict() for e in loaded.indexer_entries] == [
+            e.to_dict() for e in snapshot.indexer_entries
+        ]
+        assert [e.to_dict() for e in loaded.semantic_entries] == [
+            e.to_dict() for e in snapshot.semantic_entries
+        ]
+
+    def test_other_library_digest_is_rejected(self, written):
+        path, _, datas = written
+        datas[0]["metadata"]["description"] += " (edited)"
+        assert load_index_snapshot(path, compute_library_digest(headers_of(datas))) is None
+
+    def test_code_digest_change_is_rejected(self, written, monkeypatch):
+        path, snapshot, _ = written
+        monkeypatch.setattr(index_snapshot, "_code_digest", "0" * 64)
+        assert load_index_snapshot(path, snapshot.library_digest) is None
+
+    def test_code_digest_follows_the_index_sources(self, tmp_path, monkeypatch):
+        source = tmp_path / "indexer.py"
+        source.write_text("KEYWORDS = 1\n")
+        monkeypatch.setattr(index_snapshot, "_INDEX_SOURCES", (source,))
+        monkeypatch.setattr(index_snapshot, "_code_digest", None)
+        snapshot = make_snapshot(library_data(2))
+        path = tmp_path / "library.index.json"
+        write_index_snapshot(path, snapshot)
+        assert load_index_snapshot(path, snapshot.library_digest) is not None
+
+        source.write_text("KEYWORDS = 2\n")
+        monkeypatch.setattr(index_snapshot, "_code_digest", None)
+        assert load_index_snapshot(path, snapshot.library_digest) is None
+        assert compute_code_digest() != json.loads(path.read_text())["code_digest"]
+
+    def test_other_version_is_rejected(self, written):
+        path, snapshot, _ = written
+        data = json.loads(path.read_text())
+        data["snapshot_version"] = index_snapshot.SNAPSHOT_VERSION + 1
+        path.write_text(json.dumps(data))
+        assert load_index_snapshot(path, snapshot.library_digest) is None
+
+    @pytest.mark.parametrize("content", ["", "{", "[]", '{"snapshot_version": 1}'])
+    def test_unreadable_snapshot_is_ignored(self, written, content):
+        path, snapshot, _ = written
+        path.write_text(content)
+        assert load_index_snapshot(path, snapshot.library_digest) is None
+
+    def test_missing_snapshot(self, tmp_path):
+        assert load_index_snapshot(tmp_path / "missing.index.json", "x") is None
+
+    def test_unwritable_location(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        assert not write_index_snapshot(blocker / "library.index.json", make_snapshot([]))
+        assert list(tmp_path.iterdir()) == [blocker]
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """A small library directory copied from the expanded library."""
+    path = tmp_path / "library"
+    path.mkdir()
+    for source in sorted(LIBRARY_PATH.glob("*.json"))[:20]:
+        shutil.copy(source, path / source.name)
+    return path
+
+
+def indexed(forge):
+    with forge._library.pin() as library:
+        return (
+            [e.to_dict() for e in library.indexer.get_entries()],
+            [e.to_dict() for e in library.semantic_composer.get_entries()],
+        )
+
+
+class TestNeuropForgeSnapshot:
+    """NeuropForge reuses a matching snapshot and rebuilds a stale one."""
+
+    def test_matching_snapshot_skips_indexing(self, storage, monkeypatch):
+        with NeuropForge(storage_path=str(storage)) as forge:
+            built = indexed(forge)
+        assert default_snapshot_path(storage).is_file()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("index rebuilt despite a matching snapshot")
+
+        monkeypatch.setattr(BlockIndexer, "index_block", fail)
+        with NeuropForge(storage_path=str(storage)) as forge:
+            assert indexed(forge) == built
+
+    def test_edited_block_rebuilds_the_snapshot(self, storage):
+        with NeuropForge(storage_path=str(storage)):
+            pass
+        snapshot_path = default_snapshot_path(storage)
+        old_digest = json.loads(snapshot_path.read_text())["library_digest"]
+
+        path = sorted(storage.glob("*.json"))[0]
+        data = json.loads(path.read_text())
+        data["metadata"]["description"] = "Reworded description for the snapshot test"
+        path.write_text(json.dumps(data))
+
+        with NeuropForge(storage_path=str(storage)) as forge:
+            entry = next(
+                e for e in indexed(forge)[1] if e["block_identity"] == data["identity"]["hash_value"]
+            )
+            assert entry["description"] == data["metadata"]["description"]
+        assert json.loads(snapshot_path.read_text())["library_digest"] != old_digest
+
+    def test_code_change_rebuilds_the_snapshot(self, storage, monkeypatch):
+        with NeuropForge(storage_path=str(storage)) as forge:
+            built = indexed(forge)
+        monkeypatch.setattr(index_snapshot, "_code_digest", "0" * 64)
+        calls = []
+        original = BlockIndexer.index_block
+
+        def counting(self, block):
+            calls.append(block.get_identity_hash())
+            return original(self, block)
+
+        monkeypatch.setattr(BlockIndexer, "index_block", counting)
+        with NeuropForge(storage_path=str(storage)) as forge:
+            assert indexed(forge) == built
+        assert len(calls) == 20
+        assert json.loads(default_snapshot_path(storage).read_text())["code_digest"] == "0" * 64
+
+    def test_opt_out_writes_nothing(self, storage):
+        with NeuropForge(storage_path=str(storage), use_index_snapshot=False):
+            pass
+        assert not default_snapshot_path(storage).exists()
@@ -0,0 +1,255 @@
+"""
+Tests for the packed library archive (library.packed_archive).
+"""
+import hashlib
+import json
+import os
+import shutil
+
+import pytest
+
+from neurop_forge.library.block_header import BlockHeader
+from neurop_forge.library.block_store import BlockStore
+from neurop_forge.library.packed_archive import (
+    PackedLibrary,
+    default_archive_path,
+    open_library_archive,
+    write_packed_library,
+)
+from tests.conftest import LIBRARY_PATH
+
+DUPLICATED_NAME = "mask_email"
+
+
+def library_files(name=None):
+    files = sorted(LIBRARY_PATH.glob("*.json"))
+    if name is None:
+        return files
+    return [path for path in files if json.loads(path.read_bytes())["metadata"]["name"] == name]
+
+
+def write_block(directory, data):
+    """Write a block dict to its library file; return its identity."""
+    identity = data["identity"]["hash_value"]
+    (directory / f"{identity[:16]}.json").write_text(json.dumps(data))
+    return identity
+
+
+def new_copy(path, name=None):
+    """A block dict copied from a library file under a fresh identity."""
+    data = json.loads(path.read_bytes())
+    data["identity"]["hash_value"] = hashlib.sha256(
+        (data["identity"]["hash_value"] + "copy").encode()
+    ).hexdigest()
+    if name is not None:
+        data["metadata"]["name"] = name
+    return data
+
+
+def touch_after_pack(path, archive):
+    """Give a file an mtime newer than anything the archive was packed from."""
+    mtime_ns = archive.manifest["source_mtime_ns"] + 1_000_000_000
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def library(tmp_path):
+    """A small library with several blocks sharing one name."""
+    path = tmp_path / "library"
+    path.mkdir()
+    duplicates = library_files(DUPLICATED_NAME)
+    assert len(duplicates) >= 3
+    for source in library_files()[:10] + duplicates:
+        shutil.copy(source, path / source.name)
+    return path
+
+
+def identities_by_position(archive, name):
+    return sorted(archive.find_all_by_name(name), key=archive.position)
+
+
+class TestRoundTrip:
+    """Packing then reading gives back every block as it was on disk."""
+
+    def test_records_and_headers_round_trip(self, library):
+        result = write_packed_library(library)
+        assert result.is_success() and not result.errors
+        with PackedLibrary(default_archive_path(library)) as archive:
+            assert len(archive) == result.block_count == len(list(library.glob("*.json")))
+            for path in library.glob("*.json"):
+                data = json.loads(path.read_bytes())
+                identity = data["identity"]["hash_value"]
+                assert archive.get_data(identity) == data
+                assert archive.get_header(identity) == BlockHeader.from_dict(
+                    archive.get_header(identity).to_dict()
+                )
+                assert archive.get_header(identity).name == data["metadata"]["name"]
+                assert archive.find_by_prefix(path.stem) == identity
+                assert archive.get_block(identity).get_identity_hash() == identity
+
+    def test_unknown_identity(self, library):
+        write_packed_library(library)
+        with PackedLibrary(default_archive_path(library)) as archive:
+            assert archive.get_data("0" * 64) is None
+            assert archive.position("not hex") is None
+            assert archive.find_by_name("no_such_block") is None
+
+    def test_find_by_name_prefers_registry_block(self, library, tmp_path):
+        write_packed_library(library)
+        with PackedLibrary(default_archive_path(library)) as archive:
+            by_position = identities_by_position(archive, DUPLICATED_NAME)
+            assert archive.find_by_name(DUPLICATED_NAME) == by_position[0]
+        preferred = by_position[-1]
+        registry = tmp_path / "registry"
+        registry.mkdir()
+        (registry / "registry.json").write_text(json.dumps({"verified_blocks": {
+            preferred: {"verified": True, "block_name": DUPLICATED_NAME},
+        }}))
+
+        write_packed_library(library, registry_dir=registry)
+        with PackedLibrary(default_archive_path(library)) as archive:
+            assert archive.find_by_name(DUPLICATED_NAME) == preferred
+            assert archive.find_all_by_name(DUPLICATED_NAME) == [preferred] + by_position[:-1]
+            assert archive.registry_names() == {DUPLICATED_NAME: preferred}
+
+
+class TestStaleness:
+    """An archive is only used while the library directory is unchanged."""
+
+    def test_fresh_archive_opens(self, library):
+        write_packed_library(library)
+        archive = open_library_archive(library)
+        assert archive is not None
+        archive.close()
+
+    def test_added_file_makes_archive_stale(self, library):
+        write_packed_library(library)
+        extra = library_files()[20]
+        shutil.copy(extra, library / extra.name)
+        assert open_library_archive(library) is None
+
+    def test_modified_file_makes_archive_stale(self, library):
+        write_packed_library(library)
+        with PackedLibrary(default_archive_path(library)) as archive:
+            touch_after_pack(next(library.glob("*.json")), archive)
+        assert open_library_archive(library) is None
+
+    def test_file_replaced_by_older_copy_makes_archive_stale(self, library):
+        write_packed_library(library)
+        path = next(library.glob("*.json"))
+        data = json.loads(path.read_bytes())
+        data["metadata"]["description"] = "replaced"
+        stat = path.stat()
+        path.write_text(json.dumps(data))
+        older_ns = stat.st_mtime_ns - 1_000_000_000
+        os.utime(path, ns=(older_ns, older_ns))
+        assert open_library_archive(library) is None
+
+    def test_same_count_and_newest_mtime_is_still_stale(self, library):
+        write_packed_library(library)
+        files = sorted(library.glob("*.json"))
+        newest = max(path.stat().st_mtime_ns for path in files)
+        files[0].unlink()
+        extra = library_files()[20]
+        shutil.copy(extra, library / extra.name)
+        os.utime(library / extra.name, ns=(newest, newest))
+        assert open_library_archive(library) is None
+
+    def test_removed_file_makes_archive_stale(self, library):
+        write_packed_library(library)
+        next(library.glob("*.json")).unlink()
+        assert open_library_archive(library) is None
+
+    def test_archive_without_library_directory_is_the_library(self, library, tmp_path):
+        archive_path = tmp_path / "shipped.pack"
+        write_packed_library(library, archive_path)
+        shutil.rmtree(library)
+        archive = open_library_archive(library, archive_path)
+        assert archive is not None and len(archive) > 0
+        archive.close()
+
+    def test_corrupt_archive_is_ignored(self, library):
+        write_packed_library(library)
+        path = default_archive_path(library)
+        path.write_bytes(b"garbage" + path.read_bytes()[7:])
+        assert open_library_archive(library) is None
+
+
+@pytest.fixture
+def registry(library, tmp_path):
+    """A registry preferring the last-positioned block of the duplicated name."""
+    write_packed_library(library)
+    with PackedLibrary(default_archive_path(library)) as archive:
+        preferred = identities_by_position(archive, DUPLICATED_NAME)[-1]
+    path = tmp_path / "registry"
+    path.mkdir()
+    (path / "registry.json").write_text(json.dumps({"verified_blocks": {
+        preferred: {"verified": True, "block_name": DUPLICATED_NAME},
+    }}))
+    write_packed_library(library, registry_dir=path)
+    return preferred
+
+
+def shared_store(library, tmp_path):
+    return BlockStore(
+        storage_path=str(library),
+        quarantine_path=str(tmp_path / "quarantine"),
+        lazy=True,
+        shared_catalog=True,
+    )
+
+
+class TestCatalogFindByName:
+    """Blocks refreshed after packing follow the archive's name preference."""
+
+    def test_registry_block_beats_block_added_after_packing(self, library, tmp_path, registry):
+        store = shared_store(library, tmp_path)
+        catalog = store.shared_catalog
+        assert catalog.find_by_name(DUPLICATED_NAME) == registry
+        added = write_block(library, new_copy(library_files(DUPLICATED_NAME)[0]))
+        assert store.refresh().added == [added]
+        assert catalog.find_by_name(DUPLICATED_NAME) == registry
+
+    def test_archived_block_beats_block_added_after_packing(self, library, tmp_path):
+        write_packed_library(library)
+        store = shared_store(library, tmp_path)
+        catalog = store.shared_catalog
+        first = identities_by_position(catalog.archive, DUPLICATED_NAME)[0]
+        write_block(library, new_copy(library_files(DUPLICATED_NAME)[0]))
+        store.refresh()
+        assert catalog.find_by_name(DUPLICATED_NAME) == first
+
+    def test_refreshed_registry_block_still_wins(self, library, tmp_path, registry):
+        store = shared_store(library, tmp_path)
+        path = library / f"{registry[:16]}.json"
+        data = json.loads(path.read_bytes())
+        data["metadata"]["description"] += " (edited)"
+        path.write_text(json.dumps(data))
+        assert store.refresh().updated == [registry]
+        assert store.shared_catalog.find_by_name(DUPLICATED_NAME) == registry
+
+    def test_removed_registry_block_falls_back_to_index_order(self, library, tmp_path, registry):
+        store = shared_store(library, tmp_path)
+        catalog = store.shared_catalog
+        first = identities_by_position(catalog.archive, DUPLICATED_NAME)[0]
+        (library / f"{registry[:16]}.json").unlink()
+        store.refresh()
+        assert catalog.find_by_name(DUPLICATED_NAME) == first
+
+    def test_renamed_block_competes_in_index_order(self, library, tmp_path):
+        write_packed_library(library)
+        store = shared_store(library, tmp_path)
+        catalog = store.shared_catalog
+        first = identities_by_position(catalog.archive, DUPLICATED_NAME)[0]
+        others = [
+            identity for identity in catalog.archive.identities()
+            if catalog[identity].name != DUPLICATED_NAME
+        ]
+        renamed = min(others, key=catalog.archive.position)
+        path = library / f"{renamed[:16]}.json"
+        data = json.loads(path.read_bytes())
+        data["metadata"]["name"] = DUPLICATED_NAME
+        path.write_text(json.dumps(data))
+        store.refresh()
+        expected = min([first, renamed], key=catalog.archive.position)
+        assert catalog.find_by_name(DUPLICATED_NAME) == expected
@@ -0,0 +1,91 @@
+"""
+Tests for parallel loading of block JSON files (library.parallel_loader).
+
+Every parallel load must give what an in-process load gives: the same
+records in the same order and the same per-file errors.
+"""
+import shutil
+
+import pytest
+
+from neurop_forge.library.parallel_loader import (
+    MIN_FILES_PER_WORKER,
+    LoadTarget,
+    load_block_files,
+    load_library_files,
+    resolve_workers,
+)
+from tests.conftest import LIBRARY_PATH
+
+FILE_COUNT = MIN_FILES_PER_WORKER * 4
+
+
+def comparable(result, target):
+    """Records as plain data, so parallel and serial loads can be compared."""
+    if target is LoadTarget.DATA:
+        return result.records
+    return [(stem, obj.to_dict()) for stem, obj in result.records]
+
+
+@pytest.fixture(scope="module")
+def library(tmp_path_factory):
+    """Library files with a few broken ones spread through the name order."""
+    path = tmp_path_factory.mktemp("library")
+    for source in sorted(LIBRARY_PATH.glob("*.json"))[:FILE_COUNT]:
+        shutil.copy(source, path / source.name)
+    (path / "0000_truncated.json").write_text('{"identity": ')
+    (path / "8888_not_a_block.json").write_text('{"identity": {}}')
+    (path / "ffff_empty.json").write_text("")
+    return path
+
+
+class TestResolveWorkers:
+    """How many worker processes a load uses."""
+
+    def test_small_loads_stay_in_process(self):
+        assert resolve_workers(8, MIN_FILES_PER_WORKER - 1) == 1
+        assert resolve_workers(1, FILE_COUNT) == 1
+
+    def test_capped_by_files_per_worker(self):
+        assert resolve_workers(16, MIN_FILES_PER_WORKER * 3) == 3
+        assert resolve_workers(2, MIN_FILES_PER_WORKER * 3) == 2
+
+    def test_default_is_one_per_cpu(self):
+        assert resolve_workers(None, 10 ** 6) == resolve_workers(0, 10 ** 6) >= 1
+
+
+class TestParity:
+    """Parallel loads match a serial load."""
+
+    @pytest.mark.parametrize("target", list(LoadTarget))
+    def test_records_and_errors_match_serial(self, library, target):
+        serial = load_library_files(library, target=target, workers=1)
+        parallel = load_library_files(library, target=target, workers=4)
+        assert serial.workers == 1
+        assert parallel.file_count == serial.file_count == FILE_COUNT + 3
+        assert comparable(parallel, target) == comparable(serial, target)
+        assert [e.to_dict() for e in parallel.errors] == [e.to_dict() for e in serial.errors]
+
+    def test_every_broken_file_is_reported(self, library):
+        result = load_library_files(library, workers=4)
+        assert len(result.records) == FILE_COUNT
+        assert [e.path.rsplit("/", 1)[-1] for e in result.errors] == [
+            "0000_truncated.json", "8888_not_a_block.json", "ffff_empty.json",
+        ]
+        assert all(e.error.split(":", 1)[0].endswith("Error") for e in result.errors)
+
+    def test_records_follow_the_given_order(self, library):
+        paths = sorted(library.glob("*.json"), reverse=True)
+        result = load_block_files(paths, target=LoadTarget.DATA, workers=4)
+        loaded = [stem for stem, _ in result.records]
+        failed = {e.path.rsplit("/", 1)[-1][:-5] for e in result.errors}
+        assert loaded == [p.stem for p in paths if p.stem not in failed]
+
+    def test_blocks_are_keyed_by_file_stem(self, library):
+        result = load_library_files(library, workers=4)
+        for stem, block in result.records[:10]:
+            assert block.get_identity_hash().startswith(stem)
+
+    def test_empty_library(self, tmp_path):
+        result = load_library_files(tmp_path, workers=4)
+        assert (result.records, result.errors, result.file_count) == ([], [], 0)
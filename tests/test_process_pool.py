@@ -0,0 +1,90 @@
+"""
+Tests for the process-pool execution backend (runtime.process_pool).
+"""
+import threading
+import time
+
+import pytest
+
+from neurop_forge.runtime.executor import BlockExecutor
+from neurop_forge.runtime import process_pool
+from neurop_forge.runtime.process_pool import PooledBlockExecutor
+
+SPIN = '''def spin_forever(value):
+    while True:
+        value += 1
+'''
+
+DOUBLE = '''def double_value(value):
+    return value * 2
+'''
+
+
+@pytest.fixture
+def pool():
+    executor = PooledBlockExecutor(workers=1, default_timeout_ms=2000.0)
+    yield executor
+    executor.close()
+
+
+class TestPoolExecution:
+    """Results and errors match BlockExecutor."""
+
+    def test_matches_in_process_executor(self, pool, library_block):
+        block = library_block("absolute_value")
+        for value in (-3, 0, 2.5):
+            assert pool.execute(block, {"value": value}) == BlockExecutor().execute(block, {"value": value})
+
+    def test_execute_many_in_order(self, pool, custom_block):
+        block = custom_block("double_value", DOUBLE)
+        results = pool.execute_many(block, [{"value": index} for index in range(10)])
+        assert [outputs["result"] for outputs, _ in results] == [index * 2 for index in range(10)]
+
+
+class TestTimeoutAndRespawn:
+    """An overrunning call is killed and its worker replaced."""
+
+    def test_timeout_kills_and_respawns(self, pool, custom_block):
+        spin = custom_block("spin_forever", SPIN, max_execution_time_ms=300)
+        outputs, error = pool.execute(spin, {"value": 1})
+        assert outputs == {}
+        assert error.startswith("Timeout after 300")
+
+        stats = pool.get_statistics()
+        assert stats["timeouts"] == 1
+        assert stats["respawns"] == 1
+
+        outputs, error = pool.execute(custom_block("double_value", DOUBLE), {"value": 21})
+        assert error is None
+        assert outputs["result"] == 42
+
+
+class TestWaitingForWorker:
+    """Calls waiting for an idle worker never hang."""
+
+    def test_close_releases_waiting_caller(self, pool, custom_block, monkeypatch):
+        monkeypatch.setattr(process_pool, "IDLE_POLL_INTERVAL_S", 0.05)
+        worker = pool._idle.get()
+        results = []
+        waiter = threading.Thread(
+            target=lambda: results.append(pool._run(custom_block("double_value", DOUBLE), {"value": 1})),
+        )
+        waiter.start()
+        time.sleep(0.2)
+        pool.close()
+        waiter.join(5.0)
+        worker.stop()
+        assert not waiter.is_alive()
+        assert results == [({}, "WorkerError: process pool is closed")]
+
+    def test_no_idle_worker_times_out(self, pool, custom_block, monkeypatch):
+        monkeypatch.setattr(process_pool, "IDLE_POLL_INTERVAL_S", 0.05)
+        monkeypatch.setattr(process_pool, "WORKER_START_TIMEOUT_S", 0.2)
+        worker = pool._idle.get()
+        try:
+            block = custom_block("double_value", DOUBLE, max_execution_time_ms=100)
+            outputs, error = pool._run(block, {"value": 1})
+        finally:
+            pool._idle.put(worker)
+        assert outputs == {}
+        assert error.startswith("WorkerError: no worker became available")
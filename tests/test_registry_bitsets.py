@@ -0,0 +1,261 @@
+"""
+Tests for the bitset-backed registries (library.registry_bitsets) and the
+archive flag bitsets sharing their bitmap (library.packed_archive).
+
+Every bitset is checked against a plain set of the same identities.
+"""
+import hashlib
+import json
+import os
+import random
+import shutil
+
+import pytest
+
+from neurop_forge.core.block_schema import PurityLevel
+from neurop_forge.library.bitsets import bit_is_set, iter_bit_positions, to_bitmap
+from neurop_forge.library.packed_archive import (
+    ArchiveFlagSet,
+    PackedLibrary,
+    write_packed_library,
+)
+from neurop_forge.library.parallel_loader import LoadTarget, load_library_files
+from neurop_forge.library.registry_bitsets import (
+    BlockBitset,
+    OrdinalTable,
+    RegistryBitsets,
+    build_registry_bitsets,
+    load_registry_bitsets,
+)
+from tests.conftest import LIBRARY_PATH
+
+
+def identity(n):
+    return hashlib.sha256(str(n).encode()).hexdigest()
+
+
+IDENTITIES = [identity(n) for n in range(300)]
+UNKNOWN = identity("unknown")
+
+
+@pytest.fixture
+def table():
+    return OrdinalTable(IDENTITIES)
+
+
+@pytest.fixture
+def subsets():
+    """Random subsets of IDENTITIES, including the empty and full sets."""
+    rng = random.Random(7)
+    return [set(), set(IDENTITIES)] + [
+        {ident for ident in IDENTITIES if rng.random() < density}
+        for density in (0.01, 0.1, 0.5, 0.9)
+    ]
+
+
+def as_bitset(table, identities):
+    return BlockBitset(table, table.mask(identities))
+
+
+class TestBitmap:
+    """The shared bitmap primitives."""
+
+    def test_positions_round_trip(self):
+        positions = [0, 1, 7, 8, 63, 64, 299]
+        bits = sum(1 << position for position in positions)
+        assert list(iter_bit_positions(to_bitmap(bits))) == positions
+
+    def test_bit_is_set_matches_shift(self):
+        bits = int(hashlib.sha256(b"bits").hexdigest(), 16)
+        bitmap = to_bitmap(bits)
+        for position in range(300):
+            assert bit_is_set(bitmap, position) == bool(bits >> position & 1)
+
+    def test_bit_is_set_at_offset(self):
+        bitmap = b"\xff\x00" + to_bitmap(0b100)
+        assert bit_is_set(bitmap, 2, offset=2)
+        assert not bit_is_set(bitmap, 3, offset=2)
+        assert not bit_is_set(bitmap, 100, offset=2)
+
+    def test_empty_bitmap(self):
+        assert to_bitmap(0) == b""
+        assert list(iter_bit_positions(b"")) == []
+        assert not bit_is_set(b"", 0)
+
+
+class TestBlockBitset:
+    """BlockBitset behaves like the set it was built from."""
+
+    def test_membership(self, table, subsets):
+        for subset in subsets:
+            bitset = as_bitset(table, subset)
+            for ident in IDENTITIES:
+                assert (ident in bitset) == (ident in subset)
+            assert UNKNOWN not in bitset
+            assert 42 not in bitset
+
+    def test_iteration_and_len(self, table, subsets):
+        for subset in subsets:
+            bitset = as_bitset(table, subset)
+            assert len(bitset) == len(subset)
+            assert list(bitset) == [ident for ident in IDENTITIES if ident in subset]
+
+    def test_operations_with_same_table(self, table, subsets):
+        for left in subsets:
+            for right in subsets:
+                a, b = as_bitset(table, left), as_bitset(table, right)
+                for result, expected in (
+                    (a & b, left & right),
+                    (a | b, left | right),
+                    (a - b, left - right),
+                    (a ^ b, left ^ right),
+                ):
+                    assert isinstance(result, BlockBitset)
+                    assert set(result) == expected
+                    assert result == expected
+                    assert all(ident in result for ident in expected)
+
+    def test_operations_with_plain_sets(self, table, subsets):
+        left, right = subsets[3], subsets[4] | {UNKNOWN}
+        bitset = as_bitset(table, left)
+        assert bitset & right == left & right
+        assert right & bitset == left & right
+        assert bitset | right == left | right
+        assert bitset - right == left - right
+
+    def test_discarded_identity_is_not_a_member(self, table, subsets):
+        subset = subsets[4]
+        bitset = as_bitset(table, subset)
+        removed = next(iter(subset))
+        table.discard(removed)
+        assert removed not in bitset
+        assert set(bitset) == subset - {removed}
+
+
+@pytest.fixture
+def packed(tmp_path):
+    """A packed library with verified and tier_a flags, plus the expected ids."""
+    library = tmp_path / "library"
+    library.mkdir()
+    for source in sorted(LIBRARY_PATH.glob("*.json"))[:40]:
+        shutil.copy(source, library / source.name)
+    headers = [
+        header for _, header in
+        load_library_files(library, LoadTarget.HEADER, workers=1).records
+    ]
+    identities = sorted(header.identity for header in headers)
+    verified = set(identities[::3])
+    tier_a = set(identities[1::4]) | {UNKNOWN}
+
+    registry = tmp_path / "registry"
+    registry.mkdir()
+    (registry / "registry.json").write_text(json.dumps({"verified_blocks": {
+        block_id: {"verified": True} for block_id in verified
+    }}))
+    (registry / "tier_registry.json").write_text(json.dumps({
+        "tier_a": sorted(tier_a), "tier_b": [], "quarantined": [],
+    }))
+    result = write_packed_library(library, registry_dir=registry)
+    archive = PackedLibrary(result.archive_path)
+    yield {
+        "archive": archive,
+        "library": library,
+        "registry": registry,
+        "headers": headers,
+        "identities": identities,
+        "verified": verified,
+        "tier_a": tier_a,
+    }
+    archive.close()
+
+
+class TestArchiveFlagSet:
+    """ArchiveFlagSet matches the registry ids that are in the archive."""
+
+    def test_membership_iteration_and_len(self, packed):
+        archive = packed["archive"]
+        for flag in ("verified", "tier_a"):
+            expected = packed[flag] & set(packed["identities"])
+            flag_set = ArchiveFlagSet(archive, flag)
+            for ident in packed["identities"] + [UNKNOWN, "not-hex"]:
+                assert (ident in flag_set) == (ident in expected)
+                assert archive.has_flag(flag, ident) == (ident in expected)
+            assert set(flag_set) == expected
+            assert len(flag_set) == len(expected)
+
+    def test_unpacked_flag_is_empty(self, packed):
+        flag_set = ArchiveFlagSet(packed["archive"], "missing")
+        assert len(flag_set) == 0
+        assert list(flag_set) == []
+        assert packed["identities"][0] not in flag_set
+
+    def test_operations_agree_with_registry_bitsets(self, packed):
+        archive = packed["archive"]
+        bitsets = build_registry_bitsets(packed["headers"], packed["registry"])
+        in_archive = set(packed["identities"])
+        verified = ArchiveFlagSet(archive, "verified")
+        tier_a = bitsets.flag("tier_a")
+        assert verified & tier_a == packed["verified"] & packed["tier_a"]
+        assert tier_a & verified == packed["verified"] & packed["tier_a"]
+        assert verified - tier_a == (packed["verified"] - packed["tier_a"]) & in_archive
+        assert verified | tier_a == (packed["verified"] & in_archive) | packed["tier_a"]
+
+
+class TestRegistryBitsets:
+    """Registry flags built from registry files and headers."""
+
+    def test_flags_match_registry_and_headers(self, packed):
+        bitsets = build_registry_bitsets(packed["headers"], packed["registry"])
+        pure = {
+            header.identity for header in packed["headers"]
+            if header.purity == PurityLevel.PURE.value
+        }
+        assert bitsets.flag("verified") == packed["verified"]
+        assert bitsets.flag("tier_a") == packed["tier_a"]
+        assert bitsets.flag("pure") == pure
+        assert bitsets.flag("missing") == set()
+        for ident in packed["identities"] + [UNKNOWN]:
+            assert bitsets.has("tier_a", ident) == (ident in packed["tier_a"])
+            assert bitsets.has("pure", ident) == (ident in pure)
+
+    def test_flag_is_reused_until_its_mask_changes(self):
+        table = OrdinalTable(IDENTITIES)
+        bitsets = RegistryBitsets(table, {"verified": table.mask(IDENTITIES[:5])})
+        assert bitsets.flag("verified") is bitsets.flag("verified")
+        bitsets.flags["verified"] = table.mask(IDENTITIES[5:10])
+        assert bitsets.flag("verified") == set(IDENTITIES[5:10])
+        assert not bitsets.has("verified", IDENTITIES[0])
+
+    def test_sidecar_round_trip(self, packed):
+        bitsets = build_registry_bitsets(packed["headers"], packed["registry"])
+        loaded = RegistryBitsets.from_bytes(bitsets.to_bytes())
+        for name in bitsets.flags:
+            assert set(loaded.flag(name)) == set(bitsets.flag(name))
+
+    def test_sidecar_round_trip_compacts_holes(self):
+        table = OrdinalTable(IDENTITIES)
+        bitsets = RegistryBitsets(table, {"verified": table.mask(IDENTITIES[::2])})
+        table.discard(IDENTITIES[0])
+        loaded = RegistryBitsets.from_bytes(bitsets.to_bytes())
+        assert loaded.table.capacity == len(IDENTITIES) - 1
+        assert loaded.flag("verified") == set(IDENTITIES[2::2])
+
+    def test_load_rebuilds_stale_sidecar(self, packed):
+        registry, library = packed["registry"], packed["library"]
+        first = load_registry_bitsets(registry, library)
+        assert (registry / "registry.bits").is_file()
+        assert first.flag("verified") == packed["verified"]
+
+        (registry / "registry.json").write_text(json.dumps({"verified_blocks": {}}))
+        assert load_registry_bitsets(registry, library).flag("verified") == set()
+
+    def test_load_rebuilds_when_a_block_file_is_replaced(self, packed):
+        registry, library = packed["registry"], packed["library"]
+        load_registry_bitsets(registry, library)
+        path = next(library.glob("*.json"))
+        stat = path.stat()
+        path.write_text(path.read_text() + " ")
+        os.utime(path, ns=(stat.st_mtime_ns - 1, stat.st_mtime_ns - 1))
+        stale = RegistryBitsets.load(registry / "registry.bits")
+        assert not stale.is_fresh(registry, library)
+        assert load_registry_bitsets(registry, library).is_fresh(registry, library)
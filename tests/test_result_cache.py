@@ -0,0 +1,148 @@
+"""
+Tests for the pure-block result cache (runtime.result_cache).
+"""
+import pytest
+
+from neurop_forge.runtime import result_cache
+from neurop_forge.runtime.executor import BlockExecutor
+from neurop_forge.runtime.result_cache import ResultCache, canonical_input_hash
+
+COUNTING = '''def count_calls(value):
+    return [value]
+'''
+
+FAILING = '''def fail_on_negative(value):
+    if value < 0:
+        raise ValueError("negative")
+    return value
+'''
+
+
+class TestInputKeying:
+    """Inputs are keyed by value and type, never by equality alone."""
+
+    def test_equal_inputs_share_a_hash(self):
+        inputs = {"items": [1, "a", None, 2.5], "options": {"deep": (True, b"x")}}
+        assert canonical_input_hash(inputs) == canonical_input_hash(dict(inputs))
+
+    def test_types_are_distinguished(self):
+        values = [1, 1.0, True, "1", [1], (1,), b"\x01", None, {"1": 1}]
+        hashes = {canonical_input_hash({"value": value}) for value in values}
+        assert len(hashes) == len(values)
+
+    def test_nested_boundaries_are_distinguished(self):
+        assert canonical_input_hash({"v": ["ab", "c"]}) != canonical_input_hash({"v": ["a", "bc"]})
+        assert canonical_input_hash({"v": [[1], 2]}) != canonical_input_hash({"v": [[1, 2]]})
+
+    def test_dict_order_matters(self):
+        assert canonical_input_hash({"a": 1, "b": 2}) != canonical_input_hash({"b": 2, "a": 1})
+
+    def test_parameter_names_matter(self):
+        assert canonical_input_hash({"a": 1}) != canonical_input_hash({"b": 1})
+
+    @pytest.mark.parametrize("value", [{1, 2}, object(), {1: "non-str key"}, 1 + 2j])
+    def test_unsupported_values_are_not_cached(self, value):
+        assert canonical_input_hash({"value": value}) is None
+
+    def test_large_inputs_are_not_cached(self):
+        assert canonical_input_hash({"value": "x" * 100}, max_bytes=50) is None
+        assert canonical_input_hash({"value": "x" * 10}, max_bytes=50) is not None
+
+    def test_key_includes_block(self):
+        cache = ResultCache()
+        assert cache.key_for("block-a", {"value": 1}) != cache.key_for("block-b", {"value": 1})
+        assert cache.key_for("block-a", {"value": {1}}) is None
+        assert cache.get_statistics()["skipped"] == 1
+
+
+class TestResultCache:
+    """Entries are bounded, expire, and come back as fresh copies."""
+
+    def test_hit_is_a_fresh_copy(self):
+        cache = ResultCache()
+        key = cache.key_for("block", {"value": 1})
+        cache.put(key, {"result": [1]})
+        first = cache.get(key)
+        first["result"].append(2)
+        assert cache.get(key) == {"result": [1]}
+
+    def test_lru_eviction(self):
+        cache = ResultCache(max_entries=2)
+        keys = [cache.key_for("block", {"value": value}) for value in range(3)]
+        cache.put(keys[0], {"result": 0})
+        cache.put(keys[1], {"result": 1})
+        cache.get(keys[0])
+        cache.put(keys[2], {"result": 2})
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) == {"result": 0}
+        assert cache.get_statistics()["evictions"] == 1
+
+    def test_byte_bound(self):
+        cache = ResultCache(max_bytes=1000)
+        assert not cache.put(("block", "big"), {"result": "x" * 2000})
+        for value in range(20):
+            cache.put(("block", str(value)), {"result": "x" * 100})
+        assert cache.get_statistics()["bytes"] <= 1000
+
+    def test_ttl(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(result_cache.time, "monotonic", lambda: now[0])
+        cache = ResultCache(ttl_seconds=10)
+        cache.put(("block", "key"), {"result": 1})
+        now[0] += 5
+        assert cache.get(("block", "key")) == {"result": 1}
+        now[0] += 10
+        assert cache.get(("block", "key")) is None
+        assert cache.get_statistics()["expirations"] == 1
+
+    def test_unpicklable_outputs_are_skipped(self):
+        cache = ResultCache()
+        assert not cache.put(("block", "key"), {"result": lambda: None})
+        assert len(cache) == 0
+
+    def test_invalidate_block(self):
+        cache = ResultCache()
+        cache.put(("a", "1"), {"result": 1})
+        cache.put(("a", "2"), {"result": 2})
+        cache.put(("b", "1"), {"result": 3})
+        assert cache.invalidate_block("a") == 2
+        assert len(cache) == 1
+
+
+class TestExecutorCaching:
+    """BlockExecutor caches successful calls of pure, deterministic blocks only."""
+
+    def test_pure_block_is_cached(self, custom_block):
+        cache = ResultCache()
+        executor = BlockExecutor(result_cache=cache)
+        block = custom_block("count_calls", COUNTING)
+        first = executor.execute(block, {"value": 1})
+        assert executor.execute(block, {"value": 1}) == first
+        assert executor.execute(block, {"value": 1.0})[0]["result"] == [1.0]
+        stats = cache.get_statistics()
+        assert stats["hits"] == 1
+        assert stats["entries"] == 2
+
+    def test_impure_block_is_not_cached(self, custom_block):
+        cache = ResultCache()
+        executor = BlockExecutor(result_cache=cache)
+        block = custom_block("count_calls", COUNTING, purity="non_deterministic", deterministic=False)
+        executor.execute(block, {"value": 1})
+        executor.execute(block, {"value": 1})
+        assert len(cache) == 0
+        assert cache.get_statistics()["hits"] == 0
+
+    def test_failures_are_not_cached(self, custom_block):
+        cache = ResultCache()
+        executor = BlockExecutor(result_cache=cache)
+        block = custom_block("fail_on_negative", FAILING)
+        _, error = executor.execute(block, {"value": -1})
+        assert error is not None
+        assert len(cache) == 0
+
+    def test_cached_outputs_can_be_mutated(self, custom_block):
+        executor = BlockExecutor(result_cache=ResultCache())
+        block = custom_block("count_calls", COUNTING)
+        outputs, _ = executor.execute(block, {"value": 1})
+        outputs["result"].append("mutated")
+        assert executor.execute(block, {"value": 1})[0]["result"] == [1]
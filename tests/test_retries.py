@@ -0,0 +1,132 @@
+"""
+Tests for the deterministic-failure-aware retry scheduler
+(guards.classify_failure, RetryPolicy and GraphExecutor._next_retry_delay).
+"""
+import pytest
+
+from neurop_forge.runtime.executor import GraphExecutor
+from neurop_forge.runtime.guards import ExecutionGuard, FailureKind, RetryPolicy, classify_failure
+from neurop_forge.runtime.result import ExecutionStatus
+from tests.conftest import ScriptedExecutor, make_graph
+
+DOUBLE = '''def double_value(value):
+    return value * 2
+'''
+
+DIVIDE = '''def invert_value(value):
+    return 1 / value
+'''
+
+POLICY = RetryPolicy(max_retries=3, initial_delay_ms=10.0, max_delay_ms=25.0)
+
+
+def next_delay(executor, block, error, attempt=0, guard=None):
+    return executor._next_retry_delay(block, error, Exception(error), attempt, guard)
+
+
+class TestClassifyFailure:
+    """Which failures a retry can change."""
+
+    @pytest.mark.parametrize("error", [
+        "TimeoutError: took too long",
+        "ConnectionResetError: peer reset",
+        "WorkerError: worker died",
+        "RuntimeError: upstream timeout",
+    ])
+    def test_transient_errors(self, error):
+        assert classify_failure(error, True) == FailureKind.TRANSIENT
+        assert classify_failure(error, False) == FailureKind.TRANSIENT
+
+    @pytest.mark.parametrize("error", [
+        "ZeroDivisionError: division by zero",
+        "TypeError: unsupported operand",
+        "KeyError: 'x'",
+    ])
+    def test_logic_errors_depend_on_the_block(self, error):
+        assert classify_failure(error, True) == FailureKind.DETERMINISTIC
+        assert classify_failure(error, False) == FailureKind.TRANSIENT
+
+
+class TestNextRetryDelay:
+    """The backoff chosen (or not) after a failed call."""
+
+    def test_deterministic_failure_is_not_retried(self, custom_block):
+        executor = GraphExecutor(retry_policy=POLICY)
+        delay = next_delay(executor, custom_block("invert_value", DIVIDE), "ZeroDivisionError: x")
+        assert delay is None
+        stats = executor.get_retry_statistics()
+        assert stats["deterministic_skipped"] == 1
+        assert stats["wait_saved_ms"] == POLICY.remaining_delay(0) == 10.0 + 20.0 + 25.0
+
+    def test_deterministic_failure_retried_when_allowed(self, custom_block):
+        policy = RetryPolicy(max_retries=3, initial_delay_ms=10.0, retry_deterministic=True)
+        executor = GraphExecutor(retry_policy=policy)
+        assert next_delay(executor, custom_block("invert_value", DIVIDE), "ZeroDivisionError: x") == 10.0
+
+    def test_impure_block_failure_is_retried(self, custom_block):
+        block = custom_block("invert_value", DIVIDE, purity="non_deterministic", deterministic=False)
+        executor = GraphExecutor(retry_policy=POLICY)
+        assert next_delay(executor, block, "ZeroDivisionError: x") == 10.0
+
+    def test_transient_backoff_is_exponential_and_capped(self, custom_block):
+        executor = GraphExecutor(retry_policy=POLICY)
+        block = custom_block("double_value", DOUBLE)
+        delays = [next_delay(executor, block, "TimeoutError: x", attempt) for attempt in range(4)]
+        assert delays == [10.0, 20.0, 25.0, None]
+        stats = executor.get_retry_statistics()
+        assert (stats["retries"], stats["wait_ms"]) == (3, 55.0)
+
+    def test_jitter_only_shortens_the_delay(self, custom_block):
+        policy = RetryPolicy(max_retries=3, initial_delay_ms=100.0, jitter=0.5)
+        executor = GraphExecutor(retry_policy=policy)
+        block = custom_block("double_value", DOUBLE)
+        for _ in range(20):
+            assert 50.0 <= next_delay(executor, block, "TimeoutError: x") <= 100.0
+
+    def test_backoff_past_the_guard_is_skipped(self, custom_block):
+        executor = GraphExecutor(retry_policy=POLICY)
+        guard = ExecutionGuard(timeout_ms=15.0)
+        guard.start()
+        block = custom_block("double_value", DOUBLE)
+        assert next_delay(executor, block, "TimeoutError: x", 1, guard) is None
+        stats = executor.get_retry_statistics()
+        assert (stats["budget_skipped"], stats["wait_saved_ms"]) == (1, 45.0)
+
+    def test_exceptions_outside_the_policy_are_not_retried(self, custom_block):
+        policy = RetryPolicy(max_retries=3, initial_delay_ms=10.0, retry_on_exceptions=(TimeoutError,))
+        executor = GraphExecutor(retry_policy=policy)
+        block = custom_block("double_value", DOUBLE)
+        assert executor._next_retry_delay(block, "OSError: x", OSError("x"), 0) is None
+        assert executor._next_retry_delay(block, "TimeoutError: x", TimeoutError("x"), 0) == 10.0
+
+
+class TestRetriedExecution:
+    """Retries as a graph run makes them."""
+
+    def test_transient_failures_are_retried_until_success(self, custom_block):
+        block_executor = ScriptedExecutor(["ConnectionError: reset", "TimeoutError: slow"])
+        executor = GraphExecutor(retry_policy=POLICY, block_executor=block_executor)
+        executor.register_block("a", custom_block("double_value", DOUBLE))
+        result = executor.execute(make_graph(("a", [])), {"value": 2})
+        assert result.status == ExecutionStatus.SUCCESS
+        assert result.traces[0].retry_count == 2
+        assert block_executor.calls == 3
+        assert executor.get_retry_statistics()["wait_ms"] == 30.0
+
+    def test_deterministic_failure_runs_once(self, custom_block):
+        block_executor = ScriptedExecutor()
+        executor = GraphExecutor(retry_policy=POLICY, block_executor=block_executor)
+        executor.register_block("a", custom_block("invert_value", DIVIDE))
+        result = executor.execute(make_graph(("a", [])), {"value": 0})
+        assert result.status == ExecutionStatus.FAILED
+        assert result.traces[0].retry_count == 0
+        assert block_executor.calls == 1
+
+    def test_retries_stop_at_max_retries(self, custom_block):
+        block_executor = ScriptedExecutor(["TimeoutError: slow"] * 10)
+        executor = GraphExecutor(retry_policy=POLICY, block_executor=block_executor)
+        executor.register_block("a", custom_block("double_value", DOUBLE))
+        result = executor.execute(make_graph(("a", [])), {"value": 2})
+        assert result.traces[0].error == "TimeoutError: slow"
+        assert result.traces[0].retry_count == 3
+        assert block_executor.calls == 4
@@ -0,0 +1,99 @@
+"""
+Tests for DAG-parallel graph scheduling (runtime.scheduler).
+"""
+import concurrent.futures
+import threading
+
+from neurop_forge.main import NeuropForge
+from neurop_forge.runtime.executor import BlockExecutor, GraphExecutor
+from neurop_forge.runtime.result import ExecutionStatus
+from neurop_forge.runtime.scheduler import build_schedule
+from tests.conftest import make_graph
+
+DOUBLE = '''def double_value(value):
+    return value * 2
+'''
+
+
+class BarrierExecutor(BlockExecutor):
+    """The first `parties` calls only return once all of them are running."""
+
+    def __init__(self, parties):
+        super().__init__()
+        self._barrier = threading.Barrier(parties, timeout=5.0)
+        self._waiting = parties
+        self._lock = threading.Lock()
+
+    def execute(self, block, inputs):
+        with self._lock:
+            wait = self._waiting > 0
+            self._waiting -= 1
+        if wait:
+            self._barrier.wait()
+        return super().execute(block, inputs)
+
+
+class TestBuildSchedule:
+    """Dependencies only point at earlier nodes."""
+
+    def test_independent_nodes_share_a_level(self):
+        schedule = build_schedule(make_graph(("a", ["x"]), ("b", ["y"]), ("c", ["a", "b"])))
+        assert schedule.dependencies == ((), (), (0, 1))
+        assert schedule.levels == ((0, 1), (2,))
+        assert schedule.width == 2
+
+    def test_node_without_sources_waits_for_every_earlier_node(self):
+        schedule = build_schedule(make_graph(("a", ["x"]), ("b", ["y"]), ("c", [])))
+        assert schedule.dependencies[2] == (0, 1)
+
+    def test_repeated_identity_runs_in_order(self):
+        schedule = build_schedule(make_graph(("a", ["x"]), ("a", ["y"])))
+        assert schedule.dependencies == ((), (0,))
+
+
+class TestScheduledExecution:
+    """Independent nodes run concurrently; results commit in graph order."""
+
+    def test_independent_nodes_run_concurrently(self, custom_block):
+        block = custom_block("double_value", DOUBLE)
+        graph = make_graph(("a", ["x"]), ("b", ["y"]), ("c", ["a"]))
+        with concurrent.futures.ThreadPoolExecutor(2) as pool:
+            executor = GraphExecutor(block_executor=BarrierExecutor(parties=2), node_executor=pool)
+            for identity in ("a", "b", "c"):
+                executor.register_block(identity, block)
+            result = executor.execute(graph, {"value": 1})
+        assert result.status == ExecutionStatus.SUCCESS
+        assert [trace.node_id for trace in result.traces] == ["a", "b", "c"]
+        assert result.traces[2].outputs == {"result": 4}
+
+    def test_matches_sequential_execution(self, custom_block):
+        block = custom_block("double_value", DOUBLE)
+        graph = make_graph(("a", []), ("b", ["a"]), ("c", ["a"]), ("d", ["b", "c"]))
+
+        def run(node_executor):
+            executor = GraphExecutor(node_executor=node_executor)
+            for identity in "abcd":
+                executor.register_block(identity, block)
+            return executor.execute(graph, {"value": 3})
+
+        sequential = run(None)
+        with concurrent.futures.ThreadPoolExecutor(4) as pool:
+            scheduled = run(pool)
+        assert [t.node_id for t in scheduled.traces] == [t.node_id for t in sequential.traces]
+        assert [t.outputs for t in scheduled.traces] == [t.outputs for t in sequential.traces]
+        assert scheduled.final_outputs == sequential.final_outputs
+
+
+class TestNeuropForgeClose:
+    """close() stops the node threads NeuropForge starts."""
+
+    def test_close_shuts_down_node_executor(self, tmp_path):
+        forge = NeuropForge(storage_path=str(tmp_path / "library"), use_index_snapshot=False, node_workers=2)
+        node_executor = forge._node_executor
+        forge.close()
+        assert node_executor._shutdown
+
+    def test_context_manager(self, tmp_path):
+        with NeuropForge(storage_path=str(tmp_path / "library"), use_index_snapshot=False) as forge:
+            assert forge._library.current.retired is False
+        assert forge._library.current.retired is True
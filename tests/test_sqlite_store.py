@@ -0,0 +1,212 @@
+"""
+Tests for the SQLite block store and indexer (library.sqlite_store).
+"""
+import json
+import shutil
+import sqlite3
+
+import pytest
+
+from neurop_forge.library.block_store import BlockStore, StoreStatus
+from neurop_forge.library.indexer import BlockIndexer
+from neurop_forge.library.sqlite_store import SQLiteBlockIndexer, SQLiteBlockStore
+from neurop_forge.main import NeuropForge
+from tests.conftest import LIBRARY_PATH
+
+
+@pytest.fixture(scope="module")
+def library(tmp_path_factory):
+    """A library directory of 60 blocks copied from the expanded library."""
+    path = tmp_path_factory.mktemp("sqlite") / "library"
+    path.mkdir()
+    for source in sorted(LIBRARY_PATH.glob("*.json"))[:60]:
+        shutil.copy(source, path / source.name)
+    return path
+
+
+@pytest.fixture(scope="module")
+def baseline(library, tmp_path_factory):
+    """The in-memory store and indexer over the library."""
+    store = BlockStore(
+        storage_path=str(library),
+        quarantine_path=str(tmp_path_factory.mktemp("quarantine")),
+    )
+    indexer = BlockIndexer()
+    for block in store.get_all():
+        indexer.index_block(block)
+    return store, indexer
+
+
+@pytest.fixture(scope="module")
+def imported(library, tmp_path_factory):
+    """A SQLite store imported from the library."""
+    store = SQLiteBlockStore(tmp_path_factory.mktemp("db") / "library.sqlite3")
+    store.import_library(library)
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteBlockStore(tmp_path / "library.sqlite3")
+    yield store
+    store.close()
+
+
+def identities(items):
+    return sorted(
+        item.block_identity if hasattr(item, "block_identity") else item.get_identity_hash()
+        for item in items
+    )
+
+
+QUERIES = [
+    "string",
+    "to",
+    "is valid",
+    "uppercase",
+    "absolutevalue",
+    "calculate percentage of total",
+    "xyzzy",
+    "reversestringtouppercasewithpaddingandtrimmingofwhitespace" * 3,
+]
+
+
+class TestSearchParity:
+    """SQLiteBlockIndexer answers queries exactly like BlockIndexer."""
+
+    @pytest.mark.parametrize("query", QUERIES)
+    def test_keyword_search(self, baseline, imported, query):
+        _, indexer = baseline
+        expected = identities(indexer.search(query, limit=1000))
+        assert identities(SQLiteBlockIndexer(imported).search(query, limit=1000)) == expected
+
+    def test_filters(self, baseline, imported):
+        _, indexer = baseline
+        sqlite_indexer = SQLiteBlockIndexer(imported)
+        category = indexer.get_entries()[0].category
+        for options in (
+            {"category": category},
+            {"require_pure": True, "require_deterministic": True},
+            {"min_trust": 0.5},
+            {"input_types": ["string"]},
+            {"output_types": ["boolean"]},
+        ):
+            assert identities(sqlite_indexer.search("", limit=1000, **options)) == identities(
+                indexer.search("", limit=1000, **options)
+            ), options
+
+    def test_results_ordered_by_trust(self, imported):
+        results = SQLiteBlockIndexer(imported).search("string", limit=1000)
+        scores = [entry.trust_score for entry in results]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_long_words_fall_back_to_a_scan(self, baseline, imported, monkeypatch):
+        _, indexer = baseline
+        monkeypatch.setattr("neurop_forge.library.sqlite_store._MAX_CONTAINED_TERMS", 4)
+        for query in QUERIES:
+            assert identities(SQLiteBlockIndexer(imported).search(query, limit=1000)) == identities(
+                indexer.search(query, limit=1000)
+            ), query
+
+    @pytest.mark.parametrize("keywords", [["string"], ["to", "valid"], ["email"], ["zzz"]])
+    def test_get_by_intent(self, baseline, imported, keywords):
+        store, _ = baseline
+        assert identities(imported.get_by_intent(keywords)) == identities(
+            store.get_by_intent(keywords)
+        )
+
+
+class TestTransactions:
+    """store(), quarantine() and import_blocks() are all-or-nothing."""
+
+    def test_store_and_duplicate(self, store, library_block):
+        block = library_block("absolute_value")
+        identity = block.get_identity_hash()
+        assert store.store(block).status == StoreStatus.STORED
+        assert store.exists(identity)
+        assert store.get(identity).get_identity_hash() == identity
+        assert store.store(block).status == StoreStatus.ALREADY_EXISTS
+        assert store.count() == 1
+
+    def test_failed_store_leaves_no_rows(self, store, library_block):
+        block = library_block("absolute_value")
+        identity = block.get_identity_hash()
+        conn = sqlite3.connect(str(store.database_path))
+        with conn:
+            conn.execute(
+                "CREATE TRIGGER fail_keywords BEFORE INSERT ON block_keywords "
+                "BEGIN SELECT RAISE(ABORT, 'keyword insert failed'); END"
+            )
+        conn.close()
+
+        result = store.store(block)
+        assert result.status == StoreStatus.STORAGE_ERROR
+        assert "keyword insert failed" in result.error_message
+        assert not store.exists(identity)
+        db = store._connect()
+        for table in ("block_types", "block_keywords", "block_tags"):
+            assert db.execute(
+                f"SELECT COUNT(*) FROM {table} WHERE identity = ?", (identity,)
+            ).fetchone()[0] == 0
+
+    def test_failed_import_inserts_nothing(self, store, library_block):
+        conn = sqlite3.connect(str(store.database_path))
+        with conn:
+            conn.execute(
+                "CREATE TRIGGER fail_second BEFORE INSERT ON block_keywords "
+                "WHEN (SELECT COUNT(*) FROM blocks) > 1 "
+                "BEGIN SELECT RAISE(ABORT, 'second block'); END"
+            )
+        conn.close()
+
+        blocks = [library_block("absolute_value"), library_block("reverse_string")]
+        with pytest.raises(sqlite3.IntegrityError):
+            store.import_blocks(blocks)
+        assert store.count() == 0
+
+    def test_quarantine(self, store, library_block):
+        block = library_block("absolute_value")
+        identity = block.get_identity_hash()
+        assert store.quarantine(block, "first").status == StoreStatus.STORED
+        assert store.quarantine(block, "second").status == StoreStatus.STORED
+        assert store.is_quarantined(identity)
+        assert not store.exists(identity)
+        rows = store._connect().execute("SELECT reason FROM quarantine").fetchall()
+        assert rows == [("second",)]
+        assert json.loads(
+            store._connect().execute("SELECT payload FROM quarantine").fetchone()[0]
+        )["identity"]["hash_value"] == identity
+
+
+class TestCopyAndRefresh:
+    """Copies track changes made by other stores independently."""
+
+    def test_refresh_picks_up_other_writers(self, store, tmp_path, library_block):
+        other = SQLiteBlockStore(store.database_path)
+        block = library_block("absolute_value")
+        other.store(block)
+        copied = store.copy()
+        assert copied.refresh().added == [block.get_identity_hash()]
+        assert copied.search("absolute", limit=10)
+        assert store.refresh().added == [block.get_identity_hash()]
+        other.close()
+        copied.close()
+
+
+class TestForgeBuild:
+    """NeuropForge builds the sqlite backend without hydrating blocks."""
+
+    def test_build_uses_headers(self, library, tmp_path):
+        storage = tmp_path / "library"
+        shutil.copytree(library, storage)
+        with NeuropForge(
+            storage_path=str(storage), storage_backend="sqlite", use_index_snapshot=False
+        ) as forge:
+            with forge._library.pin() as current:
+                store = current.block_store
+                assert store.count() == 60
+                assert store.get_hydration_statistics()["hydrated_blocks"] == 0
+                assert len(current.semantic_composer.get_entries()) == 60
+                identity = store.identities()[0]
+                assert current.graph_executor._get_block(identity).get_identity_hash() == identity
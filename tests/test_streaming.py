@@ -0,0 +1,183 @@
+"""
+Tests for chunked streaming execution (runtime.streaming).
+"""
+import pytest
+
+from neurop_forge.runtime.executor import BlockExecutor
+from neurop_forge.runtime.streaming import (
+    REDUCERS,
+    StreamKind,
+    StreamPipeline,
+    StreamProfile,
+    StreamStage,
+    iter_chunks,
+    register_stream_profile,
+    stream_profile_for,
+)
+
+NUMBERS = [5, -2, 9, 9, 0, 3.5, 7, -2, 11, 4]
+FLAGS = [True, False, True, True, False, False, True]
+
+STRICT_SUM = '''def strict_sum(value):
+    total = 0
+    for item in value:
+        total += item
+    return total
+'''
+
+# (block name, its parameter names, streamed items, other inputs)
+STREAM_CASES = [
+    ("sum_numbers", ["items"], NUMBERS, {}),
+    ("sum_amounts", ["amounts"], NUMBERS, {}),
+    ("calculate_subtotal", ["line_totals"], NUMBERS, {}),
+    ("product_numbers", ["items"], [1, 2, 3, -1, 2, 5], {}),
+    ("min_value", ["items"], NUMBERS, {}),
+    ("max_value", ["items"], NUMBERS, {}),
+    ("min_amount", ["amounts"], NUMBERS, {}),
+    ("max_amount", ["amounts"], NUMBERS, {}),
+    ("count_true", ["values"], FLAGS, {}),
+    ("count_false", ["values"], FLAGS, {}),
+    ("count_element", ["items", "element"], NUMBERS, {"element": 9}),
+    ("all_true", ["values"], FLAGS, {}),
+    ("any_true", ["values"], [False] * 6 + [True], {}),
+    ("mean", ["values"], NUMBERS, {}),
+    ("calculate_mean", ["values"], NUMBERS, {}),
+    ("deduplicate", ["items"], [3, 1, 3, 2, 1, 5, 2, 8], {}),
+    ("unique", ["arr"], [3, 1, 3, 2, 1, 5, 2, 8], {}),
+    ("sort_ascending", ["items"], NUMBERS, {}),
+    ("sort_descending", ["items"], NUMBERS, {}),
+    ("filter_empty_strings", ["items"], ["a", "", "b", "", "", "c"], {}),
+    ("filter_none_values", ["items"], [1, None, 2, None, 3], {}),
+    ("flatten_list", ["nested"], [[1, 2], [3], [], [4, 5, 6]], {}),
+    ("chunk_list", ["items", "chunk_size"], list(range(11)), {"chunk_size": 3}),
+    ("to_csv_line", ["values", "delimiter"], [["a", "b"], ["c", "d"], ["e", "f"]], {"delimiter": ","}),
+]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1000])
+@pytest.mark.parametrize("name, params, items, inputs", STREAM_CASES, ids=[case[0] for case in STREAM_CASES])
+def test_streamed_result_matches_whole_list(library_block, name, params, items, inputs, chunk_size):
+    block = library_block(name, params)
+    profile = stream_profile_for(block)
+    executor = BlockExecutor()
+    if profile.kind == StreamKind.MAP:
+        expected = [
+            executor.execute(block, dict(inputs, **{profile.input_name: item}))[0]["result"]
+            for item in items
+        ]
+    else:
+        whole, error = executor.execute(block, dict(inputs, **{profile.input_name: list(items)}))
+        assert error is None
+        expected = whole["result"]
+    streamed, error = executor.execute_stream(block, iter(items), inputs, chunk_size=chunk_size)
+    assert error is None
+    if name in ("mean", "calculate_mean"):
+        expected = pytest.approx(expected)
+    assert streamed["result"] == expected
+
+
+class TestReducers:
+    """Reducers merge per-chunk results into the whole-list result."""
+
+    def reduce(self, name, chunks):
+        reducer = REDUCERS[name]
+        state = None
+        for index, (partial, items) in enumerate(chunks):
+            state = reducer.start(partial, items) if index == 0 else reducer.merge(state, partial, items)
+        return reducer.finish(state)
+
+    def test_mean_weights_chunks_by_size(self):
+        assert self.reduce("mean", [(2.0, 1), (5.0, 3)]) == pytest.approx(4.25)
+
+    def test_unique_keeps_first_seen_order(self):
+        assert self.reduce("unique", [([3, 1], 2), ([1, 2, 3], 3), ([4], 1)]) == [3, 1, 2, 4]
+
+    def test_unique_handles_unhashable_items(self):
+        assert self.reduce("unique", [([[1], [2]], 2), ([[1], [3]], 2)]) == [[1], [2], [3]]
+
+    def test_merge_sorted_runs(self):
+        assert self.reduce("merge_sorted", [([1, 4, 9], 3), ([2, 3, 10], 3)]) == [1, 2, 3, 4, 9, 10]
+        assert self.reduce("merge_sorted_desc", [([9, 4], 2), ([10, 3], 2)]) == [10, 9, 4, 3]
+
+    def test_unbounded_reducers_are_marked(self):
+        assert {name for name, reducer in REDUCERS.items() if not reducer.bounded} == {
+            "unique", "merge_sorted", "merge_sorted_desc",
+        }
+
+    def test_unknown_reducer_is_rejected(self):
+        with pytest.raises(ValueError):
+            register_stream_profile("never_registered", StreamProfile(reducer="median"))
+
+
+class TestStreamExecution:
+    """Chunking, sinks and failures."""
+
+    def test_iter_chunks(self):
+        assert list(iter_chunks(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+        assert list(iter_chunks([], 3)) == []
+
+    def test_empty_input_uses_the_block_answer(self, library_block):
+        block = library_block("sum_numbers", ["items"])
+        assert BlockExecutor().execute_stream(block, iter([])) == ({"result": 0}, None)
+
+    def test_sink_receives_each_output_chunk(self, library_block):
+        block = library_block("filter_none_values", ["items"])
+        consumed = []
+        received = []
+
+        def items():
+            for value in range(10):
+                consumed.append(value)
+                yield value if value % 2 else None
+
+        def sink(chunk):
+            received.append((len(consumed), chunk))
+
+        outputs, error = BlockExecutor().execute_stream(block, items(), chunk_size=4, sink=sink)
+        assert error is None and outputs == {"result": None}
+        assert [chunk for _, chunk in received] == [[1, 3], [5, 7], [9]]
+        # Each chunk reached the sink before the rest of the input was read.
+        assert [count for count, _ in received] == [4, 8, 10]
+
+    def test_chunk_multiple_is_respected(self, library_block):
+        block = library_block("chunk_list", ["items", "chunk_size"])
+        outputs, error = BlockExecutor().execute_stream(
+            block, iter(range(10)), {"chunk_size": 4}, chunk_size=5,
+        )
+        assert error is None
+        assert outputs["result"] == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+
+    def test_pipeline_of_stages(self, library_block):
+        executor = BlockExecutor()
+        stages = [
+            StreamStage(block, stream_profile_for(block))
+            for block in (
+                library_block("filter_none_values", ["items"]),
+                library_block("sum_numbers", ["items"]),
+            )
+        ]
+        outcome = StreamPipeline(executor, stages).run([1, None, 2, None, 3, 4], chunk_size=2)
+        assert outcome.error is None
+        assert outcome.value == 10
+        assert outcome.chunks == 3 and outcome.items == 6
+        assert stages[0].calls == 3
+
+    def test_only_the_last_stage_may_reduce(self, library_block):
+        block = library_block("sum_numbers", ["items"])
+        stage = StreamStage(block, stream_profile_for(block))
+        with pytest.raises(ValueError):
+            StreamPipeline(BlockExecutor(), [stage, stage])
+
+    def test_stage_failure_is_reported(self, custom_block):
+        block = custom_block("strict_sum", STRICT_SUM)
+        stage = StreamStage(block, StreamProfile(reducer="sum", input_name="value"))
+        outcome = StreamPipeline(BlockExecutor(), [stage]).run([1, 2, "x", 4], chunk_size=2)
+        assert outcome.error.startswith("TypeError")
+        assert outcome.failed_stage == 0
+        assert stage.calls == 2
+
+    def test_block_without_profile(self, library_block):
+        block = library_block("absolute_value")
+        assert stream_profile_for(block) is None
+        outputs, error = BlockExecutor().execute_stream(block, iter([1]))
+        assert outputs == {} and error.startswith("StreamError")
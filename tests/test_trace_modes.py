@@ -0,0 +1,110 @@
+"""
+Tests for trace capture levels of graph execution (TraceMode).
+"""
+import concurrent.futures
+
+from neurop_forge.runtime.executor import GraphExecutor
+from neurop_forge.runtime.result import ExecutionStatus, TraceMode
+from neurop_forge.runtime.result_cache import canonical_input_hash
+from tests.conftest import make_graph
+
+DOUBLE = '''def double_value(value):
+    return value * 2
+'''
+
+DIVIDE = '''def invert_value(value):
+    return 1 / value
+'''
+
+GRAPH = make_graph(("a", []), ("b", ["a"]))
+
+
+def executor_for(custom_block, **kwargs):
+    executor = GraphExecutor(**kwargs)
+    executor.register_block("a", custom_block("double_value", DOUBLE))
+    executor.register_block("b", custom_block("double_value", DOUBLE))
+    return executor
+
+
+class TestTraceModes:
+    """What each mode records."""
+
+    def test_full_records_bound_inputs(self, custom_block):
+        result = executor_for(custom_block).execute(GRAPH, {"value": 3})
+        assert [t.inputs for t in result.traces] == [{"value": 3}, {"value": 6}]
+        assert [t.outputs for t in result.traces] == [{"result": 6}, {"result": 12}]
+        assert all(t.inputs_hash is None for t in result.traces)
+
+    def test_outputs_only_records_an_inputs_hash(self, custom_block):
+        full = executor_for(custom_block).execute(GRAPH, {"value": 3})
+        hashed = executor_for(custom_block, trace_mode=TraceMode.OUTPUTS_ONLY).execute(GRAPH, {"value": 3})
+        assert all(t.inputs == {} for t in hashed.traces)
+        assert [t.inputs_hash for t in hashed.traces] == [
+            canonical_input_hash(t.inputs) for t in full.traces
+        ]
+        assert [t.outputs for t in hashed.traces] == [t.outputs for t in full.traces]
+        assert hashed.traces[0].inputs_hash != hashed.traces[1].inputs_hash
+
+    def test_outputs_only_with_unhashable_inputs(self, custom_block):
+        executor = executor_for(custom_block, trace_mode=TraceMode.OUTPUTS_ONLY)
+        executor.register_block("a", custom_block("invert_value", DIVIDE))
+        result = executor.execute(make_graph(("a", [])), {"value": object()})
+        assert result.traces[0].status == ExecutionStatus.FAILED
+        assert result.traces[0].inputs == {}
+        assert result.traces[0].inputs_hash is None
+
+    def test_off_keeps_status_counts_and_outputs(self, custom_block):
+        executor = executor_for(custom_block, trace_mode=TraceMode.OFF)
+        executor.register_block("a", custom_block("invert_value", DIVIDE))
+        result = executor.execute(GRAPH, {"value": 0})
+        assert result.traces == []
+        assert result.status == ExecutionStatus.PARTIAL_SUCCESS
+        assert (result.nodes_executed, result.nodes_succeeded, result.nodes_failed) == (2, 1, 1)
+        assert result.final_outputs == {"result": 0}
+        assert result.get_performance_summary()["nodes"] == 0
+
+    def test_off_with_scheduled_nodes(self, custom_block):
+        graph = make_graph(("a", ["x"]), ("b", ["y"]), ("a", ["b"]))
+        sequential = executor_for(custom_block).execute(graph, {"value": 1})
+        with concurrent.futures.ThreadPoolExecutor(2) as pool:
+            executor = executor_for(custom_block, trace_mode=TraceMode.OFF, node_executor=pool)
+            result = executor.execute(graph, {"value": 1})
+        assert result.traces == []
+        assert result.nodes_succeeded == 3
+        assert result.final_outputs == sequential.final_outputs
+
+    def test_run_override(self, custom_block):
+        executor = executor_for(custom_block, trace_mode=TraceMode.OFF)
+        assert len(executor.execute(GRAPH, {"value": 1}, trace_mode=TraceMode.FULL).traces) == 2
+        assert executor.execute(GRAPH, {"value": 1}).traces == []
+
+
+class TestSampling:
+    """SAMPLED traces one run in trace_sample_every in full."""
+
+    def test_one_run_in_n_is_traced(self, custom_block):
+        executor = executor_for(custom_block, trace_mode=TraceMode.SAMPLED, trace_sample_every=3)
+        traced = [bool(executor.execute(GRAPH, {"value": 1}).traces) for _ in range(7)]
+        assert traced == [True, False, False, True, False, False, True]
+
+    def test_sampled_runs_are_full_traces(self, custom_block):
+        executor = executor_for(custom_block, trace_mode=TraceMode.SAMPLED, trace_sample_every=2)
+        result = executor.execute(GRAPH, {"value": 5})
+        assert [t.inputs for t in result.traces] == [{"value": 5}, {"value": 10}]
+
+    def test_sample_every_below_one_traces_every_run(self, custom_block):
+        executor = executor_for(custom_block, trace_mode=TraceMode.SAMPLED, trace_sample_every=0)
+        assert all(executor.execute(GRAPH, {"value": 1}).traces for _ in range(3))
+
+    def test_copies_share_the_sampling_counter(self, custom_block):
+        executor = executor_for(custom_block, trace_mode=TraceMode.SAMPLED, trace_sample_every=2)
+        copy = executor.copy()
+        assert executor.execute(GRAPH, {"value": 1}).traces
+        assert not copy.execute(GRAPH, {"value": 1}).traces
+        assert executor.execute(GRAPH, {"value": 1}).traces
+
+    def test_compiled_runs_sample_too(self, custom_block):
+        executor = executor_for(custom_block, trace_mode=TraceMode.SAMPLED, trace_sample_every=2)
+        compiled = executor.compile(GRAPH)
+        traced = [bool(compiled.run({"value": 1}, trace_mode=TraceMode.SAMPLED).traces) for _ in range(4)]
+        assert traced == [True, False, True, False]
@@ -0,0 +1,92 @@
+"""
+Tests for vectorized execute_many batches (runtime.vectorized).
+Vectorized results must equal the scalar block's, value and type.
+"""
+import random
+
+import pytest
+
+from neurop_forge.runtime.executor import BlockExecutor
+from neurop_forge.runtime.vectorized import MIN_ROWS, VECTOR_KERNELS
+
+np = pytest.importorskip("numpy")
+
+
+def run_both(block, rows):
+    scalar = BlockExecutor().execute_many(block, rows)
+    executor = BlockExecutor(vectorize=True)
+    vector = executor.execute_many(block, rows)
+    return scalar, vector, executor
+
+
+def assert_same(scalar, vector):
+    for (expected, expected_error), (actual, actual_error) in zip(scalar, vector):
+        assert (expected_error is None) == (actual_error is None)
+        if expected_error is not None:
+            continue
+        (a,), (b,) = expected.values(), actual.values()
+        assert type(a) is type(b), (a, b)
+        assert b == pytest.approx(a, rel=1e-9, abs=1e-12)
+
+
+class TestOverflow:
+    """int64 kernel results never wrap around."""
+
+    @pytest.mark.parametrize("name,inputs,row", [
+        ("calculate_simple_interest", ["principal", "rate", "years"],
+         {"principal": 2 ** 31, "rate": 2 ** 31 - 1, "years": 2 ** 31}),
+        ("lerp", ["start", "end", "t"],
+         {"start": -2 ** 31, "end": 2 ** 31, "t": 2 ** 31}),
+        ("denormalize_from_range", ["normalized", "min_val", "max_val"],
+         {"normalized": 2 ** 31, "min_val": -2 ** 31, "max_val": 2 ** 31}),
+    ])
+    def test_large_int_rows_after_verification(self, library_block, name, inputs, row):
+        """Rows past the verified prefix whose result exceeds int64 match the block."""
+        block = library_block(name, inputs)
+        rows = [{key: index % 7 for key in inputs} for index in range(MIN_ROWS)] + [row]
+        scalar, vector, executor = run_both(block, rows)
+        assert executor._vectorizer.is_verified(executor._block_id(block)) is True
+        assert vector[-1] == scalar[-1]
+        assert vector[-1][0]["result"] > 0
+        assert_same(scalar, vector)
+
+
+class TestTypes:
+    """Vectorized results keep the scalar block's result types."""
+
+    @pytest.mark.parametrize("name", ["modulo", "safe_divide", "inverse_lerp",
+                                      "normalize_to_range", "get_taxable_amount"])
+    def test_int_rows_with_special_cases(self, library_block, name):
+        """Zero divisors and clamped rows come back with the block's types."""
+        block = library_block(name)
+        params = [param.name for param in block.interface.inputs]
+        rng = random.Random(0)
+        rows = [
+            {key: rng.choice([0, 0, 1, -7, rng.randint(-50, 50)]) for key in params}
+            for _ in range(200)
+        ]
+        scalar, vector, _ = run_both(block, rows)
+        assert_same(scalar, vector)
+
+    def test_modulo_keeps_int_results(self, library_block):
+        """All-int modulo rows return ints, not floats."""
+        block = library_block("modulo")
+        rows = [{"a": index, "b": 3} for index in range(-40, 40)]
+        _, vector, _ = run_both(block, rows)
+        assert all(type(outputs["result"]) is int for outputs, _ in vector)
+
+
+class TestParity:
+    """Every registered kernel matches its library block."""
+
+    @pytest.mark.parametrize("name", sorted(VECTOR_KERNELS))
+    def test_random_rows(self, library_block, name):
+        """All-int and all-float batches, with zeros, match value and type."""
+        block = library_block(name)
+        params = [param.name for param in block.interface.inputs]
+        rng = random.Random(1)
+        for make, zero in ((lambda: rng.randint(-50, 50), 0), (lambda: rng.uniform(-50.0, 50.0), 0.0)):
+            rows = [{key: rng.choice([zero, make()]) for key in params} for _ in range(128)]
+            scalar, vector, executor = run_both(block, rows)
+            assert executor._vectorizer.is_verified(executor._block_id(block)) is True
+            assert_same(scalar, vector)